@@ -57,6 +57,7 @@ setup(
         'vampytest',
         'vampytest.core',
         'vampytest.core.assertions',
+        'vampytest.core.cache',
         'vampytest.core.contexts',
         'vampytest.core.environment',
         'vampytest.core.event_handling',
@@ -66,6 +67,7 @@ setup(
         'vampytest.core.handling',
         'vampytest.core.helpers',
         'vampytest.core.mocking',
+        'vampytest.core.parallel',
         'vampytest.core.result',
         'vampytest.core.result.reports',
         'vampytest.core.runner',
@@ -1,4 +1,5 @@
 from .assertions import *
+from .cache import *
 from .contexts import *
 from .environment import *
 from .event_handling import *
@@ -7,6 +8,7 @@ from .file import *
 from .handling import *
 from .helpers import *
 from .mocking import *
+from .parallel import *
 from .result import *
 from .runner import *
 from .utils import *
@@ -18,6 +20,7 @@ from .test_case import *
 
 __all__ = (
     *assertions.__all__,
+    *cache.__all__,
     *contexts.__all__,
     *environment.__all__,
     *event_handling.__all__,
@@ -26,6 +29,7 @@ __all__ = (
     *handling.__all__,
     *helpers.__all__,
     *mocking.__all__,
+    *parallel.__all__,
     *result.__all__,
     *runner.__all__,
     *utils.__all__,
@@ -2,7 +2,12 @@ __all__ = ('AssertionException', )
 
 from scarletio import export
 from ..environment.default import __file__ as VAMPYTEST_ENVIRONMENT_DEFAULT_FILE_PATH
+from ..environment.generator import __file__ as VAMPYTEST_ENVIRONMENT_GENERATOR_FILE_PATH
 from ..environment.scarletio_coroutine import __file__ as VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_FILE_PATH
+from ..environment.scarletio_coroutine_generator import (
+    __file__ as VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_GENERATOR_FILE_PATH
+)
+from ..environment.watchdog import __file__ as VAMPYTEST_ENVIRONMENT_WATCHDOG_FILE_PATH
 
 from .assertion_conditional_base import __file__ as VAMPYTEST_ASSERTION_CONDITION_BASE_FILE_PATH
 from .assertion_instance import __file__ as VAMPYTEST_ASSERTION_INSTANCE_FILE_PATH
@@ -52,7 +57,7 @@ def _ignore_assertion_frames(frame):
         if name == '__new__':
             if line == 'return self.invoke()':
                 should_show_frame = False
-
+    
     elif file_name == VAMPYTEST_ASSERTION_SUBTYPE_FILE_PATH:
         if name == '__new__':
             if line == 'return self.invoke()':
@@ -73,6 +78,21 @@ def _ignore_assertion_frames(frame):
             if line == 'returned_value = await test(*positional_parameters, **keyword_parameters)':
                 should_show_frame = False
     
+    elif file_name == VAMPYTEST_ENVIRONMENT_GENERATOR_FILE_PATH:
+        if name == 'iter_run':
+            if line == 'value = next(generator)':
+                should_show_frame = False
+    
+    elif file_name == VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_GENERATOR_FILE_PATH:
+        if name == '_step_async':
+            if line == 'value = await generator.__anext__()':
+                should_show_frame = False
+    
+    elif file_name == VAMPYTEST_ENVIRONMENT_WATCHDOG_FILE_PATH:
+        if name == '_handle_signal':
+            if line == 'raise WatchdogInterrupt()':
+                should_show_frame = False
+    
     
     return should_show_frame
 
@@ -0,0 +1,18 @@
+from .case_index import *
+from .constants import *
+from .dependencies import *
+from .discovery import *
+from .durations import *
+from .result_cache import *
+from .storage import *
+
+
+__all__ = (
+    *case_index.__all__,
+    *constants.__all__,
+    *dependencies.__all__,
+    *discovery.__all__,
+    *durations.__all__,
+    *result_cache.__all__,
+    *storage.__all__,
+)
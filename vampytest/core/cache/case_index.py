@@ -0,0 +1,258 @@
+__all__ = ('CaseIndex',)
+
+from hashlib import blake2b
+
+from scarletio import RichAttributeErrorBaseType
+
+from ..file.static_collection import StaticCollection, StaticTestCase, collect_static
+
+from .constants import CACHE_FILE_NAME_CASE_INDEX
+from .storage import read_cache_file, write_cache_file
+
+
+def get_content_hash(content):
+    """
+    Returns the hash of a file's content.
+    
+    Parameters
+    ----------
+    content : `bytes`
+        The file's content.
+    
+    Returns
+    -------
+    content_hash : `str`
+    """
+    return blake2b(content, digest_size = 16).hexdigest()
+
+
+def _parse_static_collection(raw_static_collection):
+    """
+    Parses a cached static collection.
+    
+    Parameters
+    ----------
+    raw_static_collection : `object`
+        The cached static collection.
+    
+    Returns
+    -------
+    parsed : `bool`
+        Whether the static collection is valid.
+    static_collection : `None | StaticCollection`
+    """
+    if raw_static_collection is None:
+        return True, None
+    
+    if (not isinstance(raw_static_collection, list)) or (len(raw_static_collection) != 2):
+        return False, None
+    
+    complete, raw_test_cases = raw_static_collection
+    if (not isinstance(complete, bool)) or (not isinstance(raw_test_cases, list)):
+        return False, None
+    
+    test_cases = []
+    
+    for raw_test_case in raw_test_cases:
+        if (not isinstance(raw_test_case, list)) or (len(raw_test_case) != 4):
+            return False, None
+        
+        name, line, wrappers, skipped = raw_test_case
+        if (
+            (not isinstance(name, str)) or
+            (not isinstance(line, int)) or
+            (not isinstance(wrappers, list)) or
+            (not all(isinstance(wrapper, str) for wrapper in wrappers)) or
+            (not isinstance(skipped, bool))
+        ):
+            return False, None
+        
+        test_cases.append(StaticTestCase(name, line, tuple(wrappers), skipped))
+    
+    return True, StaticCollection(test_cases, complete)
+
+
+def parse_case_index(data):
+    """
+    Parses the cached case index. Invalid entries are ignored.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    files : `dict<str, (str, None | StaticCollection)>`
+        Test file paths mapped to their content's hash and to their static collection.
+    """
+    files = {}
+    if data is None:
+        return files
+    
+    raw_files = data.get('files', None)
+    if not isinstance(raw_files, dict):
+        return files
+    
+    for path, entry in raw_files.items():
+        if (not isinstance(entry, list)) or (len(entry) != 2):
+            continue
+        
+        content_hash, raw_static_collection = entry
+        if not isinstance(content_hash, str):
+            continue
+        
+        parsed, static_collection = _parse_static_collection(raw_static_collection)
+        if not parsed:
+            continue
+        
+        files[path] = (content_hash, static_collection)
+    
+    return files
+
+
+def _serialize_static_collection(static_collection):
+    """
+    Serializes the given static collection to json serializable data.
+    
+    Parameters
+    ----------
+    static_collection : `None | StaticCollection`
+        The static collection to serialize.
+    
+    Returns
+    -------
+    data : `None | list<object>`
+    """
+    if static_collection is None:
+        return None
+    
+    return [
+        static_collection.complete,
+        [
+            [test_case.name, test_case.line, [*test_case.wrappers], test_case.skipped]
+            for test_case in static_collection.test_cases
+        ],
+    ]
+
+
+class CaseIndex(RichAttributeErrorBaseType):
+    """
+    Index of the test cases of test files found without importing them. The collections are cached by the test files'
+    content hash, so only changed test files are parsed again.
+    
+    Attributes
+    ----------
+    files : `dict<str, (str, None | StaticCollection)>`
+        Test file paths mapped to their content's hash and to their static collection.
+    modified : `bool`
+        Whether the index was modified since it was loaded.
+    source_directory : `str`
+        The path to run tests from.
+    """
+    __slots__ = ('files', 'modified', 'source_directory')
+    
+    def __new__(cls, source_directory, files):
+        """
+        Creates a new case index.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        files : `dict<str, (str, None | StaticCollection)>`
+            Test file paths mapped to their content's hash and to their static collection.
+        """
+        self = object.__new__(cls)
+        self.files = files
+        self.modified = False
+        self.source_directory = source_directory
+        return self
+    
+    
+    @classmethod
+    def load(cls, source_directory):
+        """
+        Loads the case index saved by the previous runs.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        return cls(source_directory, parse_case_index(read_cache_file(source_directory, CACHE_FILE_NAME_CASE_INDEX)))
+    
+    
+    def __repr__(self):
+        """Returns the case index's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' file_count = ')
+        repr_parts.append(repr(len(self.files)))
+        
+        if self.modified:
+            repr_parts.append(', modified')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_static_collection(self, path):
+        """
+        Returns the static collection of the given test file. Parses the file only if it changed since it was indexed.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the test file.
+        
+        Returns
+        -------
+        static_collection : `None | StaticCollection`
+            Returns `None` if the file cannot be read or parsed.
+        """
+        try:
+            with open(path, 'rb') as file:
+                content = file.read()
+        except OSError:
+            return None
+        
+        content_hash = get_content_hash(content)
+        
+        entry = self.files.get(path, None)
+        if (entry is not None) and (entry[0] == content_hash):
+            return entry[1]
+        
+        static_collection = collect_static(content)
+        self.files[path] = (content_hash, static_collection)
+        self.modified = True
+        return static_collection
+    
+    
+    def save(self):
+        """
+        Saves the case index if it was modified.
+        
+        Returns
+        -------
+        saved : `bool`
+        """
+        if not self.modified:
+            return False
+        
+        data = {
+            'files': {
+                path: [content_hash, _serialize_static_collection(static_collection)]
+                for path, (content_hash, static_collection) in self.files.items()
+            },
+        }
+        
+        saved = write_cache_file(self.source_directory, CACHE_FILE_NAME_CASE_INDEX, data)
+        if saved:
+            self.modified = False
+        
+        return saved
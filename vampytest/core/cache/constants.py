@@ -0,0 +1,20 @@
+__all__ = ()
+
+CACHE_DIRECTORY_NAME = '.vampytest_cache'
+CACHE_VERSION = 1
+
+# Keeps the cache directory out of version control.
+CACHE_FILE_NAME_GITIGNORE = '.gitignore'
+
+CACHE_FILE_NAME_DURATIONS = 'durations.json'
+CACHE_FILE_NAME_DISCOVERY = 'discovery.json'
+
+# Directories modified this recently are not cached, since a later modification within the file system's timestamp
+# resolution would leave their mtime unchanged.
+DISCOVERY_RACY_INTERVAL = 2_000_000_000
+
+CACHE_FILE_NAME_CASE_INDEX = 'case_index.json'
+
+CACHE_FILE_NAME_DEPENDENCIES = 'dependencies.json'
+
+CACHE_FILE_NAME_RESULTS = 'results.json'
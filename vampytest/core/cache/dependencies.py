@@ -0,0 +1,171 @@
+__all__ = ('DependencyMap',)
+
+from scarletio import RichAttributeErrorBaseType
+
+from .constants import CACHE_FILE_NAME_DEPENDENCIES
+from .storage import read_cache_file, write_cache_file
+
+
+def parse_dependencies(data):
+    """
+    Parses the cached dependencies of the test files. Invalid entries are ignored.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    dependencies : `dict<str, frozenset<str>>`
+        Test file paths mapped to the paths of the project source files they depend on.
+    """
+    dependencies = {}
+    if data is None:
+        return dependencies
+    
+    files = data.get('files', None)
+    if not isinstance(files, dict):
+        return dependencies
+    
+    for path, dependency_paths in files.items():
+        if (not isinstance(dependency_paths, list)) or (not all(isinstance(item, str) for item in dependency_paths)):
+            continue
+        
+        dependencies[path] = frozenset(dependency_paths)
+    
+    return dependencies
+
+
+class DependencyMap(RichAttributeErrorBaseType):
+    """
+    Maps the test files to the project source files they depend on, so only the test files affected by a change need
+    to be ran.
+    
+    Attributes
+    ----------
+    dependencies : `dict<str, frozenset<str>>`
+        Test file paths mapped to the paths of the project source files they depend on.
+    modified : `bool`
+        Whether the map was modified since it was loaded.
+    source_directory : `str`
+        The path to run tests from.
+    """
+    __slots__ = ('dependencies', 'modified', 'source_directory')
+    
+    def __new__(cls, source_directory, dependencies):
+        """
+        Creates a new dependency map.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        dependencies : `dict<str, frozenset<str>>`
+            Test file paths mapped to the paths of the project source files they depend on.
+        """
+        self = object.__new__(cls)
+        self.dependencies = dependencies
+        self.modified = False
+        self.source_directory = source_directory
+        return self
+    
+    
+    @classmethod
+    def load(cls, source_directory):
+        """
+        Loads the dependency map saved by the previous runs.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        return cls(
+            source_directory, parse_dependencies(read_cache_file(source_directory, CACHE_FILE_NAME_DEPENDENCIES))
+        )
+    
+    
+    def __repr__(self):
+        """Returns the dependency map's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' file_count = ')
+        repr_parts.append(repr(len(self.dependencies)))
+        
+        if self.modified:
+            repr_parts.append(', modified')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def is_affected(self, path, changed_file_paths):
+        """
+        Returns whether the given test file is affected by the changed files. Test files without recorded dependencies
+        are always affected.
+        
+        Parameters
+        ----------
+        path : `str`
+            Normalized path of the test file.
+        changed_file_paths : `frozenset<str>`
+            The normalized paths of the changed files.
+        
+        Returns
+        -------
+        is_affected : `bool`
+        """
+        if path in changed_file_paths:
+            return True
+        
+        dependency_paths = self.dependencies.get(path, None)
+        if dependency_paths is None:
+            return True
+        
+        return not dependency_paths.isdisjoint(changed_file_paths)
+    
+    
+    def set_dependencies(self, path, dependency_paths):
+        """
+        Sets the dependencies of the given test file.
+        
+        Parameters
+        ----------
+        path : `str`
+            Normalized path of the test file.
+        dependency_paths : `iterable<str>`
+            The normalized paths of the project source files the test file depends on.
+        """
+        dependency_paths = frozenset(dependency_paths)
+        if self.dependencies.get(path, None) != dependency_paths:
+            self.dependencies[path] = dependency_paths
+            self.modified = True
+    
+    
+    def save(self):
+        """
+        Saves the dependency map if it was modified.
+        
+        Returns
+        -------
+        saved : `bool`
+        """
+        if not self.modified:
+            return False
+        
+        data = {
+            'files': {
+                path: sorted(dependency_paths) for path, dependency_paths in self.dependencies.items()
+            },
+        }
+        
+        saved = write_cache_file(self.source_directory, CACHE_FILE_NAME_DEPENDENCIES, data)
+        if saved:
+            self.modified = False
+        
+        return saved
@@ -0,0 +1,235 @@
+__all__ = ('DiscoveryCache',)
+
+from time import time_ns as get_time_ns
+
+from scarletio import RichAttributeErrorBaseType
+
+from .constants import CACHE_FILE_NAME_DISCOVERY, DISCOVERY_RACY_INTERVAL
+from .storage import read_cache_file, write_cache_file
+
+
+def _parse_listing(raw_listing):
+    """
+    Parses a cached directory listing.
+    
+    Parameters
+    ----------
+    raw_listing : `object`
+        The cached listing.
+    
+    Returns
+    -------
+    listing : `None | list<(str, bool)>`
+        Returns `None` if the listing is invalid.
+    """
+    if not isinstance(raw_listing, list):
+        return None
+    
+    listing = []
+    
+    for item in raw_listing:
+        if (not isinstance(item, list)) or (len(item) != 2):
+            return None
+        
+        name, directory = item
+        if (not isinstance(name, str)) or (not isinstance(directory, bool)):
+            return None
+        
+        listing.append((name, directory))
+    
+    return listing
+
+
+def parse_directories(data, prune_names):
+    """
+    Parses the cached directory listings. If the cache was built with different prune names, it is discarded.
+    Invalid entries are ignored.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    
+    Returns
+    -------
+    directories : `dict<str, (int, int, list<(str, bool)>)>`
+        Directory paths mapped to their modification time, inode and listing.
+    """
+    directories = {}
+    if data is None:
+        return directories
+    
+    if data.get('prune_names', None) != sorted(prune_names):
+        return directories
+    
+    raw_directories = data.get('directories', None)
+    if not isinstance(raw_directories, dict):
+        return directories
+    
+    for path, entry in raw_directories.items():
+        if (not isinstance(entry, list)) or (len(entry) != 3):
+            continue
+        
+        modified_at, inode, raw_listing = entry
+        if (not isinstance(modified_at, int)) or (not isinstance(inode, int)):
+            continue
+        
+        listing = _parse_listing(raw_listing)
+        if listing is None:
+            continue
+        
+        directories[path] = (modified_at, inode, listing)
+    
+    return directories
+
+
+class DiscoveryCache(RichAttributeErrorBaseType):
+    """
+    Caches the listing of the walked directories, so unchanged directories are not listed again on the next run.
+    
+    A directory's listing is reused only if its modification time and inode are unchanged. Adding, removing or
+    renaming an entry updates the modification time of its directory, so these changes are always picked up.
+    
+    Attributes
+    ----------
+    directories : `dict<str, (int, int, list<(str, bool)>)>`
+        Directory paths mapped to their modification time, inode and listing.
+    modified : `bool`
+        Whether the cache was modified since it was loaded.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    source_directory : `str`
+        The path to run tests from.
+    """
+    __slots__ = ('directories', 'modified', 'prune_names', 'source_directory')
+    
+    def __new__(cls, source_directory, prune_names, directories):
+        """
+        Creates a new discovery cache.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        prune_names : `frozenset<str>`
+            Directory names to not look into.
+        directories : `dict<str, (int, int, list<(str, bool)>)>`
+            Directory paths mapped to their modification time, inode and listing.
+        """
+        self = object.__new__(cls)
+        self.directories = directories
+        self.modified = False
+        self.prune_names = prune_names
+        self.source_directory = source_directory
+        return self
+    
+    
+    @classmethod
+    def load(cls, source_directory, prune_names):
+        """
+        Loads the discovery cache saved by the previous runs.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        prune_names : `frozenset<str>`
+            Directory names to not look into.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        directories = parse_directories(read_cache_file(source_directory, CACHE_FILE_NAME_DISCOVERY), prune_names)
+        return cls(source_directory, prune_names, directories)
+    
+    
+    def __repr__(self):
+        """Returns the discovery cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' directory_count = ')
+        repr_parts.append(repr(len(self.directories)))
+        
+        if self.modified:
+            repr_parts.append(', modified')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_listing(self, path, stat_result):
+        """
+        Returns the cached listing of the given directory if it did not change since.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the directory.
+        stat_result : `os.stat_result`
+            The directory's current status.
+        
+        Returns
+        -------
+        listing : `None | list<(str, bool)>`
+        """
+        entry = self.directories.get(path, None)
+        if entry is None:
+            return None
+        
+        modified_at, inode, listing = entry
+        if (modified_at != stat_result.st_mtime_ns) or (inode != stat_result.st_ino):
+            return None
+        
+        return listing
+    
+    
+    def set_listing(self, path, stat_result, listing):
+        """
+        Caches the listing of the given directory. Directories modified too recently are not cached.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the directory.
+        stat_result : `os.stat_result`
+            The directory's status before it was listed.
+        listing : `list<(str, bool)>`
+            The directory's listing.
+        """
+        modified_at = stat_result.st_mtime_ns
+        if get_time_ns() - modified_at < DISCOVERY_RACY_INTERVAL:
+            if self.directories.pop(path, None) is not None:
+                self.modified = True
+            return
+        
+        self.directories[path] = (modified_at, stat_result.st_ino, listing)
+        self.modified = True
+    
+    
+    def save(self):
+        """
+        Saves the discovery cache if it was modified.
+        
+        Returns
+        -------
+        saved : `bool`
+        """
+        if not self.modified:
+            return False
+        
+        data = {
+            'prune_names': sorted(self.prune_names),
+            'directories': {
+                path: [modified_at, inode, [[name, directory] for name, directory in listing]]
+                for path, (modified_at, inode, listing) in self.directories.items()
+            },
+        }
+        
+        saved = write_cache_file(self.source_directory, CACHE_FILE_NAME_DISCOVERY, data)
+        if saved:
+            self.modified = False
+        
+        return saved
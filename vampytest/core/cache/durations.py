@@ -0,0 +1,203 @@
+__all__ = ('DurationRecorder',)
+
+from scarletio import RichAttributeErrorBaseType
+
+from .constants import CACHE_FILE_NAME_DURATIONS
+from .storage import read_cache_file, write_cache_file
+
+
+def _is_duration(value):
+    """
+    Returns whether the given value is a valid duration.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to check.
+    
+    Returns
+    -------
+    is_duration : `bool`
+    """
+    return isinstance(value, (int, float)) and (not isinstance(value, bool)) and (value >= 0.0)
+
+
+def parse_durations(data):
+    """
+    Parses durations from the given cached data. Invalid entries are ignored.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    """
+    durations = {}
+    if data is None:
+        return durations
+    
+    files = data.get('files', None)
+    if not isinstance(files, dict):
+        return durations
+    
+    for import_route, entry in files.items():
+        if (not isinstance(entry, list)) or (len(entry) != 2):
+            continue
+        
+        file_duration, raw_case_durations = entry
+        if not _is_duration(file_duration):
+            file_duration = None
+        
+        case_durations = {}
+        if isinstance(raw_case_durations, dict):
+            for case_name, case_duration in raw_case_durations.items():
+                if _is_duration(case_duration):
+                    case_durations[case_name] = float(case_duration)
+        
+        if (file_duration is None) and (not case_durations):
+            continue
+        
+        durations[import_route] = (None if file_duration is None else float(file_duration), case_durations)
+    
+    return durations
+
+
+def merge_durations(durations, new_durations):
+    """
+    Merges the newly recorded durations into the old ones. The entries of the re-ran test files are replaced.
+    
+    Parameters
+    ----------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        The old durations.
+    new_durations : `dict<str, (None | float, dict<str, float>)>`
+        The newly recorded durations.
+    
+    Returns
+    -------
+    merged_durations : `dict<str, (None | float, dict<str, float>)>`
+    """
+    merged_durations = durations.copy()
+    
+    for import_route, (file_duration, case_durations) in new_durations.items():
+        if file_duration is None:
+            old_entry = durations.get(import_route, None)
+            if (old_entry is not None):
+                file_duration = old_entry[0]
+        
+        merged_durations[import_route] = (file_duration, case_durations)
+    
+    return merged_durations
+
+
+def load_durations(source_directory):
+    """
+    Loads the durations recorded by the previous runs.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    
+    Returns
+    -------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    """
+    return parse_durations(read_cache_file(source_directory, CACHE_FILE_NAME_DURATIONS))
+
+
+def save_durations(source_directory, durations):
+    """
+    Saves the given durations.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    
+    Returns
+    -------
+    saved : `bool`
+    """
+    data = {
+        'files': {
+            import_route: [file_duration, case_durations]
+            for import_route, (file_duration, case_durations) in durations.items()
+        },
+    }
+    
+    return write_cache_file(source_directory, CACHE_FILE_NAME_DURATIONS, data)
+
+
+class DurationRecorder(RichAttributeErrorBaseType):
+    """
+    Records the durations of test files and test cases.
+    
+    Attributes
+    ----------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    """
+    __slots__ = ('durations',)
+    
+    def __new__(cls):
+        """
+        Creates a new duration recorder.
+        """
+        self = object.__new__(cls)
+        self.durations = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the duration recorder's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' file_count = ')
+        repr_parts.append(repr(len(self.durations)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def add_file_duration(self, import_route, duration):
+        """
+        Adds duration to a test file.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        duration : `float`
+            The duration to add in seconds.
+        """
+        file_duration, case_durations = self.durations.get(import_route, (None, {}))
+        if file_duration is None:
+            file_duration = 0.0
+        
+        self.durations[import_route] = (file_duration + duration, case_durations)
+    
+    
+    def add_case_duration(self, import_route, case_name, duration):
+        """
+        Adds duration to a test case.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        case_name : `str`
+            The test case's name.
+        duration : `float`
+            The duration to add in seconds.
+        """
+        file_duration, case_durations = self.durations.get(import_route, (None, {}))
+        case_durations[case_name] = case_durations.get(case_name, 0.0) + duration
+        self.durations[import_route] = (file_duration, case_durations)
@@ -0,0 +1,366 @@
+__all__ = ('ResultCache',)
+
+from hashlib import blake2b
+
+from scarletio import RichAttributeErrorBaseType
+
+from ..result import DetachedResult, ResultTimings
+from ..result.detached_result import RESULT_FLAG_CACHED, RESULT_FLAG_PASSED
+
+from .case_index import get_content_hash
+from .constants import CACHE_FILE_NAME_RESULTS
+from .storage import read_cache_file, write_cache_file
+
+
+def get_case_identifier(import_route, name):
+    """
+    Returns the identifier of a test case.
+    
+    Parameters
+    ----------
+    import_route : `str`
+        The test file's import route.
+    name : `str`
+        The test case's name.
+    
+    Returns
+    -------
+    case_identifier : `str`
+    """
+    return f'{import_route}.{name}'
+
+
+def _parse_case_results(raw_case_results):
+    """
+    Parses the cached results of a test case.
+    
+    Parameters
+    ----------
+    raw_case_results : `object`
+        The cached results.
+    
+    Returns
+    -------
+    case_results : `None | list<(None | str, ResultTimings)>`
+        Returns `None` if the cached results are invalid.
+    """
+    if (not isinstance(raw_case_results, list)) or (not raw_case_results):
+        return None
+    
+    case_results = []
+    
+    for raw_case_result in raw_case_results:
+        if (not isinstance(raw_case_result, list)) or (len(raw_case_result) != 7):
+            return None
+        
+        case_modifier, *times = raw_case_result
+        if (
+            ((case_modifier is not None) and (not isinstance(case_modifier, str))) or
+            (not all(isinstance(time, int) for time in times))
+        ):
+            return None
+        
+        call_cpu_time, call_wall_time, close_time, enter_time, exit_time, start_time = times
+        case_results.append((
+            case_modifier,
+            ResultTimings(
+                call_cpu_time = call_cpu_time,
+                call_wall_time = call_wall_time,
+                close_time = close_time,
+                enter_time = enter_time,
+                exit_time = exit_time,
+                start_time = start_time,
+            ),
+        ))
+    
+    return case_results
+
+
+def parse_result_cache(data):
+    """
+    Parses the cached results. Invalid entries are ignored.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    cases : `dict<str, (str, list<(None | str, ResultTimings)>)>`
+        Test case identifiers mapped to the key of the code they passed with and to their results' case modifier and
+        timings.
+    """
+    cases = {}
+    if data is None:
+        return cases
+    
+    raw_cases = data.get('cases', None)
+    if not isinstance(raw_cases, dict):
+        return cases
+    
+    for case_identifier, raw_case in raw_cases.items():
+        if (not isinstance(raw_case, list)) or (len(raw_case) != 2):
+            continue
+        
+        file_key, raw_case_results = raw_case
+        if not isinstance(file_key, str):
+            continue
+        
+        case_results = _parse_case_results(raw_case_results)
+        if case_results is None:
+            continue
+        
+        cases[case_identifier] = (file_key, case_results)
+    
+    return cases
+
+
+class ResultCache(RichAttributeErrorBaseType):
+    """
+    Stores the results of the passed test cases with the key of the code they passed with, so the test cases can be
+    reported as passed without running them again while their code is unchanged.
+    
+    A test file's key is built from the content hashes of every project source file it depends on, including itself.
+    
+    Attributes
+    ----------
+    _content_hashes : `dict<str, None | str>`
+        Content hash cache of the already hashed files. `None` is stored for the files which could not be read.
+    cases : `dict<str, (str, list<(None | str, ResultTimings)>)>`
+        Test case identifiers mapped to the key of the code they passed with and to their results' case modifier and
+        timings.
+    modified : `bool`
+        Whether the cache was modified since it was loaded.
+    source_directory : `str`
+        The path to run tests from.
+    """
+    __slots__ = ('_content_hashes', 'cases', 'modified', 'source_directory')
+    
+    def __new__(cls, source_directory, cases):
+        """
+        Creates a new result cache.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        cases : `dict<str, (str, list<(None | str, ResultTimings)>)>`
+            Test case identifiers mapped to the key of the code they passed with and to their results' case modifier
+            and timings.
+        """
+        self = object.__new__(cls)
+        self._content_hashes = {}
+        self.cases = cases
+        self.modified = False
+        self.source_directory = source_directory
+        return self
+    
+    
+    @classmethod
+    def load(cls, source_directory):
+        """
+        Loads the results saved by the previous runs.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        return cls(source_directory, parse_result_cache(read_cache_file(source_directory, CACHE_FILE_NAME_RESULTS)))
+    
+    
+    def __reduce__(self):
+        """Reduces the result cache to be picklable."""
+        return type(self), (self.source_directory, self.cases)
+    
+    
+    def __repr__(self):
+        """Returns the result cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' case_count = ')
+        repr_parts.append(repr(len(self.cases)))
+        
+        if self.modified:
+            repr_parts.append(', modified')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _get_content_hash(self, path):
+        """
+        Returns the content hash of the file at the given path.
+        
+        Parameters
+        ----------
+        path : `str`
+            The file's path.
+        
+        Returns
+        -------
+        content_hash : `None | str`
+            Returns `None` if the file could not be read.
+        """
+        content_hashes = self._content_hashes
+        try:
+            return content_hashes[path]
+        except KeyError:
+            pass
+        
+        try:
+            with open(path, 'rb') as file:
+                content = file.read()
+        except OSError:
+            content_hash = None
+        else:
+            content_hash = get_content_hash(content)
+        
+        content_hashes[path] = content_hash
+        return content_hash
+    
+    
+    def get_file_key(self, dependency_paths):
+        """
+        Returns the key of a test file's code.
+        
+        Parameters
+        ----------
+        dependency_paths : `None | list<str>`
+            The sorted normalized paths of the project source files the test file depends on.
+        
+        Returns
+        -------
+        file_key : `None | str`
+            Returns `None` if the dependencies are unknown or if any of them could not be read.
+        """
+        if dependency_paths is None:
+            return None
+        
+        hasher = blake2b(digest_size = 16)
+        
+        for path in dependency_paths:
+            content_hash = self._get_content_hash(path)
+            if content_hash is None:
+                return None
+            
+            hasher.update(path.encode('utf-8', 'surrogatepass'))
+            hasher.update(b'\0')
+            hasher.update(content_hash.encode())
+            hasher.update(b'\n')
+        
+        return hasher.hexdigest()
+    
+    
+    def get_cached_results(self, test_case, file_key):
+        """
+        Returns the cached results of the given test case if it passed with the same code.
+        
+        Parameters
+        ----------
+        test_case : ``TestCase``
+            The test case to get its results of.
+        file_key : `str`
+            The key of the test file's code.
+        
+        Returns
+        -------
+        results : `None | list<DetachedResult>`
+        """
+        cached = self.cases.get(get_case_identifier(test_case.import_route, test_case.name), None)
+        if (cached is None) or (cached[0] != file_key):
+            return None
+        
+        case_results = cached[1]
+        last_index = len(case_results) - 1
+        
+        return [
+            DetachedResult(
+                test_case,
+                index != last_index,
+                RESULT_FLAG_PASSED | RESULT_FLAG_CACHED,
+                case_modifier,
+                None,
+                None,
+                timings,
+            )
+            for index, (case_modifier, timings) in enumerate(case_results)
+        ]
+    
+    
+    def set_case_results(self, import_route, name, file_key, case_results):
+        """
+        Sets the results of the given passed test case.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        name : `str`
+            The test case's name.
+        file_key : `str`
+            The key of the code the test case passed with.
+        case_results : `list<(None | str, ResultTimings)>`
+            The test case's results' case modifier and timings.
+        """
+        self.cases[get_case_identifier(import_route, name)] = (file_key, case_results)
+        self.modified = True
+    
+    
+    def remove_case_results(self, import_route, name):
+        """
+        Removes the results of the given test case.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        name : `str`
+            The test case's name.
+        """
+        if self.cases.pop(get_case_identifier(import_route, name), None) is not None:
+            self.modified = True
+    
+    
+    def save(self):
+        """
+        Saves the result cache if it was modified.
+        
+        Returns
+        -------
+        saved : `bool`
+        """
+        if not self.modified:
+            return False
+        
+        data = {
+            'cases': {
+                case_identifier: [
+                    file_key,
+                    [
+                        [
+                            case_modifier,
+                            timings.call_cpu_time,
+                            timings.call_wall_time,
+                            timings.close_time,
+                            timings.enter_time,
+                            timings.exit_time,
+                            timings.start_time,
+                        ]
+                        for case_modifier, timings in case_results
+                    ],
+                ]
+                for case_identifier, (file_key, case_results) in self.cases.items()
+            },
+        }
+        
+        saved = write_cache_file(self.source_directory, CACHE_FILE_NAME_RESULTS, data)
+        if saved:
+            self.modified = False
+        
+        return saved
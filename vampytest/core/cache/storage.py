@@ -0,0 +1,124 @@
+__all__ = ()
+
+from json import JSONDecodeError, dump as dump_json, load as load_json
+from os import makedirs as make_directories, replace as replace_file
+from os.path import exists, join as join_paths
+from shutil import rmtree as remove_tree
+
+from .constants import CACHE_DIRECTORY_NAME, CACHE_FILE_NAME_GITIGNORE, CACHE_VERSION
+
+
+def get_cache_directory_path(source_directory):
+    """
+    Returns the path of the cache directory.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    
+    Returns
+    -------
+    path : `str`
+    """
+    return join_paths(source_directory, CACHE_DIRECTORY_NAME)
+
+
+def read_cache_file(source_directory, file_name):
+    """
+    Reads a cache file. If the file is missing, corrupted or was written by a different cache version, returns `None`.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    file_name : `str`
+        The cache file's name.
+    
+    Returns
+    -------
+    data : `None | dict<str, object>`
+    """
+    path = join_paths(get_cache_directory_path(source_directory), file_name)
+    
+    try:
+        with open(path, 'r', encoding = 'utf-8') as file:
+            content = load_json(file)
+    except (OSError, UnicodeDecodeError, JSONDecodeError):
+        return None
+    
+    if (not isinstance(content, dict)) or (content.get('version', None) != CACHE_VERSION):
+        return None
+    
+    data = content.get('data', None)
+    if not isinstance(data, dict):
+        return None
+    
+    return data
+
+
+def _create_cache_directory(directory_path):
+    """
+    Creates the cache directory if it does not exist yet, with a `.gitignore` file keeping it out of version control.
+    
+    Parameters
+    ----------
+    directory_path : `str`
+        The cache directory's path.
+    
+    Raises
+    ------
+    OSError
+    """
+    make_directories(directory_path, exist_ok = True)
+    
+    path = join_paths(directory_path, CACHE_FILE_NAME_GITIGNORE)
+    if not exists(path):
+        with open(path, 'w', encoding = 'utf-8') as file:
+            file.write('# Created by vampytest.\n*\n')
+
+
+def write_cache_file(source_directory, file_name, data):
+    """
+    Writes a cache file. Failing to write is ignored, since the cache is only used to speed up later runs.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    file_name : `str`
+        The cache file's name.
+    data : `dict<str, object>`
+        Json serializable data to write.
+    
+    Returns
+    -------
+    written : `bool`
+    """
+    directory_path = get_cache_directory_path(source_directory)
+    path = join_paths(directory_path, file_name)
+    temporary_path = path + '.tmp'
+    
+    try:
+        _create_cache_directory(directory_path)
+        
+        with open(temporary_path, 'w', encoding = 'utf-8') as file:
+            dump_json({'version': CACHE_VERSION, 'data': data}, file)
+        
+        replace_file(temporary_path, path)
+    except OSError:
+        return False
+    
+    return True
+
+
+def clear_cache_directory(source_directory):
+    """
+    Removes the cache directory with all of its content.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The path to run tests from.
+    """
+    remove_tree(get_cache_directory_path(source_directory), ignore_errors = True)
@@ -0,0 +1,81 @@
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq, assert_false, assert_instance, assert_true
+from ...utils import _
+from ...wrappers import call_from
+
+from ..dependencies import DependencyMap
+
+
+def test__DependencyMap__new():
+    """
+    Tests whether ``DependencyMap.__new__`` works as intended.
+    """
+    dependency_map = DependencyMap('/koishi', {})
+    assert_instance(dependency_map, DependencyMap)
+    assert_eq(dependency_map.dependencies, {})
+    assert_false(dependency_map.modified)
+    assert_eq(dependency_map.source_directory, '/koishi')
+
+
+def _iter_options__is_affected():
+    dependencies = {'/test_satori.py': frozenset(('/satori.py', '/orin.py'))}
+    
+    yield dependencies, '/test_satori.py', frozenset(('/orin.py',)), True
+    yield dependencies, '/test_satori.py', frozenset(('/okuu.py',)), False
+    yield dependencies, '/test_satori.py', frozenset(('/test_satori.py',)), True
+    yield dependencies, '/test_koishi.py', frozenset(('/okuu.py',)), True
+    yield dependencies, '/test_satori.py', frozenset(), False
+
+
+@_(call_from(_iter_options__is_affected()).returning_last())
+def test__DependencyMap__is_affected(dependencies, path, changed_file_paths):
+    """
+    Tests whether ``DependencyMap.is_affected`` works as intended.
+    
+    Parameters
+    ----------
+    dependencies : `dict<str, frozenset<str>>`
+        Test file paths mapped to the paths of the project source files they depend on.
+    path : `str`
+        Normalized path of the test file.
+    changed_file_paths : `frozenset<str>`
+        The normalized paths of the changed files.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    return DependencyMap('/koishi', dependencies).is_affected(path, changed_file_paths)
+
+
+def test__DependencyMap__set_dependencies():
+    """
+    Tests whether ``DependencyMap.set_dependencies`` works as intended.
+    """
+    dependency_map = DependencyMap('/koishi', {'/test_satori.py': frozenset(('/satori.py',))})
+    
+    dependency_map.set_dependencies('/test_satori.py', ['/satori.py'])
+    assert_false(dependency_map.modified)
+    
+    dependency_map.set_dependencies('/test_satori.py', ['/satori.py', '/orin.py'])
+    assert_true(dependency_map.modified)
+    assert_eq(dependency_map.dependencies, {'/test_satori.py': frozenset(('/satori.py', '/orin.py'))})
+
+
+def test__DependencyMap__save():
+    """
+    Tests whether ``DependencyMap.save`` works as intended.
+    
+    Case: saving and loading back.
+    """
+    with TemporaryDirectory() as directory_path:
+        dependency_map = DependencyMap(directory_path, {})
+        assert_false(dependency_map.save())
+        
+        dependency_map.set_dependencies('/test_satori.py', ['/satori.py', '/orin.py'])
+        assert_true(dependency_map.save())
+        assert_false(dependency_map.modified)
+        
+        loaded_dependency_map = DependencyMap.load(directory_path)
+        assert_eq(loaded_dependency_map.dependencies, dependency_map.dependencies)
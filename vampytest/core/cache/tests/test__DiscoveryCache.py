@@ -0,0 +1,99 @@
+from os import stat as get_stat
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq, assert_false, assert_instance, assert_is, assert_true
+
+from ..discovery import DiscoveryCache
+
+
+class StatResult:
+    """
+    Stat result with only the fields used by the discovery cache.
+    
+    Attributes
+    ----------
+    st_ino : `int`
+        Inode.
+    st_mtime_ns : `int`
+        Modification time in nanoseconds.
+    """
+    __slots__ = ('st_ino', 'st_mtime_ns')
+    
+    def __new__(cls, st_mtime_ns, st_ino):
+        """
+        Creates a new stat result.
+        
+        Parameters
+        ----------
+        st_mtime_ns : `int`
+            Modification time in nanoseconds.
+        st_ino : `int`
+            Inode.
+        """
+        self = object.__new__(cls)
+        self.st_ino = st_ino
+        self.st_mtime_ns = st_mtime_ns
+        return self
+
+
+def test__DiscoveryCache__new():
+    """
+    Tests whether ``DiscoveryCache.__new__`` works as intended.
+    """
+    discovery_cache = DiscoveryCache('/koishi', frozenset(('.git',)), {})
+    assert_instance(discovery_cache, DiscoveryCache)
+    assert_eq(discovery_cache.directories, {})
+    assert_false(discovery_cache.modified)
+    assert_eq(discovery_cache.prune_names, frozenset(('.git',)))
+    assert_eq(discovery_cache.source_directory, '/koishi')
+
+
+def test__DiscoveryCache__get_listing():
+    """
+    Tests whether ``DiscoveryCache.get_listing`` works as intended.
+    """
+    listing = [('tests', True)]
+    discovery_cache = DiscoveryCache('/koishi', frozenset(), {'/koishi/satori': (12, 6, listing)})
+    
+    assert_is(discovery_cache.get_listing('/koishi/satori', StatResult(12, 6)), listing)
+    assert_is(discovery_cache.get_listing('/koishi/satori', StatResult(13, 6)), None)
+    assert_is(discovery_cache.get_listing('/koishi/satori', StatResult(12, 7)), None)
+    assert_is(discovery_cache.get_listing('/koishi/orin', StatResult(12, 6)), None)
+
+
+def test__DiscoveryCache__set_listing():
+    """
+    Tests whether ``DiscoveryCache.set_listing`` works as intended.
+    """
+    discovery_cache = DiscoveryCache('/koishi', frozenset(), {'/koishi/orin': (12, 6, [])})
+    
+    discovery_cache.set_listing('/koishi/satori', StatResult(12, 6), [('tests', True)])
+    assert_eq(discovery_cache.directories.get('/koishi/satori', None), (12, 6, [('tests', True)]))
+    assert_true(discovery_cache.modified)
+    
+    # Recently modified directories are not cached.
+    discovery_cache.set_listing('/koishi/orin', StatResult(1 << 62, 6), [])
+    assert_is(discovery_cache.directories.get('/koishi/orin', None), None)
+
+
+def test__DiscoveryCache__save():
+    """
+    Tests whether ``DiscoveryCache.save`` works as intended.
+    
+    Case: saving and loading back.
+    """
+    with TemporaryDirectory() as directory_path:
+        discovery_cache = DiscoveryCache(directory_path, frozenset(('.git',)), {})
+        assert_false(discovery_cache.save())
+        
+        stat_result = get_stat(directory_path)
+        discovery_cache.directories[directory_path] = (stat_result.st_mtime_ns, stat_result.st_ino, [('tests', True)])
+        discovery_cache.modified = True
+        assert_true(discovery_cache.save())
+        assert_false(discovery_cache.modified)
+        
+        loaded_discovery_cache = DiscoveryCache.load(directory_path, frozenset(('.git',)))
+        assert_eq(loaded_discovery_cache.directories, discovery_cache.directories)
+        
+        loaded_discovery_cache = DiscoveryCache.load(directory_path, frozenset())
+        assert_eq(loaded_discovery_cache.directories, {})
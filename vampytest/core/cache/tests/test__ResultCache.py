@@ -0,0 +1,146 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq, assert_false, assert_instance, assert_is, assert_ne, assert_true
+from ...result import DetachedResult, ResultTimings
+
+from ..result_cache import ResultCache
+
+
+class TestCase:
+    """
+    Test case with only the fields used by the result cache.
+    
+    Attributes
+    ----------
+    import_route : `str`
+        The test file's import route.
+    name : `str`
+        The test's name.
+    """
+    __slots__ = ('import_route', 'name')
+    
+    def __new__(cls, import_route, name):
+        """
+        Creates a new test case.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        name : `str`
+            The test's name.
+        """
+        self = object.__new__(cls)
+        self.import_route = import_route
+        self.name = name
+        return self
+
+
+def test__ResultCache__new():
+    """
+    Tests whether ``ResultCache.__new__`` works as intended.
+    """
+    result_cache = ResultCache('/koishi', {})
+    assert_instance(result_cache, ResultCache)
+    assert_eq(result_cache.cases, {})
+    assert_false(result_cache.modified)
+    assert_eq(result_cache.source_directory, '/koishi')
+
+
+def test__ResultCache__get_file_key():
+    """
+    Tests whether ``ResultCache.get_file_key`` works as intended.
+    """
+    with TemporaryDirectory() as directory_path:
+        path_0 = join_paths(directory_path, 'satori.py')
+        path_1 = join_paths(directory_path, 'orin.py')
+        
+        with open(path_0, 'w') as file:
+            file.write('satori')
+        
+        with open(path_1, 'w') as file:
+            file.write('orin')
+        
+        result_cache = ResultCache(directory_path, {})
+        file_key = result_cache.get_file_key([path_0, path_1])
+        assert_instance(file_key, str)
+        assert_eq(result_cache.get_file_key([path_0, path_1]), file_key)
+        assert_ne(result_cache.get_file_key([path_0]), file_key)
+        assert_is(result_cache.get_file_key(None), None)
+        assert_is(result_cache.get_file_key([join_paths(directory_path, 'okuu.py')]), None)
+        
+        with open(path_1, 'w') as file:
+            file.write('okuu')
+        
+        assert_ne(ResultCache(directory_path, {}).get_file_key([path_0, path_1]), file_key)
+
+
+def test__ResultCache__get_cached_results():
+    """
+    Tests whether ``ResultCache.get_cached_results`` works as intended.
+    """
+    timings_0 = ResultTimings(call_wall_time = 12)
+    timings_1 = ResultTimings(call_wall_time = 6)
+    
+    result_cache = ResultCache(
+        '/koishi',
+        {'koishi.test_satori': ('abc', [('[0]', timings_0), ('[1]', timings_1)])},
+    )
+    
+    test_case = TestCase('koishi', 'test_satori')
+    assert_is(result_cache.get_cached_results(test_case, 'def'), None)
+    assert_is(result_cache.get_cached_results(TestCase('koishi', 'test_orin'), 'abc'), None)
+    
+    results = result_cache.get_cached_results(test_case, 'abc')
+    assert_eq(len(results), 2)
+    
+    for result, case_modifier, timings, continuous in zip(
+        results, ('[0]', '[1]'), (timings_0, timings_1), (True, False)
+    ):
+        assert_instance(result, DetachedResult)
+        assert_is(result.case, test_case)
+        assert_eq(result.case_modifier, case_modifier)
+        assert_is(result.timings, timings)
+        assert_eq(result.continuous, continuous)
+        assert_true(result.is_passed())
+        assert_true(result.is_cached())
+        assert_false(result.is_failed())
+
+
+def test__ResultCache__set_case_results():
+    """
+    Tests whether ``ResultCache.set_case_results`` and ``ResultCache.remove_case_results`` work as intended.
+    """
+    timings = ResultTimings(call_wall_time = 12)
+    
+    result_cache = ResultCache('/koishi', {})
+    result_cache.remove_case_results('koishi', 'test_satori')
+    assert_false(result_cache.modified)
+    
+    result_cache.set_case_results('koishi', 'test_satori', 'abc', [(None, timings)])
+    assert_true(result_cache.modified)
+    assert_eq(result_cache.cases, {'koishi.test_satori': ('abc', [(None, timings)])})
+    
+    result_cache.modified = False
+    result_cache.remove_case_results('koishi', 'test_satori')
+    assert_true(result_cache.modified)
+    assert_eq(result_cache.cases, {})
+
+
+def test__ResultCache__save():
+    """
+    Tests whether ``ResultCache.save`` works as intended.
+    
+    Case: saving and loading back.
+    """
+    with TemporaryDirectory() as directory_path:
+        result_cache = ResultCache(directory_path, {})
+        assert_false(result_cache.save())
+        
+        result_cache.set_case_results('koishi', 'test_satori', 'abc', [('[0]', ResultTimings(call_wall_time = 12))])
+        assert_true(result_cache.save())
+        assert_false(result_cache.modified)
+        
+        loaded_result_cache = ResultCache.load(directory_path)
+        assert_eq(loaded_result_cache.cases, result_cache.cases)
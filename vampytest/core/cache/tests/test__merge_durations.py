@@ -0,0 +1,31 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..durations import merge_durations
+
+
+def _iter_options():
+    yield {}, {}, {}
+    yield {'a': (1.0, {})}, {}, {'a': (1.0, {})}
+    yield {'a': (1.0, {'test': 1.0})}, {'a': (2.0, {'test': 2.0})}, {'a': (2.0, {'test': 2.0})}
+    yield {'a': (1.0, {'test': 1.0})}, {'a': (None, {'test': 2.0})}, {'a': (1.0, {'test': 2.0})}
+    yield {'a': (1.0, {})}, {'b': (2.0, {})}, {'a': (1.0, {}), 'b': (2.0, {})}
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__merge_durations(durations, new_durations):
+    """
+    Tests whether ``merge_durations`` works as intended.
+    
+    Parameters
+    ----------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        The old durations.
+    new_durations : `dict<str, (None | float, dict<str, float>)>`
+        The newly recorded durations.
+    
+    Returns
+    -------
+    output : `dict<str, (None | float, dict<str, float>)>`
+    """
+    return merge_durations(durations, new_durations)
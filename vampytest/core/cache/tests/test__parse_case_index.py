@@ -0,0 +1,49 @@
+from ...file import StaticCollection, StaticTestCase
+from ...utils import _
+from ...wrappers import call_from
+
+from ..case_index import parse_case_index
+
+
+def _iter_options():
+    yield None, {}
+    yield {}, {}
+    yield {'files': None}, {}
+    yield (
+        {'files': {'/koishi.py': ['aa', [True, [['test_satori', 6, ['call_with.returning'], False]]]]}},
+        {
+            '/koishi.py': (
+                'aa',
+                StaticCollection([StaticTestCase('test_satori', 6, ('call_with.returning',), False)], True),
+            ),
+        },
+    )
+    yield {'files': {'/koishi.py': ['aa', None]}}, {'/koishi.py': ('aa', None)}
+    yield (
+        {
+            'files': {
+                '/koishi.py': ['aa', [True, [['test_satori', 6, 'call_with', False]]]],
+                '/satori.py': ['aa', [1, []]],
+                '/orin.py': [None, [True, []]],
+                '/okuu.py': ['aa'],
+            },
+        },
+        {},
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_case_index(data):
+    """
+    Tests whether ``parse_case_index`` works as intended.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    output : `dict<str, (str, None | StaticCollection)>`
+    """
+    return parse_case_index(data)
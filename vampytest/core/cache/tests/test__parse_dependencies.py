@@ -0,0 +1,35 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..dependencies import parse_dependencies
+
+
+def _iter_options():
+    yield None, {}
+    yield {}, {}
+    yield {'files': None}, {}
+    yield (
+        {'files': {'/koishi.py': ['/satori.py', '/orin.py'], '/okuu.py': []}},
+        {'/koishi.py': frozenset(('/satori.py', '/orin.py')), '/okuu.py': frozenset()},
+    )
+    yield (
+        {'files': {'/koishi.py': ['/satori.py', 12], '/orin.py': '/okuu.py', '/okuu.py': ['/orin.py']}},
+        {'/okuu.py': frozenset(('/orin.py',))},
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_dependencies(data):
+    """
+    Tests whether ``parse_dependencies`` works as intended.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    output : `dict<str, frozenset<str>>`
+    """
+    return parse_dependencies(data)
@@ -0,0 +1,52 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..discovery import parse_directories
+
+
+def _iter_options():
+    yield None, frozenset(), {}
+    yield {}, frozenset(), {}
+    yield {'prune_names': [], 'directories': None}, frozenset(), {}
+    yield (
+        {'prune_names': ['.git'], 'directories': {'/koishi': [12, 6, [['tests', True], ['satori.py', False]]]}},
+        frozenset(('.git',)),
+        {'/koishi': (12, 6, [('tests', True), ('satori.py', False)])},
+    )
+    yield (
+        {'prune_names': ['.git'], 'directories': {'/koishi': [12, 6, []]}},
+        frozenset(('.git', 'venv')),
+        {},
+    )
+    yield (
+        {
+            'prune_names': [],
+            'directories': {
+                '/koishi': [12, 6, [['tests', 'True']]],
+                '/satori': [12.5, 6, []],
+                '/orin': [12, 6],
+                '/okuu': [12, 6, []],
+            },
+        },
+        frozenset(),
+        {'/okuu': (12, 6, [])},
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_directories(data, prune_names):
+    """
+    Tests whether ``parse_directories`` works as intended.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    
+    Returns
+    -------
+    output : `dict<str, (int, int, list<(str, bool)>)>`
+    """
+    return parse_directories(data, prune_names)
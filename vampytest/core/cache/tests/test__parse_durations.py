@@ -0,0 +1,32 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..durations import parse_durations
+
+
+def _iter_options():
+    yield None, {}
+    yield {}, {}
+    yield {'files': None}, {}
+    yield {'files': {'a': [1, {'test': 2}]}}, {'a': (1.0, {'test': 2.0})}
+    yield {'files': {'a': [None, {'test': 2}]}}, {'a': (None, {'test': 2.0})}
+    yield {'files': {'a': [-1, {'test': 'koishi', 'test_1': True}]}}, {}
+    yield {'files': {'a': [1]}}, {}
+    yield {'files': {'a': [1, None]}}, {'a': (1.0, {})}
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_durations(data):
+    """
+    Tests whether ``parse_durations`` works as intended.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    output : `dict<str, (None | float, dict<str, float>)>`
+    """
+    return parse_durations(data)
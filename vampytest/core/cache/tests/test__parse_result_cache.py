@@ -0,0 +1,93 @@
+from ...result import ResultTimings
+from ...utils import _
+from ...wrappers import call_from
+
+from ..result_cache import parse_result_cache
+
+
+def _iter_options():
+    yield None, {}
+    yield {}, {}
+    yield {'cases': None}, {}
+    yield (
+        {
+            'cases': {
+                'koishi.test_satori': ['abc', [['[0]', 1, 2, 3, 4, 5, 6], [None, 7, 8, 9, 10, 11, 12]]],
+            },
+        },
+        {
+            'koishi.test_satori': (
+                'abc',
+                [
+                    (
+                        '[0]',
+                        ResultTimings(
+                            call_cpu_time = 1,
+                            call_wall_time = 2,
+                            close_time = 3,
+                            enter_time = 4,
+                            exit_time = 5,
+                            start_time = 6,
+                        ),
+                    ),
+                    (
+                        None,
+                        ResultTimings(
+                            call_cpu_time = 7,
+                            call_wall_time = 8,
+                            close_time = 9,
+                            enter_time = 10,
+                            exit_time = 11,
+                            start_time = 12,
+                        ),
+                    ),
+                ],
+            ),
+        },
+    )
+    yield (
+        {
+            'cases': {
+                'koishi.test_satori': [12, [[None, 1, 2, 3, 4, 5, 6]]],
+                'koishi.test_orin': ['abc', []],
+                'koishi.test_okuu': ['abc', [[None, 1, 2, 3, 4, 5]]],
+                'koishi.test_koishi': ['abc', [[None, 1, 2, 3, 4, 5, 6.5]]],
+                'koishi.test_kokoro': ['abc', [[None, 1, 2, 3, 4, 5, 6]]],
+            },
+        },
+        {
+            'koishi.test_kokoro': (
+                'abc',
+                [
+                    (
+                        None,
+                        ResultTimings(
+                            call_cpu_time = 1,
+                            call_wall_time = 2,
+                            close_time = 3,
+                            enter_time = 4,
+                            exit_time = 5,
+                            start_time = 6,
+                        ),
+                    ),
+                ],
+            ),
+        },
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_result_cache(data):
+    """
+    Tests whether ``parse_result_cache`` works as intended.
+    
+    Parameters
+    ----------
+    data : `None | dict<str, object>`
+        The cached data.
+    
+    Returns
+    -------
+    output : `dict<str, (str, list<(None | str, ResultTimings)>)>`
+    """
+    return parse_result_cache(data)
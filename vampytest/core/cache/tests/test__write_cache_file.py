@@ -0,0 +1,24 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq, assert_true
+
+from ..constants import CACHE_DIRECTORY_NAME
+from ..storage import read_cache_file, write_cache_file
+
+
+def test__write_cache_file():
+    """
+    Tests whether ``write_cache_file`` works as intended.
+    
+    Case: the cache directory is created with a `.gitignore` file ignoring its content.
+    """
+    with TemporaryDirectory() as source_directory:
+        output = write_cache_file(source_directory, 'koishi.json', {'satori': 1})
+        assert_true(output)
+        assert_eq(read_cache_file(source_directory, 'koishi.json'), {'satori': 1})
+        
+        with open(join_paths(source_directory, CACHE_DIRECTORY_NAME, '.gitignore'), 'r', encoding = 'utf-8') as file:
+            content = file.read()
+    
+    assert_eq(content.splitlines()[-1], '*')
@@ -1,6 +1,7 @@
 from .base import *
 from .calling import *
 from .garbage_collect import *
+from .output_buffer import *
 from .output_capturing import *
 
 
@@ -8,5 +9,6 @@ __all__ = (
     *base.__all__,
     *calling.__all__,
     *garbage_collect.__all__,
+    *output_buffer.__all__,
     *output_capturing.__all__,
 )
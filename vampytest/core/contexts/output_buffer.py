@@ -0,0 +1,268 @@
+__all__ = ('OutputBuffer',)
+
+from io import BytesIO, SEEK_END, TextIOBase, UnsupportedOperation
+from tempfile import TemporaryFile
+
+
+ENCODING = 'utf-8'
+
+
+class OutputBuffer(TextIOBase):
+    """
+    Text stream capturing output with a bounded memory usage.
+    
+    The output is kept in memory till its size reaches the memory limit, then it is spilled into a temporary file.
+    When the output is read back and it is over the limit, only its head and tail are kept, each up to half of the
+    limit.
+    
+    Attributes
+    ----------
+    _file : `None | FileIO`
+        The temporary file the output is spilled into. Unbuffered, so it can be shared with file descriptors.
+    _memory : ``BytesIO``
+        The output kept in memory.
+    memory_limit : `int`
+        The maximal size of the output in bytes to keep in memory.
+    """
+    __slots__ = ('_file', '_memory', 'memory_limit')
+    
+    def __new__(cls, memory_limit):
+        """
+        Creates a new output buffer.
+        
+        Parameters
+        ----------
+        memory_limit : `int`
+            The maximal size of the output in bytes to keep in memory.
+        """
+        self = TextIOBase.__new__(cls)
+        self._file = None
+        self._memory = BytesIO()
+        self.memory_limit = memory_limit
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the output buffer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' memory_limit = ')
+        repr_parts.append(repr(self.memory_limit))
+        
+        if (self._file is not None):
+            repr_parts.append(', spilled = True')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @property
+    def encoding(self):
+        """
+        Returns the encoding the output is stored with.
+        
+        Returns
+        -------
+        encoding : `str`
+        """
+        return ENCODING
+    
+    
+    def fileno(self):
+        """
+        Returns the file descriptor of the temporary file the output is spilled into.
+        
+        Returns
+        -------
+        file_descriptor : `int`
+        
+        Raises
+        ------
+        UnsupportedOperation
+            - If the output is not spilled.
+        """
+        file = self._file
+        if (file is None):
+            raise UnsupportedOperation('fileno')
+        
+        return file.fileno()
+    
+    
+    def writable(self):
+        """
+        Returns whether the stream can be written into.
+        
+        Returns
+        -------
+        writable : `bool`
+        """
+        return True
+    
+    
+    def write(self, value):
+        """
+        Writes the given value into the buffer.
+        
+        Parameters
+        ----------
+        value : `str`
+            The value to write.
+        
+        Returns
+        -------
+        written : `int`
+        """
+        self.write_bytes(value.encode(ENCODING, 'replace'))
+        return len(value)
+    
+    
+    def write_bytes(self, value):
+        """
+        Writes the given encoded value into the buffer.
+        
+        Parameters
+        ----------
+        value : `bytes`
+            The value to write.
+        """
+        file = self._file
+        if (file is None):
+            memory = self._memory
+            if memory.tell() + len(value) <= self.memory_limit:
+                memory.write(value)
+                return
+            
+            file = self.spill()
+        
+        _write_all(file, value)
+    
+    
+    def spill(self):
+        """
+        Moves the output kept in memory into a temporary file. Further output is written into the file as well.
+        
+        Returns
+        -------
+        file : `FileIO`
+            The temporary file.
+        """
+        file = self._file
+        if (file is None):
+            file = TemporaryFile('w+b', buffering = 0)
+            self._file = file
+            
+            memory = self._memory
+            _write_all(file, memory.getvalue())
+            memory.seek(0)
+            memory.truncate(0)
+        
+        return file
+    
+    
+    def getvalue(self):
+        """
+        Returns the captured output. If it is over the memory limit, its middle part is truncated.
+        
+        Returns
+        -------
+        output : `str`
+        """
+        file = self._file
+        if (file is None):
+            return self._memory.getvalue().decode(ENCODING, 'replace')
+        
+        size = file.seek(0, SEEK_END)
+        memory_limit = self.memory_limit
+        
+        if size <= memory_limit:
+            file.seek(0)
+            output = _read_exactly(file, size).decode(ENCODING, 'replace')
+        
+        else:
+            head_size = memory_limit >> 1
+            tail_size = memory_limit - head_size
+            
+            file.seek(0)
+            head = _read_exactly(file, head_size).decode(ENCODING, 'replace')
+            file.seek(size - tail_size)
+            tail = _read_exactly(file, tail_size).decode(ENCODING, 'replace')
+            
+            output = f'{head}\n... {size - head_size - tail_size} bytes of output truncated ...\n{tail}'
+        
+        file.seek(0, SEEK_END)
+        return output
+    
+    
+    def clear(self):
+        """
+        Clears the captured output.
+        """
+        memory = self._memory
+        memory.seek(0)
+        memory.truncate(0)
+        
+        file = self._file
+        if (file is not None):
+            file.seek(0)
+            file.truncate(0)
+    
+    
+    def close(self):
+        """
+        Closes the buffer, releasing its temporary file.
+        """
+        file = self._file
+        if (file is not None):
+            self._file = None
+            file.close()
+        
+        TextIOBase.close(self)
+
+
+def _write_all(file, data):
+    """
+    Writes all of the given data into the file. Unbuffered files might write only a part of it at once.
+    
+    Parameters
+    ----------
+    file : `FileIO`
+        The file to write into.
+    data : `bytes`
+        The data to write.
+    """
+    data = memoryview(data)
+    
+    while data:
+        written = file.write(data)
+        if written is None:
+            continue
+        
+        data = data[written:]
+
+
+def _read_exactly(file, size):
+    """
+    Reads the given amount of bytes from the file's current position, or less if the file ends sooner.
+    
+    Parameters
+    ----------
+    file : `FileIO`
+        The file to read from.
+    size : `int`
+        The amount of bytes to read.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    chunks = []
+    
+    while size > 0:
+        chunk = file.read(size)
+        if not chunk:
+            break
+        
+        chunks.append(chunk)
+        size -= len(chunk)
+    
+    return b''.join(chunks)
@@ -1,49 +1,246 @@
-__all__ = ('ContextOutputCapturing',)
+__all__ = (
+    'ContextOutputCapturing', 'DEFAULT_OUTPUT_MEMORY_LIMIT', 'OUTPUT_CAPTURE_MODES', 'OUTPUT_CAPTURE_MODE_FD',
+    'OUTPUT_CAPTURE_MODE_SYS'
+)
 
 import sys
-from io import StringIO
+from os import close as close_file_descriptor, dup, dup2
 
 from scarletio import copy_docs
 
 from .base import ContextBase
+from .output_buffer import OutputBuffer
+
+
+# Captures the output written into `sys.stdout` and `sys.stderr`.
+OUTPUT_CAPTURE_MODE_SYS = 'sys'
+# Captures the output written into the standard output and error file descriptors as well, like the ones of
+# C extensions and of sub-processes.
+OUTPUT_CAPTURE_MODE_FD = 'fd'
+
+OUTPUT_CAPTURE_MODES = (OUTPUT_CAPTURE_MODE_FD, OUTPUT_CAPTURE_MODE_SYS)
+
+DEFAULT_OUTPUT_MEMORY_LIMIT = 1 << 20
+
+STANDARD_FILE_DESCRIPTORS = (1, 2)
+
+
+def _flush_stream(stream):
+    """
+    Flushes the given stream ignoring the errors, so their buffered output is written before redirecting.
+    
+    Parameters
+    ----------
+    stream : `None | io-like`
+        The stream to flush.
+    """
+    if stream is None:
+        return
+    
+    try:
+        stream.flush()
+    except BaseException:
+        pass
 
 
 class ContextOutputCapturing(ContextBase):
     """
     Captures output.
-
+    
     Attributes
     ----------
+    _saved_file_descriptors : `None | tuple<int>`
+        Duplicates of the standard file descriptors to restore them from, while they are redirected.
+    memory_limit : `int`
+        The maximal size of the output in bytes to keep in memory. Over it, the output is spilled into a temporary file
+        and only its head and tail is kept.
+    mode : `str`
+        How the output is captured. Can be either `OUTPUT_CAPTURE_MODE_SYS` or `OUTPUT_CAPTURE_MODE_FD`.
     standard_error_stream : `None`, `io-like`
         Standard error stream.
     standard_output_stream : `None`, `io-like`
         Standard output stream.
-    stream : `None`, ``StringIO``
+    stream : `None`, ``OutputBuffer``
         Stream to capture stdout and stderr into.
+    
+    Class Attributes
+    ----------------
+    default_memory_limit : `int` = `DEFAULT_OUTPUT_MEMORY_LIMIT`
+        The memory limit used if not given.
+    default_mode : `str` = `OUTPUT_CAPTURE_MODE_SYS`
+        The mode used if not given.
     """
-    __slots__ = ('standard_error_stream', 'standard_output_stream', 'stream')
+    __slots__ = (
+        '_saved_file_descriptors', 'memory_limit', 'mode', 'standard_error_stream', 'standard_output_stream', 'stream'
+    )
+    
+    default_memory_limit = DEFAULT_OUTPUT_MEMORY_LIMIT
+    default_mode = OUTPUT_CAPTURE_MODE_SYS
     
-    def __new__(cls):
+    def __new__(cls, *, memory_limit = None, mode = None):
         """
         Creates a new test context.
+        
+        Parameters
+        ----------
+        memory_limit : `None | int` = `None`, Optional (Keyword only)
+            The maximal size of the output in bytes to keep in memory. Defaults to ``.default_memory_limit``.
+        mode : `None | str` = `None`, Optional (Keyword only)
+            How the output is captured. Defaults to ``.default_mode``.
         """
+        if memory_limit is None:
+            memory_limit = cls.default_memory_limit
+        
+        if mode is None:
+            mode = cls.default_mode
+        
         self = object.__new__(cls)
+        self._saved_file_descriptors = None
+        self.memory_limit = memory_limit
+        self.mode = mode
         self.stream = None
         self.standard_error_stream = None
         self.standard_output_stream = None
         return self
     
     
+    @classmethod
+    def set_defaults(cls, *, memory_limit = None, mode = None):
+        """
+        Sets the defaults used by the output capturing contexts created afterwards.
+        
+        Parameters
+        ----------
+        memory_limit : `None | int` = `None`, Optional (Keyword only)
+            The maximal size of the output in bytes to keep in memory. If `None`, resets it.
+        mode : `None | str` = `None`, Optional (Keyword only)
+            How the output is captured. If `None`, resets it.
+        """
+        if memory_limit is None:
+            memory_limit = DEFAULT_OUTPUT_MEMORY_LIMIT
+        
+        if mode is None:
+            mode = OUTPUT_CAPTURE_MODE_SYS
+        
+        cls.default_memory_limit = memory_limit
+        cls.default_mode = mode
+    
+    
+    @copy_docs(ContextBase.__repr__)
+    def __repr__(self):
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' mode = ')
+        repr_parts.append(repr(self.mode))
+        
+        repr_parts.append(', memory_limit = ')
+        repr_parts.append(repr(self.memory_limit))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
     @copy_docs(ContextBase.start)
     def start(self):
-        stream = StringIO()
+        stream = OutputBuffer(self.memory_limit)
         self.stream = stream
-        self.standard_output_stream = sys.stdout
-        self.standard_error_stream = sys.stderr
+        
+        if self.mode == OUTPUT_CAPTURE_MODE_FD:
+            # The file descriptors can be redirected only into a file.
+            stream.spill()
+        
+        self._capture()
+    
+    
+    def _capture(self):
+        """
+        Redirects the standard streams into the context's stream.
+        """
+        stream = self.stream
+        standard_output_stream = sys.stdout
+        standard_error_stream = sys.stderr
+        
+        if self.mode == OUTPUT_CAPTURE_MODE_FD:
+            _flush_stream(standard_output_stream)
+            _flush_stream(standard_error_stream)
+            
+            saved_file_descriptors = []
+            try:
+                for file_descriptor in STANDARD_FILE_DESCRIPTORS:
+                    saved_file_descriptors.append(dup(file_descriptor))
+            except OSError:
+                # The standard file descriptors are not open, nothing to capture from them.
+                for saved_file_descriptor in saved_file_descriptors:
+                    close_file_descriptor(saved_file_descriptor)
+            
+            else:
+                file_descriptor_to_capture_into = stream.fileno()
+                for file_descriptor in STANDARD_FILE_DESCRIPTORS:
+                    dup2(file_descriptor_to_capture_into, file_descriptor)
+                
+                self._saved_file_descriptors = tuple(saved_file_descriptors)
+        
+        self.standard_output_stream = standard_output_stream
+        self.standard_error_stream = standard_error_stream
         sys.stdout = stream
         sys.stderr = stream
     
     
+    def suspend(self):
+        """
+        Restores the standard streams while the context is started, so the output can be captured differently. Used
+        when the test is ran concurrently with other tests, because then its output is captured per task.
+        """
+        standard_output_stream = self.standard_output_stream
+        if standard_output_stream is None:
+            # Was not started or is suspended
+            return
+        
+        sys.stdout = standard_output_stream
+        sys.stderr = self.standard_error_stream
+        self.standard_output_stream = None
+        self.standard_error_stream = None
+        
+        saved_file_descriptors = self._saved_file_descriptors
+        if (saved_file_descriptors is not None):
+            self._saved_file_descriptors = None
+            
+            for file_descriptor, saved_file_descriptor in zip(STANDARD_FILE_DESCRIPTORS, saved_file_descriptors):
+                dup2(saved_file_descriptor, file_descriptor)
+                close_file_descriptor(saved_file_descriptor)
+    
+    
+    def resume(self):
+        """
+        Captures the standard streams again after the context was suspended.
+        """
+        stream = self.stream
+        if (stream is None) or (self.standard_output_stream is not None):
+            # Was not started or is not suspended
+            return
+        
+        self._capture()
+    
+    
+    def pop_output(self):
+        """
+        Returns the output captured so far and clears it. Used to split the output of a generator test between the
+        results of its yielded values.
+        
+        Returns
+        -------
+        output : `str`
+        """
+        stream = self.stream
+        if stream is None:
+            # Was not started
+            return ''
+        
+        output = stream.getvalue()
+        stream.clear()
+        return output
+    
+    
     @copy_docs(ContextBase.close)
     def close(self, result):
         stream = self.stream
@@ -51,12 +248,11 @@ class ContextOutputCapturing(ContextBase):
             # Was not started
             return
         
-        sys.stdout = self.standard_output_stream
-        sys.stderr = self.standard_error_stream
-        self.standard_output_stream = None
-        self.standard_error_stream = None
+        self.suspend()
         
         if (result is not None):
             output = stream.getvalue()
             if output:
                 result.with_output(output)
+        
+        stream.close()
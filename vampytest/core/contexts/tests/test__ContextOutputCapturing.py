@@ -0,0 +1,123 @@
+import sys
+from os import write as write_file_descriptor
+
+from ...assertions import assert_eq, assert_in, assert_is
+
+from ..output_capturing import ContextOutputCapturing, OUTPUT_CAPTURE_MODE_FD, OUTPUT_CAPTURE_MODE_SYS
+
+
+class Result:
+    """
+    Result stand-in.
+    
+    Attributes
+    ----------
+    output : `None | str`
+        The attached output.
+    """
+    __slots__ = ('output',)
+    
+    def __new__(cls):
+        """
+        Creates a new result stand-in.
+        """
+        self = object.__new__(cls)
+        self.output = None
+        return self
+    
+    
+    def with_output(self, output):
+        """
+        Attaches the given output.
+        
+        Parameters
+        ----------
+        output : `str`
+            The output to attach.
+        
+        Returns
+        -------
+        self : `instance<type<self>>`
+        """
+        self.output = output
+        return self
+
+
+def test__ContextOutputCapturing__sys():
+    """
+    Tests whether ``ContextOutputCapturing`` works as intended.
+    
+    Case: sys mode.
+    """
+    standard_output_stream = sys.stdout
+    result = Result()
+    
+    context = ContextOutputCapturing(mode = OUTPUT_CAPTURE_MODE_SYS)
+    context.start()
+    try:
+        sys.stdout.write('hey ')
+        sys.stderr.write('mister')
+    finally:
+        context.close(result)
+    
+    assert_is(sys.stdout, standard_output_stream)
+    assert_eq(result.output, 'hey mister')
+
+
+def test__ContextOutputCapturing__fd():
+    """
+    Tests whether ``ContextOutputCapturing`` works as intended.
+    
+    Case: fd mode.
+    """
+    standard_output_stream = sys.stdout
+    result = Result()
+    
+    context = ContextOutputCapturing(mode = OUTPUT_CAPTURE_MODE_FD)
+    context.start()
+    try:
+        sys.stdout.write('hey ')
+        write_file_descriptor(1, b'mister ')
+        write_file_descriptor(2, b'okuu')
+    finally:
+        context.close(result)
+    
+    assert_is(sys.stdout, standard_output_stream)
+    assert_eq(result.output, 'hey mister okuu')
+
+
+def test__ContextOutputCapturing__memory_limit():
+    """
+    Tests whether ``ContextOutputCapturing`` works as intended.
+    
+    Case: over the memory limit.
+    """
+    result = Result()
+    
+    context = ContextOutputCapturing(memory_limit = 8)
+    context.start()
+    try:
+        sys.stdout.write('a' * 6 + 'b' * 20 + 'c' * 6)
+    finally:
+        context.close(result)
+    
+    assert_in('24 bytes of output truncated', result.output)
+
+
+def test__ContextOutputCapturing__pop_output():
+    """
+    Tests whether ``ContextOutputCapturing.pop_output`` works as intended.
+    """
+    result = Result()
+    
+    context = ContextOutputCapturing()
+    context.start()
+    try:
+        sys.stdout.write('hey')
+        output = context.pop_output()
+        sys.stdout.write('mister')
+    finally:
+        context.close(result)
+    
+    assert_eq(output, 'hey')
+    assert_eq(result.output, 'mister')
@@ -0,0 +1,85 @@
+from ...assertions import assert_eq, assert_in, assert_instance, assert_is, assert_is_not
+
+from ..output_buffer import OutputBuffer
+
+
+def _assert_fields_set(output_buffer):
+    """
+    Asserts whether every fields are set of the given output buffer.
+    
+    Parameters
+    ----------
+    output_buffer : ``OutputBuffer``
+        The output buffer to check.
+    """
+    assert_instance(output_buffer, OutputBuffer)
+    assert_instance(output_buffer.memory_limit, int)
+
+
+def test__OutputBuffer__new():
+    """
+    Tests whether ``OutputBuffer.__new__`` works as intended.
+    """
+    memory_limit = 16
+    
+    output_buffer = OutputBuffer(memory_limit)
+    try:
+        _assert_fields_set(output_buffer)
+        assert_eq(output_buffer.memory_limit, memory_limit)
+        assert_is(output_buffer._file, None)
+    finally:
+        output_buffer.close()
+
+
+def test__OutputBuffer__write__in_memory():
+    """
+    Tests whether ``OutputBuffer.write`` works as intended.
+    
+    Case: under the memory limit.
+    """
+    output_buffer = OutputBuffer(16)
+    try:
+        output_buffer.write('hey ')
+        output_buffer.write('mister')
+        
+        assert_is(output_buffer._file, None)
+        assert_eq(output_buffer.getvalue(), 'hey mister')
+    finally:
+        output_buffer.close()
+
+
+def test__OutputBuffer__write__spilled():
+    """
+    Tests whether ``OutputBuffer.write`` works as intended.
+    
+    Case: over the memory limit.
+    """
+    output_buffer = OutputBuffer(8)
+    try:
+        output_buffer.write('a' * 6)
+        output_buffer.write('b' * 20)
+        output_buffer.write('c' * 6)
+        
+        assert_is_not(output_buffer._file, None)
+        
+        output = output_buffer.getvalue()
+        assert_eq(output[:4], 'aaaa')
+        assert_eq(output[-4:], 'cccc')
+        assert_in('24 bytes of output truncated', output)
+    finally:
+        output_buffer.close()
+
+
+def test__OutputBuffer__clear():
+    """
+    Tests whether ``OutputBuffer.clear`` works as intended.
+    """
+    output_buffer = OutputBuffer(8)
+    try:
+        output_buffer.write('hey mister')
+        output_buffer.clear()
+        output_buffer.write('okuu')
+        
+        assert_eq(output_buffer.getvalue(), 'okuu')
+    finally:
+        output_buffer.close()
@@ -1,16 +1,24 @@
+from .asyncio_coroutine import *
 from .configuration import *
 from .constants import *
 from .default import *
+from .generator import *
 from .helpers import *
 from .manager import *
 from .scarletio_coroutine import *
+from .scarletio_coroutine_generator import *
+from .timeout import *
 
 
 __all__ = (
+    *asyncio_coroutine.__all__,
     *configuration.__all__,
     *constants.__all__,
     *default.__all__,
+    *generator.__all__,
     *helpers.__all__,
     *manager.__all__,
     *scarletio_coroutine.__all__,
+    *scarletio_coroutine_generator.__all__,
+    *timeout.__all__,
 )
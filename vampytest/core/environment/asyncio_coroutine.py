@@ -0,0 +1,282 @@
+__all__ = ('AsyncioCoroutineEnvironment',)
+
+from asyncio import gather, new_event_loop, sleep, wait
+
+from scarletio import copy_docs
+
+from ..handling import ResultState
+
+from .constants import ENVIRONMENT_TYPE_COROUTINE
+from .default import DefaultEnvironment
+
+
+try:
+    from asyncio import all_tasks
+except ImportError:
+    # python 3.6
+    from asyncio import Task
+    all_tasks = Task.all_tasks
+
+
+DEFAULT_TIMEOUT = 60.0
+
+
+def _close_event_loop(event_loop):
+    """
+    Cancels the tasks left on the given event loop, then closes it.
+    
+    Parameters
+    ----------
+    event_loop : ``AbstractEventLoop``
+        The event loop to close.
+    """
+    tasks = [task for task in all_tasks(event_loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    
+    if tasks:
+        event_loop.run_until_complete(gather(*tasks, return_exceptions = True))
+    
+    event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+    event_loop.close()
+
+
+class AsyncioCoroutineEnvironment(DefaultEnvironment):
+    """
+    Implements an asyncio coroutine environment.
+    
+    The tests are ran on the same event loop one after the other. After each test the tasks left behind on the event
+    loop are written into the test's output, then cancelled, so the next tests are still isolated.
+    
+    Attributes
+    ----------
+    _created_event_loop : `None | AbstractEventLoop`
+        The event loop created by the environment.
+    
+    _event_loop_module_name : `None | str`
+        The name of the module the created event loop runs the tests of. Used only if `per_file` is `True`.
+    
+    event_loop : `None | AbstractEventLoop`
+        The event loop to use to run the tests in.
+        
+        Defaults to creating a new event loop for the whole session or for each test file if set as `None`.
+    
+    per_file : `bool`
+        Whether a new event loop should be created for the tests of each test file, instead of using the same one for
+        the whole session.
+    
+    timeout : `None | float`
+        The maximal timeout to interrupt each test after.
+    
+    Class Attributes
+    ----------------
+    identifier : `int` = `ENVIRONMENT_TYPE_COROUTINE`
+        Represents for which environment the test is applicable for.
+    """
+    __slots__ = ('_created_event_loop', '_event_loop_module_name', 'event_loop', 'per_file')
+    
+    identifier = ENVIRONMENT_TYPE_COROUTINE
+    
+    def __new__(cls, *, event_loop = None, per_file = False, timeout = DEFAULT_TIMEOUT):
+        """
+        Parameters
+        ----------
+        event_loop : `None | AbstractEventLoop` = `None`, Optional (Keyword only)
+            The event loop to use to run the tests in.
+            
+            Defaults to creating a new event loop for the whole session or for each test file if given as `None`.
+        
+        per_file : `bool` = `False`, Optional (Keyword only)
+            Whether a new event loop should be created for the tests of each test file.
+        
+        timeout : `None | float` = `DEFAULT_TIMEOUT`, Optional (Keyword only)
+            The maximal timeout to interrupt each test after.
+        """
+        self = object.__new__(cls)
+        self._created_event_loop = None
+        self._event_loop_module_name = None
+        self.event_loop = event_loop
+        self.per_file = per_file
+        self.timeout = timeout
+        return self
+    
+    
+    def _get_event_loop(self, test):
+        """
+        Returns the event loop to run the given test on.
+        
+        Parameters
+        ----------
+        test : `FunctionType`
+            The test to run.
+        
+        Returns
+        -------
+        event_loop : ``AbstractEventLoop``
+        """
+        event_loop = self.event_loop
+        if (event_loop is not None):
+            return event_loop
+        
+        event_loop = self._created_event_loop
+        
+        if self.per_file:
+            module_name = getattr(test, '__module__', None)
+            if (event_loop is not None) and (self._event_loop_module_name != module_name):
+                self._created_event_loop = None
+                _close_event_loop(event_loop)
+                event_loop = None
+            
+            self._event_loop_module_name = module_name
+        
+        if (event_loop is None) or event_loop.is_closed():
+            event_loop = new_event_loop()
+            self._created_event_loop = event_loop
+        
+        return event_loop
+    
+    
+    @copy_docs(DefaultEnvironment.run)
+    def run(self, test, positional_parameters, keyword_parameters):
+        event_loop = self._get_event_loop(test)
+        
+        try:
+            result_state = self._run_in(event_loop, test, positional_parameters, keyword_parameters)
+            leak_message = self._check_leaks(event_loop)
+            if (leak_message is not None):
+                result_state = result_state.with_leak(leak_message)
+        except KeyboardInterrupt as exception:
+            # In case it is frozen lets provide a better output. Better than nothing.
+            raise KeyboardInterrupt(
+                f'`{type(self).__name__}.run` interrupted while running {test!r}.'
+            ) from exception
+        
+        return result_state
+    
+    
+    def _run_in(self, event_loop, test, positional_parameters, keyword_parameters):
+        """
+        Runs the defined test with the given parameters on the given event loop.
+        
+        Parameters
+        ----------
+        event_loop : ``AbstractEventLoop``
+            The event loop to run on.
+        test : `FunctionType`
+            The test to call
+        positional_parameters : `list` of `object`
+            Positional parameters to call the test with.
+        keyword_parameters : `dict<str, object>`
+            Keyword parameters to call the test with.
+        
+        Returns
+        -------
+        result_state : ``ResultState``
+            The result's product.
+        
+        Raises
+        ------
+        KeyboardInterrupt
+        """
+        try:
+            task = event_loop.create_task(test(*positional_parameters, **keyword_parameters))
+        except BaseException as raised_exception:
+            return ResultState().with_raise(raised_exception)
+        
+        timeout = self.timeout
+        event_loop.run_until_complete(wait((task,), timeout = timeout))
+        
+        if not task.done():
+            task.cancel()
+            event_loop.run_until_complete(wait((task,), timeout = timeout))
+            return ResultState().with_raise(TimeoutError(f'Test timed out after {timeout!r} seconds.'))
+        
+        if task.cancelled():
+            try:
+                task.result()
+            except BaseException as raised_exception:
+                return ResultState().with_raise(raised_exception)
+        
+        raised_exception = task.exception()
+        if (raised_exception is not None):
+            return ResultState().with_raise(raised_exception)
+        
+        return ResultState().with_return(task.result())
+    
+    
+    def _check_leaks(self, event_loop):
+        """
+        Checks whether the test left any pending task behind on the given event loop, then cancels them.
+        
+        Parameters
+        ----------
+        event_loop : ``AbstractEventLoop``
+            The event loop the test was ran on.
+        
+        Returns
+        -------
+        leak_message : `None | str`
+            Description of the tasks left behind. `None` if there was none.
+        """
+        # Let the just finished callbacks run before checking.
+        event_loop.run_until_complete(sleep(0.0))
+        
+        tasks = [task for task in all_tasks(event_loop) if not task.done()]
+        if not tasks:
+            return None
+        
+        leak_message = ''.join([
+            f'{type(self).__name__}: the test left behind the following; cancelling them:\n',
+            *(f'- pending task: {task!r}\n' for task in tasks),
+        ])
+        
+        for task in tasks:
+            task.cancel()
+        
+        event_loop.run_until_complete(gather(*tasks, return_exceptions = True))
+        return leak_message
+    
+    
+    @copy_docs(DefaultEnvironment.__repr__)
+    def __repr__(self):
+        repr_parts = ['<', self.__class__.__name__]
+        
+        event_loop = self.event_loop
+        if (event_loop is not None):
+            repr_parts.append(' event_loop = ')
+            repr_parts.append(repr(event_loop))
+            
+            field_added = True
+        
+        else:
+            field_added = False
+        
+        if self.per_file:
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' per_file = True')
+        
+        timeout = self.timeout
+        if (timeout is None) or (timeout != DEFAULT_TIMEOUT):
+            if field_added:
+                repr_parts.append(',')
+            
+            repr_parts.append(' timeout = ')
+            repr_parts.append(repr(timeout))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @copy_docs(DefaultEnvironment.shutdown)
+    def shutdown(self):
+        event_loop = self._created_event_loop
+        if (event_loop is not None):
+            self._created_event_loop = None
+            self._event_loop_module_name = None
+            
+            if not event_loop.is_closed():
+                _close_event_loop(event_loop)
@@ -16,6 +16,9 @@ ENVIRONMENT_SCOPE_FILE = 3
 
 ENVIRONMENTS_BY_SCOPE = {}
 
+# The environments applied to each file path. Cleared when an environment is set.
+ENVIRONMENTS_BY_FILE_PATH = {}
+
 
 def _set_environment_by_scope(environment, scope, detail):
     """
@@ -50,6 +53,7 @@ def _set_environment_by_scope(environment, scope, detail):
         environment_by_detail[detail] = environments_by_identifier
     
     environments_by_identifier[environment.identifier] = environment
+    ENVIRONMENTS_BY_FILE_PATH.clear()
 
 
 def _get_last_module_file_path():
@@ -211,7 +215,29 @@ def apply_environments_for_file_at(environment_manager, path):
     -------
     environment_manager : ``EnvironmentManager``
     """
-    return environment_manager.with_environment(*_iter_environments_for_file_at(path))
+    return environment_manager.with_environment(*_get_environments_for_file_at(path))
+
+
+def _get_environments_for_file_at(path):
+    """
+    Returns the registered environments for the given `path`. The environments are cached till a new one is set.
+    
+    Parameters
+    ----------
+    path : `str`
+        The respective file's path.
+    
+    Returns
+    -------
+    environments : `tuple<DefaultEnvironment>`
+    """
+    try:
+        environments = ENVIRONMENTS_BY_FILE_PATH[path]
+    except KeyError:
+        environments = tuple(_iter_environments_for_file_at(path))
+        ENVIRONMENTS_BY_FILE_PATH[path] = environments
+    
+    return environments
 
 
 def _check_environment_type(environment):
@@ -1,35 +1,59 @@
 __all__ = ('DefaultEnvironment',)
 
+import sys
+from time import perf_counter_ns, process_time_ns
+
 from scarletio import RichAttributeErrorBaseType
 
 from ..handling import ResultState
 
 from .constants import ENVIRONMENT_TYPE_DEFAULT
+from .watchdog import Watchdog, WatchdogInterrupt
 
 
 class DefaultEnvironment(RichAttributeErrorBaseType):
     """
     Implements a default environment to call tests in.
     
+    Attributes
+    ----------
+    timeout : `None | float`
+        The maximal timeout to interrupt each test after. If `None` the tests are not interrupted.
+    
     Class Attributes
     ----------------
     identifier : `int` = `ENVIRONMENT_TYPE_DEFAULT`
         Represents for which environment the test is applicable for.
     """
-    __slots__ = ()
+    __slots__ = ('timeout',)
     
     identifier = ENVIRONMENT_TYPE_DEFAULT
     
-    def __new__(cls):
+    def __new__(cls, *, timeout = None):
         """
         Creates a new environment.
+        
+        Parameters
+        ----------
+        timeout : `None | float` = `None`, Optional (Keyword only)
+            The maximal timeout to interrupt each test after. If `None` the tests are not interrupted.
         """
-        return object.__new__(cls)
+        self = object.__new__(cls)
+        self.timeout = timeout
+        return self
     
     
     def __repr__(self):
         """Returns the environment's representation."""
-        return f'<{self.__class__.__name__}>'
+        repr_parts = ['<', self.__class__.__name__]
+        
+        timeout = self.timeout
+        if (timeout is not None):
+            repr_parts.append(' timeout = ')
+            repr_parts.append(repr(timeout))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
     
     
     def run(self, test, positional_parameters, keyword_parameters):
@@ -50,14 +74,114 @@ class DefaultEnvironment(RichAttributeErrorBaseType):
         result_state : ``ResultState``
             The result's product.
         """
+        watchdog = Watchdog(self.timeout)
         try:
-            returned_value = test(*positional_parameters, **keyword_parameters)
+            with watchdog:
+                returned_value = test(*positional_parameters, **keyword_parameters)
+        except WatchdogInterrupt as interrupt:
+            watchdog.stop()
+            return ResultState().with_raise(watchdog.build_timeout_error(interrupt))
         except BaseException as raised_exception:
             return ResultState().with_raise(raised_exception)
         
+        # Could not be interrupted, like when blocked outside of the main thread.
+        if watchdog.timed_out:
+            return ResultState().with_raise(watchdog.build_timeout_error(None))
+        
         return ResultState().with_return(returned_value)
     
     
+    def is_streaming(self):
+        """
+        Returns whether the environment streams the values yielded by the tests. If it does, the runner calls
+        ``.iter_run`` instead of ``.run`` and reports a result for each yielded value.
+        
+        Returns
+        -------
+        is_streaming : `bool`
+        """
+        return False
+    
+    
+    def iter_run(self, test, positional_parameters, keyword_parameters):
+        """
+        Runs the defined test with the given parameters, yielding a result state for each value yielded by it, then
+        the final result state.
+        
+        By default only the final result state is yielded.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        test : `FunctionType`
+            The test to call
+        positional_parameters : `list` of `object`
+            Positional parameters to call the test with.
+        keyword_parameters : `dict<str, object>`
+            Keyword parameters to call the test with.
+        
+        Yields
+        ------
+        result_state : ``ResultState``
+            The result's product.
+        streamed : `bool`
+            Whether the result state is for a yielded value. `False` for the final result state.
+        """
+        yield self.run(test, positional_parameters, keyword_parameters), False
+    
+    
+    def is_concurrent(self):
+        """
+        Returns whether the environment runs more tests at the same time. If it does, the runner collects the
+        consecutive tests using it and passes them to ``.run_concurrently`` together.
+        
+        Returns
+        -------
+        is_concurrent : `bool`
+        """
+        return False
+    
+    
+    def run_concurrently(self, calls):
+        """
+        Runs the given tests at the same time, capturing the output of each into its own stream.
+        
+        By default the tests are ran one after the other.
+        
+        Parameters
+        ----------
+        calls : `list<(FunctionType, list<object>, dict<str, object>, StringIO)>`
+            The tests to call with their positional and keyword parameters, and the stream to capture their output
+            into.
+        
+        Returns
+        -------
+        outcomes : `list<(ResultState, int, int)>`
+            The tests' result state, and their call's wall and processor time in nanoseconds in the same order as the
+            tests were given.
+        """
+        outcomes = []
+        
+        standard_output_stream = sys.stdout
+        standard_error_stream = sys.stderr
+        try:
+            for test, positional_parameters, keyword_parameters, stream in calls:
+                sys.stdout = stream
+                sys.stderr = stream
+                
+                cpu_start = process_time_ns()
+                call_start = perf_counter_ns()
+                result_state = self.run(test, positional_parameters, keyword_parameters)
+                outcomes.append((result_state, perf_counter_ns() - call_start, process_time_ns() - cpu_start))
+        
+        finally:
+            sys.stdout = standard_output_stream
+            sys.stderr = standard_error_stream
+        
+        return outcomes
+    
+    
     def shutdown(self):
         """
         Stops the environment.
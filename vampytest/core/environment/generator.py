@@ -0,0 +1,99 @@
+__all__ = ('GeneratorEnvironment',)
+
+from scarletio import copy_docs
+
+from ..handling import ResultState
+
+from .constants import ENVIRONMENT_TYPE_GENERATOR
+from .default import DefaultEnvironment
+from .watchdog import Watchdog, WatchdogInterrupt
+
+
+class GeneratorEnvironment(DefaultEnvironment):
+    """
+    Implements a generator environment streaming the values yielded by the tests.
+    
+    Attributes
+    ----------
+    timeout : `None | float`
+        The maximal timeout to interrupt the tests after while producing a value. If `None` the tests are not
+        interrupted.
+    
+    Class Attributes
+    ----------------
+    identifier : `int` = `ENVIRONMENT_TYPE_GENERATOR`
+        Represents for which environment the test is applicable for.
+    """
+    __slots__ = ()
+    
+    identifier = ENVIRONMENT_TYPE_GENERATOR
+    
+    @copy_docs(DefaultEnvironment.run)
+    def run(self, test, positional_parameters, keyword_parameters):
+        return collect_streamed_result_states(self.iter_run(test, positional_parameters, keyword_parameters))
+    
+    
+    @copy_docs(DefaultEnvironment.is_streaming)
+    def is_streaming(self):
+        return True
+    
+    
+    @copy_docs(DefaultEnvironment.iter_run)
+    def iter_run(self, test, positional_parameters, keyword_parameters):
+        generator = test(*positional_parameters, **keyword_parameters)
+        try:
+            while True:
+                watchdog = Watchdog(self.timeout)
+                try:
+                    with watchdog:
+                        value = next(generator)
+                except StopIteration as exception:
+                    yield ResultState().with_return(exception.value), False
+                    return
+                
+                except WatchdogInterrupt as interrupt:
+                    watchdog.stop()
+                    yield ResultState().with_raise(watchdog.build_timeout_error(interrupt)), False
+                    return
+                
+                except BaseException as raised_exception:
+                    yield ResultState().with_raise(raised_exception), False
+                    return
+                
+                if watchdog.timed_out:
+                    yield ResultState().with_raise(watchdog.build_timeout_error(None)), False
+                    return
+                
+                yield ResultState().with_return(value), True
+        
+        finally:
+            generator.close()
+
+
+def collect_streamed_result_states(result_states):
+    """
+    Collects the values of the given streamed result states into a list.
+    
+    Parameters
+    ----------
+    result_states : `iterable<(ResultState, bool)>`
+        The streamed result states and whether they are for a yielded value.
+    
+    Returns
+    -------
+    result_state : ``ResultState``
+        The result state returning the yielded values, or raising the raised exception.
+    """
+    values = []
+    
+    for result_state, streamed in result_states:
+        if streamed:
+            values.append(result_state.result)
+            continue
+        
+        if result_state.is_raise():
+            return result_state
+        
+        break
+    
+    return ResultState().with_return(values)
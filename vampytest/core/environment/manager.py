@@ -4,12 +4,16 @@ from scarletio import RichAttributeErrorBaseType
 
 from .helpers import get_function_environment_identifier
 from .default import DefaultEnvironment
+from .generator import GeneratorEnvironment
 from .scarletio_coroutine import ScarletioCoroutineEnvironment
+from .scarletio_coroutine_generator import ScarletioCoroutineGeneratorEnvironment
 
 
 DEFAULT_ENVIRONMENT_TYPES = (
     DefaultEnvironment,
+    GeneratorEnvironment,
     ScarletioCoroutineEnvironment,
+    ScarletioCoroutineGeneratorEnvironment,
 )
 
 
@@ -19,15 +23,18 @@ class EnvironmentManager(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    _derived_managers : `None | dict<tuple<DefaultEnvironment>, EnvironmentManager>`
+        The environment managers created by ``.with_environment`` mapped to the environments they were created with.
     _environments_by_identifier : `dict` of (`int`, ``DefaultEnvironment``) items
     """
-    __slots__ = ('_environments_by_identifier',)
+    __slots__ = ('_derived_managers', '_environments_by_identifier',)
     
     def __new__(cls):
         """
         Creates a new environment manager.
         """
         self = object.__new__(cls)
+        self._derived_managers = None
         self._environments_by_identifier = {}
         return self
     
@@ -68,6 +75,9 @@ class EnvironmentManager(RichAttributeErrorBaseType):
         """
         Copies the environment manager with the given environment.
         
+        The copies are memoised by the given environments, so applying the same environments again returns the same
+        environment manager without copying.
+        
         Parameters
         ----------
         *environments : ``DefaultEnvironment``
@@ -80,12 +90,23 @@ class EnvironmentManager(RichAttributeErrorBaseType):
         if not environments:
             return self
         
+        derived_managers = self._derived_managers
+        if derived_managers is None:
+            derived_managers = {}
+            self._derived_managers = derived_managers
+        
+        try:
+            return derived_managers[environments]
+        except KeyError:
+            pass
+        
         new = self.copy()
         
         environments_by_identifier = new._environments_by_identifier
         for environment in environments:
             environments_by_identifier[environment.identifier] = environment
         
+        derived_managers[environments] = new
         return new
     
     
@@ -100,14 +121,21 @@ class EnvironmentManager(RichAttributeErrorBaseType):
         environments_by_identifier = self._environments_by_identifier.copy()
         
         new = object.__new__(type(self))
+        new._derived_managers = None
         new._environments_by_identifier = environments_by_identifier
         return new
-
-
-    def populate(self):
+    
+    
+    def populate(self, *, timeout = None):
         """
         Tries to auto populate the environment manager.
         
+        Parameters
+        ----------
+        timeout : `None | float` = `None`, Optional (Keyword only)
+            The maximal timeout to interrupt each test after in the populated environments. If `None` their default
+            is used.
+        
         Returns
         -------
         self : ``EnvironmentManager``
@@ -117,6 +145,13 @@ class EnvironmentManager(RichAttributeErrorBaseType):
         for environment_type in DEFAULT_ENVIRONMENT_TYPES:
             identifier = environment_type.identifier
             if identifier not in environments_by_identifier:
-                environments_by_identifier[identifier] = environment_type()
+                if timeout is None:
+                    environment = environment_type()
+                else:
+                    environment = environment_type(timeout = timeout)
+                
+                environments_by_identifier[identifier] = environment
         
+        # The derived managers are not aware of the new environments.
+        self._derived_managers = None
         return self
@@ -1,17 +1,132 @@
 __all__ = ('ScarletioCoroutineEnvironment',)
 
-from time import sleep as sync_sleep
+import sys
+from itertools import chain
+from time import perf_counter_ns, sleep as sync_sleep
 
-from scarletio import copy_docs, EventThread
+from scarletio import copy_docs, EventThread, Task, TaskGroup, skip_ready_cycle
 
 from ..handling import ResultState
 
 from .constants import ENVIRONMENT_TYPE_COROUTINE
 from .default import DefaultEnvironment
+from .task_output_routing import TaskOutputRouter
 
 
+DEFAULT_CONCURRENCY = 1
 DEFAULT_TIMEOUT = 60.0
 
+# The maximal amount of warm event loops kept by a pooled environment.
+EVENT_LOOP_POOL_SIZE = 4
+
+
+def _create_event_loop():
+    """
+    Creates a new event loop to run tests in.
+    
+    Returns
+    -------
+    event_loop : ``EventThread``
+    """
+    return EventThread(daemon = True, name = 'scarletio.run', start_later = False)
+
+
+def _stop_event_loop(event_loop):
+    """
+    Stops the given event loop.
+    
+    Parameters
+    ----------
+    event_loop : ``EventThread``
+        The event loop to stop.
+    """
+    event_loop.stop()
+    sync_sleep(0.0)
+
+
+def _is_internal_handle(event_loop, handle):
+    """
+    Returns whether the given handle is scheduled by the event loop itself.
+    
+    Parameters
+    ----------
+    event_loop : ``EventThread``
+        The event loop owning the handle.
+    handle : ``Handle | TimerHandle``
+        The handle to check.
+    
+    Returns
+    -------
+    is_internal_handle : `bool`
+    """
+    event_loop_type = type(event_loop)
+    func = handle.func
+    return (
+        (getattr(func, '__func__', None) is event_loop_type.empty_self_socket) or
+        (func is event_loop_type._release_executor_step)
+    )
+
+
+def iter_event_loop_leaks(event_loop, current_task):
+    """
+    Iterates over the descriptions of the tasks, callbacks and transports left behind on the given event loop.
+    Should be called from the event loop's thread.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    event_loop : ``EventThread``
+        The event loop to check.
+    current_task : `None | Task`
+        The task doing the check, which is not a leak.
+    
+    Yields
+    ------
+    leak : `str`
+    """
+    for task in event_loop.get_tasks():
+        if (task is not current_task) and (not task.is_done()):
+            yield f'pending task: {task!r}'
+    
+    callback_count = 0
+    for handle in chain(event_loop._ready, event_loop._scheduled):
+        if (not handle.cancelled) and (not _is_internal_handle(event_loop, handle)):
+            callback_count += 1
+    
+    if callback_count:
+        yield f'{callback_count} scheduled callback(s)'
+    
+    self_read_socket = event_loop._self_read_socket
+    if self_read_socket is None:
+        self_read_file_descriptor = -1
+    else:
+        self_read_file_descriptor = self_read_socket.fileno()
+    
+    file_descriptor_count = 0
+    for file_descriptor in event_loop.selector.get_map().keys():
+        if file_descriptor != self_read_file_descriptor:
+            file_descriptor_count += 1
+    
+    if file_descriptor_count:
+        yield f'{file_descriptor_count} open transport(s) or watched file descriptor(s)'
+
+
+def _time_out_task(task, timed_out_tasks):
+    """
+    Cancels the given task, because it ran out of time.
+    
+    Parameters
+    ----------
+    task : ``Task``
+        The task to cancel.
+    timed_out_tasks : `set<Task>`
+        The tasks which ran out of time to put the task into.
+    """
+    if not task.is_done():
+        timed_out_tasks.add(task)
+        task.cancel()
+
 
 class ScarletioCoroutineEnvironment(DefaultEnvironment):
     """
@@ -19,37 +134,68 @@ class ScarletioCoroutineEnvironment(DefaultEnvironment):
     
     Attributes
     ----------
-    timeout : `None | float`
-        The maximal timeout to interrupt tests before.
-        
-        Defaults to creating a new event loop every time if set as `None`.
+    _idle_event_loops : `list<EventThread>`
+        Warm event loops waiting to be reused. Used only if `pooled` is `True`.
+    
+    concurrency : `int`
+        The maximal amount of tests to run at the same time. If above `1`, the consecutive tests using the environment
+        are ran concurrently on the same event loop, capturing the output of each test separately.
     
     event_loop : `None`, ``EventThread``
         The event loop to use to run the test in.
+        
+        Defaults to creating a new event loop every time if set as `None`.
+    
+    pooled : `bool`
+        Whether the created event loops should be kept warm and reused by the next tests. An event loop is reused only
+        if the test left no pending tasks, callbacks or open transports on it, otherwise these are reported in the
+        test's output and the event loop is replaced.
+    
+    timeout : `None | float`
+        The maximal timeout to interrupt tests before.
     
     Class Attributes
     ----------------
     identifier : `int` = `ENVIRONMENT_TYPE_COROUTINE`
         Represents for which environment the test is applicable for.
     """
-    __slots__ = ('event_loop', 'timeout',)
+    __slots__ = ('_idle_event_loops', 'concurrency', 'event_loop', 'pooled')
     
     identifier = ENVIRONMENT_TYPE_COROUTINE
     
-    def __new__(cls, *, event_loop = None, timeout = DEFAULT_TIMEOUT):
+    def __new__(
+        cls, *, concurrency = DEFAULT_CONCURRENCY, event_loop = None, pooled = False, timeout = DEFAULT_TIMEOUT
+    ):
         """
         Parameters
         ----------
+        concurrency : `int` = `DEFAULT_CONCURRENCY`, Optional (Keyword only)
+            The maximal amount of tests to run at the same time.
+        
         event_loop : `None`, ``EventThread`` = `None`, Optional (Keyword only)
             The event loop to use to run the test in.
-            S
-            Defaults to creating a new event loop every time if given as `None`.
             
+            Defaults to creating a new event loop every time if given as `None`.
+        
+        pooled : `bool` = `False`, Optional (Keyword only)
+            Whether the created event loops should be kept warm and reused by the next tests.
+        
         timeout : `None | float` = `DEFAULT_TIMEOUT`, Optional (Keyword only)
             The maximal timeout to interrupt tests before.
+        
+        Raises
+        ------
+        ValueError
+            - If `concurrency` is less than `1`.
         """
+        if concurrency < 1:
+            raise ValueError(f'`concurrency` can be `1` or greater, got {concurrency!r}.')
+        
         self = object.__new__(cls)
+        self._idle_event_loops = []
+        self.concurrency = concurrency
         self.event_loop = event_loop
+        self.pooled = pooled
         self.timeout = timeout
         return self
     
@@ -57,28 +203,286 @@ class ScarletioCoroutineEnvironment(DefaultEnvironment):
     @copy_docs(DefaultEnvironment.run)
     def run(self, test, positional_parameters, keyword_parameters):
         event_loop = self.event_loop
-        create_event_loop = (event_loop is None)
+        if (event_loop is not None):
+            return self._run_in(event_loop, self._run_async(test, positional_parameters, keyword_parameters), test)
+        
+        if not self.pooled:
+            event_loop = _create_event_loop()
+            try:
+                return self._run_in(event_loop, self._run_async(test, positional_parameters, keyword_parameters), test)
+            finally:
+                _stop_event_loop(event_loop)
         
+        event_loop = self._acquire_event_loop()
+        released = False
         try:
-            if create_event_loop:
-                event_loop = EventThread(daemon = True, name = 'scarletio.run', start_later = False)
+            result_state, clean = self._run_in(
+                event_loop, self._run_async_checked(event_loop, test, positional_parameters, keyword_parameters), test
+            )
+            if clean:
+                self._release_event_loop(event_loop)
+                released = True
             
+            return result_state
+        
+        finally:
+            if not released:
+                _stop_event_loop(event_loop)
+    
+    
+    @copy_docs(DefaultEnvironment.is_concurrent)
+    def is_concurrent(self):
+        return self.concurrency > 1
+    
+    
+    @copy_docs(DefaultEnvironment.run_concurrently)
+    def run_concurrently(self, calls):
+        event_loop = self.event_loop
+        if (event_loop is not None):
+            return self._run_concurrently_in(event_loop, calls, False)
+        
+        if not self.pooled:
+            event_loop = _create_event_loop()
             try:
-                return event_loop.run(
-                    self._run_async(test, positional_parameters, keyword_parameters),
-                    timeout = self.timeout,
-                )
-            except KeyboardInterrupt as exception:
-                # In case it is frozen lets provide a better output. Better than nothing.
-                raise KeyboardInterrupt(
-                    f'`{type(self).__name__}.run` interrupted while running {test!r}.'
-                ) from exception
+                return self._run_concurrently_in(event_loop, calls, False)
+            finally:
+                _stop_event_loop(event_loop)
+        
+        event_loop = self._acquire_event_loop()
+        released = False
+        try:
+            outcomes, clean = self._run_concurrently_in(event_loop, calls, True)
+            if clean:
+                self._release_event_loop(event_loop)
+                released = True
+            
+            return outcomes
+        
         finally:
-            if create_event_loop:
-                if (event_loop is not None):
-                    event_loop.stop()
-                    event_loop = None
-                    sync_sleep(0.0)
+            if not released:
+                _stop_event_loop(event_loop)
+    
+    
+    def _run_concurrently_in(self, event_loop, calls, check_leaks):
+        """
+        Runs the given tests concurrently on the given event loop, while routing the standard streams into the
+        streams of the tests.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop to run on.
+        calls : `list<(FunctionType, list<object>, dict<str, object>, StringIO)>`
+            The tests to call with their positional and keyword parameters, and the stream to capture their output
+            into.
+        check_leaks : `bool`
+            Whether to check whether the tests left anything behind on the event loop.
+        
+        Returns
+        -------
+        outcomes : `list<(ResultState, int, int)>`
+            The tests' result state, and their call's wall and processor time in nanoseconds.
+        clean : `bool`
+            Whether the tests left nothing behind. Only returned if `check_leaks` is `True`.
+        
+        Raises
+        ------
+        KeyboardInterrupt
+        """
+        streams = {}
+        standard_output_stream = sys.stdout
+        standard_error_stream = sys.stderr
+        sys.stdout = TaskOutputRouter(event_loop, streams, standard_output_stream)
+        sys.stderr = TaskOutputRouter(event_loop, streams, standard_error_stream)
+        
+        # The tests time out one by one, this is just an upper limit if a test would ignore its cancellation.
+        timeout = self.timeout
+        if (timeout is not None):
+            timeout *= len(calls) + 1
+        
+        try:
+            return event_loop.run(
+                self._run_concurrently_async(event_loop, calls, streams, check_leaks), timeout = timeout
+            )
+        except KeyboardInterrupt as exception:
+            raise KeyboardInterrupt(
+                f'`{type(self).__name__}.run_concurrently` interrupted while running {len(calls)} tests.'
+            ) from exception
+        finally:
+            sys.stdout = standard_output_stream
+            sys.stderr = standard_error_stream
+    
+    
+    async def _run_concurrently_async(self, event_loop, calls, streams, check_leaks):
+        """
+        Runs the given tests with at most ``.concurrency`` running at the same time.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop the tests are ran on.
+        calls : `list<(FunctionType, list<object>, dict<str, object>, StringIO)>`
+            The tests to call with their positional and keyword parameters, and the stream to capture their output
+            into.
+        streams : `dict<Task, StringIO>`
+            Tasks mapped to the stream their output is captured into.
+        check_leaks : `bool`
+            Whether to check whether the tests left anything behind on the event loop.
+        
+        Returns
+        -------
+        outcomes : `list<(ResultState, int, int)>`
+            The tests' result state, and their call's wall and processor time in nanoseconds. If the tests left
+            anything behind, it is added to each result state.
+        clean : `bool`
+            Whether the tests left nothing behind. Only returned if `check_leaks` is `True`.
+        """
+        outcomes = [None] * len(calls)
+        call_iterator = iter(enumerate(calls))
+        
+        await TaskGroup(
+            event_loop,
+            [
+                Task(event_loop, self._run_calls_from(event_loop, call_iterator, outcomes, streams))
+                for _ in range(min(self.concurrency, len(calls)))
+            ],
+        ).wait_all()
+        
+        if not check_leaks:
+            return outcomes
+        
+        # Let the just finished callbacks run before checking.
+        await skip_ready_cycle()
+        
+        leaks = [*iter_event_loop_leaks(event_loop, event_loop.current_task)]
+        if leaks:
+            leak_message = ''.join([
+                f'{type(self).__name__}: one of the concurrently ran tests left behind the following; replacing '
+                f'their event loop:\n',
+                *(f'- {leak}\n' for leak in leaks),
+            ])
+            
+            # Any of the tests could have left them behind, so each of them is reported with the leaks.
+            outcomes = [
+                (result_state.with_leak(leak_message), wall_time, processor_time)
+                for result_state, wall_time, processor_time in outcomes
+            ]
+        
+        return outcomes, (not leaks)
+    
+    
+    async def _run_calls_from(self, event_loop, call_iterator, outcomes, streams):
+        """
+        Runs the tests from the given iterator one after the other, until it is exhausted. The iterator is shared, so
+        more of these can run at the same time.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop the tests are ran on.
+        call_iterator : `iterator<(int, (FunctionType, list<object>, dict<str, object>, StringIO))>`
+            Iterator over the tests to call with their index.
+        outcomes : `list<None | (ResultState, int, int)>`
+            The tests' outcomes to put the new ones into.
+        streams : `dict<Task, StringIO>`
+            Tasks mapped to the stream their output is captured into.
+        """
+        timeout = self.timeout
+        timed_out_tasks = set()
+        
+        for index, (test, positional_parameters, keyword_parameters, stream) in call_iterator:
+            call_start = perf_counter_ns()
+            
+            task = Task(event_loop, self._run_async(test, positional_parameters, keyword_parameters))
+            streams[task] = stream
+            
+            if timeout is None:
+                timeout_handle = None
+            else:
+                timeout_handle = event_loop.call_after(timeout, _time_out_task, task, timed_out_tasks)
+            
+            try:
+                result_state = await task
+            finally:
+                if (timeout_handle is not None):
+                    timeout_handle.cancel()
+                
+                del streams[task]
+            
+            if task in timed_out_tasks:
+                timed_out_tasks.discard(task)
+                result_state = ResultState().with_raise(TimeoutError(f'Test timed out after {timeout!r} seconds.'))
+            
+            # Processor time is shared between the concurrently ran tests, so it is not measured.
+            outcomes[index] = (result_state, perf_counter_ns() - call_start, 0)
+    
+    
+    def _run_in(self, event_loop, coroutine, test):
+        """
+        Runs the given coroutine on the given event loop.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop to run on.
+        coroutine : ``CoroutineType``
+            The coroutine to run.
+        test : `FunctionType`
+            The ran test. Used when rendering interruption.
+        
+        Returns
+        -------
+        result : `object`
+            The coroutine's result.
+        
+        Raises
+        ------
+        KeyboardInterrupt
+        """
+        try:
+            return event_loop.run(coroutine, timeout = self.timeout)
+        except KeyboardInterrupt as exception:
+            # In case it is frozen lets provide a better output. Better than nothing.
+            raise KeyboardInterrupt(
+                f'`{type(self).__name__}.run` interrupted while running {test!r}.'
+            ) from exception
+    
+    
+    def _acquire_event_loop(self):
+        """
+        Returns a warm event loop from the pool, or creates a new one if there is none.
+        
+        Returns
+        -------
+        event_loop : ``EventThread``
+        """
+        idle_event_loops = self._idle_event_loops
+        while idle_event_loops:
+            event_loop = idle_event_loops.pop()
+            if not event_loop.is_stopped():
+                return event_loop
+        
+        return _create_event_loop()
+    
+    
+    def _release_event_loop(self, event_loop):
+        """
+        Puts the given clean event loop back into the pool, or stops it if the pool is full.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop to release.
+        """
+        idle_event_loops = self._idle_event_loops
+        if len(idle_event_loops) < EVENT_LOOP_POOL_SIZE:
+            idle_event_loops.append(event_loop)
+        else:
+            _stop_event_loop(event_loop)
     
     
     async def _run_async(self, test, positional_parameters, keyword_parameters):
@@ -109,6 +513,48 @@ class ScarletioCoroutineEnvironment(DefaultEnvironment):
         return ResultState().with_return(returned_value)
     
     
+    async def _run_async_checked(self, event_loop, test, positional_parameters, keyword_parameters):
+        """
+        Runs the defined test with the given parameters, then checks whether it left anything behind on the event
+        loop. The leaks are added to the result state, so they are reported even if the test's output is not.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop the test is ran on.
+        test : `FunctionType`
+            The test to call
+        positional_parameters : `list` of `object`
+            Positional parameters to call the test with.
+        keyword_parameters : `dict<str, object>`
+            Keyword parameters to call the test with.
+        
+        Returns
+        -------
+        result_state : ``ResultState``
+            The result's product.
+        clean : `bool`
+            Whether the test left nothing behind, so the event loop can be reused.
+        """
+        result_state = await self._run_async(test, positional_parameters, keyword_parameters)
+        
+        # Let the just finished callbacks run before checking.
+        await skip_ready_cycle()
+        
+        leaks = [*iter_event_loop_leaks(event_loop, event_loop.current_task)]
+        if leaks:
+            result_state = result_state.with_leak(
+                ''.join([
+                    f'{type(self).__name__}: the test left behind the following; replacing its event loop:\n',
+                    *(f'- {leak}\n' for leak in leaks),
+                ])
+            )
+        
+        return result_state, (not leaks)
+    
+    
     @copy_docs(DefaultEnvironment.__repr__)
     def __repr__(self):
         repr_parts = ['<', self.__class__.__name__]
@@ -123,6 +569,24 @@ class ScarletioCoroutineEnvironment(DefaultEnvironment):
         else:
             field_added = False
         
+        concurrency = self.concurrency
+        if concurrency != DEFAULT_CONCURRENCY:
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' concurrency = ')
+            repr_parts.append(repr(concurrency))
+        
+        if self.pooled:
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' pooled = True')
+        
         timeout = self.timeout
         if (timeout is None) or (timeout != DEFAULT_TIMEOUT):
             if field_added:
@@ -137,7 +601,12 @@ class ScarletioCoroutineEnvironment(DefaultEnvironment):
     
     @copy_docs(DefaultEnvironment.shutdown)
     def shutdown(self):
+        idle_event_loops = self._idle_event_loops
+        while idle_event_loops:
+            idle_event_loops.pop().stop()
+        
         event_loop = self.event_loop
         if (event_loop is not None):
             event_loop.stop()
-            sync_sleep(0.0)
+        
+        sync_sleep(0.0)
@@ -0,0 +1,186 @@
+__all__ = ('ScarletioCoroutineGeneratorEnvironment',)
+
+from scarletio import copy_docs
+
+from ..handling import ResultState
+
+from .constants import ENVIRONMENT_TYPE_COROUTINE_GENERATOR
+from .default import DefaultEnvironment
+from .generator import collect_streamed_result_states
+from .scarletio_coroutine import DEFAULT_TIMEOUT, _create_event_loop, _stop_event_loop
+
+
+class ScarletioCoroutineGeneratorEnvironment(DefaultEnvironment):
+    """
+    Implements a scarletio coroutine generator environment streaming the values yielded by the tests.
+    
+    Attributes
+    ----------
+    event_loop : `None`, ``EventThread``
+        The event loop to use to run the test in.
+        
+        Defaults to creating a new event loop for every test if set as `None`.
+    
+    timeout : `None | float`
+        The maximal timeout to interrupt the tests before, applied to producing each value.
+    
+    Class Attributes
+    ----------------
+    identifier : `int` = `ENVIRONMENT_TYPE_COROUTINE_GENERATOR`
+        Represents for which environment the test is applicable for.
+    """
+    __slots__ = ('event_loop',)
+    
+    identifier = ENVIRONMENT_TYPE_COROUTINE_GENERATOR
+    
+    def __new__(cls, *, event_loop = None, timeout = DEFAULT_TIMEOUT):
+        """
+        Parameters
+        ----------
+        event_loop : `None`, ``EventThread`` = `None`, Optional (Keyword only)
+            The event loop to use to run the test in.
+            
+            Defaults to creating a new event loop for every test if given as `None`.
+        
+        timeout : `None | float` = `DEFAULT_TIMEOUT`, Optional (Keyword only)
+            The maximal timeout to interrupt the tests before, applied to producing each value.
+        """
+        self = object.__new__(cls)
+        self.event_loop = event_loop
+        self.timeout = timeout
+        return self
+    
+    
+    @copy_docs(DefaultEnvironment.run)
+    def run(self, test, positional_parameters, keyword_parameters):
+        return collect_streamed_result_states(self.iter_run(test, positional_parameters, keyword_parameters))
+    
+    
+    @copy_docs(DefaultEnvironment.is_streaming)
+    def is_streaming(self):
+        return True
+    
+    
+    @copy_docs(DefaultEnvironment.iter_run)
+    def iter_run(self, test, positional_parameters, keyword_parameters):
+        event_loop = self.event_loop
+        if event_loop is None:
+            event_loop = _create_event_loop()
+            created = True
+        else:
+            created = False
+        
+        try:
+            generator = test(*positional_parameters, **keyword_parameters)
+            finished = False
+            try:
+                while True:
+                    result_state, streamed = self._run_in(event_loop, self._step_async(generator), test)
+                    if not streamed:
+                        finished = True
+                        yield result_state, False
+                        return
+                    
+                    yield result_state, True
+            
+            finally:
+                if not finished:
+                    event_loop.run(generator.aclose(), timeout = self.timeout)
+        
+        finally:
+            if created:
+                _stop_event_loop(event_loop)
+    
+    
+    def _run_in(self, event_loop, coroutine, test):
+        """
+        Runs the given coroutine on the given event loop.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop to run on.
+        coroutine : ``CoroutineType``
+            The coroutine to run.
+        test : `FunctionType`
+            The ran test. Used when rendering interruption.
+        
+        Returns
+        -------
+        result : `object`
+            The coroutine's result.
+        
+        Raises
+        ------
+        KeyboardInterrupt
+        """
+        try:
+            return event_loop.run(coroutine, timeout = self.timeout)
+        except TimeoutError as exception:
+            return ResultState().with_raise(exception), False
+        except KeyboardInterrupt as exception:
+            # In case it is frozen lets provide a better output. Better than nothing.
+            raise KeyboardInterrupt(
+                f'`{type(self).__name__}.run` interrupted while running {test!r}.'
+            ) from exception
+    
+    
+    async def _step_async(self, generator):
+        """
+        Produces the next value of the given coroutine generator.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        generator : ``AsyncGeneratorType``
+            The coroutine generator to step.
+        
+        Returns
+        -------
+        result_state : ``ResultState``
+            The result's product.
+        streamed : `bool`
+            Whether a value was yielded. `False` if the generator finished.
+        """
+        try:
+            value = await generator.__anext__()
+        except StopAsyncIteration:
+            return ResultState().with_return(None), False
+        except BaseException as raised_exception:
+            return ResultState().with_raise(raised_exception), False
+        
+        return ResultState().with_return(value), True
+    
+    
+    @copy_docs(DefaultEnvironment.__repr__)
+    def __repr__(self):
+        repr_parts = ['<', self.__class__.__name__]
+        
+        event_loop = self.event_loop
+        if (event_loop is not None):
+            repr_parts.append(' event_loop = ')
+            repr_parts.append(repr(event_loop))
+            
+            field_added = True
+        
+        else:
+            field_added = False
+        
+        timeout = self.timeout
+        if (timeout is None) or (timeout != DEFAULT_TIMEOUT):
+            if field_added:
+                repr_parts.append(',')
+            
+            repr_parts.append(' timeout = ')
+            repr_parts.append(repr(timeout))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @copy_docs(DefaultEnvironment.shutdown)
+    def shutdown(self):
+        event_loop = self.event_loop
+        if (event_loop is not None):
+            event_loop.stop()
@@ -0,0 +1,114 @@
+__all__ = ()
+
+from threading import current_thread
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class TaskOutputRouter(RichAttributeErrorBaseType):
+    """
+    Standard stream replacement writing the output of each task into its own stream. Used to capture the output of
+    concurrently ran tests separately.
+    
+    Output written outside of the registered tasks, like from the tasks the tests create, goes to the fallback stream.
+    
+    Attributes
+    ----------
+    event_loop : ``EventThread``
+        The event loop the tasks are ran on.
+    fallback_stream : `io-like`
+        Stream to write the output outside of the registered tasks into.
+    streams : `dict<Task, io-like>`
+        Tasks mapped to the stream their output is captured into. Shared between the standard output and error
+        routers.
+    """
+    __slots__ = ('event_loop', 'fallback_stream', 'streams')
+    
+    def __new__(cls, event_loop, streams, fallback_stream):
+        """
+        Creates a new task output router.
+        
+        Parameters
+        ----------
+        event_loop : ``EventThread``
+            The event loop the tasks are ran on.
+        streams : `dict<Task, io-like>`
+            Tasks mapped to the stream their output is captured into.
+        fallback_stream : `io-like`
+            Stream to write the output outside of the registered tasks into.
+        """
+        self = object.__new__(cls)
+        self.event_loop = event_loop
+        self.fallback_stream = fallback_stream
+        self.streams = streams
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the task output router's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' task_count = ')
+        repr_parts.append(repr(len(self.streams)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __getattr__(self, attribute_name):
+        """Returns the fallback stream's attribute, so the router can be used as any other stream."""
+        return getattr(self.fallback_stream, attribute_name)
+    
+    
+    def get_stream(self):
+        """
+        Returns the stream to write into from the current context.
+        
+        Returns
+        -------
+        stream : `io-like`
+        """
+        event_loop = self.event_loop
+        if current_thread() is event_loop:
+            task = event_loop.current_task
+            if (task is not None):
+                stream = self.streams.get(task, None)
+                if (stream is not None):
+                    return stream
+        
+        return self.fallback_stream
+    
+    
+    def write(self, value):
+        """
+        Writes the given value into the current task's stream.
+        
+        Parameters
+        ----------
+        value : `str`
+            The value to write.
+        
+        Returns
+        -------
+        written : `int`
+        """
+        return self.get_stream().write(value)
+    
+    
+    def writelines(self, lines):
+        """
+        Writes the given lines into the current task's stream.
+        
+        Parameters
+        ----------
+        lines : `iterable<str>`
+            The lines to write.
+        """
+        self.get_stream().writelines(lines)
+    
+    
+    def flush(self):
+        """
+        Flushes the current task's stream.
+        """
+        self.get_stream().flush()
@@ -0,0 +1,148 @@
+from asyncio import all_tasks, get_event_loop, sleep
+
+from ...assertions import assert_eq, assert_in, assert_is, assert_is_not, assert_true
+
+from ..asyncio_coroutine import AsyncioCoroutineEnvironment
+
+
+async def _get_event_loop():
+    """
+    Returns the event loop the test runs on.
+    
+    This function is a coroutine.
+    
+    Returns
+    -------
+    event_loop : ``AbstractEventLoop``
+    """
+    return get_event_loop()
+
+
+async def _raise():
+    """
+    Raises an exception.
+    
+    This function is a coroutine.
+    
+    Raises
+    ------
+    ValueError
+    """
+    raise ValueError('satori')
+
+
+async def _sleep_long():
+    """
+    Sleeps for a long time.
+    
+    This function is a coroutine.
+    """
+    await sleep(100.0)
+
+
+async def _leak_task():
+    """
+    Leaves a pending task behind, then returns the event loop the test runs on.
+    
+    This function is a coroutine.
+    
+    Returns
+    -------
+    event_loop : ``AbstractEventLoop``
+    """
+    event_loop = get_event_loop()
+    event_loop.create_task(_sleep_long())
+    return event_loop
+
+
+def test__AsyncioCoroutineEnvironment__run__session():
+    """
+    Tests whether ``AsyncioCoroutineEnvironment.run`` works as intended.
+    
+    Case: reusing the event loop.
+    """
+    environment = AsyncioCoroutineEnvironment()
+    try:
+        result_state_0 = environment.run(_get_event_loop, [], {})
+        result_state_1 = environment.run(_get_event_loop, [], {})
+    finally:
+        environment.shutdown()
+    
+    assert_true(result_state_0.is_return())
+    assert_is(result_state_0.result, result_state_1.result)
+    assert_true(result_state_0.result.is_closed())
+
+
+def test__AsyncioCoroutineEnvironment__run__per_file():
+    """
+    Tests whether ``AsyncioCoroutineEnvironment.run`` works as intended.
+    
+    Case: per file, creating a new event loop for a test of another module.
+    """
+    async def test():
+        return get_event_loop()
+    
+    test.__module__ = 'koishi'
+    
+    environment = AsyncioCoroutineEnvironment(per_file = True)
+    try:
+        result_state_0 = environment.run(_get_event_loop, [], {})
+        result_state_1 = environment.run(_get_event_loop, [], {})
+        result_state_2 = environment.run(test, [], {})
+    finally:
+        environment.shutdown()
+    
+    assert_is(result_state_0.result, result_state_1.result)
+    assert_is_not(result_state_0.result, result_state_2.result)
+    assert_true(result_state_0.result.is_closed())
+
+
+def test__AsyncioCoroutineEnvironment__run__raise():
+    """
+    Tests whether ``AsyncioCoroutineEnvironment.run`` works as intended.
+    
+    Case: raising.
+    """
+    environment = AsyncioCoroutineEnvironment()
+    try:
+        result_state = environment.run(_raise, [], {})
+    finally:
+        environment.shutdown()
+    
+    assert_true(result_state.is_raise())
+    assert_is(type(result_state.result), ValueError)
+
+
+def test__AsyncioCoroutineEnvironment__run__timeout():
+    """
+    Tests whether ``AsyncioCoroutineEnvironment.run`` works as intended.
+    
+    Case: timing out.
+    """
+    environment = AsyncioCoroutineEnvironment(timeout = 0.01)
+    try:
+        result_state = environment.run(_sleep_long, [], {})
+    finally:
+        environment.shutdown()
+    
+    assert_true(result_state.is_raise())
+    assert_is(type(result_state.result), TimeoutError)
+
+
+def test__AsyncioCoroutineEnvironment__run__leak():
+    """
+    Tests whether ``AsyncioCoroutineEnvironment.run`` works as intended.
+    
+    Case: test leaking a task.
+    """
+    environment = AsyncioCoroutineEnvironment()
+    try:
+        result_state = environment.run(_leak_task, [], {})
+        event_loop = result_state.result
+        task_count = len([task for task in all_tasks(event_loop) if not task.done()])
+    finally:
+        environment.shutdown()
+    
+    assert_true(result_state.is_return())
+    assert_in('pending task', result_state.leak_message)
+    assert_eq(task_count, 0)
@@ -0,0 +1,121 @@
+from threading import Thread
+from time import perf_counter, sleep
+
+from ...assertions import assert_eq, assert_in, assert_is, assert_true
+
+from ..default import DefaultEnvironment
+
+
+def _return_sum(value_0, value_1):
+    """
+    Returns the sum of the given values.
+    
+    Parameters
+    ----------
+    value_0 : `int`
+        Value to add.
+    value_1 : `int`
+        Value to add.
+    
+    Returns
+    -------
+    value : `int`
+    """
+    return value_0 + value_1
+
+
+def _spin():
+    """
+    Never returns.
+    """
+    while True:
+        pass
+
+
+def _sleep_swallowing():
+    """
+    Sleeps, swallowing the exception it is interrupted with, then returns.
+    
+    Returns
+    -------
+    value : `int`
+    """
+    try:
+        sleep(10.0)
+    except BaseException:
+        pass
+    
+    return 1
+
+
+def test__DefaultEnvironment__repr():
+    """
+    Tests whether ``DefaultEnvironment.__repr__`` works as intended.
+    """
+    assert_eq(repr(DefaultEnvironment()), '<DefaultEnvironment>')
+    assert_eq(repr(DefaultEnvironment(timeout = 2.0)), '<DefaultEnvironment timeout = 2.0>')
+
+
+def test__DefaultEnvironment__run():
+    """
+    Tests whether ``DefaultEnvironment.run`` works as intended.
+    
+    Case: returning.
+    """
+    environment = DefaultEnvironment(timeout = 10.0)
+    
+    result_state = environment.run(_return_sum, [1], {'value_1': 2})
+    
+    assert_true(result_state.is_return())
+    assert_eq(result_state.result, 3)
+
+
+def test__DefaultEnvironment__run__timeout_blocking():
+    """
+    Tests whether ``DefaultEnvironment.run`` works as intended.
+    
+    Case: timing out while blocked in the main thread.
+    """
+    environment = DefaultEnvironment(timeout = 0.05)
+    
+    start = perf_counter()
+    result_state = environment.run(sleep, [10.0], {})
+    
+    assert_true(perf_counter() - start < 5.0)
+    assert_true(result_state.is_raise())
+    assert_is(type(result_state.result), TimeoutError)
+    assert_in('Test timed out after 0.05 seconds', str(result_state.result))
+
+
+def test__DefaultEnvironment__run__timeout_thread():
+    """
+    Tests whether ``DefaultEnvironment.run`` works as intended.
+    
+    Case: timing out outside of the main thread.
+    """
+    environment = DefaultEnvironment(timeout = 0.05)
+    output = []
+    
+    thread = Thread(target = lambda : output.append(environment.run(_spin, [], {})), daemon = True)
+    thread.start()
+    thread.join(5.0)
+    
+    assert_eq(len(output), 1)
+    result_state = output[0]
+    assert_true(result_state.is_raise())
+    assert_is(type(result_state.result), TimeoutError)
+    assert_in('in _spin', str(result_state.result))
+
+
+def test__DefaultEnvironment__run__timeout_swallowed():
+    """
+    Tests whether ``DefaultEnvironment.run`` works as intended.
+    
+    Case: timed out, but the test swallowed the interruption.
+    """
+    environment = DefaultEnvironment(timeout = 0.05)
+    
+    result_state = environment.run(_sleep_swallowing, [], {})
+    
+    assert_true(result_state.is_raise())
+    assert_is(type(result_state.result), TimeoutError)
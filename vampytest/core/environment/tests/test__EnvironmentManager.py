@@ -0,0 +1,78 @@
+from ...assertions import assert_eq, assert_is, assert_is_not
+
+from ..configuration import (
+    ENVIRONMENTS_BY_FILE_PATH, ENVIRONMENTS_BY_SCOPE, ENVIRONMENT_SCOPE_FILE, _get_environments_for_file_at,
+    _set_environment_by_scope, apply_environments_for_file_at
+)
+from ..default import DefaultEnvironment
+from ..generator import GeneratorEnvironment
+from ..manager import EnvironmentManager
+
+
+def _test():
+    """
+    Test to get environment for.
+    """
+
+
+def test__EnvironmentManager__with_environment__memoised():
+    """
+    Tests whether ``EnvironmentManager.with_environment`` works as intended.
+    
+    Case: the same environments return the same manager.
+    """
+    environment_0 = DefaultEnvironment()
+    environment_1 = GeneratorEnvironment()
+    
+    environment_manager = EnvironmentManager().populate()
+    
+    assert_is(environment_manager.with_environment(), environment_manager)
+    
+    derived_manager = environment_manager.with_environment(environment_0)
+    assert_is_not(derived_manager, environment_manager)
+    assert_is(derived_manager.get_environment_for_test(_test), environment_0)
+    assert_is(environment_manager.with_environment(environment_0), derived_manager)
+    
+    assert_is_not(environment_manager.with_environment(environment_0, environment_1), derived_manager)
+
+
+def test__EnvironmentManager__populate__clears_memoised():
+    """
+    Tests whether ``EnvironmentManager.populate`` works as intended.
+    
+    Case: the managers created before are not reused.
+    """
+    environment_0 = GeneratorEnvironment()
+    
+    environment_manager = EnvironmentManager()
+    derived_manager = environment_manager.with_environment(environment_0)
+    
+    environment_manager.populate()
+    assert_is_not(environment_manager.with_environment(environment_0), derived_manager)
+
+
+def test__apply_environments_for_file_at__cache_cleared():
+    """
+    Tests whether ``apply_environments_for_file_at`` works as intended.
+    
+    Case: setting an environment clears the cached environments.
+    """
+    path = '/vampytest/does/not/exist/test__apply_environments_for_file_at.py'
+    environment_0 = DefaultEnvironment()
+    
+    environment_manager = EnvironmentManager().populate()
+    
+    try:
+        # Other test files might have set a global environment.
+        environments = _get_environments_for_file_at(path)
+        
+        _set_environment_by_scope(environment_0, ENVIRONMENT_SCOPE_FILE, path)
+        assert_eq(_get_environments_for_file_at(path), (*environments, environment_0))
+        
+        derived_manager = apply_environments_for_file_at(environment_manager, path)
+        assert_is(derived_manager.get_environment_for_test(_test), environment_0)
+        assert_is(apply_environments_for_file_at(environment_manager, path), derived_manager)
+    
+    finally:
+        ENVIRONMENTS_BY_SCOPE.get(ENVIRONMENT_SCOPE_FILE, {}).pop(path, None)
+        ENVIRONMENTS_BY_FILE_PATH.pop(path, None)
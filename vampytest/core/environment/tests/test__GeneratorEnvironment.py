@@ -0,0 +1,124 @@
+from time import sleep
+
+from ...assertions import assert_eq, assert_is, assert_true
+
+from ..generator import GeneratorEnvironment
+
+
+def _generate(count):
+    """
+    Yields the numbers up to the given count, then returns it.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    count : `int`
+        The amount of numbers to yield.
+    
+    Yields
+    ------
+    value : `int`
+    
+    Returns
+    -------
+    count : `int`
+    """
+    for value in range(count):
+        yield value
+    
+    return count
+
+
+def _generate_raise():
+    """
+    Yields a value then raises.
+    
+    This function is an iterable generator.
+    
+    Yields
+    ------
+    value : `int`
+    
+    Raises
+    ------
+    ValueError
+    """
+    yield 1
+    raise ValueError('satori')
+
+
+def _generate_hang():
+    """
+    Yields a value then hangs.
+    
+    This function is an iterable generator.
+    
+    Yields
+    ------
+    value : `int`
+    """
+    yield 1
+    sleep(10.0)
+
+
+def test__GeneratorEnvironment__iter_run():
+    """
+    Tests whether ``GeneratorEnvironment.iter_run`` works as intended.
+    
+    Case: returning.
+    """
+    environment = GeneratorEnvironment()
+    
+    output = [
+        (result_state.is_return(), result_state.result, streamed)
+        for result_state, streamed in environment.iter_run(_generate, [2], {})
+    ]
+    
+    assert_eq(output, [(True, 0, True), (True, 1, True), (True, 2, False)])
+
+
+def test__GeneratorEnvironment__iter_run__raise():
+    """
+    Tests whether ``GeneratorEnvironment.iter_run`` works as intended.
+    
+    Case: raising.
+    """
+    environment = GeneratorEnvironment()
+    
+    output = [*environment.iter_run(_generate_raise, [], {})]
+    
+    assert_eq(len(output), 2)
+    assert_eq(output[0][0].result, 1)
+    assert_true(output[1][0].is_raise())
+    assert_is(type(output[1][0].result), ValueError)
+    assert_eq(output[1][1], False)
+
+
+def test__GeneratorEnvironment__iter_run__timeout():
+    """
+    Tests whether ``GeneratorEnvironment.iter_run`` works as intended.
+    
+    Case: timing out while producing a value.
+    """
+    environment = GeneratorEnvironment(timeout = 0.05)
+    
+    output = [*environment.iter_run(_generate_hang, [], {})]
+    
+    assert_eq(len(output), 2)
+    assert_eq(output[0][0].result, 1)
+    assert_true(output[1][0].is_raise())
+    assert_is(type(output[1][0].result), TimeoutError)
+    assert_eq(output[1][1], False)
+
+
+def test__GeneratorEnvironment__run():
+    """
+    Tests whether ``GeneratorEnvironment.run`` works as intended.
+    """
+    environment = GeneratorEnvironment()
+    
+    result_state = environment.run(_generate, [3], {})
+    
+    assert_true(result_state.is_return())
+    assert_eq(result_state.result, [0, 1, 2])
@@ -0,0 +1,186 @@
+from io import StringIO
+
+from scarletio import Task, get_event_loop, sleep
+
+from ...assertions import assert_eq, assert_in, assert_is, assert_is_not, assert_true
+
+from ..scarletio_coroutine import ScarletioCoroutineEnvironment
+
+
+async def _get_event_loop():
+    """
+    Returns the event loop the test runs on.
+    
+    This function is a coroutine.
+    
+    Returns
+    -------
+    event_loop : ``EventThread``
+    """
+    return get_event_loop()
+
+
+async def _sleep_long():
+    """
+    Sleeps for a long time.
+    
+    This function is a coroutine.
+    """
+    await sleep(100.0)
+
+
+async def _leak_task():
+    """
+    Leaves a pending task behind, then returns the event loop the test runs on.
+    
+    This function is a coroutine.
+    
+    Returns
+    -------
+    event_loop : ``EventThread``
+    """
+    event_loop = get_event_loop()
+    Task(event_loop, _sleep_long())
+    return event_loop
+
+
+def test__ScarletioCoroutineEnvironment__run__pooled():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run`` works as intended.
+    
+    Case: pooled, reusing the event loop.
+    """
+    environment = ScarletioCoroutineEnvironment(pooled = True)
+    try:
+        result_state_0 = environment.run(_get_event_loop, [], {})
+        result_state_1 = environment.run(_get_event_loop, [], {})
+        
+        assert_true(result_state_0.is_return())
+        assert_is(result_state_0.result, result_state_1.result)
+        assert_eq(environment._idle_event_loops, [result_state_0.result])
+    
+    finally:
+        environment.shutdown()
+
+
+def test__ScarletioCoroutineEnvironment__run__pooled_leak():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run`` works as intended.
+    
+    Case: pooled, test leaking a task.
+    """
+    environment = ScarletioCoroutineEnvironment(pooled = True)
+    try:
+        result_state_0 = environment.run(_leak_task, [], {})
+        result_state_1 = environment.run(_get_event_loop, [], {})
+    
+    finally:
+        environment.shutdown()
+    
+    assert_true(result_state_0.is_return())
+    assert_is_not(result_state_0.result, result_state_1.result)
+    assert_true(result_state_0.result.is_stopped())
+    assert_in('pending task', result_state_0.leak_message)
+    assert_is(result_state_1.leak_message, None)
+
+
+def test__ScarletioCoroutineEnvironment__run__not_pooled():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run`` works as intended.
+    
+    Case: not pooled, creating a new event loop every time.
+    """
+    environment = ScarletioCoroutineEnvironment()
+    
+    result_state_0 = environment.run(_get_event_loop, [], {})
+    result_state_1 = environment.run(_get_event_loop, [], {})
+    
+    assert_is_not(result_state_0.result, result_state_1.result)
+    assert_eq(environment._idle_event_loops, [])
+
+
+async def _print_after(value, delay):
+    """
+    Prints the given value, sleeps, then prints it again and returns it.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    value : `int`
+        The value to print and return.
+    delay : `float`
+        The time to sleep.
+    
+    Returns
+    -------
+    value : `int`
+    """
+    print('start', value)
+    await sleep(delay)
+    print('end', value)
+    return value
+
+
+def test__ScarletioCoroutineEnvironment__run_concurrently():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run_concurrently`` works as intended.
+    
+    Case: outcomes in order, output captured per test.
+    """
+    environment = ScarletioCoroutineEnvironment(concurrency = 2)
+    streams = [StringIO() for index in range(3)]
+    
+    outcomes = environment.run_concurrently([
+        (_print_after, [index], {'delay': 0.01 * (3 - index)}, stream) for index, stream in enumerate(streams)
+    ])
+    
+    assert_eq([outcome[0].result for outcome in outcomes], [0, 1, 2])
+    assert_eq(
+        [stream.getvalue() for stream in streams],
+        [f'start {index}\nend {index}\n' for index in range(3)],
+    )
+
+
+def test__ScarletioCoroutineEnvironment__run_concurrently__timeout():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run_concurrently`` works as intended.
+    
+    Case: timing out a test.
+    """
+    environment = ScarletioCoroutineEnvironment(concurrency = 2, timeout = 0.05)
+    
+    outcomes = environment.run_concurrently([
+        (_sleep_long, [], {}, StringIO()),
+        (_get_event_loop, [], {}, StringIO()),
+    ])
+    
+    assert_true(outcomes[0][0].is_raise())
+    assert_is(type(outcomes[0][0].result), TimeoutError)
+    assert_true(outcomes[1][0].is_return())
+
+
+def test__ScarletioCoroutineEnvironment__run_concurrently__pooled_leak():
+    """
+    Tests whether ``ScarletioCoroutineEnvironment.run_concurrently`` works as intended.
+    
+    Case: pooled, test leaking a task.
+    """
+    environment = ScarletioCoroutineEnvironment(concurrency = 2, pooled = True)
+    streams = [StringIO() for index in range(2)]
+    try:
+        outcomes = environment.run_concurrently([
+            (_leak_task, [], {}, streams[0]),
+            (_get_event_loop, [], {}, streams[1]),
+        ])
+    
+    finally:
+        environment.shutdown()
+    
+    assert_true(outcomes[0][0].is_return())
+    assert_true(outcomes[0][0].result.is_stopped())
+    assert_eq(environment._idle_event_loops, [])
+    for outcome in outcomes:
+        assert_in('pending task', outcome[0].leak_message)
+    
+    assert_eq([stream.getvalue() for stream in streams], ['', ''])
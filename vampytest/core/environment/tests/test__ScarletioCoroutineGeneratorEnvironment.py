@@ -0,0 +1,87 @@
+from scarletio import sleep
+
+from ...assertions import assert_eq, assert_is, assert_true
+
+from ..scarletio_coroutine_generator import ScarletioCoroutineGeneratorEnvironment
+
+
+async def _generate(count):
+    """
+    Yields the numbers up to the given count.
+    
+    This function is a coroutine generator.
+    
+    Parameters
+    ----------
+    count : `int`
+        The amount of numbers to yield.
+    
+    Yields
+    ------
+    value : `int`
+    """
+    for value in range(count):
+        await sleep(0.0)
+        yield value
+
+
+async def _generate_raise():
+    """
+    Yields a value then raises.
+    
+    This function is a coroutine generator.
+    
+    Yields
+    ------
+    value : `int`
+    
+    Raises
+    ------
+    ValueError
+    """
+    yield 1
+    raise ValueError('satori')
+
+
+def test__ScarletioCoroutineGeneratorEnvironment__iter_run():
+    """
+    Tests whether ``ScarletioCoroutineGeneratorEnvironment.iter_run`` works as intended.
+    
+    Case: returning.
+    """
+    environment = ScarletioCoroutineGeneratorEnvironment()
+    
+    output = [
+        (result_state.is_return(), result_state.result, streamed)
+        for result_state, streamed in environment.iter_run(_generate, [2], {})
+    ]
+    
+    assert_eq(output, [(True, 0, True), (True, 1, True), (True, None, False)])
+
+
+def test__ScarletioCoroutineGeneratorEnvironment__iter_run__raise():
+    """
+    Tests whether ``ScarletioCoroutineGeneratorEnvironment.iter_run`` works as intended.
+    
+    Case: raising.
+    """
+    environment = ScarletioCoroutineGeneratorEnvironment()
+    
+    output = [*environment.iter_run(_generate_raise, [], {})]
+    
+    assert_eq(len(output), 2)
+    assert_eq(output[0][0].result, 1)
+    assert_true(output[1][0].is_raise())
+    assert_is(type(output[1][0].result), ValueError)
+
+
+def test__ScarletioCoroutineGeneratorEnvironment__run():
+    """
+    Tests whether ``ScarletioCoroutineGeneratorEnvironment.run`` works as intended.
+    """
+    environment = ScarletioCoroutineGeneratorEnvironment()
+    
+    result_state = environment.run(_generate, [3], {})
+    
+    assert_true(result_state.is_return())
+    assert_eq(result_state.result, [0, 1, 2])
@@ -0,0 +1,133 @@
+from time import sleep
+
+from ...assertions import assert_eq, assert_instance, assert_is, assert_true
+from ...handling import ResultState
+
+from ..default import DefaultEnvironment
+from ..generator import GeneratorEnvironment
+from ..scarletio_coroutine import ScarletioCoroutineEnvironment
+from ..timeout import TimeoutEnvironment, apply_timeout
+
+
+class CustomEnvironment(DefaultEnvironment):
+    """
+    Environment returning a fixed value instead of calling the test.
+    """
+    __slots__ = ()
+    
+    def run(self, test, positional_parameters, keyword_parameters):
+        return ResultState().with_return('custom')
+
+
+def _hang():
+    """
+    Hangs.
+    """
+    sleep(10.0)
+
+
+def _generate_hang():
+    """
+    Yields a value then hangs.
+    
+    This function is an iterable generator.
+    
+    Yields
+    ------
+    value : `int`
+    """
+    yield 1
+    sleep(10.0)
+
+
+def test__TimeoutEnvironment__new():
+    """
+    Tests whether ``TimeoutEnvironment.__new__`` works as intended.
+    """
+    wrapped_environment = GeneratorEnvironment()
+    environment = TimeoutEnvironment(wrapped_environment, 0.5)
+    assert_is(environment.environment, wrapped_environment)
+    assert_eq(environment.timeout, 0.5)
+    assert_eq(environment.identifier, wrapped_environment.identifier)
+    assert_true(environment.is_streaming())
+
+
+def test__TimeoutEnvironment__run__wrapped_environment():
+    """
+    Tests whether ``TimeoutEnvironment.run`` works as intended.
+    
+    Case: the test is ran by the wrapped environment.
+    """
+    environment = TimeoutEnvironment(CustomEnvironment(), 0.5)
+    
+    result_state = environment.run(_hang, [], {})
+    
+    assert_true(result_state.is_return())
+    assert_eq(result_state.result, 'custom')
+
+
+def test__TimeoutEnvironment__run__timeout():
+    """
+    Tests whether ``TimeoutEnvironment.run`` works as intended.
+    
+    Case: timing out.
+    """
+    environment = TimeoutEnvironment(DefaultEnvironment(), 0.05)
+    
+    result_state = environment.run(_hang, [], {})
+    
+    assert_true(result_state.is_raise())
+    assert_instance(result_state.result, TimeoutError)
+    assert_true('0.05' in str(result_state.result))
+
+
+def test__TimeoutEnvironment__run__timeout_inside_wrapped_timeout():
+    """
+    Tests whether ``TimeoutEnvironment.run`` works as intended.
+    
+    Case: timing out before the wrapped environment's own timeout.
+    """
+    environment = TimeoutEnvironment(DefaultEnvironment(timeout = 60.0), 0.05)
+    
+    result_state = environment.run(_hang, [], {})
+    
+    assert_true(result_state.is_raise())
+    assert_instance(result_state.result, TimeoutError)
+    assert_true('0.05' in str(result_state.result))
+
+
+def test__TimeoutEnvironment__iter_run__timeout():
+    """
+    Tests whether ``TimeoutEnvironment.iter_run`` works as intended.
+    
+    Case: timing out while producing a value.
+    """
+    environment = TimeoutEnvironment(GeneratorEnvironment(), 0.05)
+    
+    output = [*environment.iter_run(_generate_hang, [], {})]
+    
+    assert_eq(len(output), 2)
+    assert_eq(output[0][0].result, 1)
+    assert_true(output[0][1])
+    assert_true(output[1][0].is_raise())
+    assert_is(type(output[1][0].result), TimeoutError)
+    assert_eq(output[1][1], False)
+
+
+def test__apply_timeout():
+    """
+    Tests whether ``apply_timeout`` works as intended.
+    """
+    environment = CustomEnvironment()
+    
+    output = apply_timeout(environment, None)
+    assert_is(output, environment)
+    
+    output = apply_timeout(environment, 0.5)
+    assert_instance(output, TimeoutEnvironment)
+    assert_is(output.environment, environment)
+    assert_eq(output.timeout, 0.5)
+    
+    environment = ScarletioCoroutineEnvironment()
+    output = apply_timeout(environment, 0.5)
+    assert_is(output, environment)
@@ -0,0 +1,147 @@
+__all__ = ('TimeoutEnvironment', 'apply_timeout')
+
+from scarletio import copy_docs, export
+
+from ..handling import ResultState
+
+from .constants import ENVIRONMENT_TYPE_DEFAULT, ENVIRONMENT_TYPE_GENERATOR
+from .default import DefaultEnvironment
+from .watchdog import Watchdog, WatchdogInterrupt
+
+
+class TimeoutEnvironment(DefaultEnvironment):
+    """
+    Runs the tests in an other environment with a watchdog around it, interrupting them if they run for too long.
+    
+    Used to apply the timeout of a single test on the environment resolved for it.
+    
+    Attributes
+    ----------
+    environment : ``DefaultEnvironment``
+        The environment to run the tests in.
+    timeout : `float`
+        The maximal timeout to interrupt each test after. For streaming environments it is applied on producing each
+        value.
+    """
+    __slots__ = ('environment',)
+    
+    def __new__(cls, environment, timeout):
+        """
+        Creates a new timeout environment.
+        
+        Parameters
+        ----------
+        environment : ``DefaultEnvironment``
+            The environment to run the tests in.
+        timeout : `float`
+            The maximal timeout to interrupt each test after.
+        """
+        self = object.__new__(cls)
+        self.environment = environment
+        self.timeout = timeout
+        return self
+    
+    
+    @copy_docs(DefaultEnvironment.__repr__)
+    def __repr__(self):
+        repr_parts = ['<', self.__class__.__name__]
+        
+        repr_parts.append(' environment = ')
+        repr_parts.append(repr(self.environment))
+        
+        repr_parts.append(', timeout = ')
+        repr_parts.append(repr(self.timeout))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @property
+    def identifier(self):
+        """
+        Returns the identifier of the wrapped environment.
+        
+        Returns
+        -------
+        identifier : `int`
+        """
+        return self.environment.identifier
+    
+    
+    @copy_docs(DefaultEnvironment.run)
+    def run(self, test, positional_parameters, keyword_parameters):
+        watchdog = Watchdog(self.timeout)
+        try:
+            with watchdog:
+                result_state = self.environment.run(test, positional_parameters, keyword_parameters)
+        except WatchdogInterrupt as interrupt:
+            watchdog.stop()
+            return ResultState().with_raise(watchdog.build_timeout_error(interrupt))
+        
+        # The environment might have caught the interrupt, or the test could not be interrupted.
+        if watchdog.timed_out:
+            return ResultState().with_raise(watchdog.build_timeout_error(None))
+        
+        return result_state
+    
+    
+    @copy_docs(DefaultEnvironment.is_streaming)
+    def is_streaming(self):
+        return self.environment.is_streaming()
+    
+    
+    @copy_docs(DefaultEnvironment.iter_run)
+    def iter_run(self, test, positional_parameters, keyword_parameters):
+        iterator = self.environment.iter_run(test, positional_parameters, keyword_parameters)
+        try:
+            while True:
+                watchdog = Watchdog(self.timeout)
+                try:
+                    with watchdog:
+                        result_state, streamed = next(iterator)
+                except StopIteration:
+                    return
+                
+                except WatchdogInterrupt as interrupt:
+                    watchdog.stop()
+                    yield ResultState().with_raise(watchdog.build_timeout_error(interrupt)), False
+                    return
+                
+                if watchdog.timed_out:
+                    yield ResultState().with_raise(watchdog.build_timeout_error(None)), False
+                    return
+                
+                yield result_state, streamed
+                
+                if not streamed:
+                    return
+        
+        finally:
+            iterator.close()
+
+
+@export
+def apply_timeout(environment, timeout):
+    """
+    Applies the given timeout on the environment resolved for a synchronous test.
+    
+    Coroutine tests are left to be interrupted by their environment's timeout.
+    
+    Parameters
+    ----------
+    environment : ``DefaultEnvironment``
+        The environment resolved for the test.
+    timeout : `None | float`
+        The maximal timeout to interrupt the test after.
+    
+    Returns
+    -------
+    environment : ``DefaultEnvironment``
+    """
+    if timeout is None:
+        return environment
+    
+    if environment.identifier not in (ENVIRONMENT_TYPE_DEFAULT, ENVIRONMENT_TYPE_GENERATOR):
+        return environment
+    
+    return TimeoutEnvironment(environment, timeout)
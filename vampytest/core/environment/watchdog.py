@@ -0,0 +1,296 @@
+__all__ = ()
+
+import sys
+from threading import Event, Lock, Thread, get_ident, main_thread
+from time import perf_counter
+
+from scarletio import RichAttributeErrorBaseType
+
+
+try:
+    from signal import SIGALRM, SIG_DFL, pthread_kill, signal as set_signal_handler
+except ImportError:
+    # windows
+    SIGALRM = None
+    SIG_DFL = None
+    pthread_kill = None
+    set_signal_handler = None
+
+
+try:
+    from ctypes import c_ulong, py_object, pythonapi
+    set_async_exception = pythonapi.PyThreadState_SetAsyncExc
+except (AttributeError, ImportError):
+    # Not CPython.
+    c_ulong = None
+    py_object = None
+    set_async_exception = None
+
+
+class WatchdogInterrupt(BaseException):
+    """
+    Raised into the code ran by a watchdog when it timed out. Derives from ``BaseException``, so tests catching
+    ``Exception`` do not swallow it.
+    """
+
+
+def _format_stack(frame, stop_frame):
+    """
+    Formats the given stack in the same way as `faulthandler` dumps it.
+    
+    Parameters
+    ----------
+    frame : `None | FrameType`
+        The most recent frame of the stack.
+    stop_frame : `None | FrameType`
+        The frame to stop at. Not included.
+    
+    Returns
+    -------
+    stack : `str`
+    """
+    lines = []
+    
+    while (frame is not None) and (frame is not stop_frame):
+        code = frame.f_code
+        lines.append(f'  File "{code.co_filename}", line {frame.f_lineno} in {code.co_name}\n')
+        frame = frame.f_back
+    
+    return ''.join(lines)
+
+
+class Watchdog(RichAttributeErrorBaseType):
+    """
+    Context manager interrupting the code ran inside of it, if it does not finish in time.
+    
+    A watchdog thread waits for the timeout. If it passes, the thread dumps the stack of the code, then interrupts it
+    by raising ``WatchdogInterrupt`` into it. The main thread is interrupted by a signal, so even blocking calls are
+    interrupted. Other threads are interrupted when they run python code next.
+    
+    Attributes
+    ----------
+    _active : `bool`
+        Whether the code is still running and can be interrupted.
+    _entered_frame : `None | FrameType`
+        The frame the watchdog was entered from. The stack is dumped till it.
+    _lock : ``Lock``
+        Lock to not interrupt the code while the watchdog is stopped.
+    _previous_signal_handler : `None | object`
+        The signal handler to restore after the watchdog is stopped.
+    _stop_event : ``Event``
+        Event set when the code finished to stop the watchdog thread.
+    _thread : `None | Thread`
+        The watchdog thread.
+    _thread_identifier : `int`
+        The identifier of the thread running the code.
+    _uses_signal : `bool`
+        Whether the code is interrupted by a signal.
+    elapsed : `float`
+        How long the code ran in seconds.
+    stack : `None | str`
+        The dumped stack of the code when it timed out.
+    started : `float`
+        When the code started to run.
+    timed_out : `bool`
+        Whether the code timed out.
+    timeout : `None | float`
+        The time in seconds to interrupt the code after. If `None` the code is not interrupted.
+    """
+    __slots__ = (
+        '_active', '_entered_frame', '_lock', '_previous_signal_handler', '_stop_event', '_thread',
+        '_thread_identifier', '_uses_signal', 'elapsed', 'stack', 'started', 'timed_out', 'timeout'
+    )
+    
+    def __new__(cls, timeout):
+        """
+        Creates a new watchdog.
+        
+        Parameters
+        ----------
+        timeout : `None | float`
+            The time in seconds to interrupt the code after. If `None` the code is not interrupted.
+        """
+        self = object.__new__(cls)
+        self._active = False
+        self._entered_frame = None
+        self._lock = None
+        self._previous_signal_handler = None
+        self._stop_event = None
+        self._thread = None
+        self._thread_identifier = 0
+        self._uses_signal = False
+        self.elapsed = 0.0
+        self.stack = None
+        self.started = 0.0
+        self.timed_out = False
+        self.timeout = timeout
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the watchdog's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' timeout = ')
+        repr_parts.append(repr(self.timeout))
+        
+        if self.timed_out:
+            repr_parts.append(', timed_out = True')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __enter__(self):
+        """
+        Starts the watchdog.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        self.started = perf_counter()
+        
+        timeout = self.timeout
+        if timeout is None:
+            return self
+        
+        thread_identifier = get_ident()
+        uses_signal = (SIGALRM is not None) and (thread_identifier == main_thread().ident)
+        if (not uses_signal) and (set_async_exception is None):
+            return self
+        
+        if uses_signal:
+            previous_signal_handler = set_signal_handler(SIGALRM, self._handle_signal)
+            # `None` if the handler was not set from python.
+            if previous_signal_handler is None:
+                previous_signal_handler = SIG_DFL
+            
+            self._previous_signal_handler = previous_signal_handler
+        
+        self._active = True
+        self._entered_frame = sys._getframe(1)
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread_identifier = thread_identifier
+        self._uses_signal = uses_signal
+        
+        thread = Thread(target = self._watch, name = f'{type(self).__name__} watching', daemon = True)
+        self._thread = thread
+        thread.start()
+        return self
+    
+    
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        """
+        Stops the watchdog.
+        
+        Parameters
+        ----------
+        exception_type : `None | type<BaseException>`
+            The raised exception's type.
+        exception_value : `None | BaseException`
+            The raised exception.
+        exception_traceback : `None | TracebackType`
+            The raised exception's traceback.
+        
+        Returns
+        -------
+        suppress : `bool`
+        """
+        self.stop()
+        return False
+    
+    
+    def stop(self):
+        """
+        Stops the watchdog. Can be called more times.
+        
+        Since the code can be interrupted right before the watchdog is stopped by exiting it, it should be stopped
+        again after catching ``WatchdogInterrupt``. The code is interrupted only once.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        
+        with self._lock:
+            self._active = False
+        
+        self._stop_event.set()
+        thread.join()
+        self._thread = None
+        self._entered_frame = None
+        self.elapsed = perf_counter() - self.started
+        
+        if self._uses_signal:
+            set_signal_handler(SIGALRM, self._previous_signal_handler)
+            self._previous_signal_handler = None
+        
+        elif self.timed_out:
+            # Clear the exception if it was not raised yet.
+            set_async_exception(c_ulong(self._thread_identifier), None)
+    
+    
+    def _watch(self):
+        """
+        Waits for the timeout, then interrupts the code if it is still running.
+        """
+        if self._stop_event.wait(self.timeout):
+            return
+        
+        with self._lock:
+            if not self._active:
+                return
+            
+            self.timed_out = True
+            self.stack = _format_stack(sys._current_frames().get(self._thread_identifier, None), self._entered_frame)
+            
+            if self._uses_signal:
+                pthread_kill(self._thread_identifier, SIGALRM)
+            else:
+                set_async_exception(c_ulong(self._thread_identifier), py_object(WatchdogInterrupt))
+    
+    
+    def _handle_signal(self, signal_number, frame):
+        """
+        Handles the signal sent by the watchdog thread, by interrupting the code if it is still running.
+        
+        Parameters
+        ----------
+        signal_number : `int`
+            The received signal.
+        frame : `None | FrameType`
+            The interrupted frame.
+        
+        Raises
+        ------
+        WatchdogInterrupt
+        """
+        if self._active:
+            self._active = False
+            raise WatchdogInterrupt()
+    
+    
+    def build_timeout_error(self, interrupt):
+        """
+        Builds the exception describing the timeout.
+        
+        Parameters
+        ----------
+        interrupt : `None | WatchdogInterrupt`
+            The exception the code was interrupted with. Its traceback is reused.
+        
+        Returns
+        -------
+        exception : `TimeoutError`
+        """
+        exception = TimeoutError(
+            f'Test timed out after {self.timeout!r} seconds; ran for {self.elapsed:.3f} seconds.\n'
+            f'Stack when it timed out (most recent call first):\n'
+            f'{self.stack}'
+        )
+        
+        if (interrupt is not None):
+            exception = exception.with_traceback(interrupt.__traceback__)
+        
+        return exception
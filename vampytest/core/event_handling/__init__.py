@@ -1,14 +1,22 @@
 from .rendering_helpers import *
 
 from .base import *
+from .collection_writer import *
 from .default import *
 from .default_output_writer import *
+from .journal import *
+from .junit_xml import *
+from .result_file import *
 
 
 __all__ = (
     *rendering_helpers.__all__,
     
     *base.__all__,
+    *collection_writer.__all__,
     *default.__all__,
     *default_output_writer.__all__,
+    *journal.__all__,
+    *junit_xml.__all__,
+    *result_file.__all__,
 )
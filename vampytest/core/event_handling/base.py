@@ -1,10 +1,11 @@
 __all__ = ('EventHandlerManager',)
 
-from scarletio import CallableAnalyzer, RichAttributeErrorBaseType
+from scarletio import CallableAnalyzer, RichAttributeErrorBaseType, export
 
 from ..events import EventBase
 
 
+@export
 class EventHandlerManager(RichAttributeErrorBaseType):
     """
     Event handler for handling test runner events.
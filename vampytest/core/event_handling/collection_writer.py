@@ -0,0 +1,196 @@
+__all__ = ('CollectionWriter',)
+
+import sys
+from json import dumps as dump_json
+
+from scarletio import RichAttributeErrorBaseType, export
+
+from ..events import FileLoadDoneEvent, TestingEndEvent, TestingStartEvent
+
+from .rendering_helpers.case_modifiers import iter_build_case_modifier
+from .result_file import build_load_failure_record
+
+
+RECORD_TYPE_CASE = 'case'
+
+
+def build_handle_record(handle, wrapper_group_index):
+    """
+    Builds a collection record from the given test handle.
+    
+    Parameters
+    ----------
+    handle : ``Handle``
+        The test handle to build record from.
+    wrapper_group_index : `None | int`
+        The index of the handle's wrapper group within its test case. `None` if the test case has no wrappers.
+    
+    Returns
+    -------
+    record : `dict<str, object>`
+    """
+    case = handle.case
+    call_state = handle.build_call_state()
+    case_modifier = ''.join(iter_build_case_modifier(call_state))
+    
+    wrappers = handle.wrappers
+    if wrappers is None:
+        wrapper_names = None
+    else:
+        wrapper_names = [type(wrapper).__name__ for wrapper in wrappers]
+    
+    return {
+        'type': RECORD_TYPE_CASE,
+        'import_route': case.import_route,
+        'name': case.name,
+        'wrapper_group': wrapper_group_index,
+        'wrappers': wrapper_names,
+        'call_state_name': call_state.name,
+        'case_modifier': case_modifier if case_modifier else None,
+        'skipped': case.do_skip(),
+    }
+
+
+def iter_build_test_file_records(test_file):
+    """
+    Builds the collection records of a loaded test file.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The loaded test file.
+    
+    Yields
+    ------
+    record : `dict<str, object>`
+    """
+    if test_file.is_loaded_with_failure():
+        yield build_load_failure_record(test_file)
+        return
+    
+    # Directories have no test cases of their own.
+    if test_file.is_directory():
+        return
+    
+    for test_case in test_file.iter_test_cases():
+        for wrapper_group_index, handle in enumerate(test_case.iter_handles()):
+            yield build_handle_record(handle, None if handle.wrappers is None else wrapper_group_index)
+
+
+@export
+class CollectionWriter(RichAttributeErrorBaseType):
+    """
+    Writes the collected test handles as json lines without running them.
+    
+    Attributes
+    ----------
+    file : `None | io-like`
+        The opened file to write to.
+    path : `None | str`
+        Path to the file to write to. If `None`, writes to the standard output.
+    """
+    __slots__ = ('file', 'path')
+    
+    def __new__(cls, path):
+        """
+        Creates a new collection writer.
+        
+        Parameters
+        ----------
+        path : `None | str`
+            Path to the file to write to. If `None`, writes to the standard output.
+        """
+        self = object.__new__(cls)
+        self.file = None
+        self.path = path
+        return self
+    
+    
+    @classmethod
+    def from_configuration(cls, configuration):
+        """
+        Creates a new collection writer from the given configuration.
+        
+        Parameters
+        ----------
+        configuration : ``RunnerConfiguration``
+            The runner's settings.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+            Returns `None` if not collecting.
+        """
+        if not configuration.is_collecting_only():
+            return None
+        
+        return cls(configuration.collect_file_path)
+    
+    
+    def __repr__(self):
+        """Returns the collection writer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def testing_start(self, event : TestingStartEvent):
+        """
+        Opens the file to write to when testing started.
+        
+        Parameters
+        ----------
+        event : ``TestingStartEvent``
+            The dispatched event.
+        """
+        path = self.path
+        if path is None:
+            file = sys.stdout
+        else:
+            file = open(path, 'w', encoding = 'utf-8')
+        
+        self.file = file
+    
+    
+    def file_load_done(self, event : FileLoadDoneEvent):
+        """
+        Writes the test handles of the loaded test file.
+        
+        Parameters
+        ----------
+        event : ``FileLoadDoneEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        for record in iter_build_test_file_records(event.file):
+            file.write(dump_json(record))
+            file.write('\n')
+        
+        file.flush()
+    
+    
+    def testing_end(self, event : TestingEndEvent):
+        """
+        Closes the file written to when testing ended.
+        
+        Parameters
+        ----------
+        event : ``TestingEndEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        self.file = None
+        if (self.path is not None):
+            file.close()
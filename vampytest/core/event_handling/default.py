@@ -14,8 +14,10 @@ from ..events import (
 from .base import EventHandlerManager
 from .default_output_writer import OutputWriter
 from .rendering_helpers.load_failure_rendering import produce_load_failure_exception
-from .rendering_helpers.case_modifiers import iter_build_case_modifier
-from .rendering_helpers.writers import write_load_failure, write_result_failing, write_result_informal
+from .rendering_helpers.case_modifiers import iter_build_result_case_modifier
+from .rendering_helpers.writers import (
+    write_durations, write_load_failure, write_result_failing, write_result_informal
+)
 
 
 IS_WINDOWS = PLATFORM == 'win32'
@@ -224,16 +226,21 @@ class DefaultEventFormatter(RichAttributeErrorBaseType):
             token_type = HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_UNKNOWN
         
         highlight_streamer = get_highlight_streamer(self.highlighter)
-        name = ''.join([
+        name_parts = [
             *highlight_streamer.asend((token_type, keyword)),
             *highlight_streamer.asend((token_type,' ')),
             *highlight_streamer.asend((token_type, result.case.name)),
             *chain.from_iterable(
                 highlight_streamer.asend((token_type, part))
-                    for part in iter_build_case_modifier(result.get_final_call_state())
+                    for part in iter_build_result_case_modifier(result)
             ),
-            *highlight_streamer.asend(None),
-        ])
+        ]
+        
+        if result.is_cached():
+            name_parts.extend(highlight_streamer.asend((HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL, ' (cached)')))
+        
+        name_parts.extend(highlight_streamer.asend(None))
+        name = ''.join(name_parts)
         message_parts = test_file.entry.render_custom_sub_directory_into(
             message_parts,
             name,
@@ -283,6 +290,10 @@ class DefaultEventFormatter(RichAttributeErrorBaseType):
             for result in context.iter_informal_results():
                 write_result_informal(output_writer, result, highlight_streamer)
         
+        durations_count = context.runner.configuration.durations_count
+        if durations_count:
+            write_durations(output_writer, context, durations_count, highlight_streamer)
+        
         # build the summary line
         message_parts = []
         
@@ -349,6 +360,13 @@ class DefaultEventFormatter(RichAttributeErrorBaseType):
             f'{passed_count} passed',
         )))
         
+        cached_count = context.get_cached_test_count()
+        if cached_count:
+            message_parts.extend(highlight_streamer.asend((
+                HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL,
+                f' ({cached_count} cached)',
+            )))
+        
         if load_failures:
             # Separator
             message_parts.extend(highlight_streamer.asend((
@@ -0,0 +1,252 @@
+__all__ = ('JournalWriter', 'iter_read_journal')
+
+from json import JSONDecodeError, dumps as dump_json, loads as load_json
+from os import fsync
+from time import perf_counter
+
+from scarletio import RichAttributeErrorBaseType, export
+
+from ..events import FileLoadDoneEvent, TestDoneEvent, TestingEndEvent, TestingStartEvent
+
+from .result_file import RECORD_TYPE_SUMMARY, build_load_failure_record, build_result_record
+
+
+JOURNAL_VERSION = 1
+
+RECORD_TYPE_JOURNAL = 'journal'
+
+DEFAULT_SYNC_INTERVAL = 1.0
+
+
+def build_journal_result_record(result):
+    """
+    Builds a journal record from the given result.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to build record from.
+    
+    Returns
+    -------
+    record : `dict<str, object>`
+    """
+    record = build_result_record(result)
+    
+    timings = result.timings
+    record['duration'] = None if timings is None else timings.get_total_time()
+    return record
+
+
+def iter_read_journal(path):
+    """
+    Reads the records of the journal at the given path.
+    
+    A journal of an interrupted run might end with a partially written record, it is ignored.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the journal.
+    
+    Yields
+    ------
+    record : `dict<str, object>`
+    
+    Raises
+    ------
+    OSError
+        - If the journal could not be read.
+    ValueError
+        - If a record is not valid json other than the last one.
+    """
+    with open(path, 'r', encoding = 'utf-8') as file:
+        line_to_decode = None
+        
+        for line in file:
+            if (line_to_decode is not None):
+                yield load_json(line_to_decode)
+            
+            line_to_decode = line if line.strip() else None
+        
+        if (line_to_decode is not None):
+            try:
+                record = load_json(line_to_decode)
+            except JSONDecodeError:
+                return
+            
+            yield record
+
+
+@export
+class JournalWriter(RichAttributeErrorBaseType):
+    """
+    Appends the results to a journal file as json lines when each test is done, so the results of a killed run are not
+    lost.
+    
+    Attributes
+    ----------
+    file : `None | io-like`
+        The opened file to write to.
+    last_sync : `float`
+        When the file was last synchronised to the disk. Uses `perf_counter` as reference.
+    path : `str`
+        Path to the file to write to.
+    sync_interval : `float`
+        The minimal interval in seconds between synchronising the file to the disk.
+    """
+    __slots__ = ('file', 'last_sync', 'path', 'sync_interval')
+    
+    def __new__(cls, path, *, sync_interval = DEFAULT_SYNC_INTERVAL):
+        """
+        Creates a new journal writer.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the file to write to.
+        sync_interval : `float` = `DEFAULT_SYNC_INTERVAL`, Optional (Keyword only)
+            The minimal interval in seconds between synchronising the file to the disk.
+        """
+        self = object.__new__(cls)
+        self.file = None
+        self.last_sync = 0.0
+        self.path = path
+        self.sync_interval = sync_interval
+        return self
+    
+    
+    @classmethod
+    def from_configuration(cls, configuration):
+        """
+        Creates a new journal writer from the given configuration.
+        
+        Parameters
+        ----------
+        configuration : ``RunnerConfiguration``
+            The runner's settings.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+            Returns `None` if no journal is requested.
+        """
+        journal_file_path = configuration.journal_file_path
+        if journal_file_path is None:
+            return None
+        
+        return cls(journal_file_path)
+    
+    
+    def __repr__(self):
+        """Returns the journal writer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        sync_interval = self.sync_interval
+        if sync_interval != DEFAULT_SYNC_INTERVAL:
+            repr_parts.append(', sync_interval = ')
+            repr_parts.append(repr(sync_interval))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _write_record(self, record):
+        """
+        Writes the given record into the journal. Synchronises the file to the disk if the sync interval passed.
+        
+        Parameters
+        ----------
+        record : `dict<str, object>`
+            The record to write.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        file.write(dump_json(record))
+        file.write('\n')
+        # Flush, so the record is not lost if only the process is killed.
+        file.flush()
+        
+        now = perf_counter()
+        if now - self.last_sync >= self.sync_interval:
+            self.last_sync = now
+            fsync(file.fileno())
+    
+    
+    def testing_start(self, event : TestingStartEvent):
+        """
+        Opens the journal when testing started.
+        
+        Parameters
+        ----------
+        event : ``TestingStartEvent``
+            The dispatched event.
+        """
+        self.file = open(self.path, 'w', encoding = 'utf-8')
+        self.last_sync = perf_counter()
+        self._write_record({
+            'type': RECORD_TYPE_JOURNAL,
+            'version': JOURNAL_VERSION,
+        })
+    
+    
+    def file_load_done(self, event : FileLoadDoneEvent):
+        """
+        Writes the load failure of the test file if it failed to load.
+        
+        Parameters
+        ----------
+        event : ``FileLoadDoneEvent``
+            The dispatched event.
+        """
+        test_file = event.file
+        if test_file.is_loaded_with_failure():
+            self._write_record(build_load_failure_record(test_file))
+    
+    
+    def test_done(self, event : TestDoneEvent):
+        """
+        Writes the result of the done test.
+        
+        Parameters
+        ----------
+        event : ``TestDoneEvent``
+            The dispatched event.
+        """
+        self._write_record(build_journal_result_record(event.result))
+    
+    
+    def testing_end(self, event : TestingEndEvent):
+        """
+        Writes the summary and closes the journal when testing ended.
+        
+        Parameters
+        ----------
+        event : ``TestingEndEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        context = event.context
+        self._write_record({
+            'type': RECORD_TYPE_SUMMARY,
+            'passed': context.get_passed_test_count(),
+            'failed': context.get_failed_test_count(),
+            'skipped': context.get_skipped_test_count(),
+            'load_failures': len(context.get_file_load_failures()),
+        })
+        
+        self.file = None
+        try:
+            fsync(file.fileno())
+        finally:
+            file.close()
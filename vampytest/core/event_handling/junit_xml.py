@@ -0,0 +1,286 @@
+__all__ = ('JUnitXMLWriter',)
+
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from scarletio import RichAttributeErrorBaseType, export
+
+from ..events import FileLoadDoneEvent, TestDoneEvent, TestingEndEvent, TestingStartEvent
+from ..result import DetachedResult
+
+from .rendering_helpers.case_modifiers import iter_build_result_case_modifier
+from .rendering_helpers.result_rendering import produce_result_failing, produce_result_informal
+from .result_file import join_tokens
+
+
+TEST_SUITE_NAME = 'vampytest'
+LOAD_FAILURE_CASE_NAME = '<module>'
+
+# Characters not allowed in xml 1.0, like the ones of ansi escape sequences.
+INVALID_XML_CHARACTERS_RP = re.compile('[^\\u0009\\u000a\\u000d\\u0020-\\ud7ff\\ue000-\\ufffd\\U00010000-\\U0010ffff]')
+
+
+def escape_text(text):
+    """
+    Escapes the given text to be written into an xml element.
+    
+    Parameters
+    ----------
+    text : `str`
+        The text to escape.
+    
+    Returns
+    -------
+    text : `str`
+    """
+    return escape(INVALID_XML_CHARACTERS_RP.sub('?', text))
+
+
+def escape_attribute(value):
+    """
+    Escapes and quotes the given value to be written as an xml attribute.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to escape.
+    
+    Returns
+    -------
+    value : `str`
+    """
+    return quoteattr(INVALID_XML_CHARACTERS_RP.sub('?', value))
+
+
+def get_result_output(result):
+    """
+    Returns the captured output of the given result.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to get its output of.
+    
+    Returns
+    -------
+    output : `None | str`
+    """
+    if isinstance(result, DetachedResult):
+        if result.is_informal():
+            return join_tokens(produce_result_informal(result))
+        
+        return None
+    
+    output_report = result.get_output_report()
+    if output_report is None:
+        return None
+    
+    return output_report.output
+
+
+def iter_build_result_element(result):
+    """
+    Builds the `<testcase>` element of the given result.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to build the element of.
+    
+    Yields
+    ------
+    part : `str`
+    """
+    case = result.case
+    
+    yield '<testcase classname='
+    yield escape_attribute(case.import_route)
+    yield ' name='
+    yield escape_attribute(''.join([case.name, *iter_build_result_case_modifier(result)]))
+    
+    timings = result.timings
+    if (timings is not None):
+        yield ' time="'
+        yield format(timings.get_total_time() / 1_000_000_000, '.6f')
+        yield '"'
+    
+    yield '>'
+    
+    if result.is_skipped():
+        yield '<skipped/>'
+    
+    elif result.is_failed():
+        yield '<failure message="Test failed.">'
+        yield escape_text(join_tokens(produce_result_failing(result)))
+        yield '</failure>'
+    
+    output = get_result_output(result)
+    if output:
+        yield '<system-out>'
+        yield escape_text(output)
+        yield '</system-out>'
+    
+    yield '</testcase>\n'
+
+
+def iter_build_load_failure_element(test_file):
+    """
+    Builds the `<testcase>` element of the given test file failed to load.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The test file failed to load.
+    
+    Yields
+    ------
+    part : `str`
+    """
+    yield '<testcase classname='
+    yield escape_attribute(test_file.import_route)
+    yield ' name='
+    yield escape_attribute(LOAD_FAILURE_CASE_NAME)
+    yield '><error message="Test file failed to load.">'
+    yield escape_text(join_tokens(test_file.get_load_failure().iter_exception_tokens()))
+    yield '</error></testcase>\n'
+
+
+@export
+class JUnitXMLWriter(RichAttributeErrorBaseType):
+    """
+    Writes the results into a JUnit XML file. Each `<testcase>` element is written when its test is done, so the
+    results are not accumulated in memory.
+    
+    The results of different test files might be interleaved when ran in worker processes, so they are written into a
+    single `<testsuite>`, using the test files' import routes as class names.
+    
+    Attributes
+    ----------
+    file : `None | io-like`
+        The opened file to write to.
+    path : `str`
+        Path to the file to write to.
+    """
+    __slots__ = ('file', 'path')
+    
+    def __new__(cls, path):
+        """
+        Creates a new JUnit XML writer.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the file to write to.
+        """
+        self = object.__new__(cls)
+        self.file = None
+        self.path = path
+        return self
+    
+    
+    @classmethod
+    def from_configuration(cls, configuration):
+        """
+        Creates a new JUnit XML writer from the given configuration.
+        
+        Parameters
+        ----------
+        configuration : ``RunnerConfiguration``
+            The runner's settings.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+            Returns `None` if no JUnit XML file is requested.
+        """
+        junit_xml_file_path = configuration.junit_xml_file_path
+        if junit_xml_file_path is None:
+            return None
+        
+        return cls(junit_xml_file_path)
+    
+    
+    def __repr__(self):
+        """Returns the JUnit XML writer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def testing_start(self, event : TestingStartEvent):
+        """
+        Opens the file and writes the opening elements when testing started.
+        
+        Parameters
+        ----------
+        event : ``TestingStartEvent``
+            The dispatched event.
+        """
+        file = open(self.path, 'w', encoding = 'utf-8')
+        file.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        file.write('<testsuites>\n')
+        file.write(f'<testsuite name={escape_attribute(TEST_SUITE_NAME)}>\n')
+        self.file = file
+    
+    
+    def file_load_done(self, event : FileLoadDoneEvent):
+        """
+        Writes the test file as an erroring test case if it failed to load.
+        
+        Parameters
+        ----------
+        event : ``FileLoadDoneEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        test_file = event.file
+        if test_file.is_loaded_with_failure():
+            file.write(''.join(iter_build_load_failure_element(test_file)))
+    
+    
+    def test_done(self, event : TestDoneEvent):
+        """
+        Writes the test case element of the done test.
+        
+        Parameters
+        ----------
+        event : ``TestDoneEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        file.write(''.join(iter_build_result_element(event.result)))
+    
+    
+    def testing_end(self, event : TestingEndEvent):
+        """
+        Writes the closing elements and closes the file when testing ended.
+        
+        Parameters
+        ----------
+        event : ``TestingEndEvent``
+            The dispatched event.
+        """
+        file = self.file
+        if file is None:
+            return
+        
+        self.file = None
+        try:
+            file.write('</testsuite>\n')
+            file.write('</testsuites>\n')
+        finally:
+            file.close()
@@ -1,5 +1,6 @@
 from .assertion_rendering import *
 from .case_modifiers import *
+from .duration_rendering import *
 from .load_failure_rendering import *
 from .parameter_rendering import *
 from .report_rendering import *
@@ -11,6 +12,7 @@ from .writers import *
 __all__ = (
     *assertion_rendering.__all__,
     *case_modifiers.__all__,
+    *duration_rendering.__all__,
     *load_failure_rendering.__all__,
     *parameter_rendering.__all__,
     *report_rendering.__all__,
@@ -2,6 +2,38 @@ __all__ = ()
 
 from reprlib import repr as short_repr
 
+from ...result import DetachedResult
+
+
+def iter_build_result_case_modifier(result):
+    """
+    Builds the case modifier of the given result.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to build its case modifier.
+    
+    Yields
+    ------
+    part : `str`
+    """
+    if isinstance(result, DetachedResult):
+        case_modifier = result.case_modifier
+        if (case_modifier is not None):
+            yield case_modifier
+        return
+    
+    yield from iter_build_case_modifier(result.get_final_call_state())
+    
+    sub_case = result.sub_case
+    if (sub_case is not None):
+        yield '{'
+        yield sub_case
+        yield '}'
+
 
 def iter_build_case_modifier(call_state):
     """
@@ -0,0 +1,211 @@
+__all__ = ()
+
+from scarletio import HIGHLIGHT_TOKEN_TYPES
+
+from .case_modifiers import iter_build_result_case_modifier
+
+
+def format_duration(duration):
+    """
+    Formats the given duration.
+    
+    Parameters
+    ----------
+    duration : `int`
+        Duration in nanoseconds.
+    
+    Returns
+    -------
+    formatted : `str`
+    """
+    return f'{duration / 1_000_000_000:.3f}s'
+
+
+def get_file_time(test_file):
+    """
+    Returns the total time spent on importing and running the test file.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The test file.
+    
+    Returns
+    -------
+    file_time : `int`
+    """
+    file_time = test_file.import_time
+    if file_time is None:
+        file_time = 0
+    
+    for result in test_file.iter_results():
+        timings = result.timings
+        if (timings is not None):
+            file_time += timings.get_total_time()
+    
+    return file_time
+
+
+def get_slowest_results(context, count):
+    """
+    Returns the slowest results.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    count : `int`
+        The maximal amount of results to return.
+    
+    Returns
+    -------
+    results : `list<Result | DetachedResult>`
+    """
+    results = [result for result in context.iter_results() if (result.timings is not None)]
+    results.sort(key = lambda result: result.timings.get_total_time(), reverse = True)
+    del results[count:]
+    return results
+
+
+def get_slowest_files(context, count):
+    """
+    Returns the slowest test files with their total time.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    count : `int`
+        The maximal amount of test files to return.
+    
+    Returns
+    -------
+    test_files_and_times : `list<(TestFile, int)>`
+    """
+    test_files_and_times = [
+        (test_file, get_file_time(test_file)) for test_file in context.iter_registered_files()
+        if (not test_file.is_directory()) and (test_file.import_time is not None)
+    ]
+    test_files_and_times.sort(key = lambda item: item[1], reverse = True)
+    del test_files_and_times[count:]
+    return test_files_and_times
+
+
+def get_slowest_imports(context, count):
+    """
+    Returns the slowest to import test files.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    count : `int`
+        The maximal amount of test files to return.
+    
+    Returns
+    -------
+    test_files : `list<TestFile>`
+    """
+    test_files = [test_file for test_file in context.iter_registered_files() if (test_file.import_time is not None)]
+    test_files.sort(key = lambda test_file: test_file.import_time, reverse = True)
+    del test_files[count:]
+    return test_files
+
+
+def _produce_section_title(title):
+    """
+    Produces a duration section's title.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    title : `str`
+        The title to produce.
+    
+    Yields
+    -------
+    token_type_and_part : `(int, str)`
+    """
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL, title
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'
+
+
+def _produce_duration_line(duration, details, name):
+    """
+    Produces a line of a duration section.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    duration : `int`
+        The duration to produce in nanoseconds.
+    details : `None | str`
+        Additional details to produce after the duration.
+    name : `str`
+        The name of the timed object.
+    
+    Yields
+    -------
+    token_type_and_part : `(int, str)`
+    """
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_SPACE, '    '
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_NUMERIC_FLOAT, format_duration(duration).rjust(9)
+    
+    if (details is not None):
+        yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_SPACE, ' '
+        yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT, details
+    
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_SPACE, ' '
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT, name
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'
+
+
+def produce_durations(context, count):
+    """
+    Produces the slowest tests, the slowest test files and the slowest imports.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    count : `int`
+        The maximal amount of entries to produce in each section.
+    
+    Yields
+    -------
+    token_type_and_part : `(int, str)`
+    """
+    yield from _produce_section_title(f'Slowest {count} test(s):')
+    for result in get_slowest_results(context, count):
+        timings = result.timings
+        case = result.case
+        yield from _produce_duration_line(
+            timings.get_total_time(),
+            (
+                f'(call {format_duration(timings.call_wall_time)}, '
+                f'cpu {format_duration(timings.call_cpu_time)}, '
+                f'setup {format_duration(timings.get_setup_time())}, '
+                f'teardown {format_duration(timings.get_teardown_time())})'
+            ),
+            ''.join([case.import_route, '.', case.name, *iter_build_result_case_modifier(result)]),
+        )
+    
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'
+    
+    yield from _produce_section_title(f'Slowest {count} test file(s):')
+    for test_file, file_time in get_slowest_files(context, count):
+        yield from _produce_duration_line(
+            file_time,
+            f'(import {format_duration(test_file.import_time)})',
+            test_file.import_route,
+        )
+    
+    yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'
+    
+    yield from _produce_section_title(f'Slowest {count} import(s):')
+    for test_file in get_slowest_imports(context, count):
+        yield from _produce_duration_line(test_file.import_time, None, test_file.import_route)
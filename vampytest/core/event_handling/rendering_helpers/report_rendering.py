@@ -7,7 +7,12 @@ from scarletio.utils.trace.trace import _produce_exception, _produce_frames
 from ...assertions import AssertionRaising
 from ...assertions.exception import _ignore_assertion_frames
 from ...environment.default import __file__ as VAMPYTEST_ENVIRONMENT_DEFAULT_FILE_PATH
+from ...environment.generator import __file__ as VAMPYTEST_ENVIRONMENT_GENERATOR_FILE_PATH
 from ...environment.scarletio_coroutine import __file__ as VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_FILE_PATH
+from ...environment.scarletio_coroutine_generator import (
+    __file__ as VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_GENERATOR_FILE_PATH
+)
+from ...environment.watchdog import __file__ as VAMPYTEST_ENVIRONMENT_WATCHDOG_FILE_PATH
 from ...result import (
     ReportFailureAsserting, ReportFailureParameterMismatch, ReportFailureRaising, ReportFailureReturning
 )
@@ -76,7 +81,7 @@ def produce_output_report(report, path_parts, name, documentation_lines, call_st
     """
     yield from produce_test_header(
         HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL,
-        'Captured output', 
+        'Captured output',
         path_parts,
         name,
         documentation_lines,
@@ -85,6 +90,44 @@ def produce_output_report(report, path_parts, name, documentation_lines, call_st
     yield from _produce_break_and_output(HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL, report.output)
 
 
+def produce_leak_report(report, path_parts, name, documentation_lines, call_state):
+    """
+    Renders leak report.
+    
+    This functions is an iterable generator.
+    
+    Parameter
+    ---------
+    report : ``ReportLeak``
+        Report containing what the test left behind.
+    
+    path_parts : `tuple<str>`
+        Path parts from the imported file.
+    
+    name : `str`
+        The test's name.
+    
+    documentation_lines : `None | list<str>`
+        Lines of the test's documentation.
+    
+    call_state : ``None | CallState``
+        Call state of the report.
+    
+    Yields
+    -------
+    token_type_and_part : `(int, str)`
+    """
+    yield from produce_test_header(
+        HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL,
+        'Leaked resources',
+        path_parts,
+        name,
+        documentation_lines,
+        call_state,
+    )
+    yield from _produce_break_and_output(HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEUTRAL, report.message)
+
+
 def _maybe_produce_output_report(report):
     """
     Renders the captured output report as a section into the given list.
@@ -286,7 +329,7 @@ def _produce_report_parameter_mismatch(report, path_parts, name, documentation_l
     """
     yield from produce_test_header(
         HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE,
-        'Parameter mismatch', 
+        'Parameter mismatch',
         path_parts,
         name,
         documentation_lines,
@@ -360,6 +403,21 @@ def _ignore_invoke_test_frame(frame):
             if line == 'returned_value = await test(*positional_parameters, **keyword_parameters)':
                 should_show_frame = False
     
+    elif file_name == VAMPYTEST_ENVIRONMENT_GENERATOR_FILE_PATH:
+        if name == 'iter_run':
+            if line == 'value = next(generator)':
+                should_show_frame = False
+    
+    elif file_name == VAMPYTEST_ENVIRONMENT_SCARLETIO_COROUTINE_GENERATOR_FILE_PATH:
+        if name == '_step_async':
+            if line == 'value = await generator.__anext__()':
+                should_show_frame = False
+    
+    elif file_name == VAMPYTEST_ENVIRONMENT_WATCHDOG_FILE_PATH:
+        if name == '_handle_signal':
+            if line == 'raise WatchdogInterrupt()':
+                should_show_frame = False
+    
     return should_show_frame
 
 
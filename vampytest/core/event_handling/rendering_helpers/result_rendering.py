@@ -2,7 +2,9 @@ __all__ = ()
 
 from scarletio import HIGHLIGHT_TOKEN_TYPES
 
-from .report_rendering import produce_failure_report, produce_output_report
+from ...result import DetachedResult
+
+from .report_rendering import produce_failure_report, produce_leak_report, produce_output_report
 from .result_rendering_common import produce_test_header
 
 
@@ -46,16 +48,22 @@ def produce_result_wrapper_conflict(result):
     -------
     token_type_and_part : `(int, str)`
     """
-    into = produce_test_header(
+    handle = result.handle
+    if handle is None:
+        documentation_lines = None
+    else:
+        documentation_lines = handle.get_test_documentation_lines()
+    
+    yield from produce_test_header(
         HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE,
-        'Wrapper conflict', 
+        'Wrapper conflict',
         result.case.path_parts,
         result.case.name,
-        result.handle.get_test_documentation_lines(),
+        documentation_lines,
         None,
     )
     
-    wrapper_conflict = result.wrapper_conflict
+    wrapper_conflict = result.conflict
     reason = wrapper_conflict.reason
     if (reason is not None):
         yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_TITLE, 'Reason: '
@@ -75,8 +83,6 @@ def produce_result_wrapper_conflict(result):
         yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_SPACE, ' '
         yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT, repr(wrapper_conflict.wrapper_1)
         yield HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'
-    
-    return into
 
 
 def produce_result_failure_report(result):
@@ -104,6 +110,32 @@ def produce_result_failure_report(result):
     )
 
 
+def _maybe_produce_result_leak(result):
+    """
+    Renders the leak report of the given result if it has any.
+    
+    This function is an iterable generator.
+    
+    Parameter
+    ---------
+    result : ``Result``
+        The result to render its leak report of.
+    
+    Yields
+    -------
+    token_type_and_part : `(int, str)`
+    """
+    leak_report = result.get_leak_report()
+    if (leak_report is not None):
+        yield from produce_leak_report(
+            leak_report,
+            result.case.path_parts,
+            result.case.name,
+            result.handle.get_test_documentation_lines(),
+            result.handle.final_call_state,
+        )
+
+
 def produce_result_failing(result):
     """
     Renders a failing result.
@@ -119,6 +151,10 @@ def produce_result_failing(result):
     -------
     token_type_and_part : `(int, str)`
     """
+    if isinstance(result, DetachedResult):
+        yield from result.iter_failure_tokens()
+        return
+    
     if result.is_conflicted():
         producer = produce_result_wrapper_conflict
     elif result.reversed:
@@ -127,6 +163,7 @@ def produce_result_failing(result):
         producer = produce_result_failure_report
     
     yield from producer(result)
+    yield from _maybe_produce_result_leak(result)
 
 
 def produce_result_informal(result):
@@ -144,10 +181,16 @@ def produce_result_informal(result):
     -------
     token_type_and_part : `(int, str)`
     """
+    if isinstance(result, DetachedResult):
+        yield from result.iter_informal_tokens()
+        return
+    
+    yield from _maybe_produce_result_leak(result)
+    
     output_report = result.get_output_report()
     if (output_report is not None):
         yield from produce_output_report(
-            output_report, 
+            output_report,
             result.case.path_parts,
             result.case.name,
             result.handle.get_test_documentation_lines(),
@@ -0,0 +1,27 @@
+from ....utils import _
+from ....wrappers import call_from
+
+from ..duration_rendering import format_duration
+
+
+def _iter_options():
+    yield 0, '0.000s'
+    yield 1_500_000, '0.002s'
+    yield 12_345_000_000, '12.345s'
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__format_duration(duration):
+    """
+    Tests whether ``format_duration`` works as intended.
+    
+    Parameters
+    ----------
+    duration : `int`
+        Duration in nanoseconds.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    return format_duration(duration)
@@ -1,10 +1,8 @@
 __all__ = ()
 
 from scarletio import HIGHLIGHT_TOKEN_TYPES
-from scarletio.utils.trace.trace import _produce_exception
-
-from ...file.load_failure import _ignore_module_import_frame
 
+from .duration_rendering import produce_durations
 from .result_rendering import produce_result_failing, produce_result_informal
 
 
@@ -43,7 +41,33 @@ def write_load_failure(output_writer, load_failure, highlight_streamer):
             '\n',
         )))
     
-    for item in _produce_exception(load_failure.exception, _ignore_module_import_frame):
+    for item in load_failure.iter_exception_tokens():
+        message_parts.extend(highlight_streamer.asend(item))
+    
+    output_writer.write_line(''.join(message_parts))
+    output_writer.write_break_line()
+
+
+def write_durations(output_writer, context, count, highlight_streamer):
+    """
+    Writes the slowest tests, the slowest test files and the slowest imports.
+    
+    Parameters
+    ----------
+    output_writer : ``OutputWriter``
+        The output writer to write the output with.
+    
+    context : ``RunnerContext``
+        The respective test runner context.
+    
+    count : `int`
+        The maximal amount of entries to write in each section.
+    
+    highlight_streamer : `CoroutineGeneratorType`
+        Highlight streamer to highlight the produced tokens.
+    """
+    message_parts = []
+    for item in produce_durations(context, count):
         message_parts.extend(highlight_streamer.asend(item))
     
     output_writer.write_line(''.join(message_parts))
@@ -0,0 +1,249 @@
+__all__ = ('ResultFileWriter',)
+
+from json import dumps as dump_json
+
+from scarletio import RichAttributeErrorBaseType, export
+
+from ..events import TestingEndEvent
+
+from .rendering_helpers.case_modifiers import iter_build_result_case_modifier
+from .rendering_helpers.result_rendering import produce_result_failing, produce_result_informal
+
+
+RESULT_FILE_VERSION = 1
+
+RECORD_TYPE_SHARD = 'shard'
+RECORD_TYPE_LOAD_FAILURE = 'load_failure'
+RECORD_TYPE_RESULT = 'result'
+RECORD_TYPE_SUMMARY = 'summary'
+
+STATUS_FAILED = 'failed'
+STATUS_INFORMAL = 'informal'
+STATUS_PASSED = 'passed'
+STATUS_SKIPPED = 'skipped'
+
+
+def join_tokens(tokens):
+    """
+    Joins the given rendered tokens into plain text.
+    
+    Parameters
+    ----------
+    tokens : `iterable<(int, str)>`
+        The tokens to join.
+    
+    Returns
+    -------
+    text : `str`
+    """
+    return ''.join(part for token_type, part in tokens)
+
+
+def build_result_record(result):
+    """
+    Builds a result file record from the given result.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to build record from.
+    
+    Returns
+    -------
+    record : `dict<str, object>`
+    """
+    case = result.case
+    
+    if result.is_skipped():
+        status = STATUS_SKIPPED
+        message = None
+    elif result.is_failed():
+        status = STATUS_FAILED
+        message = join_tokens(produce_result_failing(result))
+    elif result.is_informal():
+        status = STATUS_INFORMAL
+        message = join_tokens(produce_result_informal(result))
+    else:
+        status = STATUS_PASSED
+        message = None
+    
+    case_modifier = ''.join(iter_build_result_case_modifier(result))
+    
+    return {
+        'type': RECORD_TYPE_RESULT,
+        'import_route': case.import_route,
+        'name': case.name,
+        'case_modifier': case_modifier if case_modifier else None,
+        'status': status,
+        'message': message,
+    }
+
+
+def build_load_failure_record(test_file):
+    """
+    Builds a result file record from the given test file failed to load.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The test file failed to load.
+    
+    Returns
+    -------
+    record : `dict<str, object>`
+    """
+    return {
+        'type': RECORD_TYPE_LOAD_FAILURE,
+        'import_route': test_file.import_route,
+        'path': test_file.path,
+        'message': join_tokens(test_file.get_load_failure().iter_exception_tokens()),
+    }
+
+
+def iter_build_records(context, shard_index, shard_count):
+    """
+    Builds the result file records of a test run.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    shard_index : `int`
+        The index of the ran shard.
+    shard_count : `int`
+        The amount of shards.
+    
+    Yields
+    ------
+    record : `dict<str, object>`
+    """
+    yield {
+        'type': RECORD_TYPE_SHARD,
+        'version': RESULT_FILE_VERSION,
+        'index': shard_index + 1,
+        'count': shard_count,
+    }
+    
+    load_failure_count = 0
+    for test_file in context.iter_load_failed_files():
+        load_failure_count += 1
+        yield build_load_failure_record(test_file)
+    
+    passed_count = 0
+    failed_count = 0
+    skipped_count = 0
+    
+    for result in context.iter_results():
+        record = build_result_record(result)
+        status = record['status']
+        if status == STATUS_FAILED:
+            failed_count += 1
+        else:
+            # Skipped tests are counted as passed too, as in the summary of the run.
+            if status == STATUS_SKIPPED:
+                skipped_count += 1
+            
+            passed_count += 1
+        
+        yield record
+    
+    yield {
+        'type': RECORD_TYPE_SUMMARY,
+        'index': shard_index + 1,
+        'passed': passed_count,
+        'failed': failed_count,
+        'skipped': skipped_count,
+        'load_failures': load_failure_count,
+    }
+
+
+@export
+class ResultFileWriter(RichAttributeErrorBaseType):
+    """
+    Writes the results of a test run into a file as json lines, so the result files of separate shards can be merged
+    by concatenating them.
+    
+    Attributes
+    ----------
+    path : `str`
+        Path to the file to write to.
+    shard_count : `int`
+        The amount of shards.
+    shard_index : `int`
+        The index of the ran shard.
+    """
+    __slots__ = ('path', 'shard_count', 'shard_index')
+    
+    def __new__(cls, path, shard_index, shard_count):
+        """
+        Creates a new result file writer.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the file to write to.
+        shard_index : `int`
+            The index of the ran shard.
+        shard_count : `int`
+            The amount of shards.
+        """
+        self = object.__new__(cls)
+        self.path = path
+        self.shard_count = shard_count
+        self.shard_index = shard_index
+        return self
+    
+    
+    @classmethod
+    def from_configuration(cls, configuration):
+        """
+        Creates a new result file writer from the given configuration.
+        
+        Parameters
+        ----------
+        configuration : ``RunnerConfiguration``
+            The runner's settings.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+            Returns `None` if no result file is requested.
+        """
+        result_file_path = configuration.result_file_path
+        if result_file_path is None:
+            return None
+        
+        return cls(result_file_path, configuration.shard_index, configuration.shard_count)
+    
+    
+    def __repr__(self):
+        """Returns the result file writer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        repr_parts.append(', shard = ')
+        repr_parts.append(repr(self.shard_index + 1))
+        repr_parts.append('/')
+        repr_parts.append(repr(self.shard_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def testing_end(self, event : TestingEndEvent):
+        """
+        Writes the results when testing ended.
+        
+        Parameters
+        ----------
+        event : ``TestingEndEvent``
+            The dispatched event.
+        """
+        with open(self.path, 'w', encoding = 'utf-8') as file:
+            for record in iter_build_records(event.context, self.shard_index, self.shard_count):
+                file.write(dump_json(record))
+                file.write('\n')
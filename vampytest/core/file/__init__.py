@@ -1,6 +1,7 @@
 from .collection import *
 from .file_system_entry import *
 from .load_failure import *
+from .static_collection import *
 from .test_file import *
 
 
@@ -8,5 +9,6 @@ __all__ = (
     *collection.__all__,
     *file_system_entry.__all__,
     *load_failure.__all__,
+    *static_collection.__all__,
     *test_file.__all__,
 )
@@ -0,0 +1,161 @@
+__all__ = ()
+
+from os.path import abspath as get_absolute_path, normcase as normalize_case
+from sys import modules
+from types import ModuleType
+
+
+def normalize_path(path):
+    """
+    Normalizes the given path, so paths of the same file are compared as equal.
+    
+    Parameters
+    ----------
+    path : `str`
+        The path to normalize.
+    
+    Returns
+    -------
+    path : `str`
+    """
+    return normalize_case(get_absolute_path(path))
+
+
+def is_project_module_name(module_name, sources):
+    """
+    Returns whether the given module is part of the project.
+    
+    Parameters
+    ----------
+    module_name : `str`
+        The module's name.
+    sources : `set<str>`
+        The project's top level packages.
+    
+    Returns
+    -------
+    is_project_module_name : `bool`
+    """
+    return module_name.partition('.')[0] in sources
+
+
+def iter_parent_module_names(module_name):
+    """
+    Iterates over the names of the packages containing the given module, since importing a module runs them too.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    module_name : `str`
+        The module's name.
+    
+    Yields
+    ------
+    module_name : `str`
+    """
+    while True:
+        module_name, separator, name = module_name.rpartition('.')
+        if not separator:
+            return
+        
+        yield module_name
+
+
+def get_referenced_module_names(module):
+    """
+    Returns the names of the modules referenced from the given module's namespace. Imported modules are referenced
+    directly, while imported functions and types through their `__module__`.
+    
+    Parameters
+    ----------
+    module : `ModuleType`
+        The module to check.
+    
+    Returns
+    -------
+    module_names : `set<str>`
+    """
+    module_names = set()
+    
+    for value in [*module.__dict__.values()]:
+        if isinstance(value, ModuleType):
+            module_name = value.__name__
+        else:
+            try:
+                module_name = getattr(value, '__module__', None)
+            except Exception:
+                continue
+        
+        if isinstance(module_name, str):
+            module_names.add(module_name)
+    
+    return module_names
+
+
+def collect_dependency_paths(module_names, sources, referenced_module_names_cache):
+    """
+    Collects the source files of the given modules and of every project module they depend on. The packages
+    containing these modules are included too, but their own dependencies are not followed, since a package importing
+    all of its modules would make every module depend on each other.
+    
+    Parameters
+    ----------
+    module_names : `iterable<str>`
+        The modules to start from.
+    sources : `set<str>`
+        The project's top level packages. Only the modules of these packages are followed.
+    referenced_module_names_cache : `dict<str, set<str>>`
+        Module names mapped to the names of the modules they reference. Shared between calls, so each module's
+        namespace is checked only once.
+    
+    Returns
+    -------
+    dependency_paths : `list<str>`
+        The source files' normalized paths sorted.
+    """
+    to_check = [*module_names]
+    checked = set()
+    parent_module_names = set()
+    dependency_paths = set()
+    
+    while to_check:
+        module_name = to_check.pop()
+        if module_name in checked:
+            continue
+        
+        checked.add(module_name)
+        
+        module = modules.get(module_name, None)
+        if module is None:
+            continue
+        
+        file_path = getattr(module, '__file__', None)
+        if isinstance(file_path, str):
+            dependency_paths.add(normalize_path(file_path))
+        
+        try:
+            referenced_module_names = referenced_module_names_cache[module_name]
+        except KeyError:
+            referenced_module_names = get_referenced_module_names(module)
+            referenced_module_names_cache[module_name] = referenced_module_names
+        
+        for referenced_module_name in referenced_module_names:
+            if is_project_module_name(referenced_module_name, sources):
+                to_check.append(referenced_module_name)
+        
+        parent_module_names.update(iter_parent_module_names(module_name))
+    
+    for module_name in parent_module_names:
+        if module_name in checked:
+            continue
+        
+        module = modules.get(module_name, None)
+        if module is None:
+            continue
+        
+        file_path = getattr(module, '__file__', None)
+        if isinstance(file_path, str):
+            dependency_paths.add(normalize_path(file_path))
+    
+    return sorted(dependency_paths)
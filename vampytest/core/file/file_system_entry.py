@@ -1,6 +1,6 @@
 __all__ = ('FileSystemEntry',)
 
-from os import listdir as list_directory
+from os import scandir as scan_directory, stat as get_stat
 from os.path import join as join_paths, isdir as is_directory, isfile as is_file
 
 from scarletio import RichAttributeErrorBaseType, WeakReferer
@@ -8,6 +8,46 @@ from scarletio import RichAttributeErrorBaseType, WeakReferer
 
 PYTHON_EXTENSIONS = ('.py', '.pyd', '.pyc', '.so')
 
+# Directories never containing tests, but which can be huge.
+DEFAULT_PRUNE_NAMES = frozenset((
+    '.eggs',
+    '.git',
+    '.hg',
+    '.mypy_cache',
+    '.nox',
+    '.pytest_cache',
+    '.svn',
+    '.tox',
+    '.vampytest_cache',
+    '.venv',
+    '__pycache__',
+    'node_modules',
+    'site-packages',
+    'venv',
+))
+
+# Virtual environments are recognized by this file and are pruned too.
+VIRTUAL_ENVIRONMENT_MARKER_NAME = 'pyvenv.cfg'
+
+
+def build_prune_names(extra_prune_names):
+    """
+    Builds the names of the directories to not look into.
+    
+    Parameters
+    ----------
+    extra_prune_names : `None | iterable<str>`
+        Additional directory names to prune.
+    
+    Returns
+    -------
+    prune_names : `frozenset<str>`
+    """
+    if extra_prune_names is None:
+        return DEFAULT_PRUNE_NAMES
+    
+    return DEFAULT_PRUNE_NAMES.union(extra_prune_names)
+
 
 def is_python_file(path):
     """
@@ -34,13 +74,96 @@ def is_python_file(path):
     return None
 
 
+def list_directory(path, prune_names):
+    """
+    Lists the sub directories and the python files of the given directory, using the file type information
+    `scandir` already holds.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the directory.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    
+    Returns
+    -------
+    listing : `None | list<(str, bool)>`
+        Entry names and whether they are directories sorted by name. `None` if the directory cannot be listed.
+        Virtual environments are listed as empty.
+    """
+    listing = []
+    
+    try:
+        with scan_directory(path) as directory_iterator:
+            for directory_entry in directory_iterator:
+                name = directory_entry.name
+                if name == VIRTUAL_ENVIRONMENT_MARKER_NAME:
+                    return []
+                
+                try:
+                    directory = directory_entry.is_dir()
+                    if directory:
+                        if name in prune_names:
+                            continue
+                    
+                    else:
+                        if not name.endswith(PYTHON_EXTENSIONS):
+                            continue
+                        
+                        if not directory_entry.is_file():
+                            continue
+                
+                except OSError:
+                    continue
+                
+                listing.append((name, directory))
+    
+    except OSError:
+        return None
+    
+    listing.sort()
+    return listing
+
+
 class FileSystemEntry(RichAttributeErrorBaseType):
+    """
+    Represents a file or a directory in the file system.
+    
+    The entries of a directory are looked up with `scandir` only when first iterated over, so directories which cannot
+    contain tests are never walked.
+    
+    Attributes
+    ----------
+    _directory : `bool`
+        Whether the entry is a directory.
+    _directory_path : `str`
+        Path to the entry's directory.
+    _discovery_cache : `None | DiscoveryCache`
+        Cache to take the listing of unchanged directories from.
+    _entries : `None | list<FileSystemEntry>`
+        The entry's sub entries.
+    _full_path : `str`
+        The entry's path.
+    _name : `str`
+        The entry's name.
+    _parent_reference : `None | WeakReferer`
+        Weak reference to the entry's parent.
+    _prune_names : `frozenset<str>`
+        Directory names to not look into.
+    _scanned : `bool`
+        Whether the entry's sub entries are already looked up.
+    _self_reference : `None | WeakReferer`
+        Weak reference to the entry itself.
+    _used : `int`
+        How much times the entry is used.
+    """
     __slots__ = (
-        '__weakref__', '_directory', '_directory_path', '_entries', '_full_path', '_name', '_parent_reference',
-        '_self_reference', '_used'
+        '__weakref__', '_directory', '_directory_path', '_discovery_cache', '_entries', '_full_path', '_name',
+        '_parent_reference', '_prune_names', '_scanned', '_self_reference', '_used'
     )
         
-    def __new__(cls, path, name, limit_lookup_to):
+    def __new__(cls, path, name, limit_lookup_to, prune_names = None, discovery_cache = None):
         """
         Creates a new File system entry.
         
@@ -52,56 +175,131 @@ class FileSystemEntry(RichAttributeErrorBaseType):
             The name of the entry.
         limit_lookup_to : `None | list<str>`
             Limits sub-directory lookups to only the given path.
+        prune_names : `None | frozenset<str>` = `None`, Optional
+            Directory names to not look into. Defaults to the built-in ones.
+        discovery_cache : `None | DiscoveryCache` = `None`, Optional
+            Cache to take the listing of unchanged directories from.
         
         Returns
         -------
         entry : `None | instance<cls>`
         """
+        if prune_names is None:
+            prune_names = DEFAULT_PRUNE_NAMES
+        
         full_path = join_paths(path, name)
         directory = is_directory(full_path)
         
-        entries = None
-        
         if directory:
             if (limit_lookup_to is None) or (not limit_lookup_to):
-                for sub_name in sorted(list_directory(full_path)):
-                    entry = cls(full_path, sub_name, None)
-                    if entry is None:
-                        continue
-                    
-                    if entries is None:
-                        entries = []
-                    
-                    entries.append(entry)
+                scanned = False
+                entries = None
             
             else:
-                entry = cls(full_path, limit_lookup_to[0], limit_lookup_to[1:])
-                if (entry is not None):
-                    if entries is None:
-                        entries = []
-                    
-                    entries.append(entry)
+                scanned = True
+                entry = cls(full_path, limit_lookup_to[0], limit_lookup_to[1:], prune_names, discovery_cache)
+                if entry is None:
+                    entries = None
+                else:
+                    entries = [entry]
+        
         else:
             file_path = is_python_file(full_path)
             if file_path is None:
                 return None
             
             full_path = file_path
+            scanned = True
+            entries = None
+        
+        self = cls._create(path, name, full_path, directory, prune_names, discovery_cache)
+        self._entries = entries
+        self._scanned = scanned
+        
+        if (entries is not None):
+            for entry in entries:
+                entry.link_parent(self)
+        
+        return self
+    
+    
+    @classmethod
+    def _create(cls, path, name, full_path, directory, prune_names, discovery_cache):
+        """
+        Creates a new file system entry without looking up anything.
         
+        Parameters
+        ----------
+        path : `str`
+            Path to the entry's directory.
+        name : `str`
+            The name of the entry.
+        full_path : `str`
+            The entry's path.
+        directory : `bool`
+            Whether the entry is a directory.
+        prune_names : `frozenset<str>`
+            Directory names to not look into.
+        discovery_cache : `None | DiscoveryCache`
+            Cache to take the listing of unchanged directories from.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
         self = object.__new__(cls)
         self._directory = directory
         self._directory_path = path
-        self._entries = entries
+        self._discovery_cache = discovery_cache
+        self._entries = None
         self._full_path = full_path
         self._name = name
         self._parent_reference = None
+        self._prune_names = prune_names
+        self._scanned = not directory
         self._self_reference = None
         self._used = 0
+        return self
+    
+    
+    def _scan(self):
+        """
+        Looks up the sub entries of the entry. If the directory did not change since it was cached, its listing is
+        taken from the discovery cache.
+        """
+        self._scanned = True
+        full_path = self._full_path
+        prune_names = self._prune_names
+        discovery_cache = self._discovery_cache
         
-        for entry in self.iter_entries():
+        if discovery_cache is None:
+            listing = list_directory(full_path, prune_names)
+        
+        else:
+            try:
+                stat_result = get_stat(full_path)
+            except OSError:
+                return
+            
+            listing = discovery_cache.get_listing(full_path, stat_result)
+            if listing is None:
+                listing = list_directory(full_path, prune_names)
+                if (listing is not None):
+                    discovery_cache.set_listing(full_path, stat_result, listing)
+        
+        if not listing:
+            return
+        
+        entries = []
+        
+        for name, directory in listing:
+            entry = type(self)._create(
+                full_path, name, join_paths(full_path, name), directory, prune_names, discovery_cache
+            )
             entry.link_parent(self)
+            entries.append(entry)
         
-        return self
+        self._entries = entries
     
     
     def __bool__(self):
@@ -312,6 +510,9 @@ class FileSystemEntry(RichAttributeErrorBaseType):
         ------
         parent : ``FileSystemEntry``
         """
+        if not self._scanned:
+            self._scan()
+        
         entries = self._entries
         if (entries is not None):
             yield from entries
@@ -328,16 +529,19 @@ class FileSystemEntry(RichAttributeErrorBaseType):
         if not self:
             return False
         
-        entries = None
-        
-        for entry in self.iter_entries():
-            if entry.purge():
-                if entries is None:
-                    entries = []
-                
-                entries.append(entry)
-        
-        self._entries = entries
+        # Not yet scanned entries cannot have used sub entries, do not scan them.
+        old_entries = self._entries
+        if (old_entries is not None):
+            entries = None
+            
+            for entry in old_entries:
+                if entry.purge():
+                    if entries is None:
+                        entries = []
+                    
+                    entries.append(entry)
+            
+            self._entries = entries
         
         return True
     
@@ -1,6 +1,7 @@
 __all__ = ()
 
 from scarletio import RichAttributeErrorBaseType
+from scarletio.utils.trace.trace import _produce_exception
 
 from .test_file import __file__ as VAMPYTEST_TEST_FILE_PATH
 
@@ -39,13 +40,16 @@ class TestFileLoadFailure(RichAttributeErrorBaseType):
     
     Attributes
     ----------
-    exception : `BaseException`
-        The exception.
+    exception : `None | BaseException`
+        The exception. Set as `None` if the test file was loaded in a different process.
+    
+    exception_tokens : `None | list<(int, str)>`
+        The pre-rendered exception if the test file was loaded in a different process.
     
     path : `str`
         The files path which failed to load.
     """
-    __slots__ = ('path', 'exception')
+    __slots__ = ('exception', 'exception_tokens', 'path')
     
     def __new__(cls, test_file, exception):
         """
@@ -58,10 +62,52 @@ class TestFileLoadFailure(RichAttributeErrorBaseType):
         """
         self = object.__new__(cls)
         self.exception = exception
+        self.exception_tokens = None
+        self.path = test_file.path
+        return self
+    
+    
+    @classmethod
+    def from_exception_tokens(cls, test_file, exception_tokens):
+        """
+        Creates a new test file load failure from an already rendered exception.
+        
+        Parameters
+        ----------
+        test_file : ``TestFile``
+            The test file which failed to load.
+        exception_tokens : `list<(int, str)>`
+            The rendered exception.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        self = object.__new__(cls)
+        self.exception = None
+        self.exception_tokens = exception_tokens
         self.path = test_file.path
         return self
     
     
+    def iter_exception_tokens(self):
+        """
+        Iterates over the tokens of the rendered exception.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        token_type_and_part : `(int, str)`
+        """
+        exception_tokens = self.exception_tokens
+        if (exception_tokens is not None):
+            yield from exception_tokens
+            return
+        
+        yield from _produce_exception(self.exception, _ignore_module_import_frame)
+    
+    
     def __repr__(self):
         """Returns the test loading failure's representation."""
         return f'<{type(self).__name__} of {self.path!r}>'
@@ -0,0 +1,348 @@
+__all__ = ('StaticCollection', 'StaticTestCase', 'collect_static')
+
+from ast import (
+    AsyncFunctionDef, Attribute, Call, ClassDef, FunctionDef, Import, ImportFrom, Name, Store, iter_child_nodes,
+    parse as parse_source
+)
+
+from scarletio import RichAttributeErrorBaseType
+
+from .test_file import is_test_name
+
+
+# Names of the wrappers which can decorate a test. `_` just returns what it is called with.
+WRAPPER_NAMES = frozenset((
+    'call_from', 'call_with', 'in_environment', 'named', 'raising', 'returning', 'reverse', 'skip', 'skip_if',
+    'with_gc', 'with_timeout',
+))
+
+WRAP_NOTHING_NAME = '_'
+
+
+class StaticTestCase(RichAttributeErrorBaseType):
+    """
+    Represents a test case found without importing its file.
+    
+    Attributes
+    ----------
+    line : `int`
+        The line the test is defined at.
+    name : `str`
+        The test's name.
+    skipped : `bool`
+        Whether the test is unconditionally skipped.
+    wrappers : `tuple<str>`
+        The test's decorators from top to bottom, each as its called wrapper's name followed by its chained method
+        calls, like `'call_from.returning_last'`.
+    """
+    __slots__ = ('line', 'name', 'skipped', 'wrappers')
+    
+    def __new__(cls, name, line, wrappers, skipped):
+        """
+        Creates a new static test case.
+        
+        Parameters
+        ----------
+        name : `str`
+            The test's name.
+        line : `int`
+            The line the test is defined at.
+        wrappers : `tuple<str>`
+            The test's decorators.
+        skipped : `bool`
+            Whether the test is unconditionally skipped.
+        """
+        self = object.__new__(cls)
+        self.line = line
+        self.name = name
+        self.skipped = skipped
+        self.wrappers = wrappers
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the static test case's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' name = ')
+        repr_parts.append(repr(self.name))
+        
+        repr_parts.append(', line = ')
+        repr_parts.append(repr(self.line))
+        
+        wrappers = self.wrappers
+        if wrappers:
+            repr_parts.append(', wrappers = ')
+            repr_parts.append(repr(wrappers))
+        
+        if self.skipped:
+            repr_parts.append(', skipped')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two static test cases are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.line != other.line:
+            return False
+        
+        if self.name != other.name:
+            return False
+        
+        if self.skipped != other.skipped:
+            return False
+        
+        if self.wrappers != other.wrappers:
+            return False
+        
+        return True
+
+
+class StaticCollection(RichAttributeErrorBaseType):
+    """
+    The test cases of a test file found without importing it.
+    
+    Attributes
+    ----------
+    complete : `bool`
+        Whether the test file surely has no other test cases. Tests created dynamically or decorated with unknown
+        decorators make the collection incomplete.
+    test_cases : `list<StaticTestCase>`
+        The found test cases sorted by their name.
+    """
+    __slots__ = ('complete', 'test_cases')
+    
+    def __new__(cls, test_cases, complete):
+        """
+        Creates a new static collection.
+        
+        Parameters
+        ----------
+        test_cases : `list<StaticTestCase>`
+            The found test cases sorted by their name.
+        complete : `bool`
+            Whether the test file surely has no other test cases.
+        """
+        self = object.__new__(cls)
+        self.complete = complete
+        self.test_cases = test_cases
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the static collection's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' test_case_count = ')
+        repr_parts.append(repr(len(self.test_cases)))
+        
+        if not self.complete:
+            repr_parts.append(', incomplete')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two static collections are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.complete != other.complete:
+            return False
+        
+        if self.test_cases != other.test_cases:
+            return False
+        
+        return True
+    
+    
+    def get_test_case_count(self):
+        """
+        Returns how much test cases were found.
+        
+        Returns
+        -------
+        test_case_count : `int`
+        """
+        return len(self.test_cases)
+    
+    
+    def iter_test_case_names(self):
+        """
+        Iterates over the found test cases' names.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        name : `str`
+        """
+        for test_case in self.test_cases:
+            yield test_case.name
+
+
+def get_decorator_wrapper(node):
+    """
+    Returns the wrapper name and the chained method names of a decorator.
+    
+    Parameters
+    ----------
+    node : `ast.expr`
+        The decorator's node.
+    
+    Returns
+    -------
+    wrapper : `None | str`
+        Returns `None` if the decorator is not a known wrapper.
+    """
+    method_names = []
+    
+    while True:
+        # `_(wrapper)` -> `wrapper`
+        if (
+            isinstance(node, Call) and isinstance(node.func, Name) and (node.func.id == WRAP_NOTHING_NAME) and
+            (len(node.args) == 1) and (not node.keywords)
+        ):
+            node = node.args[0]
+            continue
+        
+        # `wrapper(...).method(...)` -> `wrapper(...)`
+        if isinstance(node, Call) and isinstance(node.func, Attribute) and isinstance(node.func.value, Call):
+            method_names.append(node.func.attr)
+            node = node.func.value
+            continue
+        
+        break
+    
+    if isinstance(node, Call):
+        node = node.func
+    
+    # `vampytest.wrapper` -> `wrapper`
+    if isinstance(node, Attribute):
+        name = node.attr
+    elif isinstance(node, Name):
+        name = node.id
+    else:
+        return None
+    
+    if name not in WRAPPER_NAMES:
+        return None
+    
+    method_names.append(name)
+    method_names.reverse()
+    return '.'.join(method_names)
+
+
+def iter_bound_names(node):
+    """
+    Iterates over the names bound by the given statement in the module's scope.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    node : `ast.AST`
+        The statement's node.
+    
+    Yields
+    ------
+    name : `None | str`
+        `None` is yielded for star imports, since the names they bind are not known.
+    """
+    if isinstance(node, Name):
+        if isinstance(node.ctx, Store):
+            yield node.id
+        return
+    
+    # Functions and classes have their own scope.
+    if isinstance(node, (FunctionDef, AsyncFunctionDef, ClassDef)):
+        yield node.name
+        return
+    
+    if isinstance(node, (Import, ImportFrom)):
+        for alias in node.names:
+            name = alias.name
+            if name == '*':
+                yield None
+                continue
+            
+            as_name = alias.asname
+            if as_name is None:
+                as_name = name.partition('.')[0]
+            
+            yield as_name
+        
+        return
+    
+    for sub_node in iter_child_nodes(node):
+        yield from iter_bound_names(sub_node)
+
+
+def _static_test_case_sort_key(test_case):
+    """
+    Sort key for static test cases.
+    
+    Parameters
+    ----------
+    test_case : ``StaticTestCase``
+        Test case to get it's sort keys.
+    
+    Returns
+    -------
+    sort_key : `str`
+    """
+    return test_case.name
+
+
+def collect_static(source):
+    """
+    Collects the test cases of a test file from its source without importing it.
+    
+    Parameters
+    ----------
+    source : `str | bytes`
+        The test file's source.
+    
+    Returns
+    -------
+    static_collection : `None | StaticCollection`
+        Returns `None` if the source cannot be parsed.
+    """
+    try:
+        module_node = parse_source(source)
+    except (SyntaxError, ValueError):
+        return None
+    
+    test_cases = {}
+    complete = True
+    
+    for node in module_node.body:
+        if isinstance(node, (FunctionDef, AsyncFunctionDef)) and is_test_name(node.name):
+            wrappers = []
+            skipped = False
+            
+            for decorator_node in node.decorator_list:
+                wrapper = get_decorator_wrapper(decorator_node)
+                if wrapper is None:
+                    complete = False
+                    continue
+                
+                if wrapper == 'skip':
+                    skipped = True
+                
+                wrappers.append(wrapper)
+            
+            test_cases[node.name] = StaticTestCase(node.name, node.lineno, tuple(wrappers), skipped)
+            continue
+        
+        for name in iter_bound_names(node):
+            if (name is None) or is_test_name(name):
+                complete = False
+                test_cases.pop(name, None)
+    
+    return StaticCollection(sorted(test_cases.values(), key = _static_test_case_sort_key), complete)
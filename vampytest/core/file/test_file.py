@@ -1,15 +1,19 @@
 __all__ = ('TestFile', )
 
 from sys import modules
+from time import perf_counter_ns
 from types import FunctionType
 
 from scarletio import RichAttributeErrorBaseType
 
 from ..environment import apply_environments_for_file_at
+from ..handling import iter_invoke_items
 from ..helpers.path_repr import get_short_path_repr
+from ..result import ResultTally
 from ..test_case import TestCase
 from ..wrappers import WrapperBase
 
+from .dependencies import collect_dependency_paths, is_project_module_name
 from .load_failure import TestFileLoadFailure
 
 
@@ -87,19 +91,33 @@ class TestFile(RichAttributeErrorBaseType):
     ----------
     _load_failure : `None`, ``TestFileLoadFailure``
         If loading the test file fails, this attribute is set to details about the occurred exception.
+    _load_skipped : `bool`
+        Whether loading the test file was skipped, because none of its test cases are selected to run.
     _module : `None`, `ModuleType`
         The module of the test file. Only set when the first call is made to it.
     _results : `None`, `list` of ``Result``
         Results of already ran tests.
     _sub_files : `None`, `list` of ``TestFile``
         Sub files if we are a directory.
+    _tallies : `list<ResultTally>`
+        The tallies to count the results added to the file in. Contains the file's own tally and the ones of its
+        parents.
     _test_cases : `None`, `list` of ``TestCase``
         The collected test_cases from the file if any. These test_cases are on collected after calling ``.get_test_cases`` for
         the first time.
+    dependency_paths : `None | list<str>`
+        The normalized paths of the project source files the test file depends on. Set as `None` if not yet
+        collected.
     entry : ``FileSystemEntry``
         The test file's respective file's or directory's entry in the file system.
+    import_time : `None | int`
+        How much time importing the test file took in nanoseconds. Set as `None` if not yet imported.
+    imported_module_names : `None | tuple<str>`
+        The names of the modules imported first by importing the test file. Set as `None` if not yet imported.
     path_parts : `tuple<str>`
         Path parts from the base path to import the file from.
+    tally : ``ResultTally``
+        Counts the results of the file, including its sub-files' ones.
     
     Utility Methods
     ---------------
@@ -107,6 +125,7 @@ class TestFile(RichAttributeErrorBaseType):
     
         - ``.is_loaded_with_success``
         - ``.is_loaded_with_failure``
+        - ``.is_load_skipped``
         - ``.get_load_failure``
         - ``.is_directory``
         - ``.is_loaded``
@@ -125,6 +144,7 @@ class TestFile(RichAttributeErrorBaseType):
         - ``.get_test_case_count``
         - ``.get_ran_test_count``
         - ``.get_passed_test_count``
+        - ``.get_cached_test_count``
         - ``.get_skipped_test_count``
         - ``.get_failed_test_count``
         - ``.get_test_file_count``
@@ -136,11 +156,16 @@ class TestFile(RichAttributeErrorBaseType):
         - ``.get_test_cases``
         - ``.iter_test_cases``
         - ``.iter_invoke_test_cases``
+        - ``.add_result``
+        - ``.restore_load``
+        - ``.collect_dependency_paths``
         - ``.feed_sub_file``
+        - ``.add_tally``
         - ``.iter_test_files``
     """
     __slots__ = (
-        '__weakref__', '_load_failure', '_module', '_results', '_sub_files', '_test_cases', 'entry', 'path_parts'
+        '__weakref__', '_load_failure', '_load_skipped', '_module', '_results', '_sub_files', '_tallies',
+        '_test_cases', 'dependency_paths', 'entry', 'import_time', 'imported_module_names', 'path_parts', 'tally'
     )
     
     def __new__(cls, entry):
@@ -164,14 +189,22 @@ class TestFile(RichAttributeErrorBaseType):
                 if last_path_part.endswith('.py'):
                     path_parts[-1] = last_path_part[:-len('.py')]
         
+        tally = ResultTally()
+        
         self = object.__new__(cls)
         self._load_failure = None
+        self._load_skipped = False
         self._module = None
         self._results = None
         self._sub_files = None
+        self._tallies = [tally]
         self._test_cases = None
+        self.dependency_paths = None
         self.entry = entry
+        self.import_time = None
+        self.imported_module_names = None
         self.path_parts = path_parts
+        self.tally = tally
         return self
     
     
@@ -257,24 +290,67 @@ class TestFile(RichAttributeErrorBaseType):
             Whether the module loaded.
         """
         import_route = self.import_route
+        module_names = {*modules.keys()}
         
+        start = perf_counter_ns()
         try:
             __import__(import_route)
         except BaseException as err:
             self._load_failure = TestFileLoadFailure(self, err)
             return False
+        finally:
+            self.import_time = perf_counter_ns() - start
+        
+        self.imported_module_names = tuple(
+            module_name for module_name in [*modules.keys()] if module_name not in module_names
+        )
         
         module = modules[import_route]
         self._module = module
         return True
     
     
-    def try_load_test_cases(self):
+    def collect_dependency_paths(self, sources, referenced_module_names_cache):
+        """
+        Collects the paths of the project source files the test file depends on, by following the imports of the
+        modules imported first by the test file.
+        
+        Parameters
+        ----------
+        sources : `set<str>`
+            The project's top level packages.
+        referenced_module_names_cache : `dict<str, set<str>>`
+            Module names mapped to the names of the modules they reference.
+        
+        Returns
+        -------
+        dependency_paths : `None | list<str>`
+            Returns `None` if the test file is not imported.
+        """
+        if self._module is None:
+            return None
+        
+        module_names = [self.import_route]
+        for module_name in self.imported_module_names:
+            if is_project_module_name(module_name, sources):
+                module_names.append(module_name)
+        
+        dependency_paths = collect_dependency_paths(module_names, sources, referenced_module_names_cache)
+        self.dependency_paths = dependency_paths
+        return dependency_paths
+    
+    
+    def try_load_test_cases(self, case_filter = None):
         """
         Loads the file's test_cases. Does method if the test file is a directory.
         
         If loading fails, returns an object representing its failure.
         
+        Parameters
+        ----------
+        case_filter : `None | ShardFilter` = `None`, Optional
+            Filter to select the test cases to load with.
+        
         Returns
         -------
         loaded : `bool`
@@ -290,7 +366,9 @@ class TestFile(RichAttributeErrorBaseType):
         test_cases = []
         
         for name, value in module.__dict__.items():
-            if is_test(name, value):
+            if is_test(name, value) and (
+                (case_filter is None) or case_filter.is_case_selected(self.import_route, name)
+            ):
                 test_cases.append(TestCase(self, name, value))
         
         test_cases.sort(key = _test_case_sort_key)
@@ -332,6 +410,17 @@ class TestFile(RichAttributeErrorBaseType):
         return self._load_failure is not None
     
     
+    def is_load_skipped(self):
+        """
+        Returns whether loading the test file was skipped.
+        
+        Returns
+        -------
+        is_load_skipped : `bool`
+        """
+        return self._load_skipped
+    
+    
     def get_load_failure(self):
         """
         Returns the loading failure representing the exception occurred when loading the test file.
@@ -359,6 +448,27 @@ class TestFile(RichAttributeErrorBaseType):
         return [*self.iter_test_cases()]
     
     
+    def get_test_case_at(self, index):
+        """
+        Returns the test case of the test file at the given index.
+        
+        Parameters
+        ----------
+        index : `int`
+            The test case's index.
+        
+        Returns
+        -------
+        test_case : `None | TestCase`
+            Returns `None` if the test file has no test case at the given index.
+        """
+        test_cases = self._test_cases
+        if (test_cases is None) or (index < 0) or (index >= len(test_cases)):
+            return None
+        
+        return test_cases[index]
+    
+    
     def iter_test_cases(self):
         """
         Iterates over the test_cases of the test file.
@@ -377,7 +487,7 @@ class TestFile(RichAttributeErrorBaseType):
             yield from sub_file.iter_test_cases()
     
     
-    def iter_invoke_test_cases(self, environment_manager):
+    def iter_invoke_test_cases(self, environment_manager, result_cache = None):
         """
         Iterates over the test cases of the file and invokes them. Yields the test cases' results. If the file is a
         directory will do nothing.
@@ -388,10 +498,12 @@ class TestFile(RichAttributeErrorBaseType):
         ----------
         environment_manager : ``EnvironmentManager``
             Testing environment manager.
+        result_cache : `None | ResultCache` = `None`, Optional
+            Result cache to reuse the results of the test cases passed with the same code from.
         
         Yields
         ------
-        result : ``Result``
+        result : ``Result | DetachedResult``
         """
         if self.is_directory():
             return
@@ -400,16 +512,150 @@ class TestFile(RichAttributeErrorBaseType):
         if (results is not None):
             return (yield from results)
         
+        if result_cache is None:
+            file_key = None
+        else:
+            file_key = result_cache.get_file_key(self.dependency_paths)
+        
         environment_manager = apply_environments_for_file_at(environment_manager, self.path)
+        for test_case, result in iter_invoke_items(
+            self._iter_invoke_items(result_cache, file_key), environment_manager
+        ):
+            self.add_result(result)
+            yield result
+    
+    
+    def _iter_invoke_items(self, result_cache, file_key):
+        """
+        Iterates over the items to invoke the test cases of the file with.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        result_cache : `None | ResultCache`
+            Result cache to reuse the results of the test cases passed with the same code from.
+        file_key : `None | str`
+            The key of the file's code. `None` if results should not be reused.
+        
+        Yields
+        ------
+        test_case : ``TestCase``
+            The test case of the item.
+        item : ``Handle | Result | DetachedResult``
+            The handle to invoke or the test case's result.
+        continuous : `bool`
+            Whether the handle's result is continuous.
+        """
         for test_case in self.iter_test_cases():
-            for result in test_case.iter_invoke(environment_manager):
-                if (results is None):
-                    results = []
-                    self._results = results
-                
-                results.append(result)
-                
-                yield result
+            if (file_key is not None):
+                cached_results = result_cache.get_cached_results(test_case, file_key)
+                if (cached_results is not None):
+                    for result in cached_results:
+                        yield test_case, result, False
+                    
+                    continue
+            
+            for item, continuous in test_case.iter_invoke_items():
+                yield test_case, item, continuous
+    
+    
+    def add_result(self, result):
+        """
+        Adds a result to the test file.
+        
+        Parameters
+        ----------
+        result : ``Result | DetachedResult``
+            The result to add.
+        """
+        results = self._results
+        if (results is None):
+            results = []
+            self._results = results
+        
+        results.append(result)
+        
+        for tally in self._tallies:
+            tally.add(result)
+    
+    
+    def replace_result(self, result, replacement):
+        """
+        Replaces a result of the test file. Used to compact the reported results. The tallies are not updated, so the
+        replacement must have the same state.
+        
+        Parameters
+        ----------
+        result : ``Result | DetachedResult``
+            The result to replace.
+        replacement : ``Result | DetachedResult``
+            The result to replace with.
+        
+        Returns
+        -------
+        replaced : `bool`
+        """
+        results = self._results
+        if (results is None):
+            return False
+        
+        # The reported results are usually the last ones.
+        for index in reversed(range(len(results))):
+            if results[index] is result:
+                results[index] = replacement
+                return True
+        
+        return False
+    
+    
+    def add_tally(self, tally):
+        """
+        Adds a tally to count the results of the file and of its sub-files in.
+        
+        Parameters
+        ----------
+        tally : ``ResultTally``
+            The tally to add.
+        """
+        self._tallies.append(tally)
+        
+        for sub_file in self.iter_sub_files():
+            sub_file.add_tally(tally)
+    
+    
+    def restore_load(self, test_case_names, exception_tokens, import_time, dependency_paths):
+        """
+        Restores the test file's load state. Used when the test file was loaded in a different process.
+        
+        Parameters
+        ----------
+        test_case_names : `None | list<str>`
+            The names of the loaded test cases. Expected to be `None` if loading failed or if the file is a directory.
+        exception_tokens : `None | list<(int, str)>`
+            The rendered exception if loading failed.
+        import_time : `None | int`
+            How much time importing the test file took in nanoseconds.
+        dependency_paths : `None | list<str>`
+            The normalized paths of the project source files the test file depends on.
+        """
+        self.import_time = import_time
+        self.dependency_paths = dependency_paths
+        
+        if (exception_tokens is not None):
+            self._load_failure = TestFileLoadFailure.from_exception_tokens(self, exception_tokens)
+            return
+        
+        if (test_case_names is not None):
+            self._test_cases = [TestCase(self, name, None) for name in test_case_names]
+    
+    
+    def skip_load(self):
+        """
+        Marks the test file as skipped, so it is not imported. Used when none of its test cases are selected.
+        """
+        if (self._test_cases is None) and (self._load_failure is None):
+            self._load_skipped = True
     
     
     def iter_results(self):
@@ -458,16 +704,7 @@ class TestFile(RichAttributeErrorBaseType):
         -------
         ran_test_count : `int`
         """
-        results = self._results
-        if (results is None):
-            ran_test_count = 0
-        else:
-            ran_test_count = len(results)
-        
-        for sub_file in self.iter_sub_files():
-            ran_test_count += sub_file.get_ran_test_count()
-        
-        return ran_test_count
+        return self.tally.ran_count
     
     
     def iter_passed_results(self):
@@ -538,7 +775,18 @@ class TestFile(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(result.is_passed() for result in self.iter_results())
+        return self.tally.passed_count
+    
+    
+    def get_cached_test_count(self):
+        """
+        Returns how much test passed by reusing its result from a previous run.
+        
+        Returns
+        -------
+        cached_test_count : `int`
+        """
+        return self.tally.cached_count
     
     
     def get_skipped_test_count(self):
@@ -549,7 +797,7 @@ class TestFile(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(result.is_skipped() for result in self.iter_results())
+        return self.tally.skipped_count
     
     
     def get_failed_test_count(self):
@@ -560,7 +808,7 @@ class TestFile(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(result.is_failed() for result in self.iter_results())
+        return self.tally.failed_count
     
     
     def has_failed_test(self):
@@ -571,7 +819,7 @@ class TestFile(RichAttributeErrorBaseType):
         -------
         has_failed_tests : `bool`
         """
-        return any(result.is_failed() for result in self.iter_results())
+        return self.tally.failed_count > 0
     
     
     def feed_sub_file(self, sub_file):
@@ -597,6 +845,10 @@ class TestFile(RichAttributeErrorBaseType):
             self._sub_files = sub_files
         
         sub_files.append(sub_file)
+        
+        for tally in self._tallies:
+            sub_file.add_tally(tally)
+        
         return True
     
     
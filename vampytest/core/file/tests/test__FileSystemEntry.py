@@ -0,0 +1,157 @@
+from os import mkdir as make_directory, stat as get_stat
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq, assert_false, assert_instance, assert_is, assert_true
+from ...cache import DiscoveryCache
+
+from ..file_system_entry import DEFAULT_PRUNE_NAMES, FileSystemEntry
+
+
+def _create_files(directory_path, *relative_paths):
+    """
+    Creates the given files and their directories.
+    
+    Parameters
+    ----------
+    directory_path : `str`
+        The directory to create the files in.
+    *relative_paths : `str`
+        Paths relative to the directory. Paths ending with `/` are created as directories.
+    """
+    for relative_path in relative_paths:
+        path = directory_path
+        parts = relative_path.split('/')
+        for part in parts[:-1]:
+            path = join_paths(path, part)
+            try:
+                make_directory(path)
+            except FileExistsError:
+                pass
+        
+        if parts[-1]:
+            with open(join_paths(path, parts[-1]), 'w'):
+                pass
+
+
+def _get_entry_names(entry):
+    """
+    Returns the sub entries' names of the given entry.
+    
+    Parameters
+    ----------
+    entry : ``FileSystemEntry``
+        The entry to get its sub entries' names of.
+    
+    Returns
+    -------
+    names : `list<str>`
+    """
+    return [sub_entry.get_name() for sub_entry in entry.iter_entries()]
+
+
+def test__FileSystemEntry__new__directory():
+    """
+    Tests whether ``FileSystemEntry.__new__`` works as intended.
+    
+    Case: directory, sub entries are sorted and filtered.
+    """
+    with TemporaryDirectory() as directory_path:
+        _create_files(
+            directory_path,
+            'koishi/tests/test_satori.py',
+            'koishi/orin.py',
+            'koishi/orin.txt',
+            'koishi/.git/config',
+            'koishi/node_modules/okuu.py',
+            'koishi/venv_custom/pyvenv.cfg',
+            'koishi/venv_custom/test_okuu.py',
+        )
+        
+        entry = FileSystemEntry(directory_path, 'koishi', None, DEFAULT_PRUNE_NAMES)
+        assert_instance(entry, FileSystemEntry)
+        assert_true(entry.is_directory())
+        
+        assert_eq(_get_entry_names(entry), ['orin.py', 'tests', 'venv_custom'])
+        
+        for sub_entry in entry.iter_entries():
+            assert_is(sub_entry.get_parent(), entry)
+        
+        virtual_environment_entry = [*entry.iter_entries()][-1]
+        assert_eq(_get_entry_names(virtual_environment_entry), [])
+
+
+def test__FileSystemEntry__new__lazy():
+    """
+    Tests whether ``FileSystemEntry.__new__`` works as intended.
+    
+    Case: sub entries are not looked up before iterated over.
+    """
+    with TemporaryDirectory() as directory_path:
+        _create_files(directory_path, 'koishi/tests/test_satori.py')
+        
+        entry = FileSystemEntry(directory_path, 'koishi', None, None)
+        assert_false(entry._scanned)
+        assert_is(entry._entries, None)
+        
+        assert_eq(_get_entry_names(entry), ['tests'])
+        assert_true(entry._scanned)
+
+
+def test__FileSystemEntry__new__limit_lookup_to():
+    """
+    Tests whether ``FileSystemEntry.__new__`` works as intended.
+    
+    Case: lookup limited to a file without extension.
+    """
+    with TemporaryDirectory() as directory_path:
+        _create_files(directory_path, 'koishi/tests/test_satori.py', 'koishi/tests/test_orin.py')
+        
+        entry = FileSystemEntry(directory_path, 'koishi', ['tests', 'test_satori'], None)
+        assert_instance(entry, FileSystemEntry)
+        
+        assert_eq(_get_entry_names(entry), ['tests'])
+        test_directory_entry = [*entry.iter_entries()][0]
+        assert_eq(_get_entry_names(test_directory_entry), ['test_satori'])
+        
+        test_file_entry = [*test_directory_entry.iter_entries()][0]
+        assert_true(test_file_entry.is_file())
+        assert_eq(test_file_entry.get_path(), join_paths(directory_path, 'koishi', 'tests', 'test_satori.py'))
+
+
+def test__FileSystemEntry__new__missing():
+    """
+    Tests whether ``FileSystemEntry.__new__`` works as intended.
+    
+    Case: missing file.
+    """
+    with TemporaryDirectory() as directory_path:
+        entry = FileSystemEntry(directory_path, 'koishi', None, None)
+        assert_is(entry, None)
+
+
+def test__FileSystemEntry__new__discovery_cache():
+    """
+    Tests whether ``FileSystemEntry.__new__`` works as intended.
+    
+    Case: listing of unchanged directories is taken from the discovery cache.
+    """
+    with TemporaryDirectory() as directory_path:
+        _create_files(directory_path, 'koishi/tests/test_satori.py')
+        
+        stat_result = get_stat(join_paths(directory_path, 'koishi'))
+        discovery_cache = DiscoveryCache(
+            directory_path,
+            DEFAULT_PRUNE_NAMES,
+            {
+                join_paths(directory_path, 'koishi'): (
+                    stat_result.st_mtime_ns, stat_result.st_ino, [('cached', True)]
+                ),
+            },
+        )
+        
+        entry = FileSystemEntry(directory_path, 'koishi', None, None, discovery_cache)
+        assert_eq(_get_entry_names(entry), ['cached'])
+        
+        sub_entry = [*entry.iter_entries()][0]
+        assert_is(sub_entry._discovery_cache, discovery_cache)
@@ -0,0 +1,28 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_false, assert_true
+
+from ..file_system_entry import FileSystemEntry
+from ..test_file import TestFile
+
+
+def test__TestFile__skip_load():
+    """
+    Tests whether ``TestFile.skip_load`` works as intended.
+    
+    Case: the skipped test file is not marked as loaded.
+    """
+    with TemporaryDirectory() as directory_path:
+        with open(join_paths(directory_path, 'test_koishi.py'), 'w'):
+            pass
+        
+        test_file = TestFile(FileSystemEntry(directory_path, 'test_koishi.py', None))
+        assert_false(test_file.is_load_skipped())
+        
+        test_file.skip_load()
+        
+        assert_true(test_file.is_load_skipped())
+        assert_false(test_file.is_loaded())
+        assert_false(test_file.is_loaded_with_success())
+        assert_false(test_file.is_loaded_with_failure())
@@ -0,0 +1,27 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..file_system_entry import DEFAULT_PRUNE_NAMES, build_prune_names
+
+
+def _iter_options():
+    yield None, DEFAULT_PRUNE_NAMES
+    yield ['build'], DEFAULT_PRUNE_NAMES | {'build'}
+    yield frozenset(('build', '.git')), DEFAULT_PRUNE_NAMES | {'build'}
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__build_prune_names(extra_prune_names):
+    """
+    Tests whether ``build_prune_names`` works as intended.
+    
+    Parameters
+    ----------
+    extra_prune_names : `None | iterable<str>`
+        Additional directory names to prune.
+    
+    Returns
+    -------
+    output : `frozenset<str>`
+    """
+    return build_prune_names(extra_prune_names)
@@ -0,0 +1,67 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..static_collection import StaticCollection, StaticTestCase, collect_static
+
+
+def _iter_options():
+    yield (
+        'def test_koishi(): pass\n',
+        StaticCollection([StaticTestCase('test_koishi', 1, (), False)], True),
+    )
+    yield (
+        'def satori(): test_koishi = 1\nasync def test(): pass\n',
+        StaticCollection([StaticTestCase('test', 2, (), False)], True),
+    )
+    yield (
+        (
+            '@_(call_from(_iter_options()).returning_last())\n'
+            '@vampytest.skip\n'
+            'def test_koishi(): pass\n'
+        ),
+        StaticCollection(
+            [StaticTestCase('test_koishi', 3, ('call_from.returning_last', 'skip'), True)],
+            True,
+        ),
+    )
+    yield (
+        '@satori\ndef test_koishi(): pass\n',
+        StaticCollection([StaticTestCase('test_koishi', 2, (), False)], False),
+    )
+    yield (
+        'def test_koishi(): pass\ntest_koishi = satori(test_koishi)\n',
+        StaticCollection([], False),
+    )
+    yield (
+        'from koishi import *\n',
+        StaticCollection([], False),
+    )
+    yield (
+        'from koishi import test_satori\n',
+        StaticCollection([], False),
+    )
+    yield (
+        'if koishi:\n    def test_satori(): pass\n',
+        StaticCollection([], False),
+    )
+    yield (
+        'def test_satori(:\n',
+        None,
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__collect_static(source):
+    """
+    Tests whether ``collect_static`` works as intended.
+    
+    Parameters
+    ----------
+    source : `str`
+        The test file's source.
+    
+    Returns
+    -------
+    output : `None | StaticCollection`
+    """
+    return collect_static(source)
@@ -0,0 +1,27 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..dependencies import iter_parent_module_names
+
+
+def _iter_options():
+    yield 'koishi', []
+    yield 'koishi.satori', ['koishi']
+    yield 'koishi.satori.orin', ['koishi.satori', 'koishi']
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__iter_parent_module_names(module_name):
+    """
+    Tests whether ``iter_parent_module_names`` works as intended.
+    
+    Parameters
+    ----------
+    module_name : `str`
+        The module's name.
+    
+    Returns
+    -------
+    output : `list<str>`
+    """
+    return [*iter_parent_module_names(module_name)]
@@ -1,5 +1,6 @@
 from .call_state import *
 from .handle import *
+from .invoking import *
 from .parameter_checking import *
 from .parameter_mismatch import *
 from .result_state import *
@@ -8,6 +9,7 @@ from .result_state import *
 __all__ = (
     *call_state.__all__,
     *handle.__all__,
+    *invoking.__all__,
     *parameter_checking.__all__,
     *parameter_mismatch.__all__,
     *result_state.__all__,
@@ -1,6 +1,7 @@
 __all__ = ('Handle',)
 
 from reprlib import repr as short_repr
+from time import perf_counter_ns, process_time_ns
 
 from scarletio import RichAttributeErrorBaseType, include
 
@@ -11,7 +12,39 @@ from .parameter_checking import check_parameter_mismatch
 
 
 Result = include('Result')
+ResultTimings = include('ResultTimings')
 AssertionException = include('AssertionException')
+apply_timeout = include('apply_timeout')
+
+
+def send_outcome(invoker, outcome):
+    """
+    Sends the outcome of the test's call into its invoker, returning the test's result.
+    
+    Parameters
+    ----------
+    invoker : ``GeneratorType``
+        The test's invoker returned by ``Handle.iter_invoke_steps`` waiting for the outcome of the call.
+    outcome : `(ResultState, int, int, None)`
+        The test's final result state, and the call's wall and processor time in nanoseconds.
+    
+    Returns
+    -------
+    test_result : ``None | Result``
+        Result of the test.
+    
+    Raises
+    ------
+    RuntimeError
+        If the invoker did not finish.
+    """
+    try:
+        invoker.send(outcome)
+    except StopIteration as exception:
+        return exception.value
+    
+    invoker.close()
+    raise RuntimeError(f'Invoker did not finish after receiving the call\'s outcome: {invoker!r}.')
 
 
 class Handle(RichAttributeErrorBaseType):
@@ -291,19 +324,6 @@ class Handle(RichAttributeErrorBaseType):
             return Result(self.case).with_handle(self).with_parameter_mismatch(parameter_mismatch)
     
     
-    def _invoke_test(self, environment_manager):
-        """
-        Invokes the test of the test handle.
-        
-        Parameters
-        ----------
-        environment_manager : ``EnvironmentManager``
-            Testing environment manager.
-        """
-        environment = environment_manager.get_environment_for_test(self.test)
-        self.original_result_state = environment.run(self.test, *self._get_call_parameters())
-    
-    
     def _build_default_test_result(self):
         """
         Builds test result if non of the wrappers did before.
@@ -326,48 +346,78 @@ class Handle(RichAttributeErrorBaseType):
         return test_result
     
     
-    def _iter_applied_environments(self):
+    def get_environment(self, environment_manager):
         """
-        Iterates over the applies the environment wrappers to the test.
+        Returns the environment to run the test in.
         
-        This method is an iterable generator.
+        Parameters
+        ----------
+        environment_manager : ``EnvironmentManager``
+            Testing environment manager.
         
-        Yields
+        Returns
+        -------
+        environment : ``DefaultEnvironment``
+        
+        Raises
         ------
-        environment : ``Environment``
+        NotImplementedError
         """
         environments = self.environments
         if (environments is not None):
-            yield from environments
+            environment_manager = environment_manager.with_environment(*environments)
+        
+        environment = environment_manager.get_environment_for_test(self.test)
+        return apply_timeout(environment, self.case.get_timeout())
     
     
-    def invoke(self, environment_manager):
+    def iter_invoke_steps(self):
         """
-        Invokes the test.
+        Invokes the test step by step, returning its result.
         
-        Parameters
-        ----------
-        environment_manager : ``EnvironmentManager``
-            Testing environment manager.
+        Instead of calling the test, yields the context capturing its output, then waits for the outcome of the call
+        to be sent in. This way the caller decides how the test is called, like concurrently with other tests.
+        
+        The outcome of each value yielded by a generator test can be sent in before the final outcome. For these the
+        result of the value is yielded back.
+        
+        This method is a generator.
+        
+        Yields
+        ------
+        output_capturing : ``ContextOutputCapturing``
+            The context capturing the test's output. Yielded first.
+        test_result : ``Result``
+            The result of a value yielded by the test.
+        
+        Receives
+        --------
+        outcome : `(ResultState, int, int, None | str)`
+            The test's result state, the call's wall and processor time in nanoseconds, and the yielded value's
+            representation if the outcome is for a yielded value.
         
         Returns
         -------
-        test_result : ``Result``
-            Result of the test.
+        test_result : ``None | Result``
+            Result of the test. `None` if the test yielded values and then returned.
         """
-        environment_manager = environment_manager.with_environment(*self._iter_applied_environments())
-        
-        contexts = [ContextOutputCapturing()]
+        output_capturing = ContextOutputCapturing()
+        contexts = [output_capturing]
         test_result = None
+        timings = ResultTimings()
         
         try:
             self._collect_contexts_into(contexts)
             
+            phase_start = perf_counter_ns()
             test_result = self._start_contexts(contexts)
+            timings.start_time = perf_counter_ns() - phase_start
             if (test_result is not None):
                 return test_result
             
+            phase_start = perf_counter_ns()
             test_result = self._enter_contexts(contexts)
+            timings.enter_time = perf_counter_ns() - phase_start
             if (test_result is not None):
                 return test_result
             
@@ -375,9 +425,26 @@ class Handle(RichAttributeErrorBaseType):
             if (test_result is not None):
                 return test_result
             
-            self._invoke_test(environment_manager)
+            to_yield = output_capturing
+            sub_case_produced = False
+            
+            while True:
+                result_state, timings.call_wall_time, timings.call_cpu_time, sub_case = yield to_yield
+                self.original_result_state = result_state
+                if sub_case is None:
+                    break
+                
+                to_yield = self._build_sub_case_result(contexts, output_capturing, timings, sub_case)
+                sub_case_produced = True
+                timings = ResultTimings()
             
+            # The values were already reported one by one.
+            if sub_case_produced and result_state.is_return():
+                return None
+            
+            phase_start = perf_counter_ns()
             test_result = self._exit_contexts(contexts)
+            timings.exit_time = perf_counter_ns() - phase_start
             if (test_result is not None):
                 return test_result
             
@@ -385,7 +452,205 @@ class Handle(RichAttributeErrorBaseType):
             return test_result
         
         finally:
+            if (test_result is not None):
+                self._add_leak_report(test_result)
+            
+            phase_start = perf_counter_ns()
             self._close_contexts(contexts, test_result)
+            timings.close_time = perf_counter_ns() - phase_start
+            
+            if (test_result is not None):
+                test_result.with_timings(timings)
+    
+    
+    def _add_leak_report(self, test_result):
+        """
+        Adds a leak report to the given result if the environment reported that the test left anything behind.
+        
+        Parameters
+        ----------
+        test_result : ``Result``
+            Result of the test.
+        """
+        result_state = self.original_result_state
+        if result_state is None:
+            return
+        
+        leak_message = result_state.leak_message
+        if (leak_message is not None):
+            test_result.with_leak(leak_message)
+    
+    
+    def _build_sub_case_result(self, contexts, output_capturing, timings, sub_case):
+        """
+        Builds the result of a value yielded by the test.
+        
+        Parameters
+        ----------
+        contexts : `list` of ``ContextBase``
+            The started contexts.
+        output_capturing : ``ContextOutputCapturing``
+            The context capturing the test's output.
+        timings : ``ResultTimings``
+            How much time the phases of producing the value took.
+        sub_case : `str`
+            The yielded value's representation.
+        
+        Returns
+        -------
+        test_result : ``Result``
+        """
+        phase_start = perf_counter_ns()
+        test_result = self._exit_contexts(contexts)
+        timings.exit_time = perf_counter_ns() - phase_start
+        if test_result is None:
+            test_result = self._build_default_test_result()
+        
+        output = output_capturing.pop_output()
+        if output:
+            test_result.with_output(output)
+        
+        return test_result.with_sub_case(sub_case).with_timings(timings)
+    
+    
+    def iter_invoke_streaming_in(self, invoker, environment, output_capturing):
+        """
+        Calls the generator test in the given streaming environment, yielding the result of each value yielded by the
+        test as soon as it is produced, then finishes invoking it.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        invoker : ``GeneratorType``
+            The test's invoker returned by ``.iter_invoke_steps`` waiting for the outcome of the call.
+        environment : ``DefaultEnvironment``
+            The environment to run the test in.
+        output_capturing : ``ContextOutputCapturing``
+            The context capturing the test's output. Suspended while the results are processed.
+        
+        Yields
+        -------
+        test_result : ``Result``
+            Result of the test.
+        """
+        result_states = environment.iter_run(self.test, *self._get_call_parameters())
+        index = 0
+        
+        try:
+            cpu_start = process_time_ns()
+            phase_start = perf_counter_ns()
+            
+            for result_state, streamed in result_states:
+                call_wall_time = perf_counter_ns() - phase_start
+                call_cpu_time = process_time_ns() - cpu_start
+                
+                if not streamed:
+                    test_result = send_outcome(invoker, (result_state, call_wall_time, call_cpu_time, None))
+                    if (test_result is not None):
+                        yield test_result
+                    return
+                
+                value = result_state.result
+                if value is None:
+                    sub_case = str(index)
+                else:
+                    sub_case = f'{index}: {short_repr(value)}'
+                
+                test_result = invoker.send((result_state, call_wall_time, call_cpu_time, sub_case))
+                index += 1
+                
+                output_capturing.suspend()
+                yield test_result
+                output_capturing.resume()
+                
+                cpu_start = process_time_ns()
+                phase_start = perf_counter_ns()
+        
+        except BaseException:
+            invoker.close()
+            raise
+        
+        finally:
+            result_states.close()
+    
+    
+    def invoke_in(self, invoker, environment):
+        """
+        Calls the test in the given environment, then finishes invoking it.
+        
+        Parameters
+        ----------
+        invoker : ``GeneratorType``
+            The test's invoker returned by ``.iter_invoke_steps`` waiting for the outcome of the call.
+        environment : ``DefaultEnvironment``
+            The environment to run the test in.
+        
+        Returns
+        -------
+        test_result : ``Result``
+            Result of the test.
+        """
+        try:
+            cpu_start = process_time_ns()
+            phase_start = perf_counter_ns()
+            result_state = environment.run(self.test, *self._get_call_parameters())
+            call_wall_time = perf_counter_ns() - phase_start
+            call_cpu_time = process_time_ns() - cpu_start
+        except BaseException:
+            invoker.close()
+            raise
+        
+        return send_outcome(invoker, (result_state, call_wall_time, call_cpu_time, None))
+    
+    
+    def invoke(self, environment_manager):
+        """
+        Invokes the test.
+        
+        Parameters
+        ----------
+        environment_manager : ``EnvironmentManager``
+            Testing environment manager.
+        
+        Returns
+        -------
+        test_result : ``Result``
+            Result of the test.
+        """
+        invoker = self.iter_invoke_steps()
+        try:
+            invoker.send(None)
+        except StopIteration as exception:
+            return exception.value
+        
+        try:
+            environment = self.get_environment(environment_manager)
+        except BaseException:
+            invoker.close()
+            raise
+        
+        return self.invoke_in(invoker, environment)
+    
+    
+    def build_call_state(self):
+        """
+        Builds the call state the test would be called with, without starting the contexts or calling the test.
+        
+        Returns
+        -------
+        call_state : ``CallState``
+        """
+        contexts = []
+        self._collect_contexts_into(contexts)
+        
+        call_state = CallState()
+        for context in contexts:
+            test_result, new_call_state = context.enter(call_state)
+            if (new_call_state is not None):
+                call_state = new_call_state
+        
+        return call_state
     
     
     def get_test_documentation_lines(self):
@@ -0,0 +1,197 @@
+__all__ = ('iter_invoke_items',)
+
+from .handle import Handle, send_outcome
+
+
+# The maximal amount of tests collected to be ran concurrently at once.
+CONCURRENT_BATCH_SIZE_MAX = 256
+
+
+def _iter_invoke_batch(environment, batch):
+    """
+    Runs the tests of the given batch concurrently, then finishes invoking them.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    environment : ``DefaultEnvironment``
+        The environment to run the tests in.
+    batch : `list<(object, Handle, GeneratorType, ContextOutputCapturing, bool)>`
+        The items to run, each as its key, handle, invoker, output capturing context, and whether its result is
+        continuous. Emptied as the items are finished.
+    
+    Yields
+    ------
+    key : `object`
+        The item's key.
+    result : ``Result``
+        The test's result.
+    """
+    try:
+        outcomes = environment.run_concurrently([
+            (handle.test, *handle._get_call_parameters(), output_capturing.stream)
+            for key, handle, invoker, output_capturing, continuous in batch
+        ])
+    except BaseException:
+        _close_batch(batch)
+        raise
+    
+    batch.reverse()
+    for outcome in outcomes:
+        key, handle, invoker, output_capturing, continuous = batch.pop()
+        result = send_outcome(invoker, (*outcome, None))
+        if continuous:
+            result = result.as_continuous()
+        
+        yield key, result
+
+
+def _close_batch(batch):
+    """
+    Closes the invokers of the given batch without finishing them.
+    
+    Parameters
+    ----------
+    batch : `list<(object, Handle, GeneratorType, ContextOutputCapturing, bool)>`
+        The items to close. Emptied.
+    """
+    while batch:
+        batch.pop()[2].close()
+
+
+def _iter_invoke_streaming(key, handle, invoker, output_capturing, environment, continuous):
+    """
+    Invokes a generator test in a streaming environment, yielding the result of each value as soon as the next one is
+    produced, so only the last one is marked as not continuous.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    key : `object`
+        The item's key.
+    handle : ``Handle``
+        The handle to invoke.
+    invoker : ``GeneratorType``
+        The handle's invoker waiting for the outcome of the call.
+    output_capturing : ``ContextOutputCapturing``
+        The context capturing the test's output.
+    environment : ``DefaultEnvironment``
+        The environment to run the test in.
+    continuous : `bool`
+        Whether the handle's last result is continuous.
+    
+    Yields
+    ------
+    key : `object`
+        The item's key.
+    result : ``Result``
+        The test's result.
+    """
+    previous_result = None
+    
+    for result in handle.iter_invoke_streaming_in(invoker, environment, output_capturing):
+        if (previous_result is not None):
+            yield key, previous_result.as_continuous()
+        
+        previous_result = result
+    
+    if continuous:
+        previous_result = previous_result.as_continuous()
+    
+    yield key, previous_result
+
+
+def iter_invoke_items(items, environment_manager):
+    """
+    Invokes the given test handles, yielding their results in the same order as they were given.
+    
+    The consecutive handles running in the same concurrent environment are collected and ran together. Their output is
+    captured per test while they run.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    items : `iterable<(object, Handle | Result | DetachedResult, bool)>`
+        The items to invoke, each as its key, either the handle to invoke or an already known result, and whether the
+        handle's result is continuous.
+    environment_manager : ``EnvironmentManager``
+        Testing environment manager.
+    
+    Yields
+    ------
+    key : `object`
+        The item's key.
+    result : ``Result | DetachedResult``
+        The item's result.
+    """
+    batch = []
+    batch_environment = None
+    
+    try:
+        for key, item, continuous in items:
+            if not isinstance(item, Handle):
+                if batch:
+                    yield from _iter_invoke_batch(batch_environment, batch)
+                
+                yield key, item
+                continue
+            
+            invoker = item.iter_invoke_steps()
+            try:
+                output_capturing = invoker.send(None)
+            except StopIteration as exception:
+                result = exception.value
+                environment = None
+            else:
+                result = None
+                # Do not capture the output of the tests invoked in the meantime.
+                output_capturing.suspend()
+                
+                try:
+                    environment = item.get_environment(environment_manager)
+                except BaseException:
+                    invoker.close()
+                    raise
+            
+            if (environment is not None) and environment.is_concurrent():
+                if batch and ((environment is not batch_environment) or (len(batch) >= CONCURRENT_BATCH_SIZE_MAX)):
+                    try:
+                        yield from _iter_invoke_batch(batch_environment, batch)
+                    except BaseException:
+                        invoker.close()
+                        raise
+                
+                batch.append((key, item, invoker, output_capturing, continuous))
+                batch_environment = environment
+                continue
+            
+            if batch:
+                try:
+                    yield from _iter_invoke_batch(batch_environment, batch)
+                except BaseException:
+                    if result is None:
+                        invoker.close()
+                    raise
+            
+            if result is None:
+                output_capturing.resume()
+                
+                if environment.is_streaming():
+                    yield from _iter_invoke_streaming(key, item, invoker, output_capturing, environment, continuous)
+                    continue
+                
+                result = item.invoke_in(invoker, environment)
+            
+            if continuous:
+                result = result.as_continuous()
+            
+            yield key, result
+        
+        if batch:
+            yield from _iter_invoke_batch(batch_environment, batch)
+    
+    finally:
+        _close_batch(batch)
@@ -1,120 +1,219 @@
 __all__ = ()
 
-from scarletio import CallableAnalyzer
-
-from .parameter_mismatch import ParameterMismatch
+from weakref import WeakKeyDictionary
 
+from scarletio import CallableAnalyzer, RichAttributeErrorBaseType
 
-def iter_parameters_to_pass(positional_parameters, keyword_parameters):
-    """
-    Iterates over given parameters.
-    
-    Parameters
-    ----------
-    positional_parameters : `None | list<object>`
-        Positional parameters to call the test with.
-    keyword_parameters : `None | dict<str, object> items
-        Keyword parameters to call the test with.
-    
-    This function is an iterable generator.
-    
-    Yields
-    ------
-    is_positional : `bool`
-        Whether the parameter is a keyword one.
-    positional_parameter / keyword_parameter : `object` / `(str, object)`
-        They positional or keyword parameter item described by `is_positional`.
-    """
-    if (positional_parameters is not None):
-        for positional_parameter in positional_parameters:
-            yield True, positional_parameter
-    
-    if (keyword_parameters is not None):
-        for keyword_parameter in keyword_parameters.items():
-            yield False, keyword_parameter
+from .parameter_mismatch import ParameterMismatch
 
 
-def exhaust_next_positional_parameter(parameters):
+class ParameterBindingPlan(RichAttributeErrorBaseType):
     """
-    Exhausts and removes (if applicable) the next positional parameter.
+    The analysed parameters of a test precompiled for checking the parameters passed into it.
     
-    Parameters
+    Attributes
     ----------
-    parameters : `list<Parameter>`
-        Parameters to exhaust from.
-    
-    Returns
-    -------
-    success : `bool`
+    absorbs_positional : `bool`
+        Whether the positional parameters over `positional_count` are accepted by `*args`.
+    absorbs_keyword : `bool`
+        Whether the unknown keyword parameters are accepted by `**kwargs`.
+    keyword_indexes : `dict<str, int>`
+        The index of each parameter which can be passed as keyword by their name.
+    parameters : `tuple<Parameter>`
+        The test's parameters.
+    positional_count : `int`
+        The amount of parameters which can be passed positionally.
+    required_indexes : `tuple<int>`
+        The indexes of the parameters which must be passed.
     """
-    if not parameters:
-        return False
-    
-    parameter = parameters[0]
-    if parameter.is_args():
-        return True
-    
-    if parameter.is_positional():
-        del parameters[0]
-        return True
+    __slots__ = (
+        'absorbs_keyword', 'absorbs_positional', 'keyword_indexes', 'parameters', 'positional_count',
+        'required_indexes'
+    )
     
-    return False
-
-
-def exhaust_keyword_parameter(parameters, name):
-    """
-    Exhausts and removes (if applicable) the a keyword parameter defined by the given name.
+    def __new__(cls, test):
+        """
+        Analyses the given test's parameters.
+        
+        Parameters
+        ----------
+        test : `FunctionType`
+            The test to analyse.
+        """
+        parameters = CallableAnalyzer(test).parameters
+        if parameters is None:
+            parameters = ()
+        else:
+            parameters = (*parameters,)
+        
+        positional_count = 0
+        for parameter in parameters:
+            if parameter.is_args() or (not parameter.is_positional()):
+                break
+            
+            positional_count += 1
+        
+        absorbs_positional = (positional_count < len(parameters)) and parameters[positional_count].is_args()
+        
+        absorbs_keyword = False
+        keyword_indexes = {}
+        required_indexes = []
+        
+        for index, parameter in enumerate(parameters):
+            if parameter.is_kwargs():
+                absorbs_keyword = True
+                continue
+            
+            if parameter.is_args():
+                continue
+            
+            if parameter.is_keyword():
+                keyword_indexes[parameter.name] = index
+            
+            if not parameter.has_default:
+                required_indexes.append(index)
+        
+        self = object.__new__(cls)
+        self.absorbs_keyword = absorbs_keyword
+        self.absorbs_positional = absorbs_positional
+        self.keyword_indexes = keyword_indexes
+        self.parameters = parameters
+        self.positional_count = positional_count
+        self.required_indexes = (*required_indexes,)
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the parameter binding plan's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' parameters = ')
+        repr_parts.append(repr(len(self.parameters)))
+        
+        repr_parts.append(', positional_count = ')
+        repr_parts.append(repr(self.positional_count))
+        
+        if self.absorbs_positional:
+            repr_parts.append(', absorbs_positional = True')
+        
+        if self.absorbs_keyword:
+            repr_parts.append(', absorbs_keyword = True')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
     
-    Parameters
-    ----------
-    parameters : `list<Parameter>`
-        Parameters to exhaust from.
-    name : `str`
-        The parameter's name.
     
-    Returns
-    -------
-    success : `bool`
-    """
-    for index, parameter in enumerate(parameters):
-        if parameter.is_keyword():
-            if parameter.name == name:
-                del parameters[index]
-                return True
+    def check_mismatch(self, positional_parameters, keyword_parameters):
+        """
+        Checks whether there is parameter mismatch between the test and the parameters to pass into it.
+        
+        Parameters
+        ----------
+        positional_parameters : `None | list<object`
+            Positional parameters to call the test with.
+        keyword_parameters : `None | dict<str, object>`
+            Keyword parameters to call the test with.
+        
+        Returns
+        -------
+        parameter_mismatch : `None`, ``ParameterMismatch``
+        """
+        positional_count = self.positional_count
+        
+        if positional_parameters is None:
+            satisfied_positional_count = 0
+            extra_positional_parameters = None
+        
+        else:
+            satisfied_positional_count = min(len(positional_parameters), positional_count)
             
-            continue
+            if (len(positional_parameters) > positional_count) and (not self.absorbs_positional):
+                extra_positional_parameters = [*positional_parameters[positional_count:]]
+            else:
+                extra_positional_parameters = None
         
-        if parameter.is_kwargs():
-            return True
-    
-    return False
+        satisfied_keyword_indexes = None
+        extra_keyword_parameters = None
+        
+        if (keyword_parameters is not None):
+            keyword_indexes = self.keyword_indexes
+            
+            for name, value in keyword_parameters.items():
+                index = keyword_indexes.get(name, -1)
+                if index >= satisfied_positional_count:
+                    if satisfied_keyword_indexes is None:
+                        satisfied_keyword_indexes = set()
+                    
+                    satisfied_keyword_indexes.add(index)
+                    continue
+                
+                if self.absorbs_keyword:
+                    continue
+                
+                if extra_keyword_parameters is None:
+                    extra_keyword_parameters = {}
+                
+                extra_keyword_parameters[name] = value
+        
+        unsatisfied_parameters = None
+        
+        for index in self.required_indexes:
+            if index < satisfied_positional_count:
+                continue
+            
+            if (satisfied_keyword_indexes is not None) and (index in satisfied_keyword_indexes):
+                continue
+            
+            if unsatisfied_parameters is None:
+                unsatisfied_parameters = []
+            
+            unsatisfied_parameters.append(self.parameters[index])
+        
+        if (
+            (unsatisfied_parameters is None) and
+            (extra_positional_parameters is None) and
+            (extra_keyword_parameters is None)
+        ):
+            return None
+        
+        return ParameterMismatch(
+            [*self.parameters],
+            positional_parameters,
+            keyword_parameters,
+            unsatisfied_parameters,
+            extra_positional_parameters,
+            extra_keyword_parameters,
+        )
+
 
+# Tests mapped to their parameter binding plan, so each is analysed only once, even if called with many parameters.
+PARAMETER_BINDING_PLANS = WeakKeyDictionary()
 
-def collect_unsatisfied_parameters(parameters):
+
+def get_parameter_binding_plan(test):
     """
-    Collects the unsatisfied parameters from the given parameters list.
+    Returns the parameter binding plan of the given test. Caches it if the test can be weakly referenced.
     
     Parameters
     ----------
-    parameters : `list<Parameter>`
-        Parameters to collect from.
+    test : `FunctionType`
+        The test to get the plan of.
     
     Returns
     -------
-    unsatisfied_parameters : `None | list<Parameter>`
+    parameter_binding_plan : ``ParameterBindingPlan``
     """
-    unsatisfied_parameters = None
+    try:
+        parameter_binding_plan = PARAMETER_BINDING_PLANS.get(test, None)
+    except TypeError:
+        # Cannot be weakly referenced.
+        return ParameterBindingPlan(test)
     
-    for parameter in parameters:
-        if parameter.has_default or parameter.is_args() or parameter.is_kwargs():
-            continue
-        
-        if unsatisfied_parameters is None:
-            unsatisfied_parameters = []
-        
-        unsatisfied_parameters.append(parameter)
+    if parameter_binding_plan is None:
+        parameter_binding_plan = ParameterBindingPlan(test)
+        PARAMETER_BINDING_PLANS[test] = parameter_binding_plan
     
-    return unsatisfied_parameters
+    return parameter_binding_plan
 
 
 def check_parameter_mismatch(test, positional_parameters, keyword_parameters):
@@ -134,53 +233,4 @@ def check_parameter_mismatch(test, positional_parameters, keyword_parameters):
     -------
     parameter_mismatch : `None`, ``ParameterMismatch``
     """
-    analyzer = CallableAnalyzer(test)
-    original_parameters = analyzer.parameters
-    if original_parameters is None:
-        original_parameters = []
-    else:
-        original_parameters = [*original_parameters]
-    
-    parameters = original_parameters.copy()
-    
-    
-    extra_positional_parameters = None
-    extra_keyword_parameters = None
-    
-    for is_positional, parameter_value in iter_parameters_to_pass(positional_parameters, keyword_parameters):
-        if is_positional:
-            if exhaust_next_positional_parameter(parameters):
-                continue
-            
-            if extra_positional_parameters is None:
-                extra_positional_parameters = []
-            
-            extra_positional_parameters.append(parameter_value)
-        
-        else:
-            if exhaust_keyword_parameter(parameters, parameter_value[0]):
-                continue
-            
-            if extra_keyword_parameters is None:
-                extra_keyword_parameters = {}
-            
-            extra_keyword_parameters[parameter_value[0]] = parameter_value[1]
-    
-    
-    unsatisfied_parameters = collect_unsatisfied_parameters(parameters)
-    
-    if (
-        (unsatisfied_parameters is None) and
-        (extra_positional_parameters is None) and
-        (extra_keyword_parameters is None)
-    ):
-        return None
-    
-    return ParameterMismatch(
-        original_parameters, 
-        positional_parameters,
-        keyword_parameters,
-        unsatisfied_parameters,
-        extra_positional_parameters,
-        extra_keyword_parameters,
-    )
+    return get_parameter_binding_plan(test).check_mismatch(positional_parameters, keyword_parameters)
@@ -17,18 +17,21 @@ class ResultState(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    leak_message : `None | str`
+        Description of what the test left behind, like pending tasks on its event loop.
     mode : `int`
         The result's mode.
     result : `None`, `object`
         The resulted value.
     """
-    __slots__ = ('mode', 'result')
+    __slots__ = ('leak_message', 'mode', 'result')
     
     def __new__(cls):
         """
         Creates a new result state.
         """
         self = object.__new__(cls)
+        self.leak_message = None
         self.mode = RESULT_STATE_MODE_NONE
         self.result = None
         return self
@@ -54,6 +57,11 @@ class ResultState(RichAttributeErrorBaseType):
             repr_parts.append(' = ')
             repr_parts.append(repr(self.result))
         
+        leak_message = self.leak_message
+        if (leak_message is not None):
+            repr_parts.append(', leak_message = ')
+            repr_parts.append(repr(leak_message))
+        
         repr_parts.append('>')
         return ''.join(repr_parts)
     
@@ -69,6 +77,9 @@ class ResultState(RichAttributeErrorBaseType):
         if self.result != other.result:
             return False
         
+        if self.leak_message != other.leak_message:
+            return False
+        
         return True
     
     
@@ -99,6 +110,7 @@ class ResultState(RichAttributeErrorBaseType):
         new : `instance<type<self>>`
         """
         new = object.__new__(type(self))
+        new.leak_message = self.leak_message
         new.mode = self.mode
         new.result = self.result
         return new
@@ -118,6 +130,7 @@ class ResultState(RichAttributeErrorBaseType):
         new : `instance<type<self>>`
         """
         new = object.__new__(type(self))
+        new.leak_message = self.leak_message
         new.mode = RESULT_STATE_MODE_RETURN
         new.result = returned_value
         return new
@@ -148,11 +161,30 @@ class ResultState(RichAttributeErrorBaseType):
             )
         
         new = object.__new__(type(self))
+        new.leak_message = self.leak_message
         new.mode = RESULT_STATE_MODE_RAISE
         new.result = raised_exception
         return new
     
     
+    def with_leak(self, leak_message):
+        """
+        Creates a new result state with the given description of what the test left behind.
+        
+        Parameters
+        ----------
+        leak_message : `str`
+            Description of what the test left behind.
+        
+        Returns
+        -------
+        new : `instance<type<self>>`
+        """
+        new = self.copy()
+        new.leak_message = leak_message
+        return new
+    
+    
     def is_return(self):
         """
         Returns whether the result is a return value.
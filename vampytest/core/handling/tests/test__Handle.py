@@ -0,0 +1,31 @@
+from ...assertions import assert_eq
+from ...wrappers import call_with
+
+from ..call_state import CallState
+from ..handle import Handle
+
+
+def test__Handle__build_call_state__no_wrappers():
+    """
+    Tests whether ``Handle.build_call_state`` works as intended.
+    
+    Case: no wrappers.
+    """
+    handle = Handle(None, None, None, None)
+    
+    assert_eq(handle.build_call_state(), CallState())
+
+
+def test__Handle__build_call_state__calling():
+    """
+    Tests whether ``Handle.build_call_state`` works as intended.
+    
+    Case: calling wrapper.
+    """
+    wrapper = call_with(12, koishi = 'satori').named('orin')
+    handle = Handle(None, None, [*wrapper.iter_wrappers()], None)
+    
+    assert_eq(
+        handle.build_call_state(),
+        CallState().with_parameters([12], {'koishi': 'satori'}).with_name('orin'),
+    )
@@ -18,6 +18,7 @@ def _assert_fields_set(result_state):
         The call state to check.
     """
     assert_instance(result_state, ResultState)
+    assert_instance(result_state.leak_message, str, nullable = True)
     assert_instance(result_state.mode, int)
     assert_instance(result_state.result, object, nullable = True)
 
@@ -33,6 +34,7 @@ def test__ResultState__new__empty():
     
     assert_eq(result_state.mode, RESULT_STATE_MODE_NONE)
     assert_is(result_state.result, None)
+    assert_is(result_state.leak_message, None)
 
 
 def test__ResultState__repr__clean():
@@ -94,6 +96,7 @@ def test__ResultState__eq():
     
     assert_ne(result_state, ResultState().with_return('koishi'))
     assert_ne(result_state, ResultState().with_raise(BaseException('koishi')))
+    assert_ne(result_state, ResultState().with_leak('satori'))
     
     result_state = ResultState().with_return('koishi')
     assert_eq(result_state, result_state)
@@ -182,6 +185,25 @@ def test__ResultState__with_raise():
     assert_true(result_state.is_raise())
 
 
+def test__ResultState__with_leak():
+    """
+    Tests whether ``ResultState.with_leak`` works as intended.
+    """
+    leak_message = 'satori'
+    
+    result_state = ResultState().with_return('koishi')
+    new = result_state.with_leak(leak_message)
+    
+    _assert_fields_set(new)
+    assert_is_not(result_state, new)
+    assert_is(result_state.leak_message, None)
+    assert_eq(new.leak_message, leak_message)
+    assert_eq(new.result, 'koishi')
+    assert_true(new.is_return())
+    
+    assert_eq(new.with_return('orin').leak_message, leak_message)
+
+
 @raising(TypeError)
 @call_with(None)
 @call_with(object())
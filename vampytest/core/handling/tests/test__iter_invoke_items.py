@@ -0,0 +1,142 @@
+from ...assertions import assert_eq, assert_is, assert_true
+from ...environment import (
+    DefaultEnvironment, EnvironmentManager, GeneratorEnvironment, ScarletioCoroutineEnvironment
+)
+from ...result import Result
+
+from ..handle import Handle
+from ..invoking import iter_invoke_items
+
+
+class TestCase:
+    """
+    Test case stand-in.
+    """
+    def do_reverse(self):
+        """
+        Returns whether the test's result should be reversed.
+        
+        Returns
+        -------
+        do_reverse : `bool`
+        """
+        return False
+    
+    
+    def get_timeout(self):
+        """
+        Returns the timeout to interrupt the test after.
+        
+        Returns
+        -------
+        timeout : `None | float`
+        """
+        return None
+
+
+def _test_sync():
+    """
+    Prints and returns a value.
+    
+    Returns
+    -------
+    value : `str`
+    """
+    print('sync')
+    return 'sync'
+
+
+async def _test_async():
+    """
+    Prints and returns a value.
+    
+    This function is a coroutine.
+    
+    Returns
+    -------
+    value : `str`
+    """
+    print('async')
+    return 'async'
+
+
+def test__iter_invoke_items():
+    """
+    Tests whether ``iter_invoke_items`` works as intended.
+    
+    Case: concurrent handles mixed with sequential handles and results.
+    """
+    environments = (DefaultEnvironment(), ScarletioCoroutineEnvironment(concurrency = 4))
+    case = TestCase()
+    result = Result(case).as_skipped()
+    
+    items = [
+        (0, Handle(case, _test_async, None, environments), True),
+        (1, Handle(case, _test_async, None, environments), False),
+        (2, Handle(case, _test_sync, None, environments), False),
+        (3, result, False),
+        (4, Handle(case, _test_async, None, environments), False),
+    ]
+    
+    output = [*iter_invoke_items(items, EnvironmentManager())]
+    
+    assert_eq([key for key, test_result in output], [0, 1, 2, 3, 4])
+    assert_is(output[3][1], result)
+    
+    for key, expected_output, expected_continuous in (
+        (0, 'async\n', True),
+        (1, 'async\n', False),
+        (2, 'sync\n', False),
+        (4, 'async\n', False),
+    ):
+        test_result = output[key][1]
+        assert_eq(test_result.handle.original_result_state.result, expected_output[:-1])
+        assert_eq(test_result.continuous, expected_continuous)
+        assert_eq(test_result.get_output_report().output, expected_output)
+
+
+def _test_generator():
+    """
+    Prints and yields values.
+    
+    This function is an iterable generator.
+    
+    Yields
+    ------
+    value : `str`
+    """
+    print('a')
+    yield 'a'
+    print('b')
+    yield 'b'
+
+
+def test__iter_invoke_items__streaming():
+    """
+    Tests whether ``iter_invoke_items`` works as intended.
+    
+    Case: generator test streaming its values.
+    """
+    environments = (GeneratorEnvironment(),)
+    case = TestCase()
+    
+    items = [
+        (0, Handle(case, _test_generator, None, environments), False),
+    ]
+    
+    output = [*iter_invoke_items(items, EnvironmentManager())]
+    
+    assert_eq(len(output), 2)
+    
+    for (key, test_result), (expected_sub_case, expected_output, expected_continuous) in zip(
+        output,
+        (
+            ('0: \'a\'', 'a\n', True),
+            ('1: \'b\'', 'b\n', False),
+        ),
+    ):
+        assert_eq(key, 0)
+        assert_eq(test_result.sub_case, expected_sub_case)
+        assert_eq(test_result.get_output_report().output, expected_output)
+        assert_eq(test_result.continuous, expected_continuous)
+        assert_true(test_result.is_passed())
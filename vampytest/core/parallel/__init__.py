@@ -0,0 +1,14 @@
+from .constants import *
+from .detaching import *
+from .pool import *
+from .scheduling import *
+from .worker import *
+
+
+__all__ = (
+    *constants.__all__,
+    *detaching.__all__,
+    *pool.__all__,
+    *scheduling.__all__,
+    *worker.__all__,
+)
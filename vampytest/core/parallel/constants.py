@@ -0,0 +1,8 @@
+__all__ = ()
+
+MESSAGE_NONE = 0
+MESSAGE_FILE_LOAD_DONE = 1
+MESSAGE_TEST_DONE = 2
+MESSAGE_FILE_TESTING_DONE = 3
+MESSAGE_UNIT_DONE = 4
+MESSAGE_UNIT_CRASHED = 5
@@ -0,0 +1,184 @@
+__all__ = ('compact_result',)
+
+from scarletio import HIGHLIGHT_TOKEN_TYPES, export, render_exception_into
+
+from ..event_handling.rendering_helpers.case_modifiers import iter_build_result_case_modifier
+from ..event_handling.rendering_helpers.result_rendering import produce_result_failing, produce_result_informal
+from ..result import DetachedResult
+from ..result.detached_result import get_result_flags
+
+
+def _render_exception_tokens(exception):
+    """
+    Renders the given exception as a single text token.
+    
+    Parameters
+    ----------
+    exception : `BaseException`
+        The exception to render.
+    
+    Returns
+    -------
+    tokens : `list<(int, str)>`
+    """
+    return [(HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT, ''.join(render_exception_into(exception, [])))]
+
+
+def _render_tokens(producer, result):
+    """
+    Renders the tokens of the given result with the given producer. If rendering fails, renders the exception instead.
+    
+    Parameters
+    ----------
+    producer : `GeneratorFunctionType`
+        Token producer.
+    result : ``Result``
+        The result to render.
+    
+    Returns
+    -------
+    tokens : `list<(int, str)>`
+    """
+    try:
+        return [*producer(result)]
+    except Exception as exception:
+        return _render_exception_tokens(exception)
+
+
+def detach_result(result):
+    """
+    Detaches the given result, pre-rendering its reports. Already detached results, like the cached ones, are
+    returned as they are.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to detach.
+    
+    Returns
+    -------
+    continuous : `bool`
+        Whether this is is not the last test of the case.
+    flags : `int`
+        Bitwise flags describing the result's status.
+    case_modifier : `None | str`
+        Rendered case modifier.
+    failure_tokens : `None | list<(int, str)>`
+        The rendered failure report if the test failed.
+    informal_tokens : `None | list<(int, str)>`
+        The rendered informal report if the result is informal.
+    timings : `None | ResultTimings`
+        How much time the phases of running the test took.
+    """
+    if isinstance(result, DetachedResult):
+        return (
+            result.continuous, result.flags, result.case_modifier, result.failure_tokens, result.informal_tokens,
+            result.timings,
+        )
+    
+    flags = get_result_flags(result)
+    
+    try:
+        case_modifier = ''.join(iter_build_result_case_modifier(result))
+    except Exception as exception:
+        case_modifier = f'<{type(exception).__name__}>'
+    
+    if not case_modifier:
+        case_modifier = None
+    
+    if result.is_failed():
+        failure_tokens = _render_tokens(produce_result_failing, result)
+    else:
+        failure_tokens = None
+    
+    if result.is_informal():
+        informal_tokens = _render_tokens(produce_result_informal, result)
+    else:
+        informal_tokens = None
+    
+    return result.continuous, flags, case_modifier, failure_tokens, informal_tokens, result.timings
+
+
+@export
+def compact_result(result):
+    """
+    Compacts the given result into a detached one, pre-rendering its reports. This way it does not keep the test's
+    handle, parameters, return values, exceptions and their frames alive.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to compact.
+    
+    Returns
+    -------
+    result : ``DetachedResult``
+    """
+    if isinstance(result, DetachedResult):
+        return result
+    
+    return DetachedResult(result.case, *detach_result(result))
+
+
+def render_load_failure_tokens(load_failure):
+    """
+    Renders the exception of the given load failure.
+    
+    Parameters
+    ----------
+    load_failure : ``None | TestFileLoadFailure``
+        The load failure to render.
+    
+    Returns
+    -------
+    exception_tokens : `None | list<(int, str)>`
+    """
+    if load_failure is None:
+        return None
+    
+    try:
+        return [*load_failure.iter_exception_tokens()]
+    except Exception as exception:
+        return _render_exception_tokens(exception)
+
+
+def build_crash_tokens(exit_code):
+    """
+    Builds the tokens describing a crashed worker process.
+    
+    Parameters
+    ----------
+    exit_code : `None | int`
+        The worker process's exit code.
+    
+    Returns
+    -------
+    exception_tokens : `list<(int, str)>`
+    """
+    return [
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE, 'Worker process exited unexpectedly'),
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE, f' with exit code {exit_code!r}.'),
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'),
+    ]
+
+
+def build_load_mismatch_tokens(test_case_index):
+    """
+    Builds the tokens describing a test case reported by a worker process which is not present in the test file's
+    load.
+    
+    Parameters
+    ----------
+    test_case_index : `int`
+        The reported test case's index.
+    
+    Returns
+    -------
+    exception_tokens : `list<(int, str)>`
+    """
+    return [
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE, 'Worker process reported a test case'),
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE, f' at index {test_case_index!r}'),
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_TEXT_NEGATIVE, ' not matching the loaded test cases.'),
+        (HIGHLIGHT_TOKEN_TYPES.TOKEN_TYPE_LINE_BREAK, '\n'),
+    ]
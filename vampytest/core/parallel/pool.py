@@ -0,0 +1,512 @@
+__all__ = ('WorkerPool',)
+
+from collections import deque
+from multiprocessing import get_context
+from multiprocessing.connection import wait as wait_for_connections
+
+from scarletio import RichAttributeErrorBaseType, export
+
+from ..cache import DurationRecorder
+from ..cache.durations import load_durations, merge_durations, save_durations
+from ..contexts import DEFAULT_OUTPUT_MEMORY_LIMIT, OUTPUT_CAPTURE_MODE_SYS
+from ..events import FileLoadDoneEvent, FileTestingDoneEvent, TestDoneEvent
+from ..result import DetachedResult
+from ..runner.constants import OUTPUT_RETENTION_FAILED_ONLY
+
+from .constants import (
+    MESSAGE_FILE_LOAD_DONE, MESSAGE_FILE_TESTING_DONE, MESSAGE_TEST_DONE, MESSAGE_UNIT_CRASHED, MESSAGE_UNIT_DONE
+)
+from .detaching import build_crash_tokens, build_load_mismatch_tokens
+from .scheduling import build_work_units, get_dispatch_order
+from .worker import run_worker
+
+
+PROCESS_CONTEXT = get_context('spawn')
+WORKER_JOIN_TIMEOUT = 5.0
+
+
+class Worker(RichAttributeErrorBaseType):
+    """
+    Represents a worker process.
+    
+    Attributes
+    ----------
+    connection : ``Connection``
+        Connection to communicate with the worker process.
+    process : ``SpawnProcess``
+        The worker process.
+    unit_index : `int`
+        The index of the unit the worker is running. Set as `-1` if not running any.
+    """
+    __slots__ = ('connection', 'process', 'unit_index')
+    
+    def __new__(
+        cls,
+        source_directory,
+        sources,
+        case_filter,
+        prune_names,
+        result_cache,
+        timeout,
+        output_capture_mode,
+        output_memory_limit,
+        output_retention,
+    ):
+        """
+        Creates and starts a new worker process.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        sources : `set<str>`
+            Sources to import before executing any test.
+        case_filter : `None | ShardFilter`
+            Filter to select the test cases to run with.
+        prune_names : `frozenset<str>`
+            Directory names to not look into.
+        result_cache : `None | ResultCache`
+            Result cache to reuse the results of the test cases passed with the same code from.
+        timeout : `None | float`
+            The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+        output_capture_mode : `str`
+            How the output of the tests is captured.
+        output_memory_limit : `int`
+            The maximal size of each test's output in bytes to keep in memory.
+        output_retention : `str`
+            Which results keep their captured output after they are reported.
+        """
+        connection, child_connection = PROCESS_CONTEXT.Pipe()
+        process = PROCESS_CONTEXT.Process(
+            target = run_worker,
+            args = (
+                child_connection,
+                source_directory,
+                sources,
+                case_filter,
+                prune_names,
+                result_cache,
+                timeout,
+                output_capture_mode,
+                output_memory_limit,
+                output_retention,
+            ),
+            daemon = True,
+        )
+        process.start()
+        child_connection.close()
+        
+        self = object.__new__(cls)
+        self.connection = connection
+        self.process = process
+        self.unit_index = -1
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the worker's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' pid = ')
+        repr_parts.append(repr(self.process.pid))
+        
+        unit_index = self.unit_index
+        if unit_index != -1:
+            repr_parts.append(', unit_index = ')
+            repr_parts.append(repr(unit_index))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def dispatch(self, unit_index, unit):
+        """
+        Dispatches a unit to the worker.
+        
+        Parameters
+        ----------
+        unit_index : `int`
+            The unit's index.
+        unit : ``WorkUnit``
+            The unit to dispatch.
+        """
+        self.unit_index = unit_index
+        self.connection.send(unit.get_message(unit_index))
+    
+    
+    def retire(self):
+        """
+        Asks the worker to exit and waits for it.
+        """
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        
+        self.process.join(WORKER_JOIN_TIMEOUT)
+        self.close()
+    
+    
+    def close(self):
+        """
+        Terminates the worker if still alive and releases its resources.
+        """
+        process = self.process
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        
+        self.connection.close()
+
+
+@export
+class WorkerPool(RichAttributeErrorBaseType):
+    """
+    Runs test files in worker processes.
+    
+    Each registered test file (or test directory) is a unit of work. Test files taking longer than a worker's fair
+    share based on the previous runs are split into multiple units by their test cases. Units are handed out to the
+    workers longest first as they become idle, while the produced events are dispatched in registration order.
+    
+    Attributes
+    ----------
+    case_filter : `None | ShardFilter`
+        Filter to select the test cases to run with.
+    output_capture_mode : `str`
+        How the output of the tests is captured.
+    output_memory_limit : `int`
+        The maximal size of each test's output in bytes to keep in memory.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    result_cache : `None | ResultCache`
+        Result cache to reuse the results of the test cases passed with the same code from.
+    source_directory : `str`
+        The path to run tests from.
+    sources : `set<str>`
+        Sources to import before executing any test.
+    timeout : `None | float`
+        The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+    worker_count : `int`
+        The maximal amount of worker processes to run.
+    """
+    __slots__ = (
+        'case_filter', 'output_capture_mode', 'output_memory_limit', 'output_retention', 'prune_names', 'result_cache',
+        'source_directory', 'sources', 'timeout', 'worker_count'
+    )
+    
+    def __new__(
+        cls,
+        source_directory,
+        sources,
+        worker_count,
+        case_filter,
+        prune_names,
+        result_cache = None,
+        *,
+        output_capture_mode = OUTPUT_CAPTURE_MODE_SYS,
+        output_memory_limit = DEFAULT_OUTPUT_MEMORY_LIMIT,
+        output_retention = OUTPUT_RETENTION_FAILED_ONLY,
+        timeout = None,
+    ):
+        """
+        Creates a new worker pool.
+        
+        Parameters
+        ----------
+        source_directory : `str`
+            The path to run tests from.
+        sources : `set<str>`
+            Sources to import before executing any test.
+        worker_count : `int`
+            The maximal amount of worker processes to run.
+        case_filter : `None | ShardFilter`
+            Filter to select the test cases to run with.
+        prune_names : `frozenset<str>`
+            Directory names to not look into.
+        result_cache : `None | ResultCache` = `None`, Optional
+            Result cache to reuse the results of the test cases passed with the same code from.
+        output_capture_mode : `str` = `OUTPUT_CAPTURE_MODE_SYS`, Optional (Keyword only)
+            How the output of the tests is captured.
+        output_memory_limit : `int` = `DEFAULT_OUTPUT_MEMORY_LIMIT`, Optional (Keyword only)
+            The maximal size of each test's output in bytes to keep in memory.
+        output_retention : `str` = `OUTPUT_RETENTION_FAILED_ONLY`, Optional (Keyword only)
+            Which results keep their captured output after they are reported.
+        timeout : `None | float` = `None`, Optional (Keyword only)
+            The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+        """
+        self = object.__new__(cls)
+        self.case_filter = case_filter
+        self.output_capture_mode = output_capture_mode
+        self.output_memory_limit = output_memory_limit
+        self.output_retention = output_retention
+        self.prune_names = prune_names
+        self.result_cache = result_cache
+        self.source_directory = source_directory
+        self.sources = sources
+        self.timeout = timeout
+        self.worker_count = worker_count
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the worker pool's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' worker_count = ')
+        repr_parts.append(repr(self.worker_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def iter_events(self, context):
+        """
+        Runs the registered test files of the given context in worker processes.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        context : ``RunnerContext``
+            The respective test runner context.
+        
+        Yields
+        ------
+        event : ``FileLoadDoneEvent | TestDoneEvent | FileTestingDoneEvent``
+        """
+        source_directory = self.source_directory
+        durations = load_durations(source_directory)
+        units = build_work_units(
+            [
+                registered_file for registered_file in context.iter_registered_files_shallow()
+                if not registered_file.is_load_skipped()
+            ],
+            durations,
+            self.worker_count,
+        )
+        unit_count = len(units)
+        if not unit_count:
+            return
+        
+        pending = deque(get_dispatch_order(units))
+        buffers = [deque() for index in range(unit_count)]
+        finished = [False] * unit_count
+        next_unit_index = 0
+        progress = {}
+        recorder = DurationRecorder()
+        workers = {}
+        
+        try:
+            for index in range(min(self.worker_count, unit_count)):
+                self._start_worker(workers, units, pending)
+            
+            while next_unit_index < unit_count:
+                for connection in wait_for_connections([*workers.keys()]):
+                    worker = workers[connection]
+                    
+                    try:
+                        message = connection.recv()
+                    except (EOFError, OSError):
+                        del workers[connection]
+                        worker.close()
+                        
+                        unit_index = worker.unit_index
+                        if unit_index != -1:
+                            buffers[unit_index].append((MESSAGE_UNIT_CRASHED, unit_index, worker.process.exitcode))
+                            finished[unit_index] = True
+                        
+                        self._start_worker(workers, units, pending)
+                        continue
+                    
+                    unit_index = message[1]
+                    buffers[unit_index].append(message)
+                    
+                    if message[0] == MESSAGE_UNIT_DONE:
+                        finished[unit_index] = True
+                        
+                        # Idle workers take the next longest unit.
+                        if pending:
+                            unit_index = pending.popleft()
+                            worker.dispatch(unit_index, units[unit_index])
+                        else:
+                            del workers[connection]
+                            worker.retire()
+                
+                while next_unit_index < unit_count:
+                    buffer = buffers[next_unit_index]
+                    while buffer:
+                        yield from self._iter_message_events(
+                            context, units[next_unit_index], progress, recorder, buffer.popleft()
+                        )
+                    
+                    if not finished[next_unit_index]:
+                        break
+                    
+                    next_unit_index += 1
+        
+        finally:
+            for worker in workers.values():
+                worker.close()
+        
+        save_durations(source_directory, merge_durations(durations, recorder.durations))
+    
+    
+    def _start_worker(self, workers, units, pending):
+        """
+        Starts a new worker and dispatches a unit to it if there is any pending.
+        
+        Parameters
+        ----------
+        workers : `dict<Connection, Worker>`
+            The running workers.
+        units : `list<WorkUnit>`
+            The work units.
+        pending : `deque<int>`
+            The indexes of the units not yet dispatched.
+        """
+        if not pending:
+            return
+        
+        worker = Worker(
+            self.source_directory,
+            self.sources,
+            self.case_filter,
+            self.prune_names,
+            self.result_cache,
+            self.timeout,
+            self.output_capture_mode,
+            self.output_memory_limit,
+            self.output_retention,
+        )
+        workers[worker.connection] = worker
+        
+        unit_index = pending.popleft()
+        worker.dispatch(unit_index, units[unit_index])
+    
+    
+    def _iter_message_events(self, context, unit, progress, recorder, message):
+        """
+        Converts a message received from a worker to events.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        context : ``RunnerContext``
+            The respective test runner context.
+        unit : ``WorkUnit``
+            The work unit the message is about.
+        progress : `dict<TestFile, bool>`
+            The loaded test files mapped to whether their testing is done.
+        recorder : ``DurationRecorder``
+            Duration recorder to record the test files' and test cases' durations with.
+        message : `tuple`
+            The received message.
+        
+        Yields
+        ------
+        event : ``FileLoadDoneEvent | TestDoneEvent | FileTestingDoneEvent``
+        """
+        message_type = message[0]
+        
+        if message_type == MESSAGE_UNIT_DONE:
+            recorder.add_file_duration(unit.test_file.import_route, message[2])
+            return
+        
+        if message_type == MESSAGE_UNIT_CRASHED:
+            yield from self._iter_crash_events(context, unit, progress, message[2])
+            return
+        
+        path = message[2]
+        for test_file in unit.test_file.iter_test_files():
+            if test_file.path == path:
+                break
+        else:
+            return
+        
+        # Split test files are loaded by each of their units, but their events are dispatched only once.
+        tested = progress.get(test_file, None)
+        if tested:
+            return
+        
+        if message_type == MESSAGE_FILE_LOAD_DONE:
+            if (tested is not None):
+                return
+            
+            test_file.restore_load(message[3], message[4], message[5], message[6])
+            progress[test_file] = False
+            yield FileLoadDoneEvent(context, test_file)
+            return
+        
+        if message_type == MESSAGE_TEST_DONE:
+            test_case = test_file.get_test_case_at(message[3])
+            if test_case is None:
+                # The worker loaded different test cases than the ones it reported loading, mark the test file as
+                # failed instead of dispatching results which cannot be matched.
+                test_file.restore_load(
+                    None, build_load_mismatch_tokens(message[3]), test_file.import_time, test_file.dependency_paths
+                )
+                progress[test_file] = True
+                yield FileTestingDoneEvent(context, test_file)
+                return
+            
+            recorder.add_case_duration(test_file.import_route, test_case.name, message[4])
+            
+            result = DetachedResult(test_case, *message[5:])
+            test_file.add_result(result)
+            yield TestDoneEvent(context, result)
+            return
+        
+        if message_type == MESSAGE_FILE_TESTING_DONE:
+            if not unit.is_last:
+                return
+            
+            progress[test_file] = True
+            yield FileTestingDoneEvent(context, test_file)
+            return
+    
+    
+    def _iter_crash_events(self, context, unit, progress, exit_code):
+        """
+        Marks the not yet finished test files of a unit as failed after its worker crashed.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        context : ``RunnerContext``
+            The respective test runner context.
+        unit : ``WorkUnit``
+            The work unit the worker was running.
+        progress : `dict<TestFile, bool>`
+            The loaded test files mapped to whether their testing is done.
+        exit_code : `None | int`
+            The worker process's exit code.
+        
+        Yields
+        ------
+        event : ``FileLoadDoneEvent | FileTestingDoneEvent``
+        """
+        exception_tokens = build_crash_tokens(exit_code)
+        
+        for test_file in unit.test_file.iter_test_files():
+            tested = progress.get(test_file, None)
+            if tested is None:
+                test_file.restore_load(None, exception_tokens, None, None)
+                progress[test_file] = True
+                yield FileLoadDoneEvent(context, test_file)
+                
+                if test_file.is_directory():
+                    break
+                
+                continue
+            
+            if test_file.is_loaded_with_failure():
+                break
+            
+            if not tested:
+                test_file.restore_load(None, exception_tokens, None, None)
+                progress[test_file] = True
+                yield FileTestingDoneEvent(context, test_file)
@@ -0,0 +1,305 @@
+__all__ = ('WorkUnit',)
+
+from math import ceil
+
+from scarletio import RichAttributeErrorBaseType
+
+
+def get_unit_route(test_file):
+    """
+    Returns the file system entry names leading to the given registered test file starting from the source directory.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The registered test file.
+    
+    Returns
+    -------
+    route : `list<str>`
+    """
+    entry = test_file.entry
+    route = [parent.get_name() for parent in entry.iter_parents()]
+    
+    # Directories are collected from the directory itself.
+    if not test_file.is_directory():
+        route.append(entry.get_name())
+    
+    return route
+
+
+def is_case_name_in_bounds(name, lower_bound, upper_bound):
+    """
+    Returns whether the given test case name is within the given bounds.
+    
+    Parameters
+    ----------
+    name : `str`
+        The test case's name.
+    lower_bound : `None | str`
+        Inclusive lower bound. `None` if unbounded.
+    upper_bound : `None | str`
+        Exclusive upper bound. `None` if unbounded.
+    
+    Returns
+    -------
+    is_case_name_in_bounds : `bool`
+    """
+    if (lower_bound is not None) and (name < lower_bound):
+        return False
+    
+    if (upper_bound is not None) and (name >= upper_bound):
+        return False
+    
+    return True
+
+
+def split_case_durations(case_durations, chunk_count):
+    """
+    Splits the test cases into chunks with about equal durations. Since test cases are ran ordered by their name,
+    each chunk is represented by a name range, so test cases not present in `case_durations` still fall into a chunk.
+    
+    Parameters
+    ----------
+    case_durations : `dict<str, float>`
+        Test case names mapped to their duration.
+    chunk_count : `int`
+        The maximal amount of chunks to create.
+    
+    Returns
+    -------
+    bounds : `list<(None | str, None | str)>`
+        Inclusive lower and exclusive upper name bound of each chunk.
+    """
+    names = sorted(case_durations.keys())
+    total_duration = sum(case_durations.values())
+    
+    bounds = []
+    lower_bound = None
+    accumulated_duration = 0.0
+    
+    for index in range(len(names) - 1):
+        if len(bounds) >= chunk_count - 1:
+            break
+        
+        accumulated_duration += case_durations[names[index]]
+        
+        # Cut at the closest boundary to the goal.
+        if (
+            accumulated_duration + case_durations[names[index + 1]] * 0.5 >=
+            total_duration * (len(bounds) + 1) / chunk_count
+        ):
+            upper_bound = names[index + 1]
+            bounds.append((lower_bound, upper_bound))
+            lower_bound = upper_bound
+    
+    bounds.append((lower_bound, None))
+    return bounds
+
+
+class WorkUnit(RichAttributeErrorBaseType):
+    """
+    Represents a unit of work ran by a worker process. Either a whole registered test file or a part of its test cases.
+    
+    Attributes
+    ----------
+    estimated_duration : `None | float`
+        The unit's estimated duration based on the previous runs.
+    is_first : `bool`
+        Whether this is the first unit of the test file.
+    is_last : `bool`
+        Whether this is the last unit of the test file.
+    lower_bound : `None | str`
+        Inclusive lower bound of the test case names to run.
+    route : `list<str>`
+        File system entry names leading to the test file starting from the source directory.
+    test_file : ``TestFile``
+        The registered test file.
+    upper_bound : `None | str`
+        Exclusive upper bound of the test case names to run.
+    """
+    __slots__ = ('estimated_duration', 'is_first', 'is_last', 'lower_bound', 'route', 'test_file', 'upper_bound')
+    
+    def __new__(cls, test_file, lower_bound, upper_bound, is_first, is_last, estimated_duration):
+        """
+        Creates a new work unit.
+        
+        Parameters
+        ----------
+        test_file : ``TestFile``
+            The registered test file.
+        lower_bound : `None | str`
+            Inclusive lower bound of the test case names to run.
+        upper_bound : `None | str`
+            Exclusive upper bound of the test case names to run.
+        is_first : `bool`
+            Whether this is the first unit of the test file.
+        is_last : `bool`
+            Whether this is the last unit of the test file.
+        estimated_duration : `None | float`
+            The unit's estimated duration based on the previous runs.
+        """
+        self = object.__new__(cls)
+        self.estimated_duration = estimated_duration
+        self.is_first = is_first
+        self.is_last = is_last
+        self.lower_bound = lower_bound
+        self.route = get_unit_route(test_file)
+        self.test_file = test_file
+        self.upper_bound = upper_bound
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the work unit's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' route = ')
+        repr_parts.append(repr(self.route))
+        
+        lower_bound = self.lower_bound
+        if (lower_bound is not None):
+            repr_parts.append(', lower_bound = ')
+            repr_parts.append(repr(lower_bound))
+        
+        upper_bound = self.upper_bound
+        if (upper_bound is not None):
+            repr_parts.append(', upper_bound = ')
+            repr_parts.append(repr(upper_bound))
+        
+        estimated_duration = self.estimated_duration
+        if (estimated_duration is not None):
+            repr_parts.append(', estimated_duration = ')
+            repr_parts.append(format(estimated_duration, '.3f'))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_message(self, unit_index):
+        """
+        Returns the message to dispatch the unit to a worker with.
+        
+        Parameters
+        ----------
+        unit_index : `int`
+            The unit's index.
+        
+        Returns
+        -------
+        message : `(int, list<str>, None | str, None | str)`
+        """
+        return unit_index, self.route, self.lower_bound, self.upper_bound
+
+
+def estimate_file_duration(test_file, durations):
+    """
+    Estimates the duration of the given registered test file based on the previous runs.
+    
+    Parameters
+    ----------
+    test_file : ``TestFile``
+        The registered test file.
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    
+    Returns
+    -------
+    estimated_duration : `None | float`
+    """
+    entry = durations.get(test_file.import_route, None)
+    if entry is None:
+        return None
+    
+    file_duration, case_durations = entry
+    if (file_duration is None) and case_durations:
+        file_duration = sum(case_durations.values())
+    
+    return file_duration
+
+
+def build_work_units(test_files, durations, worker_count):
+    """
+    Builds the work units from the registered test files. Test files taking longer than a worker's fair share are
+    split into multiple units by their test cases.
+    
+    Parameters
+    ----------
+    test_files : `list<TestFile>`
+        The registered test files.
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    worker_count : `int`
+        The amount of workers.
+    
+    Returns
+    -------
+    units : `list<WorkUnit>`
+        The work units in the order their events should be dispatched in.
+    """
+    estimated_durations = [estimate_file_duration(test_file, durations) for test_file in test_files]
+    total_duration = sum(duration for duration in estimated_durations if (duration is not None))
+    fair_share = total_duration / worker_count
+    
+    units = []
+    
+    for test_file, estimated_duration in zip(test_files, estimated_durations):
+        if (
+            (worker_count > 1) and
+            (estimated_duration is not None) and
+            (estimated_duration > fair_share > 0.0) and
+            (not test_file.is_directory())
+        ):
+            case_durations = durations[test_file.import_route][1]
+            chunk_count = min(worker_count, ceil(estimated_duration / fair_share), len(case_durations))
+        else:
+            case_durations = None
+            chunk_count = 1
+        
+        if chunk_count <= 1:
+            units.append(WorkUnit(test_file, None, None, True, True, estimated_duration))
+            continue
+        
+        # Import time and such are repeated by each chunk.
+        overhead = max(estimated_duration - sum(case_durations.values()), 0.0)
+        
+        bounds = split_case_durations(case_durations, chunk_count)
+        last_index = len(bounds) - 1
+        for index, (lower_bound, upper_bound) in enumerate(bounds):
+            chunk_duration = overhead + sum(
+                case_duration for case_name, case_duration in case_durations.items()
+                if is_case_name_in_bounds(case_name, lower_bound, upper_bound)
+            )
+            units.append(WorkUnit(test_file, lower_bound, upper_bound, index == 0, index == last_index, chunk_duration))
+    
+    return units
+
+
+def get_dispatch_order(units):
+    """
+    Returns the order the units should be dispatched in. Longest units go first, so no long running unit is left
+    for the end. Units without previous duration are handled as if they would be the longest.
+    
+    Parameters
+    ----------
+    units : `list<WorkUnit>`
+        The work units.
+    
+    Returns
+    -------
+    dispatch_order : `list<int>`
+        The units' indexes.
+    """
+    maximal_duration = max(
+        (unit.estimated_duration for unit in units if (unit.estimated_duration is not None)),
+        default = 0.0,
+    )
+    
+    def get_sort_key(unit_index):
+        estimated_duration = units[unit_index].estimated_duration
+        if estimated_duration is None:
+            estimated_duration = maximal_duration
+        
+        return -estimated_duration
+    
+    return sorted(range(len(units)), key = get_sort_key)
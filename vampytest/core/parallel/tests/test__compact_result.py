@@ -0,0 +1,52 @@
+from ...assertions import assert_eq, assert_instance, assert_is
+from ...result import DetachedResult, Result, ResultTimings
+
+from ..detaching import compact_result
+
+
+class TestCase:
+    """
+    Test case stand-in.
+    """
+    def do_reverse(self):
+        """
+        Returns whether the test's result should be reversed.
+        
+        Returns
+        -------
+        do_reverse : `bool`
+        """
+        return False
+
+
+def test__compact_result__result():
+    """
+    Tests whether ``compact_result`` works as intended.
+    
+    Case: passed result.
+    """
+    case = TestCase()
+    timings = ResultTimings()
+    
+    result = Result(case)
+    result.timings = timings
+    
+    output = compact_result(result)
+    assert_instance(output, DetachedResult)
+    assert_is(output.case, case)
+    assert_is(output.timings, timings)
+    assert_eq(output.is_passed(), True)
+    assert_eq(output.is_failed(), False)
+    assert_is(output.failure_tokens, None)
+
+
+def test__compact_result__detached_result():
+    """
+    Tests whether ``compact_result`` works as intended.
+    
+    Case: already detached result.
+    """
+    result = DetachedResult(TestCase(), False, 0, None, None, None, None)
+    
+    output = compact_result(result)
+    assert_is(output, result)
@@ -0,0 +1,33 @@
+from ...assertions import assert_eq
+from ...result import DetachedResult, ResultTimings
+from ...result.detached_result import RESULT_FLAG_CACHED, RESULT_FLAG_PASSED
+
+from ..detaching import detach_result
+
+
+class TestCase:
+    """
+    Test case stand-in.
+    """
+    def do_reverse(self):
+        """
+        Returns whether the test's result should be reversed.
+        
+        Returns
+        -------
+        do_reverse : `bool`
+        """
+        return False
+
+
+def test__detach_result__detached_result():
+    """
+    Tests whether ``detach_result`` works as intended.
+    
+    Case: already detached result, like a cached one.
+    """
+    timings = ResultTimings()
+    result = DetachedResult(TestCase(), True, RESULT_FLAG_PASSED | RESULT_FLAG_CACHED, '[1]', None, None, timings)
+    
+    output = detach_result(result)
+    assert_eq(output, (True, RESULT_FLAG_PASSED | RESULT_FLAG_CACHED, '[1]', None, None, timings))
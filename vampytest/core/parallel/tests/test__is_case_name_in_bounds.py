@@ -0,0 +1,34 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..scheduling import is_case_name_in_bounds
+
+
+def _iter_options():
+    yield 'test_1', None, None, True
+    yield 'test_1', 'test_1', None, True
+    yield 'test_1', 'test_2', None, False
+    yield 'test_1', None, 'test_1', False
+    yield 'test_1', None, 'test_2', True
+    yield 'test_1', 'test_0', 'test_2', True
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__is_case_name_in_bounds(name, lower_bound, upper_bound):
+    """
+    Tests whether ``is_case_name_in_bounds`` works as intended.
+    
+    Parameters
+    ----------
+    name : `str`
+        The test case's name.
+    lower_bound : `None | str`
+        Inclusive lower bound.
+    upper_bound : `None | str`
+        Exclusive upper bound.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    return is_case_name_in_bounds(name, lower_bound, upper_bound)
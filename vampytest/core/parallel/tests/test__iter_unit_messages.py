@@ -0,0 +1,117 @@
+import sys
+from os import mkdir as make_directory
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...assertions import assert_eq
+from ...environment import EnvironmentManager
+from ...file.file_system_entry import DEFAULT_PRUNE_NAMES
+from ...runner.constants import OUTPUT_RETENTION_FAILED_ONLY
+
+from ..constants import MESSAGE_FILE_LOAD_DONE, MESSAGE_TEST_DONE
+from ..worker import _iter_unit_messages
+
+
+PACKAGE_NAME = 'vampytest_test_package_split_unit'
+
+TEST_FILE_CONTENT = """
+import vampytest
+
+
+@vampytest.call_with(2)
+def test_double(value):
+    vampytest.assert_eq(value * 2, 4)
+
+
+@vampytest.call_with(3)
+def test_multi(value):
+    vampytest.assert_eq(value * 3, 9)
+"""
+
+
+def _run_unit(source_directory, lower_bound, upper_bound, loaded_test_files):
+    """
+    Runs a unit of the test file created in the given directory.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The directory containing the test package.
+    lower_bound : `None | str`
+        Inclusive lower bound of the test case names to run.
+    upper_bound : `None | str`
+        Exclusive upper bound of the test case names to run.
+    loaded_test_files : `dict<str, TestFile>`
+        The test files loaded by the previous units.
+    
+    Returns
+    -------
+    loaded_names : `None | list<str>`
+        The names of the loaded test cases.
+    ran_test_case_indexes : `list<int>`
+        The indexes of the ran test cases.
+    """
+    loaded_names = None
+    ran_test_case_indexes = []
+    
+    for message in _iter_unit_messages(
+        0,
+        [PACKAGE_NAME, 'tests', 'test_split.py'],
+        lower_bound,
+        upper_bound,
+        source_directory,
+        set(),
+        EnvironmentManager().populate(),
+        None,
+        DEFAULT_PRUNE_NAMES,
+        {},
+        loaded_test_files,
+        None,
+        OUTPUT_RETENTION_FAILED_ONLY,
+    ):
+        message_type = message[0]
+        if message_type == MESSAGE_FILE_LOAD_DONE:
+            loaded_names = message[3]
+        
+        elif message_type == MESSAGE_TEST_DONE:
+            ran_test_case_indexes.append(message[3])
+    
+    return loaded_names, ran_test_case_indexes
+
+
+def test__iter_unit_messages__split_file_in_one_process():
+    """
+    Tests whether ``_iter_unit_messages`` works as intended.
+    
+    Case: two units of the same test file with wrapped tests ran by the same process.
+    """
+    with TemporaryDirectory() as source_directory:
+        directory_path = join_paths(source_directory, PACKAGE_NAME)
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        directory_path = join_paths(directory_path, 'tests')
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        with open(join_paths(directory_path, 'test_split.py'), 'w') as file:
+            file.write(TEST_FILE_CONTENT)
+        
+        sys.path.append(source_directory)
+        try:
+            loaded_test_files = {}
+            
+            output = _run_unit(source_directory, None, 'test_multi', loaded_test_files)
+            assert_eq(output, (['test_double', 'test_multi'], [0]))
+            
+            output = _run_unit(source_directory, 'test_multi', None, loaded_test_files)
+            assert_eq(output, (['test_double', 'test_multi'], [1]))
+        
+        finally:
+            sys.path.remove(source_directory)
+            
+            for module_name in [*sys.modules.keys()]:
+                if module_name == PACKAGE_NAME or module_name.startswith(PACKAGE_NAME + '.'):
+                    del sys.modules[module_name]
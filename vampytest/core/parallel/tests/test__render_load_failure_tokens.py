@@ -0,0 +1,30 @@
+from ...assertions import assert_eq, assert_in
+
+from ..detaching import render_load_failure_tokens
+
+
+class TestFileLoadFailure:
+    """
+    Test file load failure stand-in, failing to render its exception.
+    """
+    def iter_exception_tokens(self):
+        """
+        Raises an exception instead of iterating over the tokens of the rendered exception.
+        
+        Raises
+        ------
+        RuntimeError
+        """
+        raise RuntimeError('koishi')
+
+
+def test__render_load_failure_tokens__rendering_failure():
+    """
+    Tests whether ``render_load_failure_tokens`` works as intended.
+    
+    Case: rendering the load failure fails, rendering the exception instead.
+    """
+    output = render_load_failure_tokens(TestFileLoadFailure())
+    assert_eq(len(output), 1)
+    assert_in('RuntimeError', output[0][1])
+    assert_in('koishi', output[0][1])
@@ -0,0 +1,44 @@
+from ...utils import _
+from ...wrappers import call_from
+
+from ..scheduling import split_case_durations
+
+
+def _iter_options():
+    yield {'test_0': 1.0}, 4, [(None, None)]
+    yield {'test_0': 1.0, 'test_1': 1.0}, 1, [(None, None)]
+    yield {'test_0': 1.0, 'test_1': 1.0}, 2, [(None, 'test_1'), ('test_1', None)]
+    yield (
+        {'test_0': 1.0, 'test_1': 1.0, 'test_2': 1.0, 'test_3': 1.0},
+        2,
+        [(None, 'test_2'), ('test_2', None)],
+    )
+    yield (
+        {'test_0': 3.0, 'test_1': 1.0, 'test_2': 1.0, 'test_3': 1.0},
+        2,
+        [(None, 'test_1'), ('test_1', None)],
+    )
+    yield (
+        {'test_0': 0.0, 'test_1': 0.0, 'test_2': 0.0},
+        3,
+        [(None, 'test_1'), ('test_1', 'test_2'), ('test_2', None)],
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__split_case_durations(case_durations, chunk_count):
+    """
+    Tests whether ``split_case_durations`` works as intended.
+    
+    Parameters
+    ----------
+    case_durations : `dict<str, float>`
+        Test case names mapped to their duration.
+    chunk_count : `int`
+        The maximal amount of chunks to create.
+    
+    Returns
+    -------
+    output : `list<(None | str, None | str)>`
+    """
+    return split_case_durations(case_durations, chunk_count)
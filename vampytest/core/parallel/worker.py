@@ -0,0 +1,290 @@
+__all__ = ()
+
+import sys
+from time import perf_counter
+
+from ..contexts import ContextOutputCapturing
+from ..environment import EnvironmentManager, apply_environments_for_file_at, shutdown_environments
+from ..file import FileSystemEntry, iter_collect_test_files_in
+from ..handling import iter_invoke_items
+from ..result import DetachedResult
+from ..runner.output_retention import apply_output_retention
+from ..runner.runner import setup_test_library_import
+
+from .constants import MESSAGE_FILE_LOAD_DONE, MESSAGE_FILE_TESTING_DONE, MESSAGE_TEST_DONE, MESSAGE_UNIT_DONE
+from .detaching import detach_result, render_load_failure_tokens
+from .scheduling import is_case_name_in_bounds
+
+
+def _iter_invoke_items(test_cases, lower_bound, upper_bound, result_cache, file_key):
+    """
+    Iterates over the items to invoke the test cases within the given bounds with.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    test_cases : `list<TestCase>`
+        The test file's test cases.
+    lower_bound : `None | str`
+        Inclusive lower bound of the test case names to run.
+    upper_bound : `None | str`
+        Exclusive upper bound of the test case names to run.
+    result_cache : `None | ResultCache`
+        Result cache to reuse the results of the test cases passed with the same code from.
+    file_key : `None | str`
+        The key of the test file's code. `None` if results should not be reused.
+    
+    Yields
+    ------
+    test_case_index : `int`
+        The test case's index.
+    item : ``Handle | Result | DetachedResult``
+        The handle to invoke or the test case's result.
+    continuous : `bool`
+        Whether the handle's result is continuous.
+    """
+    for test_case_index, test_case in enumerate(test_cases):
+        if not is_case_name_in_bounds(test_case.name, lower_bound, upper_bound):
+            continue
+        
+        if (file_key is not None):
+            cached_results = result_cache.get_cached_results(test_case, file_key)
+            if (cached_results is not None):
+                for result in cached_results:
+                    yield test_case_index, result, False
+                
+                continue
+        
+        for item, continuous in test_case.iter_invoke_items():
+            yield test_case_index, item, continuous
+
+
+def _iter_unit_messages(
+    unit_index,
+    route,
+    lower_bound,
+    upper_bound,
+    source_directory,
+    sources,
+    environment_manager,
+    case_filter,
+    prune_names,
+    referenced_module_names_cache,
+    loaded_test_files,
+    result_cache,
+    output_retention,
+):
+    """
+    Runs a test unit, yielding back the messages to send to the parent process.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    unit_index : `int`
+        The unit's index.
+    route : `list<str>`
+        File system entry names leading to the unit starting from the source directory.
+    lower_bound : `None | str`
+        Inclusive lower bound of the test case names to run.
+    upper_bound : `None | str`
+        Exclusive upper bound of the test case names to run.
+    source_directory : `str`
+        The path to run tests from.
+    sources : `set<str>`
+        Sources to import before executing any test.
+    environment_manager : ``EnvironmentManager``
+        Testing environment manager.
+    case_filter : `None | ShardFilter`
+        Filter to select the test cases to run with.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    referenced_module_names_cache : `dict<str, set<str>>`
+        Module names mapped to the names of the modules they reference.
+    loaded_test_files : `dict<str, TestFile>`
+        The test files loaded by the previous units of the worker mapped to their path.
+    result_cache : `None | ResultCache`
+        Result cache to reuse the results of the test cases passed with the same code from.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    
+    Yields
+    ------
+    message : `tuple`
+    """
+    file_system_entry = FileSystemEntry(source_directory, route[0], route[1:], prune_names)
+    if file_system_entry is None:
+        return
+    
+    for registered_file in iter_collect_test_files_in(file_system_entry):
+        for test_file in registered_file.iter_test_files():
+            path = test_file.path
+            
+            if test_file.is_directory():
+                test_file.get_module()
+                
+                yield (
+                    MESSAGE_FILE_LOAD_DONE,
+                    unit_index,
+                    path,
+                    None,
+                    render_load_failure_tokens(test_file.get_load_failure()),
+                    test_file.import_time,
+                    None,
+                )
+                
+                if test_file.is_loaded_with_failure():
+                    break
+                
+                yield MESSAGE_FILE_TESTING_DONE, unit_index, path
+            
+            else:
+                # A split test file's module is imported only once per process and its tests are unbound from their
+                # wrappers when loaded, so its later units reuse the test file loaded by the first one.
+                loaded_test_file = loaded_test_files.get(path, None)
+                if loaded_test_file is None:
+                    test_file.try_load_test_cases(case_filter)
+                    test_file.collect_dependency_paths(sources, referenced_module_names_cache)
+                    loaded_test_files[path] = test_file
+                else:
+                    test_file = loaded_test_file
+                
+                if test_file.is_loaded_with_success():
+                    test_cases = test_file.get_test_cases()
+                    test_case_names = [test_case.name for test_case in test_cases]
+                else:
+                    test_cases = None
+                    test_case_names = None
+                
+                yield (
+                    MESSAGE_FILE_LOAD_DONE,
+                    unit_index,
+                    path,
+                    test_case_names,
+                    render_load_failure_tokens(test_file.get_load_failure()),
+                    test_file.import_time,
+                    test_file.dependency_paths,
+                )
+                
+                if (test_cases is not None):
+                    file_environment_manager = apply_environments_for_file_at(environment_manager, path)
+                    
+                    if result_cache is None:
+                        file_key = None
+                    else:
+                        file_key = result_cache.get_file_key(test_file.dependency_paths)
+                    
+                    start = perf_counter()
+                    for test_case_index, result in iter_invoke_items(
+                        _iter_invoke_items(test_cases, lower_bound, upper_bound, result_cache, file_key),
+                        file_environment_manager,
+                    ):
+                        end = perf_counter()
+                        test_file.add_result(result)
+                        
+                        # The output is dropped only after detaching, so the result is reported as informal, and is
+                        # not reused by the next runs, just as when ran in the main process.
+                        detached = detach_result(result)
+                        yield (
+                            MESSAGE_TEST_DONE,
+                            unit_index,
+                            path,
+                            test_case_index,
+                            end - start,
+                            *detached,
+                        )
+                        
+                        detached_result = DetachedResult(result.case, *detached)
+                        apply_output_retention(detached_result, output_retention)
+                        test_file.replace_result(result, detached_result)
+                        start = perf_counter()
+                    
+                    yield MESSAGE_FILE_TESTING_DONE, unit_index, path
+
+
+def run_worker(
+    connection,
+    source_directory,
+    sources,
+    case_filter,
+    prune_names,
+    result_cache,
+    timeout,
+    output_capture_mode,
+    output_memory_limit,
+    output_retention,
+):
+    """
+    Worker process entry point. Receives test units to run and sends back their progress until `None` is received.
+    
+    Parameters
+    ----------
+    connection : ``Connection``
+        Connection to communicate with the parent process.
+    source_directory : `str`
+        The path to run tests from.
+    sources : `set<str>`
+        Sources to import before executing any test.
+    case_filter : `None | ShardFilter`
+        Filter to select the test cases to run with.
+    prune_names : `frozenset<str>`
+        Directory names to not look into.
+    result_cache : `None | ResultCache`
+        Result cache to reuse the results of the test cases passed with the same code from.
+    timeout : `None | float`
+        The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+    output_capture_mode : `str`
+        How the output of the tests is captured.
+    output_memory_limit : `int`
+        The maximal size of each test's output in bytes to keep in memory.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    """
+    try:
+        if source_directory not in sys.path:
+            sys.path.append(source_directory)
+        
+        setup_test_library_import()
+        
+        for source in sources:
+            __import__(source)
+        
+        environment_manager = EnvironmentManager().populate(timeout = timeout)
+        ContextOutputCapturing.set_defaults(memory_limit = output_memory_limit, mode = output_capture_mode)
+        referenced_module_names_cache = {}
+        loaded_test_files = {}
+        
+        while True:
+            unit = connection.recv()
+            if unit is None:
+                break
+            
+            unit_index, route, lower_bound, upper_bound = unit
+            
+            start = perf_counter()
+            for message in _iter_unit_messages(
+                unit_index,
+                route,
+                lower_bound,
+                upper_bound,
+                source_directory,
+                sources,
+                environment_manager,
+                case_filter,
+                prune_names,
+                referenced_module_names_cache,
+                loaded_test_files,
+                result_cache,
+                output_retention,
+            ):
+                connection.send(message)
+            
+            connection.send((MESSAGE_UNIT_DONE, unit_index, perf_counter() - start))
+    
+    except (EOFError, KeyboardInterrupt):
+        pass
+    
+    finally:
+        shutdown_environments()
+        connection.close()
@@ -1,10 +1,16 @@
 from .reports import *
 
+from .detached_result import *
 from .result import *
+from .tally import *
+from .timings import *
 
 
 __all__ = (
     *reports.__all__,
     
+    *detached_result.__all__,
     *result.__all__,
+    *tally.__all__,
+    *timings.__all__,
 )
@@ -0,0 +1,269 @@
+__all__ = ('DetachedResult',)
+
+from scarletio import RichAttributeErrorBaseType
+
+
+RESULT_FLAG_SKIPPED = 1 << 0
+RESULT_FLAG_PASSED = 1 << 1
+RESULT_FLAG_FAILED = 1 << 2
+RESULT_FLAG_CONFLICTED = 1 << 3
+RESULT_FLAG_INFORMAL = 1 << 4
+RESULT_FLAG_CACHED = 1 << 5
+RESULT_FLAG_LEAKED = 1 << 6
+
+
+def get_result_flags(result):
+    """
+    Gets the status flags of the given result.
+    
+    Parameters
+    ----------
+    result : ``Result``
+        The result to get its flags of.
+    
+    Returns
+    -------
+    flags : `int`
+    """
+    flags = 0
+    
+    if result.is_skipped():
+        flags |= RESULT_FLAG_SKIPPED
+    
+    if result.is_passed():
+        flags |= RESULT_FLAG_PASSED
+    
+    if result.is_failed():
+        flags |= RESULT_FLAG_FAILED
+    
+    if result.is_conflicted():
+        flags |= RESULT_FLAG_CONFLICTED
+    
+    if result.is_informal():
+        flags |= RESULT_FLAG_INFORMAL
+    
+    if result.is_cached():
+        flags |= RESULT_FLAG_CACHED
+    
+    if (result.get_leak_report() is not None):
+        flags |= RESULT_FLAG_LEAKED
+    
+    return flags
+
+
+class DetachedResult(RichAttributeErrorBaseType):
+    """
+    Represents a test's result, which is detached from the handle that produced it.
+    
+    Its reports are pre-rendered, so it does not keep the test's parameters, return values or exceptions alive.
+    
+    Attributes
+    ----------
+    case : ``TestCase``
+        The parent test case.
+    case_modifier : `None | str`
+        Rendered case modifier. Used to differentiate the results of the same test case.
+    continuous : `bool`
+        Whether this is is not the last test of the case.
+    failure_tokens : `None | list<(int, str)>`
+        The rendered failure report if the test failed.
+    flags : `int`
+        Bitwise flags describing the result's status.
+    informal_tokens : `None | list<(int, str)>`
+        The rendered informal report if the result is informal.
+    timings : `None | ResultTimings`
+        How much time the phases of running the test took.
+    
+    Utility Methods
+    - ``.is_skipped``
+    - ``.is_passed``
+    - ``.is_failed``
+    - ``.is_conflicted``
+    - ``.is_informal``
+    - ``.is_cached``
+    - ``.is_last``
+    """
+    __slots__ = ('case', 'case_modifier', 'continuous', 'failure_tokens', 'flags', 'informal_tokens', 'timings')
+    
+    def __new__(cls, case, continuous, flags, case_modifier, failure_tokens, informal_tokens, timings):
+        """
+        Creates a new detached result.
+        
+        Parameters
+        ----------
+        case : ``TestCase``
+            The parent test case.
+        continuous : `bool`
+            Whether this is is not the last test of the case.
+        flags : `int`
+            Bitwise flags describing the result's status.
+        case_modifier : `None | str`
+            Rendered case modifier.
+        failure_tokens : `None | list<(int, str)>`
+            The rendered failure report if the test failed.
+        informal_tokens : `None | list<(int, str)>`
+            The rendered informal report if the result is informal.
+        timings : `None | ResultTimings`
+            How much time the phases of running the test took.
+        """
+        self = object.__new__(cls)
+        self.case = case
+        self.case_modifier = case_modifier
+        self.continuous = continuous
+        self.failure_tokens = failure_tokens
+        self.flags = flags
+        self.informal_tokens = informal_tokens
+        self.timings = timings
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the detached result's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' name = ')
+        repr_parts.append(repr(self.case.name))
+        
+        case_modifier = self.case_modifier
+        if (case_modifier is not None):
+            repr_parts.append(', case_modifier = ')
+            repr_parts.append(repr(case_modifier))
+        
+        if self.is_skipped():
+            repr_parts.append(', skipped')
+        
+        elif self.is_failed():
+            repr_parts.append(', failed')
+        
+        else:
+            repr_parts.append(', passed')
+        
+        if self.is_cached():
+            repr_parts.append(', cached')
+        
+        if self.continuous:
+            repr_parts.append(', continuous')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def is_skipped(self):
+        """
+        Returns whether the represented test case was skipped.
+        
+        Returns
+        -------
+        is_skipped : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_SKIPPED else False
+    
+    
+    def is_passed(self):
+        """
+        Returns whether the test result passed.
+        
+        Returns
+        -------
+        is_passed : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_PASSED else False
+    
+    
+    def is_failed(self):
+        """
+        Returns whether the test result failed.
+        
+        Returns
+        -------
+        is_failed : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_FAILED else False
+    
+    
+    def is_conflicted(self):
+        """
+        Returns whether the respective test case conflicted.
+        
+        Returns
+        -------
+        is_conflicted : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_CONFLICTED else False
+    
+    
+    def is_informal(self):
+        """
+        Returns whether the test result holds only informal results.
+        
+        Returns
+        -------
+        is_informal : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_INFORMAL else False
+    
+    
+    def is_cached(self):
+        """
+        Returns whether the result is reused from a previous run instead of running the test.
+        
+        Returns
+        -------
+        is_cached : `bool`
+        """
+        return True if self.flags & RESULT_FLAG_CACHED else False
+    
+    
+    def is_last(self):
+        """
+        Returns whether the result is the last of the test case. Can be used when rendering test tree.
+        
+        Returns
+        -------
+        is_last : `bool`
+        """
+        return (not self.continuous)
+    
+    
+    def drop_output(self):
+        """
+        Drops the rendered informal report of the detached result, releasing the captured output it is rendered from.
+        
+        The failure report is not affected, because the output is rendered into it. Neither is the informal report of
+        a result with leak report, because the leak report is rendered into it.
+        """
+        if self.flags & RESULT_FLAG_LEAKED:
+            return
+        
+        self.informal_tokens = None
+        self.flags &= ~RESULT_FLAG_INFORMAL
+    
+    
+    def iter_failure_tokens(self):
+        """
+        Iterates over the rendered failure report's tokens.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        token_type_and_part : `(int, str)`
+        """
+        failure_tokens = self.failure_tokens
+        if (failure_tokens is not None):
+            yield from failure_tokens
+    
+    
+    def iter_informal_tokens(self):
+        """
+        Iterates over the rendered informal report's tokens.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        token_type_and_part : `(int, str)`
+        """
+        informal_tokens = self.informal_tokens
+        if (informal_tokens is not None):
+            yield from informal_tokens
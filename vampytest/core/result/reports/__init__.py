@@ -3,6 +3,7 @@ from .failure_asserting import *
 from .failure_parameter_mismatch import *
 from .failure_raising import *
 from .failure_returning import *
+from .leak import *
 from .output import *
 
 
@@ -12,5 +13,6 @@ __all__ = (
     *failure_parameter_mismatch.__all__,
     *failure_raising.__all__,
     *failure_returning.__all__,
+    *leak.__all__,
     *output.__all__,
 )
@@ -0,0 +1,49 @@
+__all__ = ('ReportLeak',)
+
+from scarletio import copy_docs
+
+from .base import ReportBase
+
+
+class ReportLeak(ReportBase):
+    """
+    Reports what a test left behind, like pending tasks on its event loop.
+    
+    Kept separate from the test's output, so it is reported even if the output is dropped.
+    
+    Attributes
+    ----------
+    message : `str`
+        Description of what the test left behind.
+    """
+    __slots__ = ('message',)
+    
+    def __new__(cls, message):
+        """
+        Creates a new report.
+        
+        Attributes
+        ----------
+        message : `str`
+            Description of what the test left behind.
+        """
+        self = object.__new__(cls)
+        self.message = message
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the report's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        # message
+        repr_parts.append(' message = ')
+        repr_parts.append(repr(self.message))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @copy_docs(ReportBase.is_informal)
+    def is_informal(self):
+        return True
@@ -5,7 +5,8 @@ from scarletio import RichAttributeErrorBaseType, export
 from ..wrappers import WrapperCalling
 
 from .reports import (
-    ReportFailureAsserting, ReportFailureParameterMismatch, ReportFailureRaising, ReportFailureReturning, ReportOutput
+    ReportFailureAsserting, ReportFailureParameterMismatch, ReportFailureRaising, ReportFailureReturning, ReportLeak,
+    ReportOutput
 )
 
 
@@ -30,6 +31,10 @@ class Result(RichAttributeErrorBaseType):
         Whether the test result is reversed.
     skipped : `bool`
         Whether the test is skipped.
+    sub_case : `None | str`
+        The representation of the value yielded by a generator test this result is for.
+    timings : `None | ResultTimings`
+        How much time the phases of running the test took.
     
     Utility Methods
     - ``.is_skipped``
@@ -37,9 +42,12 @@ class Result(RichAttributeErrorBaseType):
     - ``.is_failed``
     - ``.is_conflicted``
     - ``.is_informal``
+    - ``.is_cached``
     - ``.iter_report_messages``
     """
-    __slots__ = ('case', 'conflict', 'continuous', 'handle', 'reports', 'reversed', 'skipped')
+    __slots__ = (
+        'case', 'conflict', 'continuous', 'handle', 'reports', 'reversed', 'skipped', 'sub_case', 'timings'
+    )
     
     def __new__(cls, case):
         """
@@ -58,6 +66,8 @@ class Result(RichAttributeErrorBaseType):
         self.reports = None
         self.reversed = case.do_reverse()
         self.skipped = False
+        self.sub_case = None
+        self.timings = None
         return self
     
     
@@ -101,6 +111,16 @@ class Result(RichAttributeErrorBaseType):
             
             repr_parts.append(' skipped')
         
+        sub_case = self.sub_case
+        if (sub_case is not None):
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' sub_case = ')
+            repr_parts.append(repr(sub_case))
+        
         if self.continuous:
             if field_added:
                 repr_parts.append(',')
@@ -147,6 +167,40 @@ class Result(RichAttributeErrorBaseType):
         return self
     
     
+    def with_sub_case(self, sub_case):
+        """
+        Sets the sub case of a generator test.
+        
+        Parameters
+        ----------
+        sub_case : `str`
+            The representation of the value yielded by the test.
+        
+        Returns
+        -------
+        self : `instance<type<self>>`
+        """
+        self.sub_case = sub_case
+        return self
+    
+    
+    def with_timings(self, timings):
+        """
+        Sets timings.
+        
+        Parameters
+        ----------
+        timings : ``ResultTimings``
+            How much time the phases of running the test took.
+        
+        Returns
+        -------
+        self : `instance<type<self>>`
+        """
+        self.timings = timings
+        return self
+    
+    
     def as_skipped(self):
         """
         Marks the test result as skipped.
@@ -253,7 +307,7 @@ class Result(RichAttributeErrorBaseType):
     
     def with_output(self, output):
         """
-        Adds captured output as test result. 
+        Adds captured output as test result.
         
         Parameters
         ----------
@@ -269,6 +323,39 @@ class Result(RichAttributeErrorBaseType):
         return self
     
     
+    def with_leak(self, message):
+        """
+        Adds a report about what the test left behind.
+        
+        Parameters
+        ----------
+        message : `str`
+            Description of what the test left behind.
+        
+        Returns
+        -------
+        self : `instance<type<self>>`
+        """
+        report = ReportLeak(message)
+        self._add_report(report)
+        return self
+    
+    
+    def drop_output(self):
+        """
+        Drops the captured output of the test result, releasing it. Leak reports are kept.
+        """
+        reports = self.reports
+        if (reports is None):
+            return
+        
+        reports = [report for report in reports if not isinstance(report, ReportOutput)]
+        if not reports:
+            reports = None
+        
+        self.reports = reports
+    
+    
     def _add_report(self, report):
         """
         Ads a report to the test result.
@@ -366,7 +453,18 @@ class Result(RichAttributeErrorBaseType):
                 has_informal = True
         
         return has_informal
+    
+    
+    def is_cached(self):
+        """
+        Returns whether the result is reused from a previous run instead of running the test.
         
+        Returns
+        -------
+        is_cached : `bool`
+        """
+        return False
+    
     
     def is_last(self):
         """
@@ -438,3 +536,16 @@ class Result(RichAttributeErrorBaseType):
         for report in self.iter_reports():
             if isinstance(report, ReportOutput):
                 return report
+    
+    
+    def get_leak_report(self):
+        """
+        Gets the first leak report.
+        
+        Returns
+        -------
+        report : `None`, ``ReportLeak``
+        """
+        for report in self.iter_reports():
+            if isinstance(report, ReportLeak):
+                return report
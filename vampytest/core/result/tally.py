@@ -0,0 +1,119 @@
+__all__ = ('ResultTally',)
+
+from scarletio import RichAttributeErrorBaseType, export
+
+
+@export
+class ResultTally(RichAttributeErrorBaseType):
+    """
+    Running counts of results by their state. Updated when a result is added, so the counts are available without
+    iterating over the results.
+    
+    Attributes
+    ----------
+    cached_count : `int`
+        How much results passed by reusing the result of a previous run.
+    failed_count : `int`
+        How much results failed.
+    informal_count : `int`
+        How much results are informal.
+    passed_count : `int`
+        How much results passed.
+    ran_count : `int`
+        How much results were added.
+    skipped_count : `int`
+        How much results were skipped.
+    """
+    __slots__ = ('cached_count', 'failed_count', 'informal_count', 'passed_count', 'ran_count', 'skipped_count')
+    
+    def __new__(cls):
+        """
+        Creates a new result tally.
+        """
+        self = object.__new__(cls)
+        self.cached_count = 0
+        self.failed_count = 0
+        self.informal_count = 0
+        self.passed_count = 0
+        self.ran_count = 0
+        self.skipped_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the result tally's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' ran_count = ')
+        repr_parts.append(repr(self.ran_count))
+        
+        repr_parts.append(', passed_count = ')
+        repr_parts.append(repr(self.passed_count))
+        
+        repr_parts.append(', cached_count = ')
+        repr_parts.append(repr(self.cached_count))
+        
+        repr_parts.append(', skipped_count = ')
+        repr_parts.append(repr(self.skipped_count))
+        
+        repr_parts.append(', failed_count = ')
+        repr_parts.append(repr(self.failed_count))
+        
+        repr_parts.append(', informal_count = ')
+        repr_parts.append(repr(self.informal_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two result tallies are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.cached_count != other.cached_count:
+            return False
+        
+        if self.failed_count != other.failed_count:
+            return False
+        
+        if self.informal_count != other.informal_count:
+            return False
+        
+        if self.passed_count != other.passed_count:
+            return False
+        
+        if self.ran_count != other.ran_count:
+            return False
+        
+        if self.skipped_count != other.skipped_count:
+            return False
+        
+        return True
+    
+    
+    def add(self, result):
+        """
+        Counts the given result.
+        
+        Parameters
+        ----------
+        result : ``Result | DetachedResult``
+            The result to count.
+        """
+        self.ran_count += 1
+        
+        if result.is_passed():
+            self.passed_count += 1
+        
+        if result.is_cached():
+            self.cached_count += 1
+        
+        if result.is_skipped():
+            self.skipped_count += 1
+        
+        if result.is_failed():
+            self.failed_count += 1
+        
+        if result.is_informal():
+            self.informal_count += 1
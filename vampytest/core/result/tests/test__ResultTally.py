@@ -0,0 +1,95 @@
+from ...assertions import assert_eq, assert_instance
+from ...wrappers import WrapperConflict
+
+from ..result import Result
+from ..tally import ResultTally
+
+
+class TestCase:
+    """
+    Test case stand-in.
+    """
+    def do_reverse(self):
+        """
+        Returns whether the test's result should be reversed.
+        
+        Returns
+        -------
+        do_reverse : `bool`
+        """
+        return False
+
+
+def _assert_fields_set(tally):
+    """
+    Asserts whether every fields are set of the given result tally.
+    
+    Parameters
+    ----------
+    tally : ``ResultTally``
+        The result tally to check.
+    """
+    assert_instance(tally, ResultTally)
+    assert_instance(tally.cached_count, int)
+    assert_instance(tally.failed_count, int)
+    assert_instance(tally.informal_count, int)
+    assert_instance(tally.passed_count, int)
+    assert_instance(tally.ran_count, int)
+    assert_instance(tally.skipped_count, int)
+
+
+def test__ResultTally__new():
+    """
+    Tests whether ``ResultTally.__new__`` works as intended.
+    """
+    tally = ResultTally()
+    _assert_fields_set(tally)
+    
+    assert_eq(tally.ran_count, 0)
+
+
+def test__ResultTally__repr():
+    """
+    Tests whether ``ResultTally.__repr__`` works as intended.
+    """
+    tally = ResultTally()
+    
+    output = repr(tally)
+    assert_instance(output, str)
+
+
+def test__ResultTally__eq():
+    """
+    Tests whether ``ResultTally.__eq__`` works as intended.
+    """
+    case = TestCase()
+    
+    tally_0 = ResultTally()
+    tally_1 = ResultTally()
+    assert_eq(tally_0, tally_1)
+    
+    tally_0.add(Result(case))
+    assert_eq(tally_0 == tally_1, False)
+    
+    tally_1.add(Result(case))
+    assert_eq(tally_0, tally_1)
+
+
+def test__ResultTally__add():
+    """
+    Tests whether ``ResultTally.add`` works as intended.
+    """
+    case = TestCase()
+    tally = ResultTally()
+    
+    tally.add(Result(case))
+    tally.add(Result(case).as_skipped())
+    tally.add(Result(case).with_conflict(WrapperConflict(None, reason = 'test')))
+    
+    assert_eq(tally.ran_count, 3)
+    # Skipped results count as passed as well.
+    assert_eq(tally.passed_count, 2)
+    assert_eq(tally.cached_count, 0)
+    assert_eq(tally.skipped_count, 1)
+    assert_eq(tally.failed_count, 1)
+    assert_eq(tally.informal_count, 0)
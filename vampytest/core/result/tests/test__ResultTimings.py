@@ -0,0 +1,95 @@
+from pickle import dumps as dump_pickle, loads as load_pickle
+
+from ...assertions import assert_eq, assert_instance, assert_ne
+
+from ..timings import ResultTimings
+
+
+def _assert_fields_set(timings):
+    """
+    Asserts whether every fields are set of the given result timings.
+    
+    Parameters
+    ----------
+    timings : ``ResultTimings``
+        The result timings to check.
+    """
+    assert_instance(timings, ResultTimings)
+    assert_instance(timings.call_cpu_time, int)
+    assert_instance(timings.call_wall_time, int)
+    assert_instance(timings.close_time, int)
+    assert_instance(timings.enter_time, int)
+    assert_instance(timings.exit_time, int)
+    assert_instance(timings.start_time, int)
+
+
+def test__ResultTimings__new__no_fields():
+    """
+    Tests whether ``ResultTimings.__new__`` works as intended.
+    
+    Case: no fields given.
+    """
+    timings = ResultTimings()
+    _assert_fields_set(timings)
+    
+    assert_eq(timings.get_total_time(), 0)
+
+
+def test__ResultTimings__new__all_fields():
+    """
+    Tests whether ``ResultTimings.__new__`` works as intended.
+    
+    Case: all fields given.
+    """
+    call_cpu_time = 5
+    call_wall_time = 10
+    close_time = 1
+    enter_time = 2
+    exit_time = 3
+    start_time = 4
+    
+    timings = ResultTimings(
+        call_cpu_time = call_cpu_time,
+        call_wall_time = call_wall_time,
+        close_time = close_time,
+        enter_time = enter_time,
+        exit_time = exit_time,
+        start_time = start_time,
+    )
+    _assert_fields_set(timings)
+    
+    assert_eq(timings.call_cpu_time, call_cpu_time)
+    assert_eq(timings.call_wall_time, call_wall_time)
+    assert_eq(timings.close_time, close_time)
+    assert_eq(timings.enter_time, enter_time)
+    assert_eq(timings.exit_time, exit_time)
+    assert_eq(timings.start_time, start_time)
+    
+    assert_eq(timings.get_setup_time(), 6)
+    assert_eq(timings.get_teardown_time(), 4)
+    assert_eq(timings.get_total_time(), 20)
+
+
+def test__ResultTimings__repr():
+    """
+    Tests whether ``ResultTimings.__repr__`` works as intended.
+    """
+    timings = ResultTimings(call_wall_time = 10)
+    assert_instance(repr(timings), str)
+
+
+def test__ResultTimings__eq():
+    """
+    Tests whether ``ResultTimings.__eq__`` works as intended.
+    """
+    timings = ResultTimings(call_wall_time = 10)
+    assert_eq(timings, ResultTimings(call_wall_time = 10))
+    assert_ne(timings, ResultTimings(call_wall_time = 11))
+
+
+def test__ResultTimings__pickle():
+    """
+    Tests whether ``ResultTimings`` can be pickled.
+    """
+    timings = ResultTimings(call_cpu_time = 5, call_wall_time = 10, close_time = 1)
+    assert_eq(load_pickle(dump_pickle(timings)), timings)
@@ -0,0 +1,142 @@
+__all__ = ('ResultTimings',)
+
+from scarletio import RichAttributeErrorBaseType, export
+
+
+@export
+class ResultTimings(RichAttributeErrorBaseType):
+    """
+    Holds how much time the phases of running a test took. Every time is in nanoseconds.
+    
+    Attributes
+    ----------
+    call_cpu_time : `int`
+        Processor time spent on calling the test.
+    call_wall_time : `int`
+        Wall-clock time spent on calling the test.
+    close_time : `int`
+        Wall-clock time spent on closing the contexts.
+    enter_time : `int`
+        Wall-clock time spent on entering the contexts.
+    exit_time : `int`
+        Wall-clock time spent on exiting the contexts.
+    start_time : `int`
+        Wall-clock time spent on starting the contexts.
+    """
+    __slots__ = ('call_cpu_time', 'call_wall_time', 'close_time', 'enter_time', 'exit_time', 'start_time')
+    
+    def __new__(
+        cls,
+        *,
+        call_cpu_time = 0,
+        call_wall_time = 0,
+        close_time = 0,
+        enter_time = 0,
+        exit_time = 0,
+        start_time = 0,
+    ):
+        """
+        Creates a new result timings.
+        
+        Parameters
+        ----------
+        call_cpu_time : `int` = `0`, Optional (Keyword only)
+            Processor time spent on calling the test.
+        call_wall_time : `int` = `0`, Optional (Keyword only)
+            Wall-clock time spent on calling the test.
+        close_time : `int` = `0`, Optional (Keyword only)
+            Wall-clock time spent on closing the contexts.
+        enter_time : `int` = `0`, Optional (Keyword only)
+            Wall-clock time spent on entering the contexts.
+        exit_time : `int` = `0`, Optional (Keyword only)
+            Wall-clock time spent on exiting the contexts.
+        start_time : `int` = `0`, Optional (Keyword only)
+            Wall-clock time spent on starting the contexts.
+        """
+        self = object.__new__(cls)
+        self.call_cpu_time = call_cpu_time
+        self.call_wall_time = call_wall_time
+        self.close_time = close_time
+        self.enter_time = enter_time
+        self.exit_time = exit_time
+        self.start_time = start_time
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the result timings' representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' call_wall_time = ')
+        repr_parts.append(repr(self.call_wall_time))
+        
+        repr_parts.append(', call_cpu_time = ')
+        repr_parts.append(repr(self.call_cpu_time))
+        
+        repr_parts.append(', setup_time = ')
+        repr_parts.append(repr(self.get_setup_time()))
+        
+        repr_parts.append(', teardown_time = ')
+        repr_parts.append(repr(self.get_teardown_time()))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two result timings are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.call_cpu_time != other.call_cpu_time:
+            return False
+        
+        if self.call_wall_time != other.call_wall_time:
+            return False
+        
+        if self.close_time != other.close_time:
+            return False
+        
+        if self.enter_time != other.enter_time:
+            return False
+        
+        if self.exit_time != other.exit_time:
+            return False
+        
+        if self.start_time != other.start_time:
+            return False
+        
+        return True
+    
+    
+    def get_setup_time(self):
+        """
+        Returns the wall-clock time spent before calling the test.
+        
+        Returns
+        -------
+        setup_time : `int`
+        """
+        return self.start_time + self.enter_time
+    
+    
+    def get_teardown_time(self):
+        """
+        Returns the wall-clock time spent after calling the test.
+        
+        Returns
+        -------
+        teardown_time : `int`
+        """
+        return self.exit_time + self.close_time
+    
+    
+    def get_total_time(self):
+        """
+        Returns the total wall-clock time spent on running the test.
+        
+        Returns
+        -------
+        total_time : `int`
+        """
+        return self.get_setup_time() + self.call_wall_time + self.get_teardown_time()
@@ -1,8 +1,10 @@
+from .configuration import *
 from .context import *
 from .runner import *
 
 
 __all__ = (
+    *configuration.__all__,
     *context.__all__,
     *runner.__all__,
 )
@@ -0,0 +1,24 @@
+__all__ = ()
+
+from scarletio import include
+
+
+compact_result = include('compact_result')
+
+
+def compact_reported_result(result):
+    """
+    Replaces the given reported result with its compacted version in its test file.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The reported result.
+    """
+    compacted_result = compact_result(result)
+    if compacted_result is result:
+        return
+    
+    test_file = result.case.get_test_file()
+    if (test_file is not None):
+        test_file.replace_result(result, compacted_result)
@@ -0,0 +1,594 @@
+__all__ = ('RunnerConfiguration',)
+
+from scarletio import RichAttributeErrorBaseType
+
+from ..contexts import DEFAULT_OUTPUT_MEMORY_LIMIT, OUTPUT_CAPTURE_MODES, OUTPUT_CAPTURE_MODE_SYS
+
+from .constants import OUTPUT_RETENTIONS, OUTPUT_RETENTION_FAILED_ONLY, SHARD_MODE_HASH, SHARD_MODES
+
+
+class RunnerConfiguration(RichAttributeErrorBaseType):
+    """
+    Holds the settings of a test runner.
+    
+    Attributes
+    ----------
+    cache_disabled : `bool`
+        Whether the cache should neither be read nor written.
+    changed_file_paths : `None | frozenset<str>`
+        The normalized paths of the changed files. If given, only the test files depending on them are ran.
+    clear_cache : `bool`
+        Whether the cache should be cleared before testing.
+    collect_file_path : `None | str`
+        Path to write the collected test handles into as json lines without running them.
+    collect_only : `bool`
+        Whether the test handles should only be collected and written into the standard output as json lines.
+    durations_count : `int`
+        The amount of the slowest tests, test files and imports to list after testing. If `0` none is listed.
+    force_run : `bool`
+        Whether every test should be ran even if its passed result could be reused.
+    journal_file_path : `None | str`
+        Path to append the result of each test into as json lines when it is done.
+    junit_xml_file_path : `None | str`
+        Path to write the results into as JUnit XML.
+    output_capture_mode : `str`
+        How the output of the tests is captured.
+    output_memory_limit : `int`
+        The maximal size of each test's output in bytes to keep in memory. Over it the output is spilled into a
+        temporary file and only its head and tail is reported.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    prune_directory_names : `None | frozenset<str>`
+        Additional directory names to not look into when collecting test files.
+    result_file_path : `None | str`
+        Path to write the results into as json lines.
+    reuse_results : `bool`
+        Whether the tests which passed with the same code in a previous run should be reported as passed without
+        running them.
+    shard_count : `int`
+        The amount of shards the test cases are split into. If `1` every test case is ran.
+    shard_index : `int`
+        The index of the shard to run the test cases of.
+    shard_mode : `str`
+        How the test cases are distributed between the shards.
+    timeout : `None | float`
+        The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+    worker_count : `int`
+        The amount of worker processes to run the test files in. If `0` the tests are ran in the current process.
+    """
+    __slots__ = (
+        'cache_disabled', 'changed_file_paths', 'clear_cache', 'collect_file_path', 'collect_only', 'durations_count',
+        'force_run', 'journal_file_path', 'junit_xml_file_path', 'output_capture_mode', 'output_memory_limit',
+        'output_retention', 'prune_directory_names', 'result_file_path', 'reuse_results', 'shard_count', 'shard_index',
+        'shard_mode', 'timeout', 'worker_count'
+    )
+    
+    def __new__(
+        cls,
+        *,
+        cache_disabled = False,
+        changed_file_paths = None,
+        clear_cache = False,
+        collect_file_path = None,
+        collect_only = False,
+        durations_count = 0,
+        force_run = False,
+        journal_file_path = None,
+        junit_xml_file_path = None,
+        output_capture_mode = OUTPUT_CAPTURE_MODE_SYS,
+        output_memory_limit = DEFAULT_OUTPUT_MEMORY_LIMIT,
+        output_retention = OUTPUT_RETENTION_FAILED_ONLY,
+        prune_directory_names = None,
+        result_file_path = None,
+        reuse_results = False,
+        shard_count = 1,
+        shard_index = 0,
+        shard_mode = SHARD_MODE_HASH,
+        timeout = None,
+        worker_count = 0,
+    ):
+        """
+        Creates a new runner configuration.
+        
+        Parameters
+        ----------
+        cache_disabled : `bool` = `False`, Optional (Keyword only)
+            Whether the cache should neither be read nor written.
+        changed_file_paths : `None | iterable<str>` = `None`, Optional (Keyword only)
+            The normalized paths of the changed files. If given, only the test files depending on them are ran.
+        clear_cache : `bool` = `False`, Optional (Keyword only)
+            Whether the cache should be cleared before testing.
+        collect_file_path : `None | str` = `None`, Optional (Keyword only)
+            Path to write the collected test handles into as json lines without running them.
+        collect_only : `bool` = `False`, Optional (Keyword only)
+            Whether the test handles should only be collected and written into the standard output as json lines.
+        durations_count : `int` = `0`, Optional (Keyword only)
+            The amount of the slowest tests, test files and imports to list after testing. If `0` none is listed.
+        force_run : `bool` = `False`, Optional (Keyword only)
+            Whether every test should be ran even if its passed result could be reused.
+        journal_file_path : `None | str` = `None`, Optional (Keyword only)
+            Path to append the result of each test into as json lines when it is done.
+        junit_xml_file_path : `None | str` = `None`, Optional (Keyword only)
+            Path to write the results into as JUnit XML.
+        output_capture_mode : `str` = `'sys'`, Optional (Keyword only)
+            How the output of the tests is captured. Can be `'sys'` or `'fd'`.
+        output_memory_limit : `int` = `DEFAULT_OUTPUT_MEMORY_LIMIT`, Optional (Keyword only)
+            The maximal size of each test's output in bytes to keep in memory.
+        output_retention : `str` = `'failed-only'`, Optional (Keyword only)
+            Which results keep their captured output after they are reported. Can be `'never'`, `'failed-only'` or
+            `'always'`.
+        prune_directory_names : `None | iterable<str>` = `None`, Optional (Keyword only)
+            Additional directory names to not look into when collecting test files.
+        result_file_path : `None | str` = `None`, Optional (Keyword only)
+            Path to write the results into as json lines.
+        reuse_results : `bool` = `False`, Optional (Keyword only)
+            Whether the tests which passed with the same code in a previous run should be reported as passed without
+            running them.
+        shard_count : `int` = `1`, Optional (Keyword only)
+            The amount of shards the test cases are split into. If `1` every test case is ran.
+        shard_index : `int` = `0`, Optional (Keyword only)
+            The index of the shard to run the test cases of.
+        shard_mode : `str` = `'hash'`, Optional (Keyword only)
+            How the test cases are distributed between the shards. Can be `'hash'` or `'duration'`.
+        timeout : `None | float` = `None`, Optional (Keyword only)
+            The maximal timeout to interrupt each test after. If `None` the default of each environment is used.
+        worker_count : `int` = `0`, Optional (Keyword only)
+            The amount of worker processes to run the test files in. If `0` the tests are ran in the current process.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        # cache_disabled
+        if not isinstance(cache_disabled, bool):
+            raise TypeError(
+                f'`cache_disabled` can be `bool`, got {type(cache_disabled).__name__}; {cache_disabled!r}.'
+            )
+        
+        # changed_file_paths
+        if (changed_file_paths is not None):
+            if isinstance(changed_file_paths, str):
+                raise TypeError(
+                    f'`changed_file_paths` can be `None`, `iterable<str>`, got '
+                    f'{type(changed_file_paths).__name__}; {changed_file_paths!r}.'
+                )
+            
+            try:
+                iterator = iter(changed_file_paths)
+            except TypeError:
+                raise TypeError(
+                    f'`changed_file_paths` can be `None`, `iterable<str>`, got '
+                    f'{type(changed_file_paths).__name__}; {changed_file_paths!r}.'
+                ) from None
+            
+            changed_file_paths_processed = set()
+            for changed_file_path in iterator:
+                if not isinstance(changed_file_path, str):
+                    raise TypeError(
+                        f'`changed_file_paths` elements can be `str`, got '
+                        f'{type(changed_file_path).__name__}; {changed_file_path!r}; '
+                        f'changed_file_paths = {changed_file_paths!r}.'
+                    )
+                
+                changed_file_paths_processed.add(changed_file_path)
+            
+            # Empty is kept, since it means that nothing changed.
+            changed_file_paths = frozenset(changed_file_paths_processed)
+        
+        # clear_cache
+        if not isinstance(clear_cache, bool):
+            raise TypeError(
+                f'`clear_cache` can be `bool`, got {type(clear_cache).__name__}; {clear_cache!r}.'
+            )
+        
+        # collect_file_path
+        if (collect_file_path is not None) and (not isinstance(collect_file_path, str)):
+            raise TypeError(
+                f'`collect_file_path` can be `None`, `str`, got '
+                f'{type(collect_file_path).__name__}; {collect_file_path!r}.'
+            )
+        
+        # collect_only
+        if not isinstance(collect_only, bool):
+            raise TypeError(
+                f'`collect_only` can be `bool`, got {type(collect_only).__name__}; {collect_only!r}.'
+            )
+        
+        # durations_count
+        if not isinstance(durations_count, int):
+            raise TypeError(
+                f'`durations_count` can be `int`, got {type(durations_count).__name__}; {durations_count!r}.'
+            )
+        
+        if durations_count < 0:
+            raise ValueError(
+                f'`durations_count` cannot be negative, got {durations_count!r}.'
+            )
+        
+        # force_run
+        if not isinstance(force_run, bool):
+            raise TypeError(
+                f'`force_run` can be `bool`, got {type(force_run).__name__}; {force_run!r}.'
+            )
+        
+        # journal_file_path
+        if (journal_file_path is not None) and (not isinstance(journal_file_path, str)):
+            raise TypeError(
+                f'`journal_file_path` can be `None`, `str`, got '
+                f'{type(journal_file_path).__name__}; {journal_file_path!r}.'
+            )
+        
+        # junit_xml_file_path
+        if (junit_xml_file_path is not None) and (not isinstance(junit_xml_file_path, str)):
+            raise TypeError(
+                f'`junit_xml_file_path` can be `None`, `str`, got '
+                f'{type(junit_xml_file_path).__name__}; {junit_xml_file_path!r}.'
+            )
+        
+        # output_capture_mode
+        if not isinstance(output_capture_mode, str):
+            raise TypeError(
+                f'`output_capture_mode` can be `str`, got {type(output_capture_mode).__name__}; '
+                f'{output_capture_mode!r}.'
+            )
+        
+        if output_capture_mode not in OUTPUT_CAPTURE_MODES:
+            raise ValueError(
+                f'`output_capture_mode` can be any of {sorted(OUTPUT_CAPTURE_MODES)!r}, got {output_capture_mode!r}.'
+            )
+        
+        # output_memory_limit
+        if (not isinstance(output_memory_limit, int)) or isinstance(output_memory_limit, bool):
+            raise TypeError(
+                f'`output_memory_limit` can be `int`, got {type(output_memory_limit).__name__}; '
+                f'{output_memory_limit!r}.'
+            )
+        
+        if output_memory_limit < 1:
+            raise ValueError(
+                f'`output_memory_limit` must be positive, got {output_memory_limit!r}.'
+            )
+        
+        # output_retention
+        if not isinstance(output_retention, str):
+            raise TypeError(
+                f'`output_retention` can be `str`, got {type(output_retention).__name__}; {output_retention!r}.'
+            )
+        
+        if output_retention not in OUTPUT_RETENTIONS:
+            raise ValueError(
+                f'`output_retention` can be any of {sorted(OUTPUT_RETENTIONS)!r}, got {output_retention!r}.'
+            )
+        
+        # prune_directory_names
+        if (prune_directory_names is not None):
+            if isinstance(prune_directory_names, str):
+                raise TypeError(
+                    f'`prune_directory_names` can be `None`, `iterable<str>`, got '
+                    f'{type(prune_directory_names).__name__}; {prune_directory_names!r}.'
+                )
+            
+            try:
+                iterator = iter(prune_directory_names)
+            except TypeError:
+                raise TypeError(
+                    f'`prune_directory_names` can be `None`, `iterable<str>`, got '
+                    f'{type(prune_directory_names).__name__}; {prune_directory_names!r}.'
+                ) from None
+            
+            prune_directory_names_processed = set()
+            for directory_name in iterator:
+                if not isinstance(directory_name, str):
+                    raise TypeError(
+                        f'`prune_directory_names` elements can be `str`, got '
+                        f'{type(directory_name).__name__}; {directory_name!r}; '
+                        f'prune_directory_names = {prune_directory_names!r}.'
+                    )
+                
+                prune_directory_names_processed.add(directory_name)
+            
+            if prune_directory_names_processed:
+                prune_directory_names = frozenset(prune_directory_names_processed)
+            else:
+                prune_directory_names = None
+        
+        # result_file_path
+        if (result_file_path is not None) and (not isinstance(result_file_path, str)):
+            raise TypeError(
+                f'`result_file_path` can be `None`, `str`, got '
+                f'{type(result_file_path).__name__}; {result_file_path!r}.'
+            )
+        
+        # reuse_results
+        if not isinstance(reuse_results, bool):
+            raise TypeError(
+                f'`reuse_results` can be `bool`, got {type(reuse_results).__name__}; {reuse_results!r}.'
+            )
+        
+        # shard_count
+        if not isinstance(shard_count, int):
+            raise TypeError(
+                f'`shard_count` can be `int`, got {type(shard_count).__name__}; {shard_count!r}.'
+            )
+        
+        if shard_count < 1:
+            raise ValueError(
+                f'`shard_count` must be positive, got {shard_count!r}.'
+            )
+        
+        # shard_index
+        if not isinstance(shard_index, int):
+            raise TypeError(
+                f'`shard_index` can be `int`, got {type(shard_index).__name__}; {shard_index!r}.'
+            )
+        
+        if shard_index < 0 or shard_index >= shard_count:
+            raise ValueError(
+                f'`shard_index` must be in range [0, {shard_count!r}), got {shard_index!r}.'
+            )
+        
+        # shard_mode
+        if not isinstance(shard_mode, str):
+            raise TypeError(
+                f'`shard_mode` can be `str`, got {type(shard_mode).__name__}; {shard_mode!r}.'
+            )
+        
+        if shard_mode not in SHARD_MODES:
+            raise ValueError(
+                f'`shard_mode` can be any of {sorted(SHARD_MODES)!r}, got {shard_mode!r}.'
+            )
+        
+        # timeout
+        if (timeout is not None):
+            if isinstance(timeout, int) and (not isinstance(timeout, bool)):
+                timeout = float(timeout)
+            
+            elif not isinstance(timeout, float):
+                raise TypeError(
+                    f'`timeout` can be `None`, `float`, got {type(timeout).__name__}; {timeout!r}.'
+                )
+            
+            if timeout <= 0.0:
+                raise ValueError(
+                    f'`timeout` must be positive, got {timeout!r}.'
+                )
+        
+        # worker_count
+        if not isinstance(worker_count, int):
+            raise TypeError(
+                f'`worker_count` can be `int`, got {type(worker_count).__name__}; {worker_count!r}.'
+            )
+        
+        if worker_count < 0:
+            raise ValueError(
+                f'`worker_count` cannot be negative, got {worker_count!r}.'
+            )
+        
+        # Construct
+        self = object.__new__(cls)
+        self.cache_disabled = cache_disabled
+        self.changed_file_paths = changed_file_paths
+        self.clear_cache = clear_cache
+        self.collect_file_path = collect_file_path
+        self.collect_only = collect_only
+        self.durations_count = durations_count
+        self.force_run = force_run
+        self.journal_file_path = journal_file_path
+        self.junit_xml_file_path = junit_xml_file_path
+        self.output_capture_mode = output_capture_mode
+        self.output_memory_limit = output_memory_limit
+        self.output_retention = output_retention
+        self.prune_directory_names = prune_directory_names
+        self.result_file_path = result_file_path
+        self.reuse_results = reuse_results
+        self.shard_count = shard_count
+        self.shard_index = shard_index
+        self.shard_mode = shard_mode
+        self.timeout = timeout
+        self.worker_count = worker_count
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the runner configuration's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' worker_count = ')
+        repr_parts.append(repr(self.worker_count))
+        
+        if self.is_sharded():
+            repr_parts.append(', shard = ')
+            repr_parts.append(repr(self.shard_index + 1))
+            repr_parts.append('/')
+            repr_parts.append(repr(self.shard_count))
+            
+            repr_parts.append(', shard_mode = ')
+            repr_parts.append(repr(self.shard_mode))
+        
+        result_file_path = self.result_file_path
+        if (result_file_path is not None):
+            repr_parts.append(', result_file_path = ')
+            repr_parts.append(repr(result_file_path))
+        
+        journal_file_path = self.journal_file_path
+        if (journal_file_path is not None):
+            repr_parts.append(', journal_file_path = ')
+            repr_parts.append(repr(journal_file_path))
+        
+        junit_xml_file_path = self.junit_xml_file_path
+        if (junit_xml_file_path is not None):
+            repr_parts.append(', junit_xml_file_path = ')
+            repr_parts.append(repr(junit_xml_file_path))
+        
+        timeout = self.timeout
+        if (timeout is not None):
+            repr_parts.append(', timeout = ')
+            repr_parts.append(repr(timeout))
+        
+        output_capture_mode = self.output_capture_mode
+        if output_capture_mode != OUTPUT_CAPTURE_MODE_SYS:
+            repr_parts.append(', output_capture_mode = ')
+            repr_parts.append(repr(output_capture_mode))
+        
+        output_memory_limit = self.output_memory_limit
+        if output_memory_limit != DEFAULT_OUTPUT_MEMORY_LIMIT:
+            repr_parts.append(', output_memory_limit = ')
+            repr_parts.append(repr(output_memory_limit))
+        
+        output_retention = self.output_retention
+        if output_retention != OUTPUT_RETENTION_FAILED_ONLY:
+            repr_parts.append(', output_retention = ')
+            repr_parts.append(repr(output_retention))
+        
+        durations_count = self.durations_count
+        if durations_count:
+            repr_parts.append(', durations_count = ')
+            repr_parts.append(repr(durations_count))
+        
+        prune_directory_names = self.prune_directory_names
+        if (prune_directory_names is not None):
+            repr_parts.append(', prune_directory_names = ')
+            repr_parts.append(repr(sorted(prune_directory_names)))
+        
+        if self.cache_disabled:
+            repr_parts.append(', cache_disabled = True')
+        
+        changed_file_paths = self.changed_file_paths
+        if (changed_file_paths is not None):
+            repr_parts.append(', changed_file_paths = ')
+            repr_parts.append(repr(sorted(changed_file_paths)))
+        
+        if self.clear_cache:
+            repr_parts.append(', clear_cache = True')
+        
+        if self.collect_only:
+            repr_parts.append(', collect_only = True')
+        
+        collect_file_path = self.collect_file_path
+        if (collect_file_path is not None):
+            repr_parts.append(', collect_file_path = ')
+            repr_parts.append(repr(collect_file_path))
+        
+        if self.reuse_results:
+            repr_parts.append(', reuse_results = True')
+        
+        if self.force_run:
+            repr_parts.append(', force_run = True')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two runner configurations are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.cache_disabled != other.cache_disabled:
+            return False
+        
+        if self.changed_file_paths != other.changed_file_paths:
+            return False
+        
+        if self.clear_cache != other.clear_cache:
+            return False
+        
+        if self.collect_file_path != other.collect_file_path:
+            return False
+        
+        if self.collect_only != other.collect_only:
+            return False
+        
+        if self.durations_count != other.durations_count:
+            return False
+        
+        if self.force_run != other.force_run:
+            return False
+        
+        if self.journal_file_path != other.journal_file_path:
+            return False
+        
+        if self.junit_xml_file_path != other.junit_xml_file_path:
+            return False
+        
+        if self.output_capture_mode != other.output_capture_mode:
+            return False
+        
+        if self.output_memory_limit != other.output_memory_limit:
+            return False
+        
+        if self.output_retention != other.output_retention:
+            return False
+        
+        if self.prune_directory_names != other.prune_directory_names:
+            return False
+        
+        if self.result_file_path != other.result_file_path:
+            return False
+        
+        if self.reuse_results != other.reuse_results:
+            return False
+        
+        if self.shard_count != other.shard_count:
+            return False
+        
+        if self.shard_index != other.shard_index:
+            return False
+        
+        if self.shard_mode != other.shard_mode:
+            return False
+        
+        if self.timeout != other.timeout:
+            return False
+        
+        if self.worker_count != other.worker_count:
+            return False
+        
+        return True
+    
+    
+    def is_collecting_only(self):
+        """
+        Returns whether the test handles should only be collected without running them.
+        
+        Returns
+        -------
+        is_collecting_only : `bool`
+        """
+        return self.collect_only or (self.collect_file_path is not None)
+    
+    
+    def is_parallel(self):
+        """
+        Returns whether the tests should be ran in worker processes.
+        
+        Returns
+        -------
+        is_parallel : `bool`
+        """
+        return self.worker_count > 0
+    
+    
+    def is_reusing_results(self):
+        """
+        Returns whether the passed results of the previous runs should be reused.
+        
+        Returns
+        -------
+        is_reusing_results : `bool`
+        """
+        return self.reuse_results and (not self.force_run) and (not self.cache_disabled)
+    
+    
+    def is_sharded(self):
+        """
+        Returns whether only a shard of the test cases should be ran.
+        
+        Returns
+        -------
+        is_sharded : `bool`
+        """
+        return self.shard_count > 1
@@ -0,0 +1,12 @@
+__all__ = ()
+
+SHARD_MODE_HASH = 'hash'
+SHARD_MODE_DURATION = 'duration'
+
+SHARD_MODES = frozenset((SHARD_MODE_HASH, SHARD_MODE_DURATION))
+
+OUTPUT_RETENTION_ALWAYS = 'always'
+OUTPUT_RETENTION_FAILED_ONLY = 'failed-only'
+OUTPUT_RETENTION_NEVER = 'never'
+
+OUTPUT_RETENTIONS = frozenset((OUTPUT_RETENTION_ALWAYS, OUTPUT_RETENTION_FAILED_ONLY, OUTPUT_RETENTION_NEVER))
@@ -2,6 +2,8 @@ __all__ = ('RunnerContext',)
 
 from scarletio import RichAttributeErrorBaseType
 
+from ..result import ResultTally
+
 
 class RunnerContext(RichAttributeErrorBaseType):
     """
@@ -13,8 +15,13 @@ class RunnerContext(RichAttributeErrorBaseType):
         The collected test files.
     file_system_entries : `list<FileSystemEntry>`
         The file system entries built with the test runner's settings.
+    not_reusable_cases : `set<TestCase>`
+        The test cases with any result that cannot be reused by the next runs. Collected when the results are
+        reported, before their captured output is dropped.
     runner : ``TestRunner``
         The respective test runner running tests.
+    tally : ``ResultTally``
+        Counts the results of the registered files.
     
     Utility Methods
     ---------------
@@ -27,6 +34,7 @@ class RunnerContext(RichAttributeErrorBaseType):
         - ``.get_test_case_count``
         - ``.get_ran_test_count``
         - ``.get_passed_test_count``
+        - ``.get_cached_test_count``
         - ``.get_skipped_test_count``
         - ``.get_failed_test_count``
         - ``.get_load_failed_file_count``
@@ -56,7 +64,7 @@ class RunnerContext(RichAttributeErrorBaseType):
     
         - ``.register_file``
     """
-    __slots__ = ('_registered_files', 'file_system_entries', 'runner',)
+    __slots__ = ('_registered_files', 'file_system_entries', 'not_reusable_cases', 'runner', 'tally')
     
     def __new__(cls, runner, file_system_entries):
         """
@@ -72,7 +80,9 @@ class RunnerContext(RichAttributeErrorBaseType):
         self = object.__new__(cls)
         self._registered_files = None
         self.file_system_entries = file_system_entries
+        self.not_reusable_cases = set()
         self.runner = runner
+        self.tally = ResultTally()
         return self
     
     
@@ -144,6 +154,7 @@ class RunnerContext(RichAttributeErrorBaseType):
             self._registered_files = registered_files
         
         registered_files.append(registered_file)
+        registered_file.add_tally(self.tally)
     
     
     def get_test_case_count(self):
@@ -165,7 +176,7 @@ class RunnerContext(RichAttributeErrorBaseType):
         -------
         ran_test_count : `int`
         """
-        return sum(test_file.get_ran_test_count() for test_file in self.iter_registered_files())
+        return self.tally.ran_count
     
     
     def iter_results(self):
@@ -250,11 +261,18 @@ class RunnerContext(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(
-            test_file.get_passed_test_count()
-            for test_file in self.iter_registered_files()
-            if not test_file.is_directory()
-        )
+        return self.tally.passed_count
+    
+    
+    def get_cached_test_count(self):
+        """
+        Returns how much test passed by reusing its result from a previous run.
+        
+        Returns
+        -------
+        cached_test_count : `int`
+        """
+        return self.tally.cached_count
     
     
     def get_skipped_test_count(self):
@@ -265,11 +283,7 @@ class RunnerContext(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(
-            test_file.get_skipped_test_count()
-            for test_file in self.iter_registered_files()
-            if not test_file.is_directory()
-        )
+        return self.tally.skipped_count
     
     
     def get_failed_test_count(self):
@@ -280,11 +294,7 @@ class RunnerContext(RichAttributeErrorBaseType):
         -------
         passed_test_count : `int`
         """
-        return sum(
-            test_file.get_failed_test_count()
-            for test_file in self.iter_registered_files()
-            if not test_file.is_directory()
-        )
+        return self.tally.failed_count
     
     
     def get_passed_results(self):
@@ -418,12 +428,11 @@ class RunnerContext(RichAttributeErrorBaseType):
         -------
         has_any_failure : `bool`
         """
-        for test_file in self.iter_registered_files():
-            if test_file.is_loaded_with_failure():
-                return True
+        if self.tally.failed_count:
+            return True
         
         for test_file in self.iter_registered_files():
-            if test_file.has_failed_test():
+            if test_file.is_loaded_with_failure():
                 return True
         
         return False
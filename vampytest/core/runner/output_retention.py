@@ -0,0 +1,21 @@
+__all__ = ()
+
+from .constants import OUTPUT_RETENTION_ALWAYS, OUTPUT_RETENTION_NEVER
+
+
+def apply_output_retention(result, output_retention):
+    """
+    Drops the captured output of the given reported result if it should not be retained.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The reported result.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    """
+    if output_retention == OUTPUT_RETENTION_ALWAYS:
+        return
+    
+    if (output_retention == OUTPUT_RETENTION_NEVER) or (not result.is_failed()):
+        result.drop_output()
@@ -12,17 +12,37 @@ from ...return_codes import (
     RETURN_CODE_FAILURE, RETURN_CODE_SUCCESS, RETURN_CODE_TEST_RUNNER_STOPPED, RETURN_CODE_UNSET
 )
 
+from ..contexts import ContextOutputCapturing
 from ..environment import EnvironmentManager
+from ..event_handling.rendering_helpers.case_modifiers import iter_build_result_case_modifier
 from ..events import (
     FileLoadDoneEvent, FileRegistrationEvent, FileRegistrationDoneEvent, FileTestingDoneEvent, SourceLoadFailureEvent,
     TestDoneEvent, TestingEndEvent, TestingStartEvent
 )
 from ..file import FileSystemEntry, iter_collect_test_files_in
+from ..file.dependencies import normalize_path
+from ..file.file_system_entry import build_prune_names
+from ..result import ResultTimings
 
+from ..cache import CaseIndex, DependencyMap, DiscoveryCache, ResultCache
+from ..cache.durations import load_durations
+from ..cache.storage import clear_cache_directory
+
+from .compaction import compact_reported_result
+from .configuration import RunnerConfiguration
+from .constants import SHARD_MODE_DURATION
 from .context import RunnerContext
+from .output_retention import apply_output_retention
+from .sharding import ShardFilter
 
 
+CollectionWriter = include('CollectionWriter')
 create_default_event_handler_manager = include('create_default_event_handler_manager')
+EventHandlerManager = include('EventHandlerManager')
+JournalWriter = include('JournalWriter')
+JUnitXMLWriter = include('JUnitXMLWriter')
+ResultFileWriter = include('ResultFileWriter')
+WorkerPool = include('WorkerPool')
 
 
 def setup_test_library_import():
@@ -54,8 +74,8 @@ def _add_to_system_path_callback(path, runner):
     """
     if path not in sys.path:
         sys.path.append(path)
-        
-    
+
+
 
 def _remove_from_system_path_callback(path, runner):
     """
@@ -74,6 +94,164 @@ def _remove_from_system_path_callback(path, runner):
         pass
 
 
+def _set_output_capturing_defaults_callback(memory_limit, mode, runner):
+    """
+    Sets the output capturing defaults back to the given ones.
+    
+    Parameters
+    ----------
+    memory_limit : `int`
+        The maximal size of the output in bytes to keep in memory.
+    mode : `str`
+        How the output is captured.
+    runner : ``TestRunner``
+        The respective test runner.
+    """
+    ContextOutputCapturing.set_defaults(memory_limit = memory_limit, mode = mode)
+
+
+def skip_unselected_files(context, case_filter, case_index):
+    """
+    Skips loading the registered test files which surely have no test cases selected by the given filter.
+    The test files are not imported, their test cases are found by parsing them.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    case_filter : ``ShardFilter``
+        Filter to select the test cases to run with.
+    case_index : ``CaseIndex``
+        Index to get the test files' test cases from.
+    """
+    for registered_file in context.iter_registered_files_shallow():
+        # Directories can import anything.
+        if registered_file.is_directory():
+            continue
+        
+        static_collection = case_index.get_static_collection(registered_file.path)
+        if (static_collection is None) or (not static_collection.complete):
+            continue
+        
+        if case_filter.is_any_case_selected(registered_file.import_route, static_collection.iter_test_case_names()):
+            continue
+        
+        registered_file.skip_load()
+
+
+def skip_unaffected_files(context, dependency_map, changed_file_paths):
+    """
+    Skips loading the registered test files which do not depend on any of the changed files.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    dependency_map : ``DependencyMap``
+        Map to get the test files' dependencies from.
+    changed_file_paths : `frozenset<str>`
+        The normalized paths of the changed files.
+    """
+    for registered_file in context.iter_registered_files_shallow():
+        for test_file in registered_file.iter_test_files():
+            if dependency_map.is_affected(normalize_path(test_file.path), changed_file_paths):
+                break
+        
+        else:
+            registered_file.skip_load()
+
+
+def record_dependencies(context, dependency_map):
+    """
+    Records the dependencies of the loaded test files into the given dependency map.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    dependency_map : ``DependencyMap``
+        The dependency map to record into.
+    """
+    for registered_file in context.iter_registered_files_shallow():
+        for test_file in registered_file.iter_test_files():
+            dependency_paths = test_file.dependency_paths
+            if (dependency_paths is not None):
+                dependency_map.set_dependencies(normalize_path(test_file.path), dependency_paths)
+
+
+def is_result_reusable(result):
+    """
+    Returns whether the given result can be reused by the next runs.
+    
+    Parameters
+    ----------
+    result : ``Result | DetachedResult``
+        The result to check.
+    
+    Returns
+    -------
+    is_result_reusable : `bool`
+    """
+    return result.is_passed() and (not result.is_skipped()) and (not result.is_informal())
+
+
+def record_results(context, result_cache):
+    """
+    Records the results of the test cases into the given result cache. Test cases with any not reusable result are
+    removed from it.
+    
+    The results' output might be dropped already, so whether they are informal is decided by the context's
+    `not_reusable_cases` collected when they were reported.
+    
+    Parameters
+    ----------
+    context : ``RunnerContext``
+        The respective test runner context.
+    result_cache : ``ResultCache``
+        The result cache to record into.
+    """
+    not_reusable_cases = context.not_reusable_cases
+    
+    for test_file in context.iter_registered_files():
+        if test_file.is_directory():
+            continue
+        
+        case_results = {}
+        for result in test_file.iter_results():
+            case_results.setdefault(result.case, []).append(result)
+        
+        if not case_results:
+            continue
+        
+        file_key = result_cache.get_file_key(test_file.dependency_paths)
+        import_route = test_file.import_route
+        
+        for case, results in case_results.items():
+            if (
+                (file_key is None) or
+                (case in not_reusable_cases) or
+                (not all(is_result_reusable(result) for result in results))
+            ):
+                result_cache.remove_case_results(import_route, case.name)
+                continue
+            
+            if all(result.is_cached() for result in results):
+                continue
+            
+            result_cache.set_case_results(
+                import_route,
+                case.name,
+                file_key,
+                [
+                    (
+                        ''.join(iter_build_result_case_modifier(result)) or None,
+                        ResultTimings() if result.timings is None else result.timings,
+                    )
+                    for result in results
+                ],
+            )
+
+
 def _ignore_test_call_frame(frame):
     """
     Ignores test runner frames when rendering event handler exception
@@ -152,6 +330,8 @@ class TestRunner(RichAttributeErrorBaseType):
         Whether testing is stopped.
     _teardown_callbacks : `None`, `list` of `callable`
         Functions to call when the tests are finished.
+    configuration : ``RunnerConfiguration``
+        The runner's settings.
     environment_manager : ``EnvironmentManager``
         Testing environment manager.
     event_handler_manager : ``EventHandlerManager``
@@ -167,11 +347,18 @@ class TestRunner(RichAttributeErrorBaseType):
     """
     __slots__ = (
         '_path_parts', '_return_code', '_source_directory', '_sources', '_stopped', '_teardown_callbacks',
-        'environment_manager', 'event_handler_manager'
+        'configuration', 'environment_manager', 'event_handler_manager'
     )
     
     def __new__(
-        cls, source_directory, sources, path_parts = None, *, environment_manager = None, event_handler_manager = None
+        cls,
+        source_directory,
+        sources,
+        path_parts = None,
+        *,
+        configuration = None,
+        environment_manager = None,
+        event_handler_manager = None,
     ):
         """
         Creates a new test runner instance.
@@ -184,8 +371,11 @@ class TestRunner(RichAttributeErrorBaseType):
             Sources to import before executing any test.
         path_parts : `None | list<str>` = `None`, Optional
             Added path parts to specify from which which directory we want to collect the tests from.
+        configuration : `None`, ``RunnerConfiguration`` = `None`, Optional (Keyword only)
+            The runner's settings.
         environment_manager : `None`, ``EnvironmentManager`` = `None`, Optional (Keyword only)
             Testing environment manager.
+            Not passed to worker processes, they use the default one.
         event_handler_manager : `None`, ``EventHandlerManager`` = `None`, Optional (Keyword only)
             Event handler container.
         """
@@ -194,14 +384,48 @@ class TestRunner(RichAttributeErrorBaseType):
                 path_parts = path_parts.copy()
             else:
                 path_parts = None
-            
+        
+        if configuration is None:
+            configuration = RunnerConfiguration()
+        
         if environment_manager is None:
             environment_manager = EnvironmentManager()
         
-        environment_manager = environment_manager.populate()
-        
+        environment_manager = environment_manager.populate(timeout = configuration.timeout)
         if event_handler_manager is None:
-            event_handler_manager = create_default_event_handler_manager()
+            # Collecting into the standard output is not mixed with the default output.
+            if configuration.is_collecting_only() and (configuration.collect_file_path is None):
+                event_handler_manager = EventHandlerManager()
+            else:
+                event_handler_manager = create_default_event_handler_manager()
+        
+        result_file_writer = ResultFileWriter.from_configuration(configuration)
+        if (result_file_writer is not None):
+            event_handler_manager = event_handler_manager.copy()
+            event_handler_manager.events(result_file_writer.testing_end)
+        
+        journal_writer = JournalWriter.from_configuration(configuration)
+        if (journal_writer is not None):
+            event_handler_manager = event_handler_manager.copy()
+            event_handler_manager.events(journal_writer.testing_start)
+            event_handler_manager.events(journal_writer.file_load_done)
+            event_handler_manager.events(journal_writer.test_done)
+            event_handler_manager.events(journal_writer.testing_end)
+        
+        junit_xml_writer = JUnitXMLWriter.from_configuration(configuration)
+        if (junit_xml_writer is not None):
+            event_handler_manager = event_handler_manager.copy()
+            event_handler_manager.events(junit_xml_writer.testing_start)
+            event_handler_manager.events(junit_xml_writer.file_load_done)
+            event_handler_manager.events(junit_xml_writer.test_done)
+            event_handler_manager.events(junit_xml_writer.testing_end)
+        
+        collection_writer = CollectionWriter.from_configuration(configuration)
+        if (collection_writer is not None):
+            event_handler_manager = event_handler_manager.copy()
+            event_handler_manager.events(collection_writer.testing_start)
+            event_handler_manager.events(collection_writer.file_load_done)
+            event_handler_manager.events(collection_writer.testing_end)
         
         self = object.__new__(cls)
         self._path_parts = path_parts
@@ -210,6 +434,7 @@ class TestRunner(RichAttributeErrorBaseType):
         self._sources = sources
         self._stopped = False
         self._teardown_callbacks = None
+        self.configuration = configuration
         self.environment_manager = environment_manager
         self.event_handler_manager = event_handler_manager
         return self
@@ -250,6 +475,18 @@ class TestRunner(RichAttributeErrorBaseType):
         if not working_directory_under_source:
             self.add_teardown_callback(partial_func(_add_to_system_path_callback, working_directory))
         
+        # Set the output capturing defaults for the tests ran by this runner only.
+        self.add_teardown_callback(partial_func(
+            _set_output_capturing_defaults_callback,
+            ContextOutputCapturing.default_memory_limit,
+            ContextOutputCapturing.default_mode,
+        ))
+        
+        configuration = self.configuration
+        ContextOutputCapturing.set_defaults(
+            memory_limit = configuration.output_memory_limit, mode = configuration.output_capture_mode
+        )
+        
         setup_test_library_import()
     
     
@@ -306,13 +543,27 @@ class TestRunner(RichAttributeErrorBaseType):
             self._setup()
             
             # Build context.
+            configuration = self.configuration
+            if configuration.clear_cache:
+                clear_cache_directory(self._source_directory)
+            
+            prune_names = build_prune_names(configuration.prune_directory_names)
+            
+            if configuration.cache_disabled:
+                discovery_cache = None
+            else:
+                discovery_cache = DiscoveryCache.load(self._source_directory, prune_names)
+            
             path_parts = self._path_parts
             if path_parts is None:
                 file_system_entries = [
-                    FileSystemEntry(self._source_directory, source, None) for source in self._sources
+                    FileSystemEntry(self._source_directory, source, None, prune_names, discovery_cache)
+                    for source in self._sources
                 ]
             else:
-                file_system_entries = [FileSystemEntry(self._source_directory, path_parts[0], path_parts[1:])]
+                file_system_entries = [
+                    FileSystemEntry(self._source_directory, path_parts[0], path_parts[1:], prune_names, discovery_cache)
+                ]
             
             context = RunnerContext(self, file_system_entries)
             
@@ -332,33 +583,77 @@ class TestRunner(RichAttributeErrorBaseType):
                     context.register_file(test_file)
                     yield FileRegistrationEvent(context, test_file)
             
+            if (discovery_cache is not None):
+                discovery_cache.save()
+            
             yield FileRegistrationDoneEvent(context)
             
-            # Load test files
-            for registered_file in context.iter_registered_files_shallow():
-                for test_file in registered_file.iter_test_files():
-                    if test_file.is_directory():
-                        test_file.get_module()
-                        
-                        yield FileLoadDoneEvent(context, test_file)
-                        
-                        if test_file.is_loaded_with_failure():
-                            break
-                        
-                        yield FileTestingDoneEvent(context, test_file)
-                    
-                    else:
-                        test_file.try_load_test_cases()
-                        
-                        yield FileLoadDoneEvent(context, test_file)
-                        
-                        # Run test file if loaded successfully
-                        if test_file.is_loaded_with_success():
-                            
-                            for result in test_file.iter_invoke_test_cases(self.environment_manager):
-                                yield TestDoneEvent(context, result)
-                            
-                            yield FileTestingDoneEvent(context, test_file)
+            # Select test files affected by the changes. Without the cache every test file is affected.
+            if configuration.cache_disabled:
+                dependency_map = None
+            else:
+                dependency_map = DependencyMap.load(self._source_directory)
+            
+            changed_file_paths = configuration.changed_file_paths
+            if (changed_file_paths is not None) and (dependency_map is not None):
+                skip_unaffected_files(context, dependency_map, changed_file_paths)
+            
+            # Load & run test files
+            if configuration.is_sharded() and (configuration.shard_mode == SHARD_MODE_DURATION):
+                durations = load_durations(self._source_directory)
+            else:
+                durations = None
+            
+            case_filter = ShardFilter.from_configuration(configuration, durations)
+            if (case_filter is not None):
+                if configuration.cache_disabled:
+                    case_index = CaseIndex(self._source_directory, {})
+                else:
+                    case_index = CaseIndex.load(self._source_directory)
+                
+                skip_unselected_files(context, case_filter, case_index)
+                
+                if not configuration.cache_disabled:
+                    case_index.save()
+            
+            if configuration.reuse_results and (not configuration.cache_disabled):
+                result_cache = ResultCache.load(self._source_directory)
+            else:
+                result_cache = None
+            
+            # When forced, results are still recorded, just not reused.
+            if configuration.is_reusing_results():
+                reused_result_cache = result_cache
+            else:
+                reused_result_cache = None
+            
+            if configuration.is_collecting_only():
+                yield from self._iter_load_registered_files(context, case_filter)
+            
+            elif configuration.is_parallel():
+                yield from WorkerPool(
+                    self._source_directory,
+                    self._sources,
+                    configuration.worker_count,
+                    case_filter,
+                    prune_names,
+                    reused_result_cache,
+                    output_capture_mode = configuration.output_capture_mode,
+                    output_memory_limit = configuration.output_memory_limit,
+                    output_retention = configuration.output_retention,
+                    timeout = configuration.timeout,
+                ).iter_events(context)
+            
+            else:
+                yield from self._iter_run_registered_files(context, case_filter, reused_result_cache)
+            
+            if (dependency_map is not None):
+                record_dependencies(context, dependency_map)
+                dependency_map.save()
+            
+            if (result_cache is not None) and (not configuration.is_collecting_only()):
+                record_results(context, result_cache)
+                result_cache.save()
             
             yield TestingEndEvent(context)
         
@@ -374,6 +669,96 @@ class TestRunner(RichAttributeErrorBaseType):
             self._teardown()
     
     
+    def _iter_load_registered_files(self, context, case_filter):
+        """
+        Loads the registered test files in the current process without running them.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        context : ``RunnerContext``
+            The respective test runner context.
+        case_filter : `None | ShardFilter`
+            Filter to select the test cases to load with.
+        
+        Yields
+        ------
+        event : ``FileLoadDoneEvent``
+        """
+        referenced_module_names_cache = {}
+        
+        for registered_file in context.iter_registered_files_shallow():
+            if registered_file.is_load_skipped():
+                continue
+            
+            for test_file in registered_file.iter_test_files():
+                if test_file.is_directory():
+                    test_file.get_module()
+                    
+                    yield FileLoadDoneEvent(context, test_file)
+                    
+                    if test_file.is_loaded_with_failure():
+                        break
+                
+                else:
+                    test_file.try_load_test_cases(case_filter)
+                    test_file.collect_dependency_paths(self._sources, referenced_module_names_cache)
+                    
+                    yield FileLoadDoneEvent(context, test_file)
+    
+    
+    def _iter_run_registered_files(self, context, case_filter, result_cache):
+        """
+        Loads and runs the registered test files in the current process.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        context : ``RunnerContext``
+            The respective test runner context.
+        case_filter : `None | ShardFilter`
+            Filter to select the test cases to run with.
+        result_cache : `None | ResultCache`
+            Result cache to reuse the results of the test cases passed with the same code from.
+        
+        Yields
+        ------
+        event : ``FileLoadDoneEvent | TestDoneEvent | FileTestingDoneEvent``
+        """
+        referenced_module_names_cache = {}
+        
+        for registered_file in context.iter_registered_files_shallow():
+            if registered_file.is_load_skipped():
+                continue
+            
+            for test_file in registered_file.iter_test_files():
+                if test_file.is_directory():
+                    test_file.get_module()
+                    
+                    yield FileLoadDoneEvent(context, test_file)
+                    
+                    if test_file.is_loaded_with_failure():
+                        break
+                    
+                    yield FileTestingDoneEvent(context, test_file)
+                
+                else:
+                    test_file.try_load_test_cases(case_filter)
+                    test_file.collect_dependency_paths(self._sources, referenced_module_names_cache)
+                    
+                    yield FileLoadDoneEvent(context, test_file)
+                    
+                    # Run test file if loaded successfully
+                    if test_file.is_loaded_with_success():
+                    
+                        for result in test_file.iter_invoke_test_cases(self.environment_manager, result_cache):
+                            yield TestDoneEvent(context, result)
+                        
+                        yield FileTestingDoneEvent(context, test_file)
+    
+    
     def run(self):
         """
         Runs the tests of the test runner.
@@ -386,6 +771,7 @@ class TestRunner(RichAttributeErrorBaseType):
             return self.get_return_code()
         
         event_handler_manager = self.event_handler_manager
+        output_retention = self.configuration.output_retention
         
         for event in self._run_generator():
             for event_handler in event_handler_manager.iter_handlers_for_event(event):
@@ -397,6 +783,15 @@ class TestRunner(RichAttributeErrorBaseType):
                 except BaseException as err:
                     sys.stderr.write(_render_event_exception(event_handler, event, err))
             
+            if isinstance(event, TestDoneEvent):
+                result = event.result
+                # Dropping the output can make an informal result look reusable.
+                if not is_result_reusable(result):
+                    event.context.not_reusable_cases.add(result.case)
+                
+                apply_output_retention(result, output_retention)
+                compact_reported_result(result)
+            
             if self._stopped:
                 break
         
@@ -439,7 +834,7 @@ class TestRunner(RichAttributeErrorBaseType):
             self._return_code = return_code
 
 
-def run_tests_in(source_directory, sources, test_collection_route):
+def run_tests_in(source_directory, sources, test_collection_route, *, configuration = None):
     """
     Runs tests from the given `source_directory` and collects them from the given `test_collection_route`.
     Or from `sources` if not specified.
@@ -452,9 +847,11 @@ def run_tests_in(source_directory, sources, test_collection_route):
         Sources to import before executing any test.
     test_collection_route : `None | list<str>`
         Added path parts to specify from which which directory we want to collect the tests from.
+    configuration : `None`, ``RunnerConfiguration`` = `None`, Optional (Keyword only)
+        The runner's settings.
     
     Returns
     -------
     return_code : `int`
     """
-    return TestRunner(source_directory, sources, test_collection_route).run()
+    return TestRunner(source_directory, sources, test_collection_route, configuration = configuration).run()
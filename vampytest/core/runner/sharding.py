@@ -0,0 +1,231 @@
+__all__ = ('ShardFilter',)
+
+from hashlib import blake2b
+
+from scarletio import RichAttributeErrorBaseType
+
+from .constants import SHARD_MODE_DURATION, SHARD_MODE_HASH
+
+
+def get_case_key(import_route, case_name):
+    """
+    Returns the key identifying a test case.
+    
+    Parameters
+    ----------
+    import_route : `str`
+        The test file's import route.
+    case_name : `str`
+        The test case's name.
+    
+    Returns
+    -------
+    case_key : `str`
+    """
+    return f'{import_route}:{case_name}'
+
+
+def get_stable_hash(value):
+    """
+    Returns a hash of the given string, which is the same across processes and python versions.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to hash.
+    
+    Returns
+    -------
+    hash_value : `int`
+    """
+    return int.from_bytes(blake2b(value.encode('utf-8'), digest_size = 8).digest(), 'little')
+
+
+def build_duration_assignments(durations, shard_count):
+    """
+    Assigns the test cases with known duration to shards, always picking the shard with the least total duration.
+    
+    Parameters
+    ----------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    shard_count : `int`
+        The amount of shards.
+    
+    Returns
+    -------
+    assignments : `dict<str, int>`
+        Test case keys mapped to their shard's index.
+    """
+    case_durations = []
+    for import_route, (file_duration, file_case_durations) in durations.items():
+        for case_name, case_duration in file_case_durations.items():
+            case_durations.append((get_case_key(import_route, case_name), case_duration))
+    
+    # Sort by key too, so every node gets the same assignments.
+    case_durations.sort(key = lambda item: (-item[1], item[0]))
+    
+    shard_durations = [0.0] * shard_count
+    assignments = {}
+    
+    for case_key, case_duration in case_durations:
+        shard_index = min(range(shard_count), key = shard_durations.__getitem__)
+        shard_durations[shard_index] += case_duration
+        assignments[case_key] = shard_index
+    
+    return assignments
+
+
+class ShardFilter(RichAttributeErrorBaseType):
+    """
+    Selects the test cases of a shard.
+    
+    Test cases are distributed by the hash of their import route and name, so adding new test cases does not move
+    the old ones between the shards.
+    
+    Attributes
+    ----------
+    assignments : `None | dict<str, int>`
+        Test case keys mapped to their shard's index. Test cases not included fall back to hashing.
+    shard_count : `int`
+        The amount of shards.
+    shard_index : `int`
+        The shard's index to select the test cases of.
+    """
+    __slots__ = ('assignments', 'shard_count', 'shard_index')
+    
+    def __new__(cls, shard_index, shard_count, assignments):
+        """
+        Creates a new shard filter.
+        
+        Parameters
+        ----------
+        shard_index : `int`
+            The shard's index to select the test cases of.
+        shard_count : `int`
+            The amount of shards.
+        assignments : `None | dict<str, int>`
+            Test case keys mapped to their shard's index.
+        """
+        self = object.__new__(cls)
+        self.assignments = assignments
+        self.shard_count = shard_count
+        self.shard_index = shard_index
+        return self
+    
+    
+    @classmethod
+    def from_configuration(cls, configuration, durations):
+        """
+        Creates a new shard filter from the given configuration.
+        
+        Parameters
+        ----------
+        configuration : ``RunnerConfiguration``
+            The runner's settings.
+        durations : `None | dict<str, (None | float, dict<str, float>)>`
+            Test file import routes mapped to their own duration and to their test cases' durations.
+            Required only if sharding by duration.
+        
+        Returns
+        -------
+        self : `None | instance<cls>`
+            Returns `None` if sharding is disabled.
+        """
+        if not configuration.is_sharded():
+            return None
+        
+        shard_count = configuration.shard_count
+        
+        if configuration.shard_mode == SHARD_MODE_DURATION:
+            assignments = build_duration_assignments(durations, shard_count)
+        else:
+            assignments = None
+        
+        return cls(configuration.shard_index, shard_count, assignments)
+    
+    
+    def __reduce__(self):
+        """Reduces the shard filter to be picklable."""
+        return type(self), (self.shard_index, self.shard_count, self.assignments)
+    
+    
+    def __repr__(self):
+        """Returns the shard filter's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' shard = ')
+        repr_parts.append(repr(self.shard_index + 1))
+        repr_parts.append('/')
+        repr_parts.append(repr(self.shard_count))
+        
+        repr_parts.append(', mode = ')
+        repr_parts.append(SHARD_MODE_HASH if self.assignments is None else SHARD_MODE_DURATION)
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two shard filters are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.assignments != other.assignments:
+            return False
+        
+        if self.shard_count != other.shard_count:
+            return False
+        
+        if self.shard_index != other.shard_index:
+            return False
+        
+        return True
+    
+    
+    def is_case_selected(self, import_route, case_name):
+        """
+        Returns whether the given test case belongs to the shard.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        case_name : `str`
+            The test case's name.
+        
+        Returns
+        -------
+        is_case_selected : `bool`
+        """
+        case_key = get_case_key(import_route, case_name)
+        
+        assignments = self.assignments
+        if (assignments is not None):
+            shard_index = assignments.get(case_key, None)
+            if (shard_index is not None):
+                return shard_index == self.shard_index
+        
+        return get_stable_hash(case_key) % self.shard_count == self.shard_index
+    
+    
+    def is_any_case_selected(self, import_route, case_names):
+        """
+        Returns whether any of the given test cases belong to the shard.
+        
+        Parameters
+        ----------
+        import_route : `str`
+            The test file's import route.
+        case_names : `iterable<str>`
+            The test cases' names.
+        
+        Returns
+        -------
+        is_any_case_selected : `bool`
+        """
+        for case_name in case_names:
+            if self.is_case_selected(import_route, case_name):
+                return True
+        
+        return False
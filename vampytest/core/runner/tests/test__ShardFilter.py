@@ -0,0 +1,81 @@
+from pickle import dumps as dump_pickle, loads as load_pickle
+
+from ...assertions import assert_eq, assert_false, assert_instance, assert_ne, assert_true
+
+from ..sharding import ShardFilter, get_case_key, get_stable_hash
+
+
+def test__ShardFilter__new():
+    """
+    Tests whether ``ShardFilter.__new__`` works as intended.
+    """
+    assignments = {'koishi:test__a': 1}
+    
+    shard_filter = ShardFilter(1, 3, assignments)
+    assert_instance(shard_filter, ShardFilter)
+    assert_eq(shard_filter.shard_index, 1)
+    assert_eq(shard_filter.shard_count, 3)
+    assert_eq(shard_filter.assignments, assignments)
+
+
+def test__ShardFilter__repr():
+    """
+    Tests whether ``ShardFilter.__repr__`` works as intended.
+    """
+    shard_filter = ShardFilter(1, 3, None)
+    assert_instance(repr(shard_filter), str)
+
+
+def test__ShardFilter__pickle():
+    """
+    Tests whether ``ShardFilter`` can be pickled.
+    """
+    shard_filter = ShardFilter(1, 3, {'koishi:test__a': 1})
+    assert_eq(load_pickle(dump_pickle(shard_filter)), shard_filter)
+
+
+def test__ShardFilter__is_case_selected__hash():
+    """
+    Tests whether ``ShardFilter.is_case_selected`` selects every test case in exactly one shard.
+    """
+    shard_count = 3
+    shard_filters = [ShardFilter(shard_index, shard_count, None) for shard_index in range(shard_count)]
+    
+    for case_name in ('test__a', 'test__b', 'test__c', 'test__d', 'test__e'):
+        selected = [shard_filter.is_case_selected('koishi', case_name) for shard_filter in shard_filters]
+        assert_eq(selected.count(True), 1)
+        assert_true(selected[get_stable_hash(get_case_key('koishi', case_name)) % shard_count])
+
+
+def test__ShardFilter__is_case_selected__assignments():
+    """
+    Tests whether ``ShardFilter.is_case_selected`` prefers assignments and falls back to hashing.
+    """
+    shard_count = 2
+    assignments = {'koishi:test__a': 1}
+    
+    shard_filter_0 = ShardFilter(0, shard_count, assignments)
+    shard_filter_1 = ShardFilter(1, shard_count, assignments)
+    
+    assert_false(shard_filter_0.is_case_selected('koishi', 'test__a'))
+    assert_true(shard_filter_1.is_case_selected('koishi', 'test__a'))
+    
+    assert_ne(
+        shard_filter_0.is_case_selected('koishi', 'test__b'),
+        shard_filter_1.is_case_selected('koishi', 'test__b'),
+    )
+
+
+def test__ShardFilter__is_any_case_selected():
+    """
+    Tests whether ``ShardFilter.is_any_case_selected`` works as intended.
+    """
+    assignments = {'koishi:test__a': 1, 'koishi:test__b': 0}
+    
+    shard_filter_0 = ShardFilter(0, 2, assignments)
+    shard_filter_1 = ShardFilter(1, 2, assignments)
+    
+    assert_true(shard_filter_0.is_any_case_selected('koishi', ['test__a', 'test__b']))
+    assert_false(shard_filter_0.is_any_case_selected('koishi', ['test__a']))
+    assert_true(shard_filter_1.is_any_case_selected('koishi', ['test__a']))
+    assert_false(shard_filter_1.is_any_case_selected('koishi', []))
@@ -0,0 +1,146 @@
+import sys
+from multiprocessing import current_process
+from os import mkdir as make_directory
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ... import _, call_from
+from ...assertions import assert_eq
+from ...contexts import ContextOutputCapturing, OUTPUT_CAPTURE_MODE_FD
+from ...event_handling import EventHandlerManager
+from ...events import TestDoneEvent
+
+from ..configuration import RunnerConfiguration
+from ..constants import OUTPUT_RETENTION_FAILED_ONLY, OUTPUT_RETENTION_NEVER
+from ..runner import TestRunner
+
+
+def test__TestRunner__output_capturing_defaults():
+    """
+    Tests whether ``TestRunner`` sets the output capturing defaults only while its tests are ran.
+    """
+    memory_limit = ContextOutputCapturing.default_memory_limit
+    mode = ContextOutputCapturing.default_mode
+    
+    with TemporaryDirectory() as source_directory:
+        runner = TestRunner(
+            source_directory,
+            set(),
+            configuration = RunnerConfiguration(output_capture_mode = OUTPUT_CAPTURE_MODE_FD, output_memory_limit = 12),
+        )
+        
+        assert_eq(ContextOutputCapturing.default_memory_limit, memory_limit)
+        assert_eq(ContextOutputCapturing.default_mode, mode)
+        
+        runner._setup()
+        try:
+            assert_eq(ContextOutputCapturing.default_memory_limit, 12)
+            assert_eq(ContextOutputCapturing.default_mode, OUTPUT_CAPTURE_MODE_FD)
+        finally:
+            runner._teardown()
+        
+        assert_eq(ContextOutputCapturing.default_memory_limit, memory_limit)
+        assert_eq(ContextOutputCapturing.default_mode, mode)
+
+
+PACKAGE_NAME = 'vampytest_test_package_reuse_results'
+
+TEST_FILE_CONTENT = """
+def test_print():
+    print('hey mister')
+
+
+def test_silent():
+    pass
+"""
+
+
+def _run_reusing_results(source_directory, output_retention, worker_count):
+    """
+    Runs the tests of the package created in the given directory reusing the results of the previous runs.
+    
+    Parameters
+    ----------
+    source_directory : `str`
+        The directory containing the test package.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    worker_count : `int`
+        The amount of worker processes to run the tests in.
+    
+    Returns
+    -------
+    output : `dict<str, (bool, bool)>`
+        Whether each test's result is informal and cached by the test's name.
+    """
+    output = {}
+    
+    event_handler_manager = EventHandlerManager()
+    
+    @event_handler_manager.events
+    def test_done(event : TestDoneEvent):
+        result = event.result
+        output[result.case.name] = (result.is_informal(), result.is_cached())
+    
+    try:
+        TestRunner(
+            source_directory,
+            {PACKAGE_NAME},
+            configuration = RunnerConfiguration(
+                output_retention = output_retention, reuse_results = True, worker_count = worker_count
+            ),
+            event_handler_manager = event_handler_manager,
+        ).run()
+    finally:
+        for module_name in [*sys.modules.keys()]:
+            if module_name == PACKAGE_NAME or module_name.startswith(PACKAGE_NAME + '.'):
+                del sys.modules[module_name]
+    
+    return output
+
+
+def _iter_options__reuse_results__informal():
+    yield OUTPUT_RETENTION_FAILED_ONLY, 0
+    yield OUTPUT_RETENTION_NEVER, 0
+    
+    # Daemon processes, like the workers running these tests, cannot start workers on their own.
+    if current_process().daemon:
+        return
+    
+    yield OUTPUT_RETENTION_FAILED_ONLY, 1
+    yield OUTPUT_RETENTION_NEVER, 1
+
+
+@_(call_from(_iter_options__reuse_results__informal()))
+def test__TestRunner__reuse_results__informal(output_retention, worker_count):
+    """
+    Tests whether ``TestRunner`` works as intended.
+    
+    Case: informal results are not reused, even if their output is dropped after they are reported.
+    
+    Parameters
+    ----------
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    worker_count : `int`
+        The amount of worker processes to run the tests in.
+    """
+    with TemporaryDirectory() as source_directory:
+        directory_path = join_paths(source_directory, PACKAGE_NAME)
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        directory_path = join_paths(directory_path, 'tests')
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        with open(join_paths(directory_path, 'test_reuse.py'), 'w') as file:
+            file.write(TEST_FILE_CONTENT)
+        
+        output = _run_reusing_results(source_directory, output_retention, worker_count)
+        assert_eq(output, {'test_print': (True, False), 'test_silent': (False, False)})
+        
+        output = _run_reusing_results(source_directory, output_retention, worker_count)
+        assert_eq(output, {'test_print': (True, False), 'test_silent': (False, True)})
@@ -0,0 +1,100 @@
+from ... import _, call_from
+from ...assertions import assert_eq, assert_is, assert_is_not, assert_true
+from ...result import DetachedResult, Result
+from ...result.detached_result import RESULT_FLAG_INFORMAL, RESULT_FLAG_LEAKED, RESULT_FLAG_PASSED
+from ...wrappers import WrapperConflict
+
+from ..constants import OUTPUT_RETENTION_ALWAYS, OUTPUT_RETENTION_FAILED_ONLY, OUTPUT_RETENTION_NEVER
+
+from ..output_retention import apply_output_retention
+
+
+class TestCase:
+    """
+    Test case stand-in.
+    """
+    def do_reverse(self):
+        """
+        Returns whether the test's result should be reversed.
+        
+        Returns
+        -------
+        do_reverse : `bool`
+        """
+        return False
+
+
+def _iter_options():
+    case = TestCase()
+    
+    yield Result(case).with_output('hey'), OUTPUT_RETENTION_ALWAYS, True
+    yield Result(case).with_output('hey'), OUTPUT_RETENTION_FAILED_ONLY, False
+    yield Result(case).as_skipped().with_output('hey'), OUTPUT_RETENTION_FAILED_ONLY, False
+    yield (
+        Result(case).with_conflict(WrapperConflict(None, reason = 'test')).with_output('hey'),
+        OUTPUT_RETENTION_FAILED_ONLY,
+        True,
+    )
+    yield (
+        Result(case).with_conflict(WrapperConflict(None, reason = 'test')).with_output('hey'),
+        OUTPUT_RETENTION_NEVER,
+        False,
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__apply_output_retention(result, output_retention):
+    """
+    Tests whether ``apply_output_retention`` works as intended.
+    
+    Parameters
+    ----------
+    result : ``Result``
+        The reported result.
+    output_retention : `str`
+        Which results keep their captured output after they are reported.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    apply_output_retention(result, output_retention)
+    return result.get_output_report() is not None
+
+
+def test__apply_output_retention__leak():
+    """
+    Tests whether ``apply_output_retention`` works as intended.
+    
+    Case: leak report is kept.
+    """
+    result = Result(TestCase()).with_leak('satori').with_output('hey')
+    
+    apply_output_retention(result, OUTPUT_RETENTION_FAILED_ONLY)
+    
+    assert_is(result.get_output_report(), None)
+    assert_is_not(result.get_leak_report(), None)
+    assert_true(result.is_informal())
+
+
+def test__apply_output_retention__leak__detached():
+    """
+    Tests whether ``apply_output_retention`` works as intended.
+    
+    Case: leak report is kept by a detached result.
+    """
+    informal_tokens = [(0, 'satori')]
+    result = DetachedResult(
+        TestCase(),
+        False,
+        RESULT_FLAG_PASSED | RESULT_FLAG_INFORMAL | RESULT_FLAG_LEAKED,
+        None,
+        None,
+        informal_tokens,
+        None,
+    )
+    
+    apply_output_retention(result, OUTPUT_RETENTION_FAILED_ONLY)
+    
+    assert_eq(result.informal_tokens, informal_tokens)
+    assert_true(result.is_informal())
@@ -0,0 +1,53 @@
+from ...wrappers import call_from
+from ...utils import _
+
+from ..sharding import build_duration_assignments
+
+
+def _iter_options():
+    yield {}, 2, {}
+    
+    yield (
+        {
+            'koishi': (None, {'test__a': 4.0, 'test__b': 1.0}),
+            'satori': (1.0, {'test__c': 3.0, 'test__d': 2.0}),
+        },
+        2,
+        {
+            'koishi:test__a': 0,
+            'satori:test__c': 1,
+            'satori:test__d': 1,
+            'koishi:test__b': 0,
+        },
+    )
+    
+    # Equal durations are assigned by key
+    yield (
+        {
+            'koishi': (None, {'test__b': 1.0, 'test__a': 1.0}),
+        },
+        2,
+        {
+            'koishi:test__a': 0,
+            'koishi:test__b': 1,
+        },
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__build_duration_assignments(durations, shard_count):
+    """
+    Tests whether ``build_duration_assignments`` works as intended.
+    
+    Parameters
+    ----------
+    durations : `dict<str, (None | float, dict<str, float>)>`
+        Test file import routes mapped to their own duration and to their test cases' durations.
+    shard_count : `int`
+        The amount of shards.
+    
+    Returns
+    -------
+    output : `dict<str, int>`
+    """
+    return build_duration_assignments(durations, shard_count)
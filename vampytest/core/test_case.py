@@ -4,10 +4,102 @@ import reprlib
 
 from scarletio import RichAttributeErrorBaseType, WeakReferer
 
-from .handling import Handle
+from .handling import Handle, iter_invoke_items
 from .helpers.hashing import hash_object
 from .result import Result
-from .wrappers import WrapperBase
+from .wrappers import WrapperBase, WrapperConflict
+
+
+def _build_handle_plan(wrapper):
+    """
+    Builds the plan of creating the handles of a test case from its wrapper.
+    
+    The wrappers are bucketed by their exclusivity class, so each wrapper is looked at only once. The wrappers which
+    are not exclusive with any other are put into a bucket on their own. The buckets keep the order of their first
+    wrapper.
+    
+    Parameters
+    ----------
+    wrapper : `None | WrapperBase`
+        The test case's wrapper.
+    
+    Returns
+    -------
+    handle_plan : `(None | tuple<DefaultEnvironment>, list<list<WrapperBase>>)`
+        The environments to run the test in and the mutually exclusive wrappers bucketed by their exclusivity class.
+    """
+    if wrapper is None:
+        return None, []
+    
+    environment_wrappers = [*wrapper.iter_environments()]
+    if environment_wrappers:
+        environments = tuple(environment_wrappers)
+    else:
+        environments = None
+    
+    buckets = []
+    buckets_by_key = {}
+    wrappers_unique = set()
+    
+    for wrapper in wrapper.iter_wrappers():
+        if wrapper.is_ignored_when_testing():
+            continue
+        
+        if wrapper in wrappers_unique:
+            continue
+        
+        wrappers_unique.add(wrapper)
+        
+        exclusivity_key = wrapper.get_exclusivity_key()
+        if exclusivity_key is None:
+            # Each expansion of an expanding wrapper is a separate test case.
+            if not wrapper.is_expanding():
+                buckets.append([wrapper])
+                continue
+            
+            exclusivity_key = wrapper
+        
+        try:
+            bucket = buckets_by_key[exclusivity_key]
+        except KeyError:
+            bucket = []
+            buckets.append(bucket)
+            buckets_by_key[exclusivity_key] = bucket
+        
+        bucket.append(wrapper)
+    
+    return environments, buckets
+
+
+def _iter_bucket(bucket):
+    """
+    Iterates over the wrappers of the given bucket, expanding the expanding ones. Equal wrappers are yielded only once.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    bucket : `list<WrapperBase>`
+        Mutually exclusive wrappers.
+    
+    Yields
+    ------
+    wrapper : ``WrapperBase``
+    """
+    yielded = set()
+    
+    for wrapper in bucket:
+        if wrapper.is_expanding():
+            expanded_wrappers = wrapper.iter_expanded_wrappers()
+        else:
+            expanded_wrappers = (wrapper,)
+        
+        for expanded_wrapper in expanded_wrappers:
+            if expanded_wrapper in yielded:
+                continue
+            
+            yielded.add(expanded_wrapper)
+            yield expanded_wrapper
 
 
 class TestCase(RichAttributeErrorBaseType):
@@ -16,6 +108,8 @@ class TestCase(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    _handle_plan : `None | (None | tuple<DefaultEnvironment>, list<list<WrapperBase>>)`
+        The cached plan of creating the test case's handles.
     _test_file_reference : `None`, ``WeakReferer`` to ``TestFile``
         The parent test file of the case.
     name : `str`
@@ -23,9 +117,9 @@ class TestCase(RichAttributeErrorBaseType):
     test : `FunctionType`, ``WrapperBase``
         The test itself, or the wrapped test.
     wrapper : `None`, ``WrapperBase``
-        Wrappers containing the test if any.    
+        Wrappers containing the test if any.
     """
-    __slots__ = ('_test_file_reference', 'name', 'test', 'wrapper')
+    __slots__ = ('_handle_plan', '_test_file_reference', 'name', 'test', 'wrapper')
     
     def __new__(cls, test_file, name, test):
         """
@@ -48,6 +142,7 @@ class TestCase(RichAttributeErrorBaseType):
             test = test
         
         self = object.__new__(cls)
+        self._handle_plan = None
         self._test_file_reference = WeakReferer(test_file)
         self.name = name
         self.test = test
@@ -132,6 +227,21 @@ class TestCase(RichAttributeErrorBaseType):
         return wrapper.do_reverse()
     
     
+    def get_timeout(self):
+        """
+        Returns the timeout to interrupt the test after.
+        
+        Returns
+        -------
+        timeout : `None | float`
+        """
+        wrapper = self.wrapper
+        if wrapper is None:
+            return None
+        
+        return wrapper.get_timeout()
+    
+    
     def check_conflicts(self):
         """
         Checks the test case's wrappers' conflicts.
@@ -160,91 +270,130 @@ class TestCase(RichAttributeErrorBaseType):
         -------
         result : ``Result``
         """
+        for key, result in iter_invoke_items(
+            ((self, item, continuous) for item, continuous in self.iter_invoke_items()), environment_manager
+        ):
+            yield result
+    
+    
+    def iter_invoke_items(self):
+        """
+        Iterates over the handles to invoke the test case with. If the test case should not be invoked, yields its
+        result instead.
+        
+        This method is an iterable generator.
+        
+        Yields
+        -------
+        item : ``Handle | Result``
+            The handle to invoke or the test case's result.
+        continuous : `bool`
+            Whether the handle's result is continuous.
+        """
         conflict = self.check_conflicts()
         if (conflict is not None):
-            yield Result(self).with_conflict(conflict)
+            yield Result(self).with_conflict(conflict), False
             return
         
         if self.do_skip():
-            yield Result(self).as_skipped()
+            yield Result(self).as_skipped(), False
             return
         
-        handles = [*self._iter_handles()]
-        for handle, index in zip(handles, reversed(range(len(handles)))):
-            result = handle.invoke(environment_manager)
-            if index:
-                result = result.as_continuous()
-            yield result
+        # Look ahead by one handle to know whether the current one is the last, so the handles of expanding wrappers
+        # are streamed instead of being collected.
+        handles = self.iter_handles()
+        try:
+            previous_handle = None
+            
+            while True:
+                try:
+                    handle = next(handles, None)
+                except Exception as exception:
+                    if (previous_handle is not None):
+                        yield previous_handle, True
+                    
+                    yield Result(self).with_conflict(
+                        WrapperConflict(
+                            self.wrapper,
+                            reason = f'Expanding the wrappers failed: {exception!r}.',
+                        )
+                    ), False
+                    return
+                
+                if handle is None:
+                    break
+                
+                if (previous_handle is not None):
+                    yield previous_handle, True
+                
+                previous_handle = handle
+            
+            if (previous_handle is not None):
+                yield previous_handle, False
+        
+        finally:
+            handles.close()
     
     
-    def _iter_handles(self):
+    def iter_handles(self):
         """
         Iterates over the test handles of the test case.
         
+        The first handle is created with the first wrapper of each exclusivity class, keeping the wrappers' order.
+        Then a handle is created for each other wrapper of each class, replacing the class's first wrapper. These
+        handles start with the replacing wrapper, followed by the rest in the same order as in the first handle. The
+        order of the wrappers is the order their contexts are entered in. The handles of expanding wrappers are
+        created lazily, one at a time, while iterating.
+        
         This method is an iterable generator.
         
         Yields
         ------
         handle : ``Handle``
         """
-        wrapper = self.wrapper
-        if (wrapper is None):
-            wrapper_groups = None
-            environments = None
+        environments, buckets = self._get_handle_plan()
+        test = self.test
         
-        else:
-            wrapper_groups_unique = set()
-            wrapper_groups = []
-            
-            environment_wrappers = [*wrapper.iter_environments()]
-            if environment_wrappers:
-                environments = tuple(environment_wrappers)
-            else:
-                environments = None
-            
-            wrappers = [wrapper for wrapper in wrapper.iter_wrappers() if not wrapper.is_ignored_when_testing()]
-            
-            for initial_wrapper in wrappers:
-                wrapper_group_unique = {initial_wrapper}
-                wrapper_group = [initial_wrapper]
-                
-                for wrapper in wrappers:
-                    if wrapper in wrapper_group:
-                        continue
-                    
-                    if any(wrapper.is_mutually_exclusive_with(wrapper_to_check) for wrapper_to_check in wrapper_group):
-                        continue
-                    
-                    if any(wrapper_to_check.is_mutually_exclusive_with(wrapper) for wrapper_to_check in wrapper_group):
-                        continue
-                    
-                    if wrapper in wrapper_group_unique:
-                        continue
-                    
-                    wrapper_group.append(wrapper)
-                    wrapper_group_unique.add(wrapper)
-                    continue
-                
-                wrapper_group_unique = frozenset(wrapper_group_unique)
-                if wrapper_group_unique in wrapper_groups_unique:
-                    continue
-                
-                wrapper_groups.append(wrapper_group)
-                wrapper_groups_unique.add(wrapper_group_unique)
-            
-            if not wrapper_groups:
-                wrapper_groups = None
+        bucket_iterators = []
+        base_wrapper_group = []
         
-        test = self.test
+        for bucket in buckets:
+            bucket_iterator = _iter_bucket(bucket)
+            first_wrapper = next(bucket_iterator, None)
+            if first_wrapper is None:
+                continue
+            
+            bucket_iterators.append(bucket_iterator)
+            base_wrapper_group.append(first_wrapper)
         
-        if (wrapper_groups is None):
+        if not base_wrapper_group:
             yield Handle(self, test, None, environments)
+            return
         
-        else:
-            for wrapper_group in wrapper_groups:
+        yield Handle(self, test, base_wrapper_group, environments)
+        
+        for index, bucket_iterator in enumerate(bucket_iterators):
+            for wrapper in bucket_iterator:
+                wrapper_group = [wrapper, *base_wrapper_group[:index], *base_wrapper_group[index + 1:]]
                 yield Handle(self, test, wrapper_group, environments)
     
     
+    def _get_handle_plan(self):
+        """
+        Returns the plan of creating the test case's handles. Built on the first call, then cached.
+        
+        Returns
+        -------
+        handle_plan : `(None | tuple<DefaultEnvironment>, list<list<WrapperBase>>)`
+        """
+        handle_plan = self._handle_plan
+        if handle_plan is None:
+            handle_plan = _build_handle_plan(self.wrapper)
+            self._handle_plan = handle_plan
+        
+        return handle_plan
+    
+    
     def get_test_file(self):
         """
         Returns the test file of the case.
@@ -0,0 +1,166 @@
+from ..assertions import assert_eq, assert_in, assert_instance, assert_is, assert_true
+from ..handling import Handle
+from ..result import Result
+from ..test_case import TestCase
+from ..wrappers import call_from, call_with, returning
+
+
+class TestFile:
+    """
+    Test file stand-in.
+    """
+
+
+def _test(value):
+    """
+    Test to wrap.
+    
+    Parameters
+    ----------
+    value : `int`
+        The value to return.
+    
+    Returns
+    -------
+    value : `int`
+    """
+    return value
+
+
+def test__TestCase__iter_invoke_items__streaming():
+    """
+    Tests whether ``TestCase.iter_invoke_items`` works as intended.
+    
+    Case: the handles of a `call_from` wrapper are yielded one at a time, only the last one being not continuous.
+    """
+    consumed = []
+    
+    def iter_parameters():
+        for value in range(3):
+            consumed.append(value)
+            yield value
+    
+    test_file = TestFile()
+    test_case = TestCase(test_file, '_test', call_from(iter_parameters())(_test))
+    
+    items = test_case.iter_invoke_items()
+    
+    handle, continuous = next(items)
+    assert_instance(handle, Handle)
+    assert_true(continuous)
+    # One handle is looked ahead.
+    assert_eq(consumed, [0, 1])
+    
+    output = [(handle.wrappers[0].calling_positional_parameters, continuous) for handle, continuous in items]
+    assert_eq(output, [((1,), True), ((2,), False)])
+
+
+def test__TestCase__iter_invoke_items__duplicates():
+    """
+    Tests whether ``TestCase.iter_invoke_items`` works as intended.
+    
+    Case: equal parameters of a `call_from` wrapper are called only once.
+    """
+    test_file = TestFile()
+    test_case = TestCase(test_file, '_test', call_from([1, 1, 2])(_test))
+    
+    output = [handle.wrappers[0].calling_positional_parameters for handle, continuous in test_case.iter_invoke_items()]
+    assert_eq(output, [(1,), (2,)])
+
+
+def test__TestCase__iter_invoke_items__expansion_failure():
+    """
+    Tests whether ``TestCase.iter_invoke_items`` works as intended.
+    
+    Case: expanding the wrappers fails, yielding a conflicted result.
+    """
+    test_file = TestFile()
+    wrapper = call_from([('a', 1), (2, 3)]).named_first()
+    test_case = TestCase(test_file, '_test', wrapper(_test))
+    
+    output = [*test_case.iter_invoke_items()]
+    assert_eq(len(output), 2)
+    
+    handle, continuous = output[0]
+    assert_instance(handle, Handle)
+    assert_true(continuous)
+    
+    result, continuous = output[1]
+    assert_instance(result, Result)
+    assert_true(result.is_conflicted())
+    assert_is(result.conflict.wrapper_0, wrapper)
+    assert_eq(continuous, False)
+
+
+def test__TestCase__iter_handles__grouping():
+    """
+    Tests whether ``TestCase.iter_handles`` works as intended.
+    
+    Case: mutually exclusive wrappers create separate handles, while the others are added to each of them.
+    """
+    call_with_0 = call_with(0)
+    call_with_1 = call_with(1)
+    returning_0 = returning(0)
+    
+    test_file = TestFile()
+    test_case = TestCase(test_file, '_test', call_with_0(call_with_1(call_with(1)(returning_0(_test)))))
+    
+    output = [[*handle.wrappers] for handle in test_case.iter_handles()]
+    assert_eq(len(output), 2)
+    
+    for wrapper_group in output:
+        assert_eq(len(wrapper_group), 2)
+        assert_in(returning_0, wrapper_group)
+    
+    assert_eq(
+        {
+            wrapper.calling_positional_parameters
+            for wrapper_group in output for wrapper in wrapper_group if wrapper is not returning_0
+        },
+        {(0,), (1,)},
+    )
+
+
+def test__TestCase__iter_handles__order():
+    """
+    Tests whether ``TestCase.iter_handles`` works as intended.
+    
+    Case: the first handle keeps the wrappers' order, the others start with the replacing wrapper.
+    """
+    call_with_0 = call_with(0)
+    call_with_1 = call_with(1)
+    returning_0 = returning(0)
+    
+    test_file = TestFile()
+    test_case = TestCase(test_file, '_test', call_with_0(returning_0(call_with_1(_test))))
+    
+    # The wrappers are chained up in a set, so their order is decided by their hash.
+    wrappers = [*test_case.wrapper.iter_wrappers()]
+    if wrappers.index(call_with_0) < wrappers.index(call_with_1):
+        first_call_with, other_call_with = call_with_0, call_with_1
+    else:
+        first_call_with, other_call_with = call_with_1, call_with_0
+    
+    base_wrapper_group = [wrapper for wrapper in wrappers if wrapper is not other_call_with]
+    
+    output = [[*handle.wrappers] for handle in test_case.iter_handles()]
+    assert_eq(
+        output,
+        [
+            base_wrapper_group,
+            [other_call_with, returning_0],
+        ],
+    )
+
+
+def test__TestCase__get_handle_plan__cached():
+    """
+    Tests whether ``TestCase._get_handle_plan`` works as intended.
+    
+    Case: the plan is built only once.
+    """
+    test_file = TestFile()
+    test_case = TestCase(test_file, '_test', call_with(0)(_test))
+    
+    handle_plan = test_case._get_handle_plan()
+    assert_is(test_case._get_handle_plan(), handle_plan)
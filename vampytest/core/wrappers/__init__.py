@@ -28,6 +28,7 @@ from .wrapper_garbage_collect import *
 from .wrapper_reverse import *
 from .wrapper_skip import *
 from .wrapper_skip_conditional import *
+from .wrapper_timeout import *
 
 
 __all__ = (
@@ -41,4 +42,5 @@ __all__ = (
     *wrapper_reverse.__all__,
     *wrapper_skip.__all__,
     *wrapper_skip_conditional.__all__,
+    *wrapper_timeout.__all__,
 )
@@ -1,6 +1,6 @@
 __all__ = (
     'call_from', 'call_with', 'in_environment', 'named', 'raising', 'returning', 'reverse', 'skip', 'skip_if',
-    'with_gc',
+    'with_gc', 'with_timeout',
 )
 
 
@@ -11,6 +11,7 @@ from .wrapper_garbage_collect import WrapperGarbageCollect
 from .wrapper_reverse import WrapperReverse
 from .wrapper_skip import WrapperSkip
 from .wrapper_skip_conditional import WrapperSkipConditional
+from .wrapper_timeout import WrapperTimeout
 
 call_from = WrapperCallingFrom.calling_from_constructor
 call_with = WrapperCalling.call_with_constructor
@@ -22,3 +23,4 @@ reverse = WrapperReverse
 skip = WrapperSkip
 skip_if = WrapperSkipConditional
 with_gc = WrapperGarbageCollect
+with_timeout = WrapperTimeout
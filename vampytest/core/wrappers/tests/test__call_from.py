@@ -1,5 +1,7 @@
 from vampytest import _
 
+from ...assertions import assert_eq, assert_raises
+
 from ..aliases import call_from
 
 
@@ -125,3 +127,62 @@ def test__call_from__return_itself(value_0):
     value_0 : `int`
     """
     return value_0
+
+
+@_(call_from(value for value in (1, 2)).returning_transformed(lambda x: x + 1))
+def test__call_from__generator(value_0):
+    """
+    Tests whether `call_from` accepts a generator.
+    
+    Parameters
+    ----------
+    value_0 : `int`
+    """
+    return value_0 + 1
+
+
+def test__WrapperCallingFrom__lazy():
+    """
+    Tests whether ``WrapperCallingFrom`` works as intended.
+    
+    Case: the parameters are not iterated over till the wrappers are expanded.
+    """
+    consumed = []
+    
+    def iter_parameters():
+        for parameters in (('a', 1, 2), ('b', 3, 4)):
+            consumed.append(parameters)
+            yield parameters
+    
+    wrapper = call_from(iter_parameters()).named_first().returning_last()
+    assert_eq(consumed, [])
+    
+    expanded_wrappers = wrapper.iter_expanded_wrappers()
+    
+    expanded_wrapper = next(expanded_wrappers)
+    assert_eq(len(consumed), 1)
+    assert_eq(expanded_wrapper.calling_positional_parameters, (1,))
+    assert_eq(expanded_wrapper.name, 'a')
+    assert_eq(expanded_wrapper.returning_value, 2)
+    
+    expanded_wrapper = next(expanded_wrappers)
+    assert_eq(len(consumed), 2)
+    assert_eq(expanded_wrapper.calling_positional_parameters, (3,))
+    assert_eq(expanded_wrapper.name, 'b')
+    assert_eq(expanded_wrapper.returning_value, 4)
+
+
+def test__WrapperCallingFrom__lazy_validation():
+    """
+    Tests whether ``WrapperCallingFrom`` works as intended.
+    
+    Case: the items are validated when they are expanded.
+    """
+    wrapper = call_from([('a', 1), (2, 3)]).named_first()
+    expanded_wrappers = wrapper.iter_expanded_wrappers()
+    
+    expanded_wrapper = next(expanded_wrappers)
+    assert_eq(expanded_wrapper.name, 'a')
+    
+    with assert_raises(TypeError):
+        next(expanded_wrappers)
@@ -189,6 +189,17 @@ class WrapperBase(RichAttributeErrorBaseType):
         return False
     
     
+    def get_timeout(self):
+        """
+        Returns the timeout to interrupt the test after.
+        
+        Returns
+        -------
+        timeout : `None | float`
+        """
+        return None
+    
+    
     def check_conflicts(self):
         """
         Checks whether the wrapper has internal conflict.
@@ -257,6 +268,31 @@ class WrapperBase(RichAttributeErrorBaseType):
         yield self
     
     
+    def is_expanding(self):
+        """
+        Returns whether the wrapper expands into more wrappers when testing, each creating a separate test case.
+        
+        Returns
+        -------
+        is_expanding : `bool`
+        """
+        return False
+    
+    
+    def iter_expanded_wrappers(self):
+        """
+        Iterates over the wrappers the wrapper expands into when testing. The expanded wrappers are produced lazily,
+        one at a time.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        wrapper : ``WrapperBase``
+        """
+        yield self
+    
+    
     def is_ignored_when_testing(self):
         """
         Returns whether the wrapper can be ignore when testing, but is used instead for just pre-checks.
@@ -280,7 +316,23 @@ class WrapperBase(RichAttributeErrorBaseType):
         -------
         is_mutually_exclusive_with : `bool`
         """
-        return False
+        exclusivity_key = self.get_exclusivity_key()
+        if exclusivity_key is None:
+            return False
+        
+        return exclusivity_key == other.get_exclusivity_key()
+    
+    
+    def get_exclusivity_key(self):
+        """
+        Returns the wrapper's exclusivity class. The wrappers of the same class are mutually exclusive with each other,
+        so each of them creates a separate test case. If the wrapper is not exclusive with any other, returns `None`.
+        
+        Returns
+        -------
+        exclusivity_key : `None | object`
+        """
+        return None
     
     
     def get_context(self, handle):
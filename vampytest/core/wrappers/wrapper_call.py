@@ -17,6 +17,9 @@ MODE_RETURNING = 1 << 2
 MODE_CALL_WITH = 1 << 3
 MODE_NAMED = 1 << 4
 
+# Calling wrappers of this class are mutually exclusive with each other.
+EXCLUSIVITY_KEY_CALLING = 'calling'
+
 
 class WrapperCalling(WrapperBase):
     """
@@ -332,15 +335,10 @@ class WrapperCalling(WrapperBase):
         return False
     
     
-    @copy_docs(WrapperBase.is_mutually_exclusive_with)
-    def is_mutually_exclusive_with(self, other):
-        if type(self) is not type(other):
-            return False
-        
-        if self.is_call_with() and other.is_call_with():
-            return True
-        
-        return False
+    @copy_docs(WrapperBase.get_exclusivity_key)
+    def get_exclusivity_key(self):
+        if self.is_call_with():
+            return EXCLUSIVITY_KEY_CALLING
     
     
     @copy_docs(WrapperBase.get_context)
@@ -747,7 +745,7 @@ class WrapperCalling(WrapperBase):
         is_call_with : `bool`
         """
         return True if self.mode & MODE_CALL_WITH else False
-
+    
     
     def is_named(self):
         """
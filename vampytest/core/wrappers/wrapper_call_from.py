@@ -1,7 +1,6 @@
 __all__ = ('WrapperCallingFrom',)
 
 import reprlib
-from itertools import repeat
 
 from scarletio import copy_docs
 
@@ -9,7 +8,7 @@ from ..helpers.hashing import hash_set, try_hash_method
 from ..helpers.un_nesting import un_nest_exceptions
 
 from .wrapper_base import WrapperBase
-from .wrapper_call import WrapperCalling
+from .wrapper_call import EXCLUSIVITY_KEY_CALLING, WrapperCalling
 from .wrapper_conflict import WrapperConflict
 
 
@@ -27,6 +26,162 @@ MODE_RETURNING_ALL = MODE_RETURNING_GIVEN | MODE_RETURNING_LAST | MODE_RETURNING
 MODE_NAMED_ALL = MODE_NAMED_GIVEN | MODE_NAMED_FIRST
 
 
+def _expand_raising_last(item, argument):
+    """
+    Expands an item by picking up its last parameter as the expected exceptions.
+    
+    Parameters
+    ----------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+        The item's parameters, name, expected exceptions and expected returned value.
+    argument : `None`
+        The step's argument.
+    
+    Returns
+    -------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+    
+    Raises
+    ------
+    TypeError
+        - If an exception's type is incorrect.
+    ValueError
+        - If the item has no parameters or no exceptions.
+    """
+    parameters, name, raising_exceptions, returning_value = item
+    if len(parameters) < 1:
+        raise ValueError(
+            f'`raising_last` is only applicable if the wrapper has at least 1 parameter for each call; '
+            f'got {parameters!r}.'
+        )
+    
+    raising_exceptions = un_nest_exceptions(parameters[-1])
+    if not raising_exceptions:
+        raise ValueError(
+            'At least 1 exception is required for each case.'
+        )
+    
+    return parameters[:-1], name, raising_exceptions, returning_value
+
+
+def _expand_returning_last(item, argument):
+    """
+    Expands an item by picking up its last parameter as the expected returned value.
+    
+    Parameters
+    ----------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+        The item's parameters, name, expected exceptions and expected returned value.
+    argument : `None`
+        The step's argument.
+    
+    Returns
+    -------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+    
+    Raises
+    ------
+    ValueError
+        - If the item has no parameters.
+    """
+    parameters, name, raising_exceptions, returning_value = item
+    if len(parameters) < 1:
+        raise ValueError(
+            f'`returning_last` is only applicable if the wrapper has at least 1 parameter for each call; '
+            f'got {parameters!r}.'
+        )
+    
+    return parameters[:-1], name, raising_exceptions, parameters[-1]
+
+
+def _expand_returning_transformed(item, transformer):
+    """
+    Expands an item by transforming its parameters into the expected returned value.
+    
+    Parameters
+    ----------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+        The item's parameters, name, expected exceptions and expected returned value.
+    transformer : `callable`
+        The step's argument.
+    
+    Returns
+    -------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+    """
+    parameters, name, raising_exceptions, returning_value = item
+    return parameters, name, raising_exceptions, transformer(*parameters)
+
+
+def _expand_returning_itself(item, argument):
+    """
+    Expands an item by picking up its only parameter as the expected returned value.
+    
+    Parameters
+    ----------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+        The item's parameters, name, expected exceptions and expected returned value.
+    argument : `None`
+        The step's argument.
+    
+    Returns
+    -------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+    
+    Raises
+    ------
+    ValueError
+        - If the item has incorrect amount of parameters.
+    """
+    parameters, name, raising_exceptions, returning_value = item
+    if len(parameters) != 1:
+        raise ValueError(
+            f'`returning_itself` is only applicable if the wrapper has 1 parameter added for each call; '
+            f'got {parameters!r}.'
+        )
+    
+    return parameters, name, raising_exceptions, parameters[0]
+
+
+def _expand_named_first(item, argument):
+    """
+    Expands an item by picking up its first parameter as its name.
+    
+    Parameters
+    ----------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+        The item's parameters, name, expected exceptions and expected returned value.
+    argument : `None`
+        The step's argument.
+    
+    Returns
+    -------
+    item : `(tuple<object>, None | str, None | set<BaseException>, None | object)`
+    
+    Raises
+    ------
+    TypeError
+        - If the name is not `str`.
+    ValueError
+        - If the item has no parameters.
+    """
+    parameters, name, raising_exceptions, returning_value = item
+    if len(parameters) < 1:
+        raise ValueError(
+            f'`named_first` is only applicable if the wrapper has at least 1 parameter for each call; '
+            f'got {parameters!r}.'
+        )
+    
+    name = parameters[0]
+    if not isinstance(name, str):
+        raise TypeError(
+            f'All first parameters interpreted as `name` must be `str` instances, '
+            f'got {type(name).__name__}; name = {name!r}.'
+        )
+    
+    return parameters[1:], name, raising_exceptions, returning_value
+
+
 class WrapperCallingFrom(WrapperBase):
     """
     Allows to create multiple `call_with`, `returning` and `raising` wrappers at once.
@@ -36,11 +191,11 @@ class WrapperCallingFrom(WrapperBase):
     wrapped : `object`
         The wrapped test.
     
-    calling_from : `list<tuple<object>>`
-        Values to call the tests from.
+    calling_from : `iterable<object>`
+        Values to call the tests from. Iterated only when the test cases are expanded.
     
-    name : `None | str | list<str>` = `None`
-        Whether the test cases are named.
+    name : `None | str` = `None`
+        The test cases' name if given.
     
     mode : `int`
         Bitwise flag containing the mode of handling returns.
@@ -48,21 +203,26 @@ class WrapperCallingFrom(WrapperBase):
     raising_accept_subtypes : `bool`
         Whether exception subclasses are accepted as well if ``.is_raising``.
     
-    raising_exceptions : `None | set<BaseException> | list<`set<BaseException>>`
-        The raised exceptions to be expected to be raised if ``.is_raising``.
+    raising_exceptions : `None | set<BaseException>`
+        The raised exceptions to be expected to be raised if given.
     
     raising_where : `None | callable`
         Additional check to check the raised exception if ``.is_raising`.
     
-    returning_value : `None | object | list<object>`
-        The expected returned value of the test if ``.is_returning``.
+    returning_value : `None | object`
+        The expected returned value of the test if given.
+    
+    steps : `tuple<(FunctionType, object)>`
+        Functions to expand each item with in order, with their argument.
     """
     __slots__ = (
         'calling_from', 'name', 'mode', 'raising_exceptions', 'raising_accept_subtypes', 'raising_where',
-        'returning_value'
+        'returning_value', 'steps'
     )
     
-    def __new__(cls, wrapped = None, *, calling_from = None, named = None, raising = None, returning = None):
+    def __new__(
+        cls, wrapped = None, *, calling_from = None, named = None, raising = None, returning = None, steps = ()
+    ):
         """
         Creates a new combined test wrapper.
         
@@ -71,18 +231,21 @@ class WrapperCallingFrom(WrapperBase):
         wrapped : `None<object>` = `None`, Optional
             The wrapped test if any.
         
-        calling_from : `list<tuple<object>>`
+        calling_from : `iterable<object>`
             Values to call the tests from.
         
-        named : `None | (int, str | list<str>`) = `None`, Optional (Keyword only)
+        named : `None | (int, None | str)` = `None`, Optional (Keyword only)
             Whether the test cases are named.
         
-        raising : `None | (int, set<BaseException> | list<set<BaseException>>, bool, None | callable)` = `None` \
+        raising : `None | (int, None | set<BaseException>, bool, None | callable)` = `None` \
                 , Optional (Keyword only)
             Whether the test is raising.
         
-        returning : `None | (int, object | list<object>)` = `None`, Optional (Keyword only)
+        returning : `None | (int, object)` = `None`, Optional (Keyword only)
             Whether the test is returning.
+        
+        steps : `tuple<(FunctionType, object)>` = `()`, Optional (Keyword only)
+            Functions to expand each item with in order, with their argument.
         """
         mode = 0
         
@@ -117,6 +280,7 @@ class WrapperCallingFrom(WrapperBase):
         self.raising_exceptions = raising_exceptions
         self.raising_where = raising_where
         self.returning_value = returning_value
+        self.steps = steps
         
         return self
     
@@ -142,8 +306,9 @@ class WrapperCallingFrom(WrapperBase):
                 repr_parts.append(' raising_mode = ')
                 repr_parts.append(raising_mode)
                 
-                repr_parts.append(', raising_exceptions = ')
-                repr_parts.append(repr(self.raising_exceptions))
+                if mode & MODE_RAISING_GIVEN:
+                    repr_parts.append(', raising_exceptions = ')
+                    repr_parts.append(repr(self.raising_exceptions))
                 
                 repr_parts.append(', raising_accept_subtypes = ')
                 repr_parts.append(repr(self.raising_accept_subtypes))
@@ -173,8 +338,9 @@ class WrapperCallingFrom(WrapperBase):
                 repr_parts.append(' returning_mode = ')
                 repr_parts.append(returning_mode)
                 
-                repr_parts.append(', returning_value = ')
-                repr_parts.append(reprlib.repr(self.returning_value))
+                if mode & MODE_RETURNING_GIVEN:
+                    repr_parts.append(', returning_value = ')
+                    repr_parts.append(reprlib.repr(self.returning_value))
             
             if mode & MODE_NAMED_ALL:
                 if field_added:
@@ -182,8 +348,11 @@ class WrapperCallingFrom(WrapperBase):
                 else:
                     field_added = True
                 
-                repr_parts.append(' name = ')
-                repr_parts.append(self.name)
+                if mode & MODE_NAMED_GIVEN:
+                    repr_parts.append(' name = ')
+                    repr_parts.append(repr(self.name))
+                else:
+                    repr_parts.append(' named_mode = first')
         
         return ''.join(repr_parts)
     
@@ -193,9 +362,13 @@ class WrapperCallingFrom(WrapperBase):
         hash_value = WrapperBase.__hash__(self)
         
         hash_value ^= try_hash_method(self.calling_from)
+        hash_value ^= try_hash_method(self.steps)
         
         if self.is_raising():
-            hash_value ^= hash_set(self.raising_exceptions)
+            raising_exceptions = self.raising_exceptions
+            if (raising_exceptions is not None):
+                hash_value ^= hash_set(raising_exceptions)
+            
             hash_value ^= self.raising_accept_subtypes
             raising_where = self.raising_where
             if (raising_where is not None):
@@ -224,6 +397,9 @@ class WrapperCallingFrom(WrapperBase):
         if self.calling_from != other.calling_from:
             return False
         
+        if self.steps != other.steps:
+            return False
+        
         if self_mode & MODE_RAISING_ALL:
             if self.raising_exceptions != other.raising_exceptions:
                 return False
@@ -265,55 +441,58 @@ class WrapperCallingFrom(WrapperBase):
         return False
     
     
-    @copy_docs(WrapperBase.is_mutually_exclusive_with)
-    def is_mutually_exclusive_with(self, other):
-        if type(self) is type(other):
-            return True
-        
-        if isinstance(other, WrapperCalling):
-            if other.is_call_with():
-                return True
-            
-            return False
-        
-        return False
+    @copy_docs(WrapperBase.get_exclusivity_key)
+    def get_exclusivity_key(self):
+        return EXCLUSIVITY_KEY_CALLING
+    
     
+    @copy_docs(WrapperBase.is_expanding)
+    def is_expanding(self):
+        return True
     
-    @copy_docs(WrapperBase.iter_wrappers)
-    def iter_wrappers(self):
+    
+    @copy_docs(WrapperBase.iter_expanded_wrappers)
+    def iter_expanded_wrappers(self):
         mode = self.mode
+        steps = self.steps
         
-        if not mode & MODE_RAISING_ALL:
-            raising_key_iterator = repeat(None)  
-        elif mode & MODE_RAISING_GIVEN:
-            raising_key_iterator = repeat(
-                (self.raising_exceptions, self.raising_accept_subtypes, self.raising_where),
-            )
-        else:
-            raising_key_iterator = zip(
-                self.raising_exceptions, repeat(self.raising_accept_subtypes), repeat(self.raising_where)
-            )
-        
-        if not mode & MODE_RETURNING_ALL:
-            returning_key_iterator = repeat(None)
-        elif mode & MODE_RETURNING_GIVEN:
-            returning_key_iterator = repeat((self.returning_value,),)
-        else:
-            returning_key_iterator = zip(self.returning_value)
-        
-        if not mode & MODE_NAMED_ALL:
-            named_key_iterator = repeat(None)
-        elif mode & MODE_NAMED_GIVEN:
-            named_key_iterator = repeat((self.name,),)
-        else:
-            named_key_iterator = zip(self.name)
-        
-        for calling_with_key, named_key, raising_key, returning_key in zip(
-            self.calling_from, named_key_iterator, raising_key_iterator, returning_key_iterator
-        ):
+        for parameters in self.calling_from:
+            if not isinstance(parameters, tuple):
+                parameters = (parameters,)
+            
+            item = (parameters, None, None, None)
+            for step, argument in steps:
+                item = step(item, argument)
+            
+            parameters, name, raising_exceptions, returning_value = item
+            
+            if not mode & MODE_RAISING_ALL:
+                raising_key = None
+            else:
+                if mode & MODE_RAISING_GIVEN:
+                    raising_exceptions = self.raising_exceptions
+                
+                raising_key = (raising_exceptions, self.raising_accept_subtypes, self.raising_where)
+            
+            if not mode & MODE_RETURNING_ALL:
+                returning_key = None
+            else:
+                if mode & MODE_RETURNING_GIVEN:
+                    returning_value = self.returning_value
+                
+                returning_key = (returning_value,)
+            
+            if not mode & MODE_NAMED_ALL:
+                named_key = None
+            else:
+                if mode & MODE_NAMED_GIVEN:
+                    name = self.name
+                
+                named_key = (name,)
+            
             yield WrapperCalling(
                 None,
-                call_with = (calling_with_key, {}),
+                call_with = (parameters, {}),
                 named = named_key,
                 raising = raising_key,
                 returning = returning_key,
@@ -327,7 +506,7 @@ class WrapperCallingFrom(WrapperBase):
         
         Returns
         -------
-        raising_key : `None | (int, None | set<BaseException> | list<set<BaseException>>, bool, None |callable)`
+        raising_key : `None | (int, None | set<BaseException>, bool, None | callable)`
         """
         raising_mode = self.mode & MODE_RAISING_ALL
         if raising_mode:
@@ -341,7 +520,7 @@ class WrapperCallingFrom(WrapperBase):
         
         Returns
         -------
-        returning_key : `None | (int, object | list<object>)`
+        returning_key : `None | (int, object)`
         """
         returning_mode = self.mode & MODE_RETURNING_ALL
         if returning_mode:
@@ -355,7 +534,7 @@ class WrapperCallingFrom(WrapperBase):
         
         Returns
         -------
-        named_key : `None | (int, str | list<str>)`
+        named_key : `None | (int, None | str)`
         """
         named_mode = self.mode & MODE_NAMED_ALL
         if named_mode:
@@ -403,6 +582,7 @@ class WrapperCallingFrom(WrapperBase):
             named = self.named_key,
             raising = (MODE_RAISING_GIVEN, exception_types, accept_subtypes, where),
             returning = self.returning_key,
+            steps = self.steps,
         )
     
     
@@ -412,6 +592,9 @@ class WrapperCallingFrom(WrapperBase):
         
         Note that this also removes the last parameter when calling.
         
+        The items are checked only when they are expanded, at which point an item with no parameters raises
+        `ValueError` and an incorrect exception type raises `TypeError`.
+        
         Parameters
         ----------
         accept_subtypes : `bool` = `True`
@@ -423,35 +606,14 @@ class WrapperCallingFrom(WrapperBase):
         Returns
         -------
         new : `instance<type<self>>`
-        
-        Raises
-        ------
-        TypeError
-            - If an `exception_types`'s type is incorrect.
-        ValueError
-            - If an item has no parameters.
         """
-        calling_from = self.calling_from
-        if any(len(item) < 1 for item in calling_from):
-            raise ValueError(
-                f'`raising_last` is only applicable if the wrapper has at least 1 parameter for each call; '
-                f'self = {self!r}.'
-            )
-        
-        raises = [un_nest_exceptions(item[-1]) for item in calling_from]
-        if any((not raises) for raises in raises):
-            raise ValueError(
-                'At least 1 exception is required for each case.'
-            )
-        
-        calling_from = [item[:-1] for item in calling_from]
-        
         return type(self)(
             self.wrapped,
-            calling_from = calling_from,
+            calling_from = self.calling_from,
             named = self.named_key,
-            raising = (MODE_RAISING_LAST, raises, accept_subtypes, where),
+            raising = (MODE_RAISING_LAST, None, accept_subtypes, where),
             returning = self.returning_key,
+            steps = (*self.steps, (_expand_raising_last, None)),
         )
     
     
@@ -474,6 +636,7 @@ class WrapperCallingFrom(WrapperBase):
             named = self.named_key,
             raising = self.raising_key,
             returning = (MODE_RETURNING_GIVEN, returning_value),
+            steps = self.steps,
         )
     
     
@@ -483,31 +646,20 @@ class WrapperCallingFrom(WrapperBase):
         
         Note that this also removes the last parameter when calling.
         
+        The items are checked only when they are expanded, at which point an item with no parameters raises
+        `ValueError`.
+        
         Returns
         -------
         new : `instance<type<self>>`
-        
-        Raises
-        ------
-        ValueError
-            - If an item has no parameters.
         """
-        calling_from = self.calling_from
-        if any(len(item) < 1 for item in calling_from):
-            raise ValueError(
-                f'`returning_last` is only applicable if the wrapper has at least 1 parameter for each call; '
-                f'self = {self!r}.'
-            )
-        
-        returns = [item[-1] for item in calling_from]
-        calling_from = [item[:-1] for item in calling_from]
-        
         return type(self)(
             self.wrapped,
-            calling_from = calling_from,
+            calling_from = self.calling_from,
             named = self.named_key,
             raising = self.raising_key,
-            returning = (MODE_RETURNING_LAST, returns),
+            returning = (MODE_RETURNING_LAST, None),
+            steps = (*self.steps, (_expand_returning_last, None)),
         )
     
     
@@ -519,20 +671,19 @@ class WrapperCallingFrom(WrapperBase):
         ----------
         transformer : `callable`
         
+        The transformer is called only when the items are expanded.
+        
         Returns
         -------
         new : `instance<type<self>>`
         """
-        calling_from = self.calling_from
-        
-        returns = [transformer(*item) for item in calling_from]
-        
         return type(self)(
             self.wrapped,
             calling_from = self.calling_from,
             named = self.named_key,
             raising = self.raising_key,
-            returning = (MODE_RETURNING_TRANSFORMED, returns),
+            returning = (MODE_RETURNING_TRANSFORMED, None),
+            steps = (*self.steps, (_expand_returning_transformed, transformer)),
         )
     
     
@@ -540,30 +691,20 @@ class WrapperCallingFrom(WrapperBase):
         """
         Creates a new retuning wrapper checking for whether the input value matches the returned one.
         
+        The items are checked only when they are expanded, at which point an item with incorrect amount of parameters
+        raises `ValueError`.
+        
         Returns
         -------
         new : `instance<type<self>>`
-        
-        Raises
-        ------
-        ValueError
-            - If an item stores incorrect amount parameters.
         """
-        calling_from = self.calling_from
-        if any(len(item) != 1 for item in calling_from):
-            raise ValueError(
-                f'`returning_itself` is only applicable if the wrapper has 1 parameter added for each call; '
-                f'self = {self!r}.'
-            )
-        
-        returns = [item[0] for item in calling_from]
-        
         return type(self)(
             self.wrapped,
-            calling_from = calling_from,
+            calling_from = self.calling_from,
             named = self.named_key,
             raising = self.raising_key,
-            returning = (MODE_RETURNING_ITSELF, returns),
+            returning = (MODE_RETURNING_ITSELF, None),
+            steps = (*self.steps, (_expand_returning_itself, None)),
         )
     
     
@@ -596,6 +737,7 @@ class WrapperCallingFrom(WrapperBase):
             named = (MODE_NAMED_GIVEN, name),
             raising = self.raising_key,
             returning = self.returning_key,
+            steps = self.steps,
         )
     
     
@@ -605,41 +747,20 @@ class WrapperCallingFrom(WrapperBase):
         
         Note that also removes the first parameter.
         
+        The items are checked only when they are expanded, at which point an item with no parameters raises
+        `ValueError` and a name which is not `str` raises `TypeError`.
+        
         Returns
         -------
         new : `instance<type<self>>`
-        
-        Raises
-        ------
-        ValueError
-            - If an item stores incorrect amount parameters.
-        TypeError
-            - If not all name is not `str` instance.
         """
-        calling_from = self.calling_from
-        if any(len(item) < 1 for item in calling_from):
-            raise ValueError(
-                f'`named_first` is only applicable if the wrapper has at least 1 parameter for each call; '
-                f'self = {self!r}.'
-            )
-        
-        for item in calling_from:
-            name = item[0]
-            if not isinstance(name, str):
-                raise TypeError(
-                    f'All first parameters interpreted as `name` must be `str` instances, '
-                    f'got {type(name).__name__}; name = {name!r}.'
-                )
-        
-        names = [item[0] for item in calling_from]
-        calling_from = [item[1:] for item in calling_from]
-        
         return type(self)(
             self.wrapped,
-            calling_from = calling_from,
-            named = (MODE_NAMED_FIRST, names),
+            calling_from = self.calling_from,
+            named = (MODE_NAMED_FIRST, None),
             raising = self.raising_key,
             returning = self.returning_key,
+            steps = (*self.steps, (_expand_named_first, None)),
         )
     
     
@@ -651,28 +772,25 @@ class WrapperCallingFrom(WrapperBase):
         Parameters
         ----------
         calling_from : `iterable`
-            Iterable to call the test from.
+            Iterable to call the test from. It is not iterated over till the test cases are expanded, so generators
+            and large iterables are expanded one item at a time.
         
         Returns
         -------
         self : `instance<cls>`
+        
+        Raises
+        ------
+        TypeError
+            - If `calling_from` is not iterable.
         """
         if not hasattr(calling_from, '__iter__'):
             raise TypeError(
                 f'`calling_from` must be iterable, got {type(calling_from).__name__}; {calling_from!r}.'
             )
         
-        items = []
-        
-        for item in calling_from:
-            if isinstance(item, tuple):
-                items.append(item)
-            else:
-                items.append((item,),)
-        
-        
         return cls(
-            calling_from = items,
+            calling_from = calling_from,
         )
     
     
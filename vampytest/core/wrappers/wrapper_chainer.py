@@ -95,6 +95,18 @@ class WrapperChainer(WrapperBase):
         
         return False
     
+    
+    @copy_docs(WrapperBase.get_timeout)
+    def get_timeout(self):
+        timeout = None
+        
+        for wrapper in self.wrappers:
+            wrapper_timeout = wrapper.get_timeout()
+            if (wrapper_timeout is not None) and ((timeout is None) or (wrapper_timeout < timeout)):
+                timeout = wrapper_timeout
+        
+        return timeout
+    
     @copy_docs(WrapperBase.check_conflicts)
     def check_conflicts(self):
         wrappers = list(self.wrappers)
@@ -0,0 +1,86 @@
+__all__ = ('WrapperTimeout',)
+
+from scarletio import copy_docs
+
+from .wrapper_base import WrapperBase
+
+
+class WrapperTimeout(WrapperBase):
+    """
+    Interrupts the wrapped synchronous test if it runs longer than the given timeout.
+    
+    The test is ran in its resolved environment with a watchdog around it. Coroutine tests are interrupted by their
+    environment's timeout.
+    
+    Attributes
+    ----------
+    wrapped : `None`, `object`
+        The wrapped test.
+    timeout : `float`
+        The maximal timeout to interrupt the test after.
+    """
+    __slots__ = ('timeout',)
+    
+    def __new__(cls, timeout):
+        """
+        Creates a timeout wrapper.
+        
+        Parameters
+        ----------
+        timeout : `float`
+            The maximal timeout to interrupt the test after.
+        
+        Raises
+        ------
+        TypeError
+            - If `timeout`'s type is incorrect.
+        ValueError
+            - If `timeout` is not positive.
+        """
+        if isinstance(timeout, int) and (not isinstance(timeout, bool)):
+            timeout = float(timeout)
+        
+        elif not isinstance(timeout, float):
+            raise TypeError(
+                f'`timeout` can be `float`, got {type(timeout).__name__}; {timeout!r}.'
+            )
+        
+        if timeout <= 0.0:
+            raise ValueError(
+                f'`timeout` must be positive, got {timeout!r}.'
+            )
+        
+        self = WrapperBase.__new__(cls)
+        self.timeout = timeout
+        return self
+    
+    
+    @copy_docs(WrapperBase.__repr__)
+    def __repr__(self):
+        return f'<{type(self).__name__} timeout = {self.timeout!r}>'
+    
+    
+    @copy_docs(WrapperBase.__eq__)
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.timeout != other.timeout:
+            return False
+        
+        return True
+    
+    
+    @copy_docs(WrapperBase.__hash__)
+    def __hash__(self):
+        return hash(self.timeout)
+    
+    
+    @copy_docs(WrapperBase.is_ignored_when_testing)
+    def is_ignored_when_testing(self):
+        return True
+    
+    
+    @copy_docs(WrapperBase.get_timeout)
+    def get_timeout(self):
+        return self.timeout
@@ -0,0 +1,83 @@
+__all__ = ()
+
+from os import getcwd as get_current_working_directory
+from os.path import join as join_paths
+from subprocess import PIPE, run as run_process
+
+from ..core.file.dependencies import normalize_path
+
+
+def run_git(parameters, working_directory):
+    """
+    Runs a git command on the local repository and returns its output.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        Parameters to pass to git.
+    working_directory : `str`
+        The directory to run git in.
+    
+    Returns
+    -------
+    output : `str`
+    
+    Raises
+    ------
+    ValueError
+        - If git is not available or the command failed.
+    """
+    try:
+        process = run_process(
+            ['git', *parameters], cwd = working_directory, stdout = PIPE, stderr = PIPE, universal_newlines = True
+        )
+    except OSError as exception:
+        raise ValueError(f'Failed to run git: {exception!s}') from None
+    
+    if process.returncode:
+        raise ValueError(f'git {" ".join(parameters)} failed: {process.stderr.strip()}')
+    
+    return process.stdout
+
+
+def get_changed_file_paths_since(revision, working_directory = None):
+    """
+    Returns the files changed since the given revision, including uncommitted and untracked files. Only the local
+    repository is read.
+    
+    Parameters
+    ----------
+    revision : `str`
+        Git revision to compare to.
+    working_directory : `None | str` = `None`, Optional
+        A directory in the repository. Defaults to the current working directory.
+    
+    Returns
+    -------
+    changed_file_paths : `set<str>`
+        The changed files' normalized paths.
+    
+    Raises
+    ------
+    ValueError
+        - If git is not available or the command failed.
+    """
+    if working_directory is None:
+        working_directory = get_current_working_directory()
+    
+    # Parameters starting with `-` would be interpreted as options.
+    if revision.startswith('-'):
+        raise ValueError(f'Expected a git revision, got {revision!r}.')
+    
+    repository_directory = run_git(['rev-parse', '--show-toplevel'], working_directory).strip()
+    
+    changed_file_paths = set()
+    for output in (
+        run_git(['diff', '--name-only', '--no-renames', revision, '--'], repository_directory),
+        run_git(['ls-files', '--others', '--exclude-standard'], repository_directory),
+    ):
+        for line in output.splitlines():
+            if line:
+                changed_file_paths.add(normalize_path(join_paths(repository_directory, line)))
+    
+    return changed_file_paths
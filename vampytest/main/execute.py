@@ -6,8 +6,12 @@ from os import getcwd as get_current_working_directory
 from scarletio import write_exception_sync
 
 from ..core import run_tests_in, shutdown_environments
-from ..return_codes import RETURN_CODE_TEST_LOCATION_FAILURE, RETURN_CODE_TEST_RUNNER_INTERRUPTED
+from ..return_codes import (
+    RETURN_CODE_PARAMETER_FAILURE, RETURN_CODE_TEST_LOCATION_FAILURE, RETURN_CODE_TEST_RUNNER_INTERRUPTED
+)
 
+from .parameter_parsing import parse_configuration_from_parameters, parse_report_parameters
+from .report import COMMAND_REPORT, write_journal_report
 from .source_lookup import get_source_and_target
 
 
@@ -64,6 +68,60 @@ def build_error_message(errors, parameters):
     return ''.join(error_message_parts)
 
 
+def build_parameter_error_message(errors):
+    """
+    Builds error message for the case when parameters could not be parsed.
+    
+    Parameters
+    ----------
+    errors : `list<(str, str)>`
+        Found errors while parsing the parameters. In a `parameter - message` relation.
+    
+    Returns
+    -------
+    error_message : `str`
+    """
+    error_message_parts = []
+    
+    error_message_parts.append('Invalid parameter(s):\n')
+    
+    for parameter, error in errors:
+        error_message_parts.append('- "')
+        error_message_parts.append(parameter.replace('"', '\\"'))
+        error_message_parts.append('": ')
+        error_message_parts.append(error)
+        error_message_parts.append('\n')
+    
+    return ''.join(error_message_parts)
+
+
+def execute_report_from_parameters(parameters, index):
+    """
+    Executes the report command from terminal.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        Command line parameters.
+    index : `int`
+        The index to read the command's parameters from.
+    
+    Returns
+    -------
+    return_code : `int`
+    """
+    journal_file_path, errors = parse_report_parameters(parameters, index)
+    if (errors is not None):
+        sys.stderr.write(build_parameter_error_message(errors))
+        return RETURN_CODE_PARAMETER_FAILURE
+    
+    try:
+        return write_journal_report(journal_file_path)
+    except (OSError, ValueError) as exception:
+        sys.stderr.write(f'Could not read journal {journal_file_path!r}: {exception}\n')
+        return RETURN_CODE_PARAMETER_FAILURE
+
+
 def execute_from_parameters(parameters):
     """
     Executes vampytest from terminal.
@@ -77,14 +135,22 @@ def execute_from_parameters(parameters):
     -------
     return_code : `int`
     """
+    if parameters and (parameters[0] == COMMAND_REPORT):
+        return execute_report_from_parameters(parameters, 1)
+    
     source_directory, sources, test_collection_route, errors, index = get_source_and_target(parameters, 0)
     
     if (source_directory is None) or (sources is None):
         sys.stderr.write(build_error_message(errors, parameters))
         return RETURN_CODE_TEST_LOCATION_FAILURE
     
+    configuration, errors = parse_configuration_from_parameters(parameters, index)
+    if (errors is not None):
+        sys.stderr.write(build_parameter_error_message(errors))
+        return RETURN_CODE_PARAMETER_FAILURE
+    
     try:
-        return run_tests_in(source_directory, sources, test_collection_route)
+        return run_tests_in(source_directory, sources, test_collection_route, configuration = configuration)
     except KeyboardInterrupt as exception:
         write_exception_sync(exception, before = '\nTest running interrupted...')
         return RETURN_CODE_TEST_RUNNER_INTERRUPTED
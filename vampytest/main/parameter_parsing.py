@@ -0,0 +1,499 @@
+__all__ = ()
+
+from os import cpu_count as get_cpu_count
+
+from ..core import RunnerConfiguration
+from ..core.contexts import OUTPUT_CAPTURE_MODES
+from ..core.file.dependencies import normalize_path
+from ..core.runner.constants import OUTPUT_RETENTIONS, SHARD_MODES
+
+from .changed_files import get_changed_file_paths_since
+
+
+OPTION_PREFIX = '--'
+OPTION_VALUE_SEPARATOR = '='
+
+
+def parse_worker_count(value):
+    """
+    Parses the worker count option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    worker_count : `int`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a non-negative integer or `'auto'`.
+    """
+    if value == 'auto':
+        worker_count = get_cpu_count()
+        if worker_count is None:
+            worker_count = 1
+        
+        return worker_count
+    
+    try:
+        worker_count = int(value)
+    except ValueError:
+        worker_count = -1
+    
+    if worker_count < 0:
+        raise ValueError(f'Expected a non-negative integer or `auto`, got {value!r}.')
+    
+    return worker_count
+
+
+def parse_durations_count(value):
+    """
+    Parses the durations option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    durations_count : `int`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a non-negative integer.
+    """
+    try:
+        durations_count = int(value)
+    except ValueError:
+        durations_count = -1
+    
+    if durations_count < 0:
+        raise ValueError(f'Expected a non-negative integer, got {value!r}.')
+    
+    return durations_count
+
+
+def parse_timeout(value):
+    """
+    Parses the timeout option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse. The timeout in seconds.
+    
+    Returns
+    -------
+    timeout : `float`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a positive number.
+    """
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = -1.0
+    
+    # `not` so `nan` is rejected as well.
+    if not (0.0 < timeout < float('inf')):
+        raise ValueError(f'Expected a positive number, got {value!r}.')
+    
+    return timeout
+
+
+def parse_capture_mode(value):
+    """
+    Parses the output capture mode option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output_capture_mode : `str`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a known output capture mode.
+    """
+    if value not in OUTPUT_CAPTURE_MODES:
+        raise ValueError(f'Expected any of {", ".join(sorted(OUTPUT_CAPTURE_MODES))}, got {value!r}.')
+    
+    return value
+
+
+def parse_output_memory_limit(value):
+    """
+    Parses the output memory limit option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse. The limit in bytes.
+    
+    Returns
+    -------
+    output_memory_limit : `int`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a positive integer.
+    """
+    try:
+        output_memory_limit = int(value)
+    except ValueError:
+        output_memory_limit = 0
+    
+    if output_memory_limit < 1:
+        raise ValueError(f'Expected a positive integer, got {value!r}.')
+    
+    return output_memory_limit
+
+
+def parse_output_retention(value):
+    """
+    Parses the output retention option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output_retention : `str`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a known output retention.
+    """
+    if value not in OUTPUT_RETENTIONS:
+        raise ValueError(f'Expected any of {", ".join(sorted(OUTPUT_RETENTIONS))}, got {value!r}.')
+    
+    return value
+
+
+def parse_names(value):
+    """
+    Parses a comma separated list of names.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    names : `list<str>`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` contains no names.
+    """
+    names = [name.strip() for name in value.split(',')]
+    names = [name for name in names if name]
+    if not names:
+        raise ValueError(f'Expected comma separated names, got {value!r}.')
+    
+    return names
+
+
+def parse_changed_files(value):
+    """
+    Parses a comma separated list of changed file paths.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    changed_file_paths : `set<str>`
+        The files' normalized paths.
+    
+    Raises
+    ------
+    ValueError
+        - If `value` contains no paths.
+    """
+    return {normalize_path(path) for path in parse_names(value)}
+
+
+def parse_changed_since(value):
+    """
+    Parses the changed since option, by reading the files changed since the given git revision.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    changed_file_paths : `set<str>`
+        The files' normalized paths.
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is empty or if reading the git repository failed.
+    """
+    if not value:
+        raise ValueError('Expected a git revision.')
+    
+    return get_changed_file_paths_since(value)
+
+
+def parse_shard(value):
+    """
+    Parses the shard option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse. Should be in `index/count` format, where index is 1 based.
+    
+    Returns
+    -------
+    shard_index_and_count : `(int, int)`
+        The shard's 0 based index and the amount of shards.
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not in `index/count` format or if `index` is out of `[1, count]`.
+    """
+    index, separator, count = value.partition('/')
+    
+    try:
+        shard_index = int(index)
+        shard_count = int(count)
+    except ValueError:
+        shard_index = 0
+        shard_count = 0
+    
+    if (not separator) or (shard_count < 1) or (shard_index < 1) or (shard_index > shard_count):
+        raise ValueError(f'Expected `index/count` with `1 <= index <= count`, got {value!r}.')
+    
+    return shard_index - 1, shard_count
+
+
+def parse_shard_mode(value):
+    """
+    Parses the shard mode option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    shard_mode : `str`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is not a known shard mode.
+    """
+    if value not in SHARD_MODES:
+        raise ValueError(f'Expected any of {", ".join(sorted(SHARD_MODES))}, got {value!r}.')
+    
+    return value
+
+
+def parse_path(value):
+    """
+    Parses a path option.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    path : `str`
+    
+    Raises
+    ------
+    ValueError
+        - If `value` is empty.
+    """
+    if not value:
+        raise ValueError('Expected a non-empty path.')
+    
+    return value
+
+
+# Options parsed into multiple parameters have a tuple of keywords.
+OPTIONS = {
+    'cache-clear': ('clear_cache', None),
+    'capture': ('output_capture_mode', parse_capture_mode),
+    'changed-files': ('changed_file_paths', parse_changed_files),
+    'changed-since': ('changed_file_paths', parse_changed_since),
+    'collect-file': ('collect_file_path', parse_path),
+    'collect-only': ('collect_only', None),
+    'durations': ('durations_count', parse_durations_count),
+    'force': ('force_run', None),
+    'journal': ('journal_file_path', parse_path),
+    'junit-xml': ('junit_xml_file_path', parse_path),
+    'no-cache': ('cache_disabled', None),
+    'output-memory-limit': ('output_memory_limit', parse_output_memory_limit),
+    'output-retention': ('output_retention', parse_output_retention),
+    'prune': ('prune_directory_names', parse_names),
+    'result-file': ('result_file_path', parse_path),
+    'reuse-results': ('reuse_results', None),
+    'shard': (('shard_index', 'shard_count'), parse_shard),
+    'shard-mode': ('shard_mode', parse_shard_mode),
+    'timeout': ('timeout', parse_timeout),
+    'workers': ('worker_count', parse_worker_count),
+}
+
+REPORT_OPTIONS = {
+    'from': ('journal_file_path', parse_path),
+}
+
+
+def parse_options(parameters, index, options):
+    """
+    Parses the given options from the given parameters.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        System parameters usually.
+    index : `int`
+        The index to read from.
+    options : `dict<str, (str | tuple<str>, None | FunctionType)>`
+        The accepted options' names mapped to the keywords to parse them into and their parser. Flags have no parser.
+    
+    Returns
+    -------
+    keyword_parameters : `dict<str, object>`
+        The parsed keyword parameters.
+    errors : `None | list<(str, str)>`
+        Found errors while parsing the parameters. In a `parameter - message` relation.
+    """
+    keyword_parameters = {}
+    errors = None
+    
+    parameter_count = len(parameters)
+    while index < parameter_count:
+        parameter = parameters[index]
+        index += 1
+        
+        if not parameter.startswith(OPTION_PREFIX):
+            error = (parameter, 'Unexpected parameter.')
+        
+        else:
+            name, separator, value = parameter[len(OPTION_PREFIX):].partition(OPTION_VALUE_SEPARATOR)
+            
+            try:
+                keyword, parser = options[name]
+            except KeyError:
+                error = (parameter, 'Unknown option.')
+            
+            else:
+                if parser is None:
+                    if separator:
+                        error = (parameter, 'Option does not accept a value.')
+                    else:
+                        keyword_parameters[keyword] = True
+                        error = None
+                
+                else:
+                    if not separator:
+                        if index < parameter_count:
+                            value = parameters[index]
+                            index += 1
+                        else:
+                            value = None
+                    
+                    if value is None:
+                        error = (parameter, 'Option requires a value.')
+                    
+                    else:
+                        try:
+                            value = parser(value)
+                        except ValueError as exception:
+                            error = (parameter, str(exception))
+                        else:
+                            if isinstance(keyword, tuple):
+                                keyword_parameters.update(zip(keyword, value))
+                            else:
+                                keyword_parameters[keyword] = value
+                            
+                            error = None
+        
+        if (error is not None):
+            if errors is None:
+                errors = []
+            
+            errors.append(error)
+    
+    return keyword_parameters, errors
+
+
+def parse_configuration_from_parameters(parameters, index):
+    """
+    Parses the runner configuration from the given parameters.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        System parameters usually.
+    index : `int`
+        The index to read from.
+    
+    Returns
+    -------
+    configuration : ``RunnerConfiguration``
+        The parsed configuration.
+    errors : `None | list<(str, str)>`
+        Found errors while parsing the parameters. In a `parameter - message` relation.
+    """
+    keyword_parameters, errors = parse_options(parameters, index, OPTIONS)
+    return RunnerConfiguration(**keyword_parameters), errors
+
+
+def parse_report_parameters(parameters, index):
+    """
+    Parses the parameters of the report command.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        System parameters usually.
+    index : `int`
+        The index to read from.
+    
+    Returns
+    -------
+    journal_file_path : `None | str`
+        Path to the journal to report from.
+    errors : `None | list<(str, str)>`
+        Found errors while parsing the parameters. In a `parameter - message` relation.
+    """
+    keyword_parameters, errors = parse_options(parameters, index, REPORT_OPTIONS)
+    
+    journal_file_path = keyword_parameters.get('journal_file_path', None)
+    if (journal_file_path is None) and (errors is None):
+        errors = [(f'{OPTION_PREFIX}from', 'Option is required.')]
+    
+    return journal_file_path, errors
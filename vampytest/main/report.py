@@ -0,0 +1,113 @@
+__all__ = ()
+
+from ..core.event_handling.default_output_writer import OutputWriter
+from ..core.event_handling.journal import iter_read_journal
+from ..core.event_handling.result_file import (
+    RECORD_TYPE_LOAD_FAILURE, RECORD_TYPE_RESULT, RECORD_TYPE_SUMMARY, STATUS_FAILED, STATUS_SKIPPED
+)
+from ..return_codes import RETURN_CODE_FAILURE, RETURN_CODE_SUCCESS, RETURN_CODE_TEST_RUNNER_STOPPED
+
+
+COMMAND_REPORT = 'report'
+
+
+def build_summary_line(failed_count, skipped_count, passed_count, load_failure_count):
+    """
+    Builds the summary line of a report.
+    
+    Parameters
+    ----------
+    failed_count : `int`
+        How much tests failed.
+    skipped_count : `int`
+        How much tests were skipped.
+    passed_count : `int`
+        How much tests passed.
+    load_failure_count : `int`
+        How much test files failed to load.
+    
+    Returns
+    -------
+    summary_line : `str`
+    """
+    summary_line = f'{failed_count} failed | {skipped_count} skipped | {passed_count} passed'
+    if load_failure_count:
+        summary_line = f'{summary_line} | {load_failure_count} files failed to load'
+    
+    return summary_line
+
+
+def write_journal_report(journal_file_path, file = None):
+    """
+    Rebuilds the report of a test run from its journal. Only the failures are kept in memory while reading it.
+    
+    Parameters
+    ----------
+    journal_file_path : `str`
+        Path to the journal to report from.
+    file : `None | io-like` = `None`, Optional
+        Writable object to write the report into. If not given defaults to `sys.stdout`.
+    
+    Returns
+    -------
+    return_code : `int`
+    
+    Raises
+    ------
+    OSError
+        - If the journal could not be read.
+    ValueError
+        - If the journal is corrupted.
+    """
+    output_writer = OutputWriter(file)
+    
+    failure_messages = []
+    failed_count = 0
+    skipped_count = 0
+    passed_count = 0
+    load_failure_count = 0
+    finished = False
+    
+    for record in iter_read_journal(journal_file_path):
+        record_type = record.get('type', None)
+        
+        if record_type == RECORD_TYPE_RESULT:
+            status = record.get('status', None)
+            if status == STATUS_FAILED:
+                failed_count += 1
+                failure_messages.append(record.get('message', None))
+            else:
+                # Skipped tests are counted as passed too, as in the summary of the run.
+                if status == STATUS_SKIPPED:
+                    skipped_count += 1
+                
+                passed_count += 1
+        
+        elif record_type == RECORD_TYPE_LOAD_FAILURE:
+            load_failure_count += 1
+            failure_messages.append(record.get('message', None))
+        
+        elif record_type == RECORD_TYPE_SUMMARY:
+            finished = True
+    
+    output_writer.write_break_line()
+    
+    for message in failure_messages:
+        if message:
+            output_writer.write(message.rstrip('\n'))
+            output_writer.end_line()
+            output_writer.write_break_line()
+    
+    if not finished:
+        output_writer.write_line('The run did not finish, reporting the tests done before it stopped.')
+    
+    output_writer.write_line(build_summary_line(failed_count, skipped_count, passed_count, load_failure_count))
+    output_writer.end_line()
+    
+    if failed_count or load_failure_count:
+        return RETURN_CODE_FAILURE
+    
+    if not finished:
+        return RETURN_CODE_TEST_RUNNER_STOPPED
+    
+    return RETURN_CODE_SUCCESS
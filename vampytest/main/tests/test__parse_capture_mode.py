@@ -0,0 +1,30 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_capture_mode
+
+
+def _iter_options():
+    yield 'fd', 'fd'
+    yield 'sys', 'sys'
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('mister').raising(ValueError))
+def test__parse_capture_mode(value):
+    """
+    Tests whether ``parse_capture_mode`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `str`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_capture_mode(value)
@@ -0,0 +1,36 @@
+from os.path import abspath as get_absolute_path, normcase as normalize_case
+
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_changed_files
+
+
+def _iter_options():
+    yield 'koishi.py', {normalize_case(get_absolute_path('koishi.py'))}
+    yield (
+        ' koishi.py , satori/orin.py ,',
+        {normalize_case(get_absolute_path('koishi.py')), normalize_case(get_absolute_path('satori/orin.py'))},
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('').raising(ValueError))
+@_(call_with(' , ').raising(ValueError))
+def test__parse_changed_files(value):
+    """
+    Tests whether ``parse_changed_files`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `set<str>`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_changed_files(value)
@@ -0,0 +1,71 @@
+from os.path import abspath as get_absolute_path, normcase as normalize_case
+
+from ...core import RunnerConfiguration, _, call_from
+
+from ..parameter_parsing import parse_configuration_from_parameters
+
+
+def _iter_options():
+    yield [], 0, (RunnerConfiguration(), None)
+    yield ['koishi'], 1, (RunnerConfiguration(), None)
+    yield ['koishi', '--workers', '2'], 1, (RunnerConfiguration(worker_count = 2), None)
+    yield ['--workers=3'], 0, (RunnerConfiguration(worker_count = 3), None)
+    yield ['--workers'], 0, (RunnerConfiguration(), [('--workers', 'Option requires a value.')])
+    yield ['--durations', '5'], 0, (RunnerConfiguration(durations_count = 5), None)
+    yield ['--prune', 'build,dist'], 0, (RunnerConfiguration(prune_directory_names = ['build', 'dist']), None)
+    yield ['--shard', '2/3'], 0, (RunnerConfiguration(shard_index = 1, shard_count = 3), None)
+    yield ['--no-cache', '--cache-clear'], 0, (RunnerConfiguration(cache_disabled = True, clear_cache = True), None)
+    yield ['--collect-only'], 0, (RunnerConfiguration(collect_only = True), None)
+    yield ['--collect-file', 'koishi.jsonl'], 0, (RunnerConfiguration(collect_file_path = 'koishi.jsonl'), None)
+    yield (
+        ['--changed-files', 'koishi.py'],
+        0,
+        (RunnerConfiguration(changed_file_paths = [normalize_case(get_absolute_path('koishi.py'))]), None),
+    )
+    yield ['--reuse-results', '--force'], 0, (RunnerConfiguration(force_run = True, reuse_results = True), None)
+    yield ['--no-cache=1'], 0, (RunnerConfiguration(), [('--no-cache=1', 'Option does not accept a value.')])
+    yield (
+        ['--shard=1/2', '--shard-mode', 'duration', '--result-file', 'koishi.jsonl'],
+        0,
+        (
+            RunnerConfiguration(
+                result_file_path = 'koishi.jsonl', shard_count = 2, shard_index = 0, shard_mode = 'duration'
+            ),
+            None,
+        ),
+    )
+    yield ['--timeout', '2.5'], 0, (RunnerConfiguration(timeout = 2.5), None)
+    yield (
+        ['--capture=fd', '--output-memory-limit', '4096'],
+        0,
+        (RunnerConfiguration(output_capture_mode = 'fd', output_memory_limit = 4096), None),
+    )
+    yield ['--output-retention', 'always'], 0, (RunnerConfiguration(output_retention = 'always'), None)
+    yield ['--journal', 'koishi.jsonl'], 0, (RunnerConfiguration(journal_file_path = 'koishi.jsonl'), None)
+    yield ['--junit-xml', 'koishi.xml'], 0, (RunnerConfiguration(junit_xml_file_path = 'koishi.xml'), None)
+    yield ['--satori'], 0, (RunnerConfiguration(), [('--satori', 'Unknown option.')])
+    yield ['satori'], 0, (RunnerConfiguration(), [('satori', 'Unexpected parameter.')])
+    yield (
+        ['--workers', 'mister'],
+        0,
+        (RunnerConfiguration(), [('--workers', 'Expected a non-negative integer or `auto`, got \'mister\'.')]),
+    )
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_configuration_from_parameters(parameters, index):
+    """
+    Tests whether ``parse_configuration_from_parameters`` works as intended.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        System parameters usually.
+    index : `int`
+        The index to read from.
+    
+    Returns
+    -------
+    output : `(RunnerConfiguration, None | list<(str, str)>)`
+    """
+    return parse_configuration_from_parameters(parameters, index)
@@ -0,0 +1,31 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_durations_count
+
+
+def _iter_options():
+    yield '0', 0
+    yield '10', 10
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('-1').raising(ValueError))
+@_(call_with('mister').raising(ValueError))
+def test__parse_durations_count(value):
+    """
+    Tests whether ``parse_durations_count`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `int`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_durations_count(value)
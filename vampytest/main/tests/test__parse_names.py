@@ -0,0 +1,32 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_names
+
+
+def _iter_options():
+    yield 'build', ['build']
+    yield 'build,dist', ['build', 'dist']
+    yield ' build , dist ,', ['build', 'dist']
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('').raising(ValueError))
+@_(call_with(' , ').raising(ValueError))
+def test__parse_names(value):
+    """
+    Tests whether ``parse_names`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `list<str>`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_names(value)
@@ -0,0 +1,31 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_output_memory_limit
+
+
+def _iter_options():
+    yield '1', 1
+    yield '4096', 4096
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('0').raising(ValueError))
+@_(call_with('mister').raising(ValueError))
+def test__parse_output_memory_limit(value):
+    """
+    Tests whether ``parse_output_memory_limit`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `int`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_output_memory_limit(value)
@@ -0,0 +1,31 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_output_retention
+
+
+def _iter_options():
+    yield 'always', 'always'
+    yield 'failed-only', 'failed-only'
+    yield 'never', 'never'
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('mister').raising(ValueError))
+def test__parse_output_retention(value):
+    """
+    Tests whether ``parse_output_retention`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `str`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_output_retention(value)
@@ -0,0 +1,29 @@
+from ...core import _, call_from
+
+from ..parameter_parsing import parse_report_parameters
+
+
+def _iter_options():
+    yield ['--from', 'koishi.jsonl'], 0, ('koishi.jsonl', None)
+    yield ['report', '--from=koishi.jsonl'], 1, ('koishi.jsonl', None)
+    yield [], 0, (None, [('--from', 'Option is required.')])
+    yield ['--satori'], 0, (None, [('--satori', 'Unknown option.')])
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__parse_report_parameters(parameters, index):
+    """
+    Tests whether ``parse_report_parameters`` works as intended.
+    
+    Parameters
+    ----------
+    parameters : `list<str>`
+        Parameters to parse.
+    index : `int`
+        The index to read from.
+    
+    Returns
+    -------
+    output : `(None | str, None | list<(str, str)>)`
+    """
+    return parse_report_parameters(parameters, index)
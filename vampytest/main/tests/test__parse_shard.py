@@ -0,0 +1,35 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_shard
+
+
+def _iter_options():
+    yield '1/1', (0, 1)
+    yield '1/4', (0, 4)
+    yield '4/4', (3, 4)
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('0/4').raising(ValueError))
+@_(call_with('5/4').raising(ValueError))
+@_(call_with('1/0').raising(ValueError))
+@_(call_with('4').raising(ValueError))
+@_(call_with('mister/4').raising(ValueError))
+def test__parse_shard(value):
+    """
+    Tests whether ``parse_shard`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `(int, int)`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_shard(value)
@@ -0,0 +1,34 @@
+from ...core import _, call_from, call_with
+
+from ..parameter_parsing import parse_timeout
+
+
+def _iter_options():
+    yield '10', 10.0
+    yield '0.5', 0.5
+
+
+@_(call_from(_iter_options()).returning_last())
+@_(call_with('0').raising(ValueError))
+@_(call_with('-1').raising(ValueError))
+@_(call_with('nan').raising(ValueError))
+@_(call_with('inf').raising(ValueError))
+@_(call_with('mister').raising(ValueError))
+def test__parse_timeout(value):
+    """
+    Tests whether ``parse_timeout`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    
+    Returns
+    -------
+    output : `float`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return parse_timeout(value)
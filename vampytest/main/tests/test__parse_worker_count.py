@@ -0,0 +1,44 @@
+from ...core import _, call_from, call_with, mock_globals
+
+from ..parameter_parsing import parse_worker_count
+
+
+def _iter_options__passing():
+    yield '0', 4, 0
+    yield '2', 4, 2
+    yield 'auto', 4, 4
+    yield 'auto', None, 1
+
+
+@_(call_from(_iter_options__passing()).returning_last())
+@_(call_with('-1', 4).raising(ValueError))
+@_(call_with('mister', 4).raising(ValueError))
+def test__parse_worker_count(value, cpu_count):
+    """
+    Tests whether ``parse_worker_count`` works as intended.
+    
+    Parameters
+    ----------
+    value : `str`
+        The value to parse.
+    cpu_count : `None | int`
+        The cpu count to return.
+    
+    Returns
+    -------
+    output : `int`
+    
+    Raises
+    ------
+    ValueError
+    """
+    def get_cpu_count_mock():
+        nonlocal cpu_count
+        return cpu_count
+    
+    mocked = mock_globals(
+        parse_worker_count,
+        get_cpu_count = get_cpu_count_mock,
+    )
+    
+    return mocked(value)
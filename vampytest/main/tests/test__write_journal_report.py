@@ -0,0 +1,143 @@
+import sys
+from io import StringIO
+from os import mkdir as make_directory
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+from ...core import _, assert_eq, call_from
+from ...core.event_handling import EventHandlerManager
+from ...core.event_handling.default import DefaultEventFormatter
+from ...core.event_handling.default_output_writer import OutputWriter
+from ...core.runner import RunnerConfiguration, TestRunner
+from ...return_codes import RETURN_CODE_FAILURE, RETURN_CODE_SUCCESS, RETURN_CODE_TEST_RUNNER_STOPPED
+
+from ..report import write_journal_report
+
+
+PACKAGE_NAME = 'vampytest_test_package_journal_report'
+
+TEST_FILE_CONTENT = (
+    'import vampytest\n'
+    '\n'
+    'def test_passing():\n'
+    '    pass\n'
+    '\n'
+    '@vampytest.skip()\n'
+    'def test_skipped():\n'
+    '    pass\n'
+    '\n'
+    'def test_failing():\n'
+    '    vampytest.assert_eq(1, 2)\n'
+)
+
+class File(StringIO):
+    """
+    File stand-in keeping its value after closed, because the output writer closes its file.
+    
+    Attributes
+    ----------
+    value : `None | str`
+        The file's value when it was closed.
+    """
+    def __init__(self):
+        StringIO.__init__(self)
+        self.value = None
+    
+    
+    def close(self):
+        """
+        Closes the file, keeping its value.
+        """
+        if (self.value is None):
+            self.value = self.getvalue()
+        
+        StringIO.close(self)
+
+
+def _iter_options():
+    header = '{"type": "journal", "version": 1}\n'
+    passed = '{"type": "result", "import_route": "koishi", "name": "test_satori", "status": "passed"}\n'
+    skipped = '{"type": "result", "import_route": "koishi", "name": "test_satori", "status": "skipped"}\n'
+    failed = (
+        '{"type": "result", "import_route": "koishi", "name": "test_satori", "status": "failed", "message": "orin"}\n'
+    )
+    summary = '{"type": "summary"}\n'
+    
+    yield header + passed + skipped + summary, (RETURN_CODE_SUCCESS, False, '0 failed | 1 skipped | 2 passed')
+    yield header + passed + failed + summary, (RETURN_CODE_FAILURE, True, '1 failed | 0 skipped | 1 passed')
+    yield header + passed + '{"type": "res', (RETURN_CODE_TEST_RUNNER_STOPPED, False, '0 failed | 0 skipped | 1 passed')
+
+
+@_(call_from(_iter_options()).returning_last())
+def test__write_journal_report(content):
+    """
+    Tests whether ``write_journal_report`` works as intended.
+    
+    Parameters
+    ----------
+    content : `str`
+        The journal's content.
+    
+    Returns
+    -------
+    output : `(int, bool, str)`
+    """
+    file = File()
+    
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'journal.jsonl')
+        with open(path, 'w', encoding = 'utf-8') as journal_file:
+            journal_file.write(content)
+        
+        return_code = write_journal_report(path, file)
+    
+    output = file.value
+    return return_code, ('orin' in output), output.splitlines()[-1]
+
+
+def test__write_journal_report__summary():
+    """
+    Tests whether ``write_journal_report`` works as intended.
+    
+    Case: the summary matches the one written when the tests were ran.
+    """
+    with TemporaryDirectory() as source_directory:
+        directory_path = join_paths(source_directory, PACKAGE_NAME)
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        directory_path = join_paths(directory_path, 'tests')
+        make_directory(directory_path)
+        with open(join_paths(directory_path, '__init__.py'), 'w'):
+            pass
+        
+        with open(join_paths(directory_path, 'test_summary.py'), 'w') as file:
+            file.write(TEST_FILE_CONTENT)
+        
+        path = join_paths(source_directory, 'journal.jsonl')
+        
+        run_file = File()
+        output_formatter = DefaultEventFormatter(highlighter = None, output_writer = OutputWriter(run_file))
+        event_handler_manager = EventHandlerManager()
+        event_handler_manager.events(output_formatter.testing_end)
+        
+        try:
+            TestRunner(
+                source_directory,
+                {PACKAGE_NAME},
+                configuration = RunnerConfiguration(journal_file_path = path),
+                event_handler_manager = event_handler_manager,
+            ).run()
+        finally:
+            for module_name in [*sys.modules.keys()]:
+                if module_name == PACKAGE_NAME or module_name.startswith(PACKAGE_NAME + '.'):
+                    del sys.modules[module_name]
+        
+        report_file = File()
+        write_journal_report(path, report_file)
+    
+    run_file.close()
+    output = report_file.value.splitlines()[-1]
+    assert_eq(output, run_file.value.splitlines()[-1])
+    assert_eq(output, '1 failed | 1 skipped | 2 passed')
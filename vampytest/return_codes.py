@@ -6,5 +6,6 @@ RETURN_CODE_FAILURE = 2
 
 RETURN_CODE_TEST_RUNNER_STOPPED = 4
 RETURN_CODE_TEST_RUNNER_INTERRUPTED = 5
+RETURN_CODE_PARAMETER_FAILURE = 6
 
 RETURN_CODE_TEST_LOCATION_FAILURE = 7